@@ -7,23 +7,39 @@ Emits typed events that consumers can map to their specific output format.
 Supports multiple tool executor types:
 - Sync executor: returns str or ToolResult
 - Async executor: returns str or ToolResult
-- Sync generator: yields ToolProgress, returns ToolResult (via StopIteration)
+- Sync generator: yields ToolProgress, returns ToolResult (via StopIteration);
+  driven in a worker thread, with progress streamed as it is produced
 - Async generator: yields ToolProgress and final ToolResult (real-time streaming)
 
+The system prompt is a string or a list of text blocks. Blocks may carry
+"cache_control" breakpoints; the prefix up to a breakpoint (tool schemas,
+then system blocks) is served from the provider's prompt cache on later
+calls. With prompt_caching=True the loop also places a breakpoint at the end
+of the conversation, so each tool iteration reads the previous iteration's
+prefix from the cache instead of paying for it again.
+
+Tools flagged side_effect_free that the model calls in the same turn run
+concurrently (up to max_parallel_tools), each with its own database session.
+Results are returned to the model in the order it made the calls.
+
 Used by:
 - ChatStreamService (SSE streaming)
 - Future agentic tools (e.g., deep_research)
 """
 
 import asyncio
+import concurrent.futures
 import copy
 import logging
+import threading
 import time
 import uuid
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Tuple, Union
 
 import anthropic
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from tools.registry import ToolConfig, ToolResult, ToolProgress
@@ -37,6 +53,11 @@ from schemas.chat import (
 
 logger = logging.getLogger(__name__)
 
+# Sync generator tools: progress items buffered between the worker thread and
+# the loop, and how often waits on the thread check for cancellation
+_SYNC_PROGRESS_QUEUE_SIZE = 32
+_CANCEL_POLL_SECONDS = 0.25
+
 
 # =============================================================================
 # Event Types
@@ -83,6 +104,7 @@ class AgentToolProgress(AgentEvent):
     message: str
     progress: float  # 0.0 to 1.0
     data: Optional[Any] = None
+    tool_use_id: str = ""
 
 
 @dataclass
@@ -91,6 +113,7 @@ class AgentToolComplete(AgentEvent):
     tool_name: str
     result_text: str
     result_data: Any
+    tool_use_id: str = ""
 
 
 @dataclass
@@ -143,6 +166,13 @@ class _ToolsResult:
     payloads: List[Dict]
 
 
+@dataclass
+class _ToolOutcome:
+    """Final result from _execute_tool generator."""
+    tool_call: ToolCall
+    result_data: Optional[Dict[str, Any]]
+
+
 # =============================================================================
 # Cancellation Token
 # =============================================================================
@@ -176,6 +206,13 @@ class TraceBuilder:
 
     Consolidates all trace-related state and provides helper methods
     to keep the main loop clean.
+
+    Messages are recorded append-only: each iteration stores only the messages
+    added since the previous one (AgentIteration.new_messages), referencing the
+    conversation's own message dicts instead of copying the whole array per
+    call. The loop only appends to the conversation, never edits earlier
+    messages, so the shared dicts stay accurate. AgentTrace.messages_to_model()
+    (or the trace viewer) rebuilds full arrays when needed.
     """
 
     def __init__(
@@ -184,7 +221,7 @@ class TraceBuilder:
         max_tokens: int,
         max_iterations: int,
         temperature: float,
-        system_prompt: str,
+        system_prompt: Union[str, List[Dict[str, Any]]],
         tools: Dict[str, ToolConfig],
         context: Dict[str, Any],
         initial_messages: List[Dict],
@@ -197,9 +234,10 @@ class TraceBuilder:
         self._max_tokens = max_tokens
         self._max_iterations = max_iterations
         self._temperature = temperature
-        self._system_prompt = system_prompt
+        self._system_prompt = _system_prompt_text(system_prompt)
         self._context = context
         self._initial_messages = copy.deepcopy(initial_messages)
+        self._recorded_messages = len(initial_messages)
         self._tool_definitions = [
             ToolDefinition(
                 name=config.name,
@@ -213,11 +251,15 @@ class TraceBuilder:
         self._iterations: List[AgentIteration] = []
         self._total_input_tokens = 0
         self._total_output_tokens = 0
+        self._total_cache_creation_tokens = 0
+        self._total_cache_read_tokens = 0
 
     def add_tokens(self, usage: TokenUsage) -> None:
         """Add token usage from a model call."""
         self._total_input_tokens += usage.input_tokens
         self._total_output_tokens += usage.output_tokens
+        self._total_cache_creation_tokens += usage.cache_creation_input_tokens
+        self._total_cache_read_tokens += usage.cache_read_input_tokens
 
     def add_iteration(
         self,
@@ -229,10 +271,19 @@ class TraceBuilder:
         api_call_ms: int,
         tool_calls: Optional[List[ToolCall]] = None,
     ) -> None:
-        """Record a completed iteration."""
+        """
+        Record a completed iteration.
+
+        Args:
+            messages_to_model: The conversation as sent for this iteration; only
+                messages not yet recorded are stored
+        """
+        new_messages = messages_to_model[self._recorded_messages:]
+        self._recorded_messages = len(messages_to_model)
         self._iterations.append(AgentIteration(
             iteration=iteration,
-            messages_to_model=messages_to_model,
+            new_messages=new_messages,
+            message_count=len(messages_to_model),
             response_content=response_content,
             stop_reason=stop_reason,
             usage=usage,
@@ -243,7 +294,7 @@ class TraceBuilder:
     def build(self, outcome: str, final_text: str, error_message: Optional[str] = None) -> AgentTrace:
         """Build the final trace object."""
         peak_input = max(
-            (it.usage.input_tokens for it in self._iterations),
+            (it.usage.context_tokens for it in self._iterations),
             default=0,
         )
         return AgentTrace(
@@ -263,6 +314,8 @@ class TraceBuilder:
             error_message=error_message,
             total_input_tokens=self._total_input_tokens,
             total_output_tokens=self._total_output_tokens,
+            total_cache_creation_input_tokens=self._total_cache_creation_tokens,
+            total_cache_read_input_tokens=self._total_cache_read_tokens,
             total_duration_ms=int((time.time() - self._start_time) * 1000),
             peak_input_tokens=peak_input if peak_input > 0 else None,
         )
@@ -277,7 +330,7 @@ async def run_agent_loop(
     model: str,
     max_tokens: int,
     max_iterations: int,
-    system_prompt: str,
+    system_prompt: Union[str, List[Dict[str, Any]]],
     messages: List[Dict],
     tools: Dict[str, ToolConfig],
     db: Session,
@@ -285,7 +338,9 @@ async def run_agent_loop(
     context: Optional[Dict[str, Any]] = None,
     cancellation_token: Optional[CancellationToken] = None,
     stream_text: bool = False,
-    temperature: float = 0.7
+    temperature: float = 0.7,
+    prompt_caching: bool = False,
+    max_parallel_tools: int = 1
 ) -> AsyncGenerator[AgentEvent, None]:
     """
     Generic agentic loop that yields events.
@@ -295,7 +350,8 @@ async def run_agent_loop(
         model: Model to use (e.g., "claude-sonnet-4-20250514")
         max_tokens: Maximum tokens per response
         max_iterations: Maximum tool call iterations
-        system_prompt: System prompt for the agent
+        system_prompt: System prompt for the agent (string, or text blocks with
+            optional cache_control breakpoints)
         messages: Initial message history
         tools: Dict mapping tool name -> ToolConfig
         db: Database session
@@ -304,6 +360,10 @@ async def run_agent_loop(
         cancellation_token: Optional token to check for cancellation
         stream_text: If True, yield AgentTextDelta events for streaming
         temperature: Model temperature
+        prompt_caching: If True, add a prompt-cache breakpoint at the end of the
+            conversation on every call (see module docstring)
+        max_parallel_tools: How many side_effect_free tool calls of one model
+            turn may run at the same time (1 runs every call sequentially)
 
     Yields:
         AgentEvent subclasses representing loop progress
@@ -344,8 +404,8 @@ async def run_agent_loop(
 
             logger.debug(f"Agent loop iteration {iteration}")
 
-            # Snapshot messages before API call
-            messages_to_model = copy.deepcopy(api_kwargs["messages"])
+            if prompt_caching:
+                api_kwargs["messages"] = _with_cache_breakpoint(messages)
 
             # 1. Call model
             response = None
@@ -375,7 +435,7 @@ async def run_agent_loop(
             if not tool_use_blocks:
                 trace_builder.add_iteration(
                     iteration=iteration,
-                    messages_to_model=messages_to_model,
+                    messages_to_model=messages,
                     response_content=response_content,
                     stop_reason=response.stop_reason or "end_turn",
                     usage=model_result.usage,
@@ -394,7 +454,7 @@ async def run_agent_loop(
             tool_results = None
             tools_result: Optional[_ToolsResult] = None
             async for event in _process_tools(
-                tool_use_blocks, tools, db, user_id, context, cancellation_token
+                tool_use_blocks, tools, db, user_id, context, cancellation_token, max_parallel_tools
             ):
                 if isinstance(event, _ToolsResult):
                     tools_result = event
@@ -406,7 +466,7 @@ async def run_agent_loop(
 
             trace_builder.add_iteration(
                 iteration=iteration,
-                messages_to_model=messages_to_model,
+                messages_to_model=messages,
                 response_content=response_content,
                 stop_reason=response.stop_reason or "tool_use",
                 usage=model_result.usage,
@@ -430,9 +490,11 @@ async def run_agent_loop(
             "content": "You've reached the maximum number of tool calls. Please provide a final summary of what you found based on your research above. Do not call any more tools."
         })
 
-        final_kwargs = {**api_kwargs, "messages": messages}
+        final_kwargs = {
+            **api_kwargs,
+            "messages": _with_cache_breakpoint(messages) if prompt_caching else messages,
+        }
         final_kwargs.pop("tools", None)
-        messages_to_model = copy.deepcopy(final_kwargs["messages"])
         collected_text = ""
 
         model_result = None
@@ -447,7 +509,7 @@ async def run_agent_loop(
         if model_result:
             trace_builder.add_iteration(
                 iteration=max_iterations + 1,
-                messages_to_model=messages_to_model,
+                messages_to_model=messages,
                 response_content=_response_content_to_dicts(model_result.response),
                 stop_reason=model_result.response.stop_reason or "end_turn",
                 usage=model_result.usage,
@@ -503,7 +565,7 @@ def _build_api_kwargs(
     model: str,
     max_tokens: int,
     temperature: float,
-    system_prompt: str,
+    system_prompt: Union[str, List[Dict[str, Any]]],
     messages: List[Dict],
     tools: Dict[str, ToolConfig]
 ) -> Dict:
@@ -532,6 +594,44 @@ def _build_api_kwargs(
     return api_kwargs
 
 
+def _system_prompt_text(system_prompt: Union[str, List[Dict[str, Any]]]) -> str:
+    """The system prompt as one string (for traces), joining text blocks."""
+    if isinstance(system_prompt, str):
+        return system_prompt
+    return "\n\n".join(block.get("text", "") for block in system_prompt)
+
+
+def _with_cache_breakpoint(messages: List[Dict]) -> List[Dict]:
+    """
+    Copy of messages with a prompt-cache breakpoint on the last content block.
+
+    The breakpoint moves forward every call, so the conversation itself is not
+    modified (breakpoints would otherwise pile up past the provider's limit).
+    """
+    if not messages:
+        return messages
+    last = messages[-1]
+    content = last.get("content")
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content:
+        blocks = [_block_to_dict(block) for block in content]
+    else:
+        return messages
+    if not blocks[-1].get("text", True):
+        # Empty text blocks cannot carry cache_control
+        return messages
+    blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+    return messages[:-1] + [{**last, "content": blocks}]
+
+
+def _block_to_dict(block: Any) -> Dict:
+    """Content block as a dict (SDK response blocks are pydantic models)."""
+    if isinstance(block, dict):
+        return block
+    return block.model_dump(exclude_none=True)
+
+
 # =============================================================================
 # Helper: Call Model
 # =============================================================================
@@ -581,6 +681,8 @@ async def _call_model(
     usage = TokenUsage(
         input_tokens=response.usage.input_tokens,
         output_tokens=response.usage.output_tokens,
+        cache_creation_input_tokens=getattr(response.usage, "cache_creation_input_tokens", None) or 0,
+        cache_read_input_tokens=getattr(response.usage, "cache_read_input_tokens", None) or 0,
     )
 
     yield _ModelResult(response=response, text=collected_text, usage=usage, api_call_ms=api_call_ms)
@@ -596,215 +698,383 @@ async def _process_tools(
     db: Session,
     user_id: int,
     context: Dict[str, Any],
-    cancellation_token: CancellationToken
+    cancellation_token: CancellationToken,
+    max_parallel_tools: int = 1
 ) -> AsyncGenerator[Union[AgentEvent, _ToolsResult], None]:
     """
     Process all tool calls and yield events.
 
-    Supports multiple executor types:
-    - Sync executor: def executor(...) -> str | ToolResult
-    - Async executor: async def executor(...) -> str | ToolResult
-    - Sync generator: def executor(...) -> Generator[ToolProgress, None, ToolResult]
-    - Async generator: async def executor(...) -> AsyncGenerator[ToolProgress | ToolResult, None]
-
-    For streaming tools (generators), ToolProgress items are yielded as AgentToolProgress
-    events in real-time. The final ToolResult is captured as the tool output.
+    Calls run in the order the model made them. A run of consecutive calls to
+    side_effect_free tools runs concurrently (at most max_parallel_tools at a
+    time, each with its own database session); any other call is a barrier.
+    Progress events are yielded as they happen, while AgentToolComplete events,
+    tool results and trace records keep the model's call order.
 
     Yields:
         AgentToolStart, AgentToolProgress, AgentToolComplete events
         _ToolsResult as final item with results, records, tool_calls, and payloads
     """
-    tool_results = []  # For message back to model
+    tool_results = []  # For message to model
     tool_records = []  # Simplified view for UI
     tool_calls = []  # Full trace data
     payloads = []
 
-    for tool_block in tool_use_blocks:
-        tool_name = tool_block.name
-        tool_input_from_model = tool_block.input  # Exact input from model
-        tool_use_id = tool_block.id
+    for batch in _tool_batches(tool_use_blocks, tools, max_parallel_tools):
+        for tool_block in batch:
+            logger.info(f"Agent tool call: {tool_block.name}")
+            yield AgentToolStart(
+                tool_name=tool_block.name,
+                tool_input=tool_block.input,
+                tool_use_id=tool_block.id
+            )
 
-        logger.info(f"Agent tool call: {tool_name}")
+        if len(batch) == 1:
+            events = _execute_tool(batch[0], tools, db, user_id, context, cancellation_token)
+        else:
+            logger.info(f"Running {len(batch)} side-effect-free tool calls concurrently")
+            events = _execute_concurrently(
+                batch, tools, db, user_id, context, cancellation_token, max_parallel_tools
+            )
 
-        yield AgentToolStart(
-            tool_name=tool_name,
-            tool_input=tool_input_from_model,
-            tool_use_id=tool_use_id
-        )
+        async for event in events:
+            if not isinstance(event, _ToolOutcome):
+                yield event
+                continue
 
-        # Prepare trace data
-        tool_start_time = time.time()
-        tool_input = tool_input_from_model  # No transform - same as what model requested
-        output_from_executor: Any = None
-        output_type = "unknown"
-        tool_result_str = ""
-        tool_result_data = None
+            tool_call = event.tool_call
+            tool_calls.append(tool_call)
 
-        # Execute tool
-        tool_config = tools.get(tool_name)
+            # Record simplified view for UI
+            tool_records.append({
+                "tool_name": tool_call.tool_name,
+                "input": tool_call.tool_input,
+                "output": tool_call.output_to_model
+            })
 
-        if not tool_config:
-            tool_result_str = f"Unknown tool: {tool_name}"
-            output_from_executor = tool_result_str
-            output_type = "error"
+            # Collect payload separately if present
+            if event.result_data:
+                payloads.append(event.result_data)
+
+            # Collect result for message to model
+            tool_results.append({
+                "type": "tool_result",
+                "tool_use_id": tool_call.tool_use_id,
+                "content": tool_call.output_to_model
+            })
+
+            yield AgentToolComplete(
+                tool_name=tool_call.tool_name,
+                result_text=tool_call.output_to_model,
+                result_data=event.result_data,
+                tool_use_id=tool_call.tool_use_id
+            )
+
+    yield _ToolsResult(tool_results=tool_results, tool_records=tool_records, tool_calls=tool_calls, payloads=payloads)
+
+
+def _tool_batches(tool_use_blocks: List, tools: Dict[str, ToolConfig], max_parallel_tools: int) -> List[List]:
+    """Group consecutive calls to side-effect-free tools; every other call is a batch of its own."""
+    batches: List[List] = []
+    joinable = False
+    for tool_block in tool_use_blocks:
+        tool_config = tools.get(tool_block.name)
+        parallel = max_parallel_tools > 1 and tool_config is not None and tool_config.side_effect_free
+        if parallel and joinable:
+            batches[-1].append(tool_block)
         else:
-            try:
-                if cancellation_token.is_cancelled:
-                    raise asyncio.CancelledError(f"Tool {tool_name} cancelled before execution")
-
-                # Check if executor is async (coroutine function)
-                if asyncio.iscoroutinefunction(tool_config.executor):
-                    # Async executor - await it directly
-                    raw_result = await tool_config.executor(
-                        tool_input,
-                        db,
-                        user_id,
-                        context
-                    )
-                else:
-                    # Sync executor - run in thread pool
-                    raw_result = await asyncio.to_thread(
-                        tool_config.executor,
-                        tool_input,
-                        db,
-                        user_id,
-                        context
-                    )
-
-                # Capture raw output before any processing
-                output_from_executor = raw_result
-
-                # Check if result is an async generator (streaming async tool)
-                if hasattr(raw_result, '__anext__'):
-                    output_type = "async_generator"
-                    # Async generator - iterate and yield progress in real-time
-                    async_generator_final_result = None
-                    async for item in raw_result:
-                        if cancellation_token.is_cancelled:
-                            raise asyncio.CancelledError(f"Tool {tool_name} cancelled during streaming")
-                        if isinstance(item, ToolProgress):
-                            yield AgentToolProgress(
-                                tool_name=tool_name,
-                                stage=item.stage,
-                                message=item.message,
-                                progress=item.progress,
-                                data=item.data
-                            )
-                        elif isinstance(item, ToolResult):
-                            # Final result from async generator
-                            async_generator_final_result = item
-                            tool_result_str = item.text
-                            tool_result_data = item.payload
+            batches.append([tool_block])
+        joinable = parallel
+    return batches
+
+
+async def _execute_concurrently(
+    batch: List,
+    tools: Dict[str, ToolConfig],
+    db: Session,
+    user_id: int,
+    context: Dict[str, Any],
+    cancellation_token: CancellationToken,
+    max_parallel_tools: int
+) -> AsyncGenerator[Union[AgentToolProgress, _ToolOutcome], None]:
+    """
+    Run a batch of tool calls concurrently.
+
+    Progress events are yielded as they arrive; each _ToolOutcome is held back
+    until every earlier call in the batch has completed, so outcomes come out
+    in call order.
+    """
+    semaphore = asyncio.Semaphore(max_parallel_tools)
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run(index: int, tool_block: Any) -> None:
+        try:
+            async with semaphore, _isolated_session(db) as tool_db:
+                async for item in _execute_tool(tool_block, tools, tool_db, user_id, context, cancellation_token):
+                    queue.put_nowait((index, item))
+        except BaseException as e:
+            queue.put_nowait((index, e))
+            raise
+
+    tasks = [asyncio.create_task(run(index, tool_block)) for index, tool_block in enumerate(batch)]
+    outcomes: List[Optional[_ToolOutcome]] = [None] * len(batch)
+    next_index = 0
+    try:
+        while next_index < len(batch):
+            index, item = await queue.get()
+            if isinstance(item, BaseException):
+                raise item
+            if not isinstance(item, _ToolOutcome):
+                yield item
+                continue
+            outcomes[index] = item
+            while next_index < len(batch) and outcomes[next_index] is not None:
+                yield outcomes[next_index]
+                next_index += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@asynccontextmanager
+async def _isolated_session(db: Any):
+    """A session of its own for a tool running alongside others (a session is not safe for concurrent use)."""
+    if isinstance(db, AsyncSession) and db.bind is not None:
+        async with AsyncSession(bind=db.bind, expire_on_commit=False, autoflush=False) as session:
+            yield session
+    else:
+        yield db
+
+
+async def _execute_tool(
+    tool_block: Any,
+    tools: Dict[str, ToolConfig],
+    db: Session,
+    user_id: int,
+    context: Dict[str, Any],
+    cancellation_token: CancellationToken
+) -> AsyncGenerator[Union[AgentToolProgress, _ToolOutcome], None]:
+    """
+    Execute one tool call and yield its progress.
+
+    Supports multiple executor types:
+    - Sync executor: def executor(...) -> str | ToolResult
+    - Async executor: async def executor(...) -> str | ToolResult
+    - Sync generator: def executor(...) -> Generator[ToolProgress, None, ToolResult]
+    - Async generator: async def executor(...) -> AsyncGenerator[ToolProgress | ToolResult, None]
+
+    For streaming tools (generators), ToolProgress items are yielded as AgentToolProgress
+    events in real-time. The final ToolResult is captured as the tool output.
+
+    Yields:
+        AgentToolProgress events
+        _ToolOutcome as final item with the trace record and payload
+    """
+    tool_name = tool_block.name
+    tool_input_from_model = tool_block.input  # Exact input from model
+    tool_use_id = tool_block.id
+
+    # Prepare trace data
+    tool_start_time = time.time()
+    tool_input = tool_input_from_model  # No transform - same as what model requested
+    output_from_executor: Any = None
+    output_type = "unknown"
+    tool_result_str = ""
+    tool_result_data = None
+
+    # Execute tool
+    tool_config = tools.get(tool_name)
+
+    if not tool_config:
+        tool_result_str = f"Unknown tool: {tool_name}"
+        output_from_executor = tool_result_str
+        output_type = "error"
+    else:
+        try:
+            if cancellation_token.is_cancelled:
+                raise asyncio.CancelledError(f"Tool {tool_name} cancelled before execution")
+
+            # Check if executor is async (coroutine function)
+            if asyncio.iscoroutinefunction(tool_config.executor):
+                # Async executor - await it directly
+                raw_result = await tool_config.executor(
+                    tool_input,
+                    db,
+                    user_id,
+                    context
+                )
+            else:
+                # Sync executor - run in thread pool
+                raw_result = await asyncio.to_thread(
+                    tool_config.executor,
+                    tool_input,
+                    db,
+                    user_id,
+                    context
+                )
+
+            # Capture raw output before any processing
+            output_from_executor = raw_result
+
+            # Check if result is an async generator (streaming async tool)
+            if hasattr(raw_result, '__anext__'):
+                output_type = "async_generator"
+                # Async generator - iterate and yield progress in real-time
+                async_generator_final_result = None
+                async for item in raw_result:
+                    if cancellation_token.is_cancelled:
+                        raise asyncio.CancelledError(f"Tool {tool_name} cancelled during streaming")
+                    if isinstance(item, ToolProgress):
+                        yield AgentToolProgress(
+                            tool_name=tool_name,
+                            stage=item.stage,
+                            message=item.message,
+                            progress=item.progress,
+                            data=item.data,
+                            tool_use_id=tool_use_id
+                        )
+                    elif isinstance(item, ToolResult):
+                        # Final result from async generator
+                        async_generator_final_result = item
+                        tool_result_str = item.text
+                        tool_result_data = item.payload
+                        output_type = "ToolResult"
+                    elif isinstance(item, str):
+                        # String result (less common)
+                        async_generator_final_result = item
+                        tool_result_str = item
+                        output_type = "str"
+                output_from_executor = async_generator_final_result
+
+            # Check if result is a sync generator (streaming tool)
+            elif hasattr(raw_result, '__next__'):
+                output_type = "generator"
+                # Drive it in a worker thread; progress is yielded as the tool produces it
+                generator_final_result = None
+                async for item_type, item_value in _iterate_in_thread(raw_result, cancellation_token):
+                    if item_type == 'progress' and isinstance(item_value, ToolProgress):
+                        yield AgentToolProgress(
+                            tool_name=tool_name,
+                            stage=item_value.stage,
+                            message=item_value.message,
+                            progress=item_value.progress,
+                            data=item_value.data,
+                            tool_use_id=tool_use_id
+                        )
+                    elif item_type == 'result':
+                        generator_final_result = item_value
+                        if isinstance(item_value, ToolResult):
+                            tool_result_str = item_value.text
+                            tool_result_data = item_value.payload
                             output_type = "ToolResult"
-                        elif isinstance(item, str):
-                            # String result (less common)
-                            async_generator_final_result = item
-                            tool_result_str = item
+                        elif isinstance(item_value, str):
+                            tool_result_str = item_value
                             output_type = "str"
-                    output_from_executor = async_generator_final_result
-
-                # Check if result is a sync generator (streaming tool)
-                elif hasattr(raw_result, '__next__'):
-                    output_type = "generator"
-                    # It's a generator - collect progress and result
-                    def run_generator(gen):
-                        results = []
-                        try:
-                            while True:
-                                item = next(gen)
-                                results.append(('progress', item))
-                        except StopIteration as e:
-                            results.append(('result', e.value))
-                        return results
-
-                    items = await asyncio.to_thread(run_generator, raw_result)
-                    generator_final_result = None
-                    for item_type, item_value in items:
-                        if item_type == 'progress' and isinstance(item_value, ToolProgress):
-                            yield AgentToolProgress(
-                                tool_name=tool_name,
-                                stage=item_value.stage,
-                                message=item_value.message,
-                                progress=item_value.progress,
-                                data=item_value.data
-                            )
-                        elif item_type == 'result':
-                            generator_final_result = item_value
-                            if isinstance(item_value, ToolResult):
-                                tool_result_str = item_value.text
-                                tool_result_data = item_value.payload
-                                output_type = "ToolResult"
-                            elif isinstance(item_value, str):
-                                tool_result_str = item_value
-                                output_type = "str"
-                            else:
-                                tool_result_str = str(item_value) if item_value else ""
-                                output_type = type(item_value).__name__ if item_value else "None"
-                    # Update output_from_executor with final result from generator
-                    output_from_executor = generator_final_result
-                elif isinstance(raw_result, ToolResult):
-                    output_type = "ToolResult"
-                    tool_result_str = raw_result.text
-                    tool_result_data = raw_result.payload
-                elif isinstance(raw_result, str):
-                    output_type = "str"
-                    tool_result_str = raw_result
-                else:
-                    output_type = type(raw_result).__name__
-                    tool_result_str = str(raw_result)
-
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                logger.error(f"Tool execution error: {e}", exc_info=True)
-                tool_result_str = f"Error executing tool: {str(e)}"
-                output_from_executor = str(e)
-                output_type = "error"
-
-        if cancellation_token.is_cancelled:
-            raise asyncio.CancelledError("Cancelled after tool execution")
-
-        execution_ms = int((time.time() - tool_start_time) * 1000)
-
-        # Build full trace record
-        tool_call = ToolCall(
-            tool_use_id=tool_use_id,
-            tool_name=tool_name,
-            tool_input=tool_input,
-            output_from_executor=_safe_serialize(output_from_executor),
-            output_type=output_type,
-            output_to_model=tool_result_str,
-            payload=_safe_serialize(tool_result_data) if tool_result_data else None,
-            execution_ms=execution_ms,
-        )
-        tool_calls.append(tool_call)
+                        else:
+                            tool_result_str = str(item_value) if item_value else ""
+                            output_type = type(item_value).__name__ if item_value else "None"
+                # Update output_from_executor with final result from generator
+                output_from_executor = generator_final_result
+            elif isinstance(raw_result, ToolResult):
+                output_type = "ToolResult"
+                tool_result_str = raw_result.text
+                tool_result_data = raw_result.payload
+            elif isinstance(raw_result, str):
+                output_type = "str"
+                tool_result_str = raw_result
+            else:
+                output_type = type(raw_result).__name__
+                tool_result_str = str(raw_result)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Tool execution error: {e}", exc_info=True)
+            tool_result_str = f"Error executing tool: {str(e)}"
+            output_from_executor = str(e)
+            output_type = "error"
 
-        # Record simplified view for UI
-        tool_record = {
-            "tool_name": tool_name,
-            "input": tool_input_from_model,
-            "output": tool_result_str
-        }
-        tool_records.append(tool_record)
+    if cancellation_token.is_cancelled:
+        raise asyncio.CancelledError("Cancelled after tool execution")
+
+    execution_ms = int((time.time() - tool_start_time) * 1000)
+
+    # Build full trace record
+    tool_call = ToolCall(
+        tool_use_id=tool_use_id,
+        tool_name=tool_name,
+        tool_input=tool_input,
+        output_from_executor=_safe_serialize(output_from_executor),
+        output_type=output_type,
+        output_to_model=tool_result_str,
+        payload=_safe_serialize(tool_result_data) if tool_result_data else None,
+        execution_ms=execution_ms,
+    )
 
-        # Collect payload separately if present
-        if tool_result_data:
-            payloads.append(tool_result_data)
+    yield _ToolOutcome(tool_call=tool_call, result_data=tool_result_data)
 
-        # Collect result for message to model
-        tool_results.append({
-            "type": "tool_result",
-            "tool_use_id": tool_use_id,
-            "content": tool_result_str
-        })
 
-        yield AgentToolComplete(
-            tool_name=tool_name,
-            result_text=tool_result_str,
-            result_data=tool_result_data
-        )
+async def _iterate_in_thread(
+    gen: Generator,
+    cancellation_token: CancellationToken
+) -> AsyncGenerator[Tuple[str, Any], None]:
+    """
+    Drive a sync generator in a worker thread, yielding ('progress', item) as
+    items are produced and finally ('result', return value).
+
+    Items pass through a bounded queue, so a tool that outruns the consumer
+    waits instead of buffering without limit. On cancellation the wait ends
+    immediately; the worker stops at the tool's next yield and closes the
+    generator (running its finally blocks). A step already running in the
+    thread cannot be interrupted.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_SYNC_PROGRESS_QUEUE_SIZE)
+    stop = threading.Event()
 
-    yield _ToolsResult(tool_results=tool_results, tool_records=tool_records, tool_calls=tool_calls, payloads=payloads)
+    def put(item: Tuple[str, Any]) -> bool:
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=_CANCEL_POLL_SECONDS)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop.is_set():
+                    future.cancel()
+                    return False
+
+    def drive() -> None:
+        try:
+            while not stop.is_set() and not cancellation_token.is_cancelled:
+                try:
+                    item = next(gen)
+                except StopIteration as e:
+                    put(("result", e.value))
+                    return
+                if not put(("progress", item)):
+                    break
+            gen.close()
+        except BaseException as e:
+            put(("error", e))
+
+    worker = asyncio.ensure_future(asyncio.to_thread(drive))
+    try:
+        while True:
+            try:
+                item_type, item_value = await asyncio.wait_for(queue.get(), timeout=_CANCEL_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                if cancellation_token.is_cancelled:
+                    raise asyncio.CancelledError("Tool cancelled during streaming")
+                continue
+            if item_type == "error":
+                raise item_value
+            yield item_type, item_value
+            if item_type == "result":
+                break
+    finally:
+        # Not awaited: the worker may be inside a step and exits at the tool's next yield
+        stop.set()
+        worker.add_done_callback(lambda f: None if f.cancelled() else f.exception())
 
 
 def _safe_serialize(obj: Any) -> Any:
@@ -1,13 +1,15 @@
-from typing import Dict, Any, List, Optional, Union, Type
+from typing import Dict, Any, List, Optional, Union, Type, Tuple
 from pydantic import BaseModel, create_model, Field
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.output_parsers import PydanticOutputParser
 from openai import AsyncOpenAI, APIError, APIConnectionError, RateLimitError, APITimeoutError
+from openai.types.chat import ChatCompletion
 import httpx
+import hashlib
 import logging
 from schemas.llm import ChatMessage
 from utils.message_formatter import format_langchain_messages, format_messages_for_openai
-from utils.prompt_logger import log_prompt_messages
+from utils.prompt_logger import submit_prompt_log
 from config.llm_models import MODEL_CONFIGS, get_model_capabilities, supports_reasoning_effort, supports_temperature, get_valid_reasoning_efforts, uses_max_completion_tokens
 import json
 
@@ -37,6 +39,40 @@ def get_shared_openai_client():
     return _shared_openai_client
 
 
+# Compiled response models for JSON schemas, keyed by schema fingerprint.
+# Building the Pydantic model and output parser for a dict schema is pure CPU
+# work that used to be repeated for every item of a batch. Bounded like the
+# prompt-caller cache in llm.py: least recently used entries are evicted.
+_COMPILED_SCHEMA_CACHE_SIZE = 128
+_compiled_schema_cache: Dict[str, Tuple[Type[BaseModel], PydanticOutputParser]] = {}
+
+
+def schema_fingerprint(schema: Dict[str, Any]) -> str:
+    """Stable hash of a JSON schema (key order does not matter)."""
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class LLMRateLimitError(RuntimeError):
+    """The provider rejected the call with a rate limit (429). Safe to retry after a backoff."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _retry_after_seconds(error: RateLimitError) -> Optional[float]:
+    """Read the provider's retry hint (retry-after-ms / retry-after headers), if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
 class LLMUsage(BaseModel):
     """Token usage information from LLM calls"""
     prompt_tokens: int = 0
@@ -82,11 +118,10 @@ class BasePromptCaller:
             self._text_only = True
         # Handle both Pydantic models and JSON schemas
         elif isinstance(response_model, dict):
-            # Convert JSON schema to Pydantic model
-            self.response_model = self._json_schema_to_pydantic_model(response_model)
+            # Convert JSON schema to Pydantic model (compiled once per distinct schema)
+            self.response_model, self.parser = self._get_compiled_schema(response_model)
             self._is_dynamic_model = True
             self._original_schema = response_model
-            self.parser = PydanticOutputParser(pydantic_object=self.response_model)
             self._text_only = False
         else:
             # Use the Pydantic model directly
@@ -97,6 +132,7 @@ class BasePromptCaller:
             self._text_only = False
         self.system_message = system_message
         self.messages_placeholder = messages_placeholder
+        self._format_instructions: Optional[str] = None
         
         # Set and validate model
         if model:
@@ -123,6 +159,19 @@ class BasePromptCaller:
         # Use shared OpenAI client with higher connection limits
         self.client = get_shared_openai_client()
         
+    def _get_compiled_schema(self, schema: Dict[str, Any]) -> Tuple[Type[BaseModel], PydanticOutputParser]:
+        """Get the Pydantic model and parser for a JSON schema, compiling it on first use."""
+        key = schema_fingerprint(schema)
+        compiled = _compiled_schema_cache.pop(key, None)
+        if compiled is None:
+            model = self._json_schema_to_pydantic_model(schema)
+            compiled = (model, PydanticOutputParser(pydantic_object=model))
+            if len(_compiled_schema_cache) >= _COMPILED_SCHEMA_CACHE_SIZE:
+                # Evict the least recently used entry (hits are re-inserted at the end)
+                _compiled_schema_cache.pop(next(iter(_compiled_schema_cache)))
+        _compiled_schema_cache[key] = compiled
+        return compiled
+
     def _json_schema_to_pydantic_model(self, schema: Dict[str, Any], model_name: str = "DynamicModel") -> Type[BaseModel]:
         """
         Convert a JSON schema to a Pydantic model class dynamically.
@@ -191,11 +240,12 @@ class BasePromptCaller:
         unique_name = f"{model_name}_{abs(hash(json.dumps(schema, sort_keys=True)))}"
         return create_model(unique_name, **field_definitions)
     
-    def get_prompt_template(self) -> ChatPromptTemplate:
+    def get_prompt_template(self, system_message: Optional[str] = None) -> ChatPromptTemplate:
         """Get the prompt template with system message and optional messages placeholder"""
         messages = []
-        if self.system_message:
-            messages.append(("system", self.system_message))
+        system_message = system_message or self.system_message
+        if system_message:
+            messages.append(("system", system_message))
         if self.messages_placeholder:
             messages.append(MessagesPlaceholder(variable_name="messages"))
         return ChatPromptTemplate.from_messages(messages)
@@ -203,6 +253,7 @@ class BasePromptCaller:
     def get_formatted_messages(
         self,
         messages: List[ChatMessage],
+        system_message: Optional[str] = None,
         **kwargs: Dict[str, Any]
     ) -> List[Dict[str, str]]:
         """Format messages for the prompt"""
@@ -210,10 +261,10 @@ class BasePromptCaller:
         langchain_messages = format_langchain_messages(messages)
 
         # Get format instructions (empty string for text-only mode)
-        format_instructions = self.parser.get_format_instructions() if self.parser else ""
+        format_instructions = self.get_format_instructions()
 
         # Format messages using template
-        prompt = self.get_prompt_template()
+        prompt = self.get_prompt_template(system_message)
         formatted_messages = prompt.format_messages(
             messages=langchain_messages,
             format_instructions=format_instructions,
@@ -223,6 +274,12 @@ class BasePromptCaller:
         # Convert to OpenAI format
         return format_messages_for_openai(formatted_messages)
     
+    def get_format_instructions(self) -> str:
+        """Get the parser's format instructions (empty string for text-only mode)"""
+        if self._format_instructions is None:
+            self._format_instructions = self.parser.get_format_instructions() if self.parser else ""
+        return self._format_instructions
+
     def get_schema(self) -> Dict[str, Any]:
         """Get the JSON schema for the response model"""
         # If we started with a JSON schema, return the original
@@ -237,50 +294,40 @@ class BasePromptCaller:
             return "TextResponse"
         return self.response_model.__name__
     
-    async def invoke(
+    def build_request(
         self,
         messages: List[ChatMessage] = None,
         log_prompt: bool = True,
-        return_usage: bool = False,
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         reasoning_effort: Optional[str] = None,
         max_tokens: Optional[int] = None,
+        system_message: Optional[str] = None,
+        log_stage: Optional[str] = None,
         **kwargs: Dict[str, Any]
-    ) -> Union[BaseModel, LLMResponse, str]:
+    ) -> Dict[str, Any]:
         """
-        Invoke the prompt and get a parsed response.
+        Build the Chat Completions request parameters for a call without sending it.
 
-        Args:
-            messages: List of conversation messages (optional)
-            log_prompt: Whether to log the prompt messages
-            return_usage: Whether to return usage information along with result
-            model: Override the model for this call (optional)
-            temperature: Override the temperature for this call (optional)
-            reasoning_effort: Override the reasoning effort for this call (optional)
-            max_tokens: Maximum tokens in response (optional)
-            **kwargs: Additional variables to format into the prompt
-
-        Returns:
-            If text-only mode: str (raw text response)
-            If return_usage=True: LLMResponse with result and usage info
-            If return_usage=False: Parsed response as an instance of the response model
+        Takes the same arguments as invoke(). Used by invoke() and by provider batch
+        submission (agents/prompts/llm_batch.py), which sends many requests as one job.
         """
         # Use empty list if no messages provided
         if messages is None:
             messages = []
         
         # Format messages
-        formatted_messages = self.get_formatted_messages(messages, **kwargs)
+        formatted_messages = self.get_formatted_messages(messages, system_message=system_message, **kwargs)
         
-        # Log prompt if requested
+        # Log prompt if requested (queued; written by a background thread)
         if log_prompt:
             try:
-                log_file_path = log_prompt_messages(
+                submit_prompt_log(
                     messages=formatted_messages,
-                    prompt_type=self.__class__.__name__.lower()
+                    prompt_type=self.__class__.__name__.lower(),
+                    stage=log_stage,
+                    model=model or self.model,
                 )
-                logger.debug(f"Prompt messages logged to: {log_file_path}")
             except Exception as log_error:
                 logger.warning(f"Failed to log prompt: {log_error}")
 
@@ -345,23 +392,11 @@ class BasePromptCaller:
             # Only warn if user tried to set a non-zero temperature
             logger.debug(f"Temperature parameter not supported for model {use_model} with reasoning_effort")
 
-        # Call OpenAI with error handling
-        try:
-            logger.debug(f"Calling OpenAI API: model={use_model}, schema={self.get_response_model_name()}")
-            response = await self.client.chat.completions.create(**api_params)
-            logger.debug(f"OpenAI API response received: {response.usage.total_tokens if response.usage else 0} tokens")
-        except APITimeoutError as e:
-            logger.error(f"OpenAI API timeout: {e}")
-            raise RuntimeError(f"OpenAI API request timed out after {OPENAI_TIMEOUT}s") from e
-        except RateLimitError as e:
-            logger.error(f"OpenAI API rate limit exceeded: {e}")
-            raise RuntimeError("OpenAI API rate limit exceeded. Please try again later.") from e
-        except APIConnectionError as e:
-            logger.error(f"OpenAI API connection error: {e}")
-            raise RuntimeError("Failed to connect to OpenAI API. Check network connectivity.") from e
-        except APIError as e:
-            logger.error(f"OpenAI API error: {e.status_code} - {e.message}")
-            raise RuntimeError(f"OpenAI API error: {e.message}") from e
+        return api_params
+
+    def parse_response(self, response: ChatCompletion) -> LLMResponse:
+        """Parse a chat completion into the result (model instance or text) and usage."""
+        use_model = response.model
 
         # Parse response with error handling
         try:
@@ -422,8 +457,80 @@ class BasePromptCaller:
             total_tokens=response.usage.total_tokens if response.usage else 0
         )
 
+        return LLMResponse(result=parsed_result, usage=usage_info)
+
+    async def invoke(
+        self,
+        messages: List[ChatMessage] = None,
+        log_prompt: bool = True,
+        return_usage: bool = False,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        reasoning_effort: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        system_message: Optional[str] = None,
+        log_stage: Optional[str] = None,
+        **kwargs: Dict[str, Any]
+    ) -> Union[BaseModel, LLMResponse, str]:
+        """
+        Invoke the prompt and get a parsed response.
+
+        Args:
+            messages: List of conversation messages (optional)
+            log_prompt: Whether to log the prompt messages (subject to prompt log sampling)
+            return_usage: Whether to return usage information along with result
+            model: Override the model for this call (optional)
+            temperature: Override the temperature for this call (optional)
+            reasoning_effort: Override the reasoning effort for this call (optional)
+            max_tokens: Maximum tokens in response (optional)
+            system_message: Override the system message for this call (optional), so one
+                caller can be reused across items with different rendered prompts
+            log_stage: Pipeline stage name used for per-stage prompt log sampling (optional)
+            **kwargs: Additional variables to format into the prompt
+
+        Returns:
+            If text-only mode: str (raw text response)
+            If return_usage=True: LLMResponse with result and usage info
+            If return_usage=False: Parsed response as an instance of the response model
+        """
+        api_params = self.build_request(
+            messages=messages,
+            log_prompt=log_prompt,
+            model=model,
+            temperature=temperature,
+            reasoning_effort=reasoning_effort,
+            max_tokens=max_tokens,
+            system_message=system_message,
+            log_stage=log_stage,
+            **kwargs
+        )
+        use_model = api_params["model"]
+
+        # Call OpenAI with error handling
+        try:
+            logger.debug(f"Calling OpenAI API: model={use_model}, schema={self.get_response_model_name()}")
+            response = await self.client.chat.completions.create(**api_params)
+            logger.debug(f"OpenAI API response received: {response.usage.total_tokens if response.usage else 0} tokens")
+        except APITimeoutError as e:
+            logger.error(f"OpenAI API timeout: {e}")
+            raise RuntimeError(f"OpenAI API request timed out after {OPENAI_TIMEOUT}s") from e
+        except RateLimitError as e:
+            logger.warning(f"OpenAI API rate limit exceeded: {e}")
+            raise LLMRateLimitError(
+                "OpenAI API rate limit exceeded. Please try again later.",
+                retry_after=_retry_after_seconds(e),
+            ) from e
+        except APIConnectionError as e:
+            logger.error(f"OpenAI API connection error: {e}")
+            raise RuntimeError("Failed to connect to OpenAI API. Check network connectivity.") from e
+        except APIError as e:
+            logger.error(f"OpenAI API error: {e.status_code} - {e.message}")
+            raise RuntimeError(f"OpenAI API error: {e.message}") from e
+
+        llm_response = self.parse_response(response)
+
         # Return based on return_usage flag
         if return_usage:
-            return LLMResponse(result=parsed_result, usage=usage_info)
+            return llm_response
         else:
-            return parsed_result 
\ No newline at end of file
+            return llm_response.result
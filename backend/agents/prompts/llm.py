@@ -7,6 +7,15 @@ Provides a single function `call_llm` that handles:
 - Structured (JSON schema) and text-only responses
 - Concurrent batch execution with progress callbacks
 - Per-item error handling in batch mode
+- Prompt caller reuse: one caller per (schema, model settings), shared by
+  every item of a batch and by later calls with the same configuration
+- Adaptive per-model concurrency shared by all batches in the process
+  (see llm_concurrency.py); rate-limited calls are retried with backoff
+- Opt-in cross-run result cache for stages listed in LLM_RESULT_CACHE_STAGES
+  or calls with use_cache=True (see llm_cache.py)
+- Provider batch execution (execution_mode="batch"): a batch call is sent as
+  one OpenAI Batch API job, with real-time fallback near the deadline
+  (see llm_batch.py)
 
 Example:
     # Single structured call
@@ -27,16 +36,25 @@ Example:
         response_schema=None,  # text mode
         options=LLMOptions(max_concurrent=10, on_progress=my_callback)
     )
+    # on_progress(completed, total) - a callback that also takes a `concurrency`
+    # keyword receives the current effective concurrency limit as well.
     for result in results:
         print(result.input["title"], "->", result.data if result.ok else result.error)
 """
 
-from typing import Dict, Any, List, Optional, Union, Type, Callable, Awaitable
+from typing import Dict, Any, List, Literal, Optional, Union, Type, Callable, Awaitable, AsyncIterator, Hashable, Tuple
+from contextlib import asynccontextmanager
 from pydantic import BaseModel, Field
 import asyncio
+import copy
+import inspect
 import logging
+import random
 
-from agents.prompts.base_prompt_caller import BasePromptCaller
+from agents.prompts.base_prompt_caller import BasePromptCaller, LLMRateLimitError, LLMResponse, schema_fingerprint
+from agents.prompts.llm_batch import run_provider_batch, seconds_until
+from agents.prompts.llm_cache import CachedLLMResult, get_llm_result_cache, is_stage_cached, llm_cache_key
+from agents.prompts.llm_concurrency import get_llm_concurrency_limiter
 from config.llm_models import supports_reasoning_effort
 from schemas.llm import ChatMessage, MessageRole
 from schemas.llm import ModelConfig, DEFAULT_MODEL_CONFIG
@@ -62,6 +80,7 @@ class LLMResult(BaseModel):
     data: Union[Dict[str, Any], str, None] = Field(default=None, description="Response data: dict for structured, str for text")
     error: Optional[str] = Field(default=None, description="Error message if call failed")
     usage: LLMUsage = Field(default_factory=LLMUsage, description="Token usage")
+    cached: bool = Field(default=False, description="True if served from the result cache (usage is then zero)")
 
     @property
     def ok(self) -> bool:
@@ -74,6 +93,12 @@ class LLMOptions(BaseModel):
     max_concurrent: int = Field(default=10, description="Max concurrent calls in batch mode")
     on_progress: Optional[Callable[[int, int], Awaitable[None]]] = Field(default=None, description="Async callback(completed, total)")
     log_prompt: bool = Field(default=True, description="Whether to log prompts")
+    stage: Optional[str] = Field(default=None, description="Stage name for per-stage prompt log sampling and result caching")
+    use_cache: Optional[bool] = Field(default=None, description="Force the result cache on/off (default: per LLM_RESULT_CACHE_STAGES)")
+    execution_mode: Literal["realtime", "batch"] = Field(default="realtime", description="'batch' submits batch calls as a provider batch job")
+    batch_deadline: Optional[datetime] = Field(default=None, description="Batch mode: switch to real-time calls when this gets close")
+    resume_batch_id: Optional[str] = Field(default=None, description="Batch mode: provider batch submitted earlier for these items, polled instead of resubmitting")
+    on_batch_submitted: Optional[Callable[[str], Awaitable[None]]] = Field(default=None, description="Batch mode: async callback(batch_id) once a provider batch is submitted")
 
     class Config:
         arbitrary_types_allowed = True
@@ -104,6 +129,207 @@ def _render_template(template: str, values: Dict[str, Any]) -> str:
     return result
 
 
+def _user_chat_message(content: str) -> ChatMessage:
+    """Wrap a rendered user prompt as the single conversation message."""
+    now = datetime.now(timezone.utc)
+    return ChatMessage(
+        id="llm_call",
+        chat_id="llm_call",
+        role=MessageRole.USER,
+        content=content,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _to_llm_result(
+    values: Dict[str, Any],
+    response: LLMResponse,
+    response_schema: Union[Type[BaseModel], Dict[str, Any], None],
+) -> LLMResult:
+    """Convert a parsed prompt caller response into an LLMResult."""
+    llm_response = response.result
+    usage = LLMUsage(
+        prompt_tokens=response.usage.prompt_tokens,
+        completion_tokens=response.usage.completion_tokens,
+        total_tokens=response.usage.total_tokens,
+    )
+
+    # Convert response to appropriate type
+    if response_schema is None:
+        # Text mode - result is already a string
+        data = llm_response
+    else:
+        # Structured mode - convert Pydantic to dict
+        if hasattr(llm_response, 'model_dump'):
+            data = llm_response.model_dump()
+        elif hasattr(llm_response, 'dict'):
+            data = llm_response.dict()
+        else:
+            data = dict(llm_response)
+
+    return LLMResult(
+        input=values,
+        data=data,
+        error=None,
+        usage=usage,
+    )
+
+
+# =============================================================================
+# Prompt Caller Cache
+# =============================================================================
+
+# Callers hold no per-call state (the rendered system message is passed to
+# invoke), so one instance per schema + model settings serves every call.
+_PROMPT_CALLER_CACHE_SIZE = 128
+_prompt_callers: Dict[Tuple[Hashable, ...], BasePromptCaller] = {}
+
+
+def _prompt_caller_key(
+    config: ModelConfig,
+    response_schema: Union[Type[BaseModel], Dict[str, Any], None],
+) -> Tuple[Hashable, ...]:
+    """Cache key: schema identity (fingerprint for JSON schemas) plus model settings."""
+    if isinstance(response_schema, dict):
+        schema_key: Hashable = schema_fingerprint(response_schema)
+    else:
+        schema_key = response_schema
+    return (schema_key, config.model_id, config.temperature, config.reasoning_effort)
+
+
+def _get_prompt_caller(
+    config: ModelConfig,
+    response_schema: Union[Type[BaseModel], Dict[str, Any], None],
+) -> BasePromptCaller:
+    """Get a cached prompt caller for this schema and model config, creating it on first use."""
+    key = _prompt_caller_key(config, response_schema)
+    prompt_caller = _prompt_callers.get(key)
+    if prompt_caller is None:
+        prompt_caller = BasePromptCaller(
+            response_model=response_schema,
+            messages_placeholder=True,
+            model=config.model_id,
+            temperature=config.temperature,
+            reasoning_effort=config.reasoning_effort if supports_reasoning_effort(config.model_id) else None,
+        )
+        if len(_prompt_callers) >= _PROMPT_CALLER_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _prompt_callers.pop(next(iter(_prompt_callers)))
+        _prompt_callers[key] = prompt_caller
+    return prompt_caller
+
+
+# =============================================================================
+# Concurrency and Rate-Limit Backoff
+# =============================================================================
+
+RATE_LIMIT_BACKOFF_BASE_SECONDS = 2.0
+RATE_LIMIT_BACKOFF_MAX_SECONDS = 60.0
+
+
+@asynccontextmanager
+async def _llm_slot(model_id: str, semaphore: Optional[asyncio.Semaphore] = None) -> AsyncIterator[None]:
+    """Hold a batch slot (if any) and a slot from the model's shared adaptive limiter."""
+    limiter = get_llm_concurrency_limiter(model_id)
+    if semaphore is not None:
+        await semaphore.acquire()
+    try:
+        if limiter is not None:
+            async with limiter.slot():
+                yield
+        else:
+            yield
+    finally:
+        if semaphore is not None:
+            semaphore.release()
+
+
+def _rate_limit_backoff(attempt: int, retry_after: Optional[float]) -> float:
+    """Seconds to wait before retrying a rate-limited call."""
+    if retry_after:
+        return min(RATE_LIMIT_BACKOFF_MAX_SECONDS, retry_after) * random.uniform(1.0, 1.25)
+    delay = min(RATE_LIMIT_BACKOFF_MAX_SECONDS, RATE_LIMIT_BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return delay * random.uniform(0.5, 1.5)
+
+
+def _effective_concurrency(model_id: str, max_concurrent: int) -> int:
+    """Concurrency a batch can currently use: its own cap or the model's adaptive limit."""
+    limiter = get_llm_concurrency_limiter(model_id)
+    return min(max_concurrent, limiter.current_limit) if limiter else max_concurrent
+
+
+def _progress_accepts_concurrency(callback: Callable[..., Awaitable[None]]) -> bool:
+    """Whether an on_progress callback takes the optional `concurrency` keyword."""
+    try:
+        params = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.name == "concurrency" or p.kind == inspect.Parameter.VAR_KEYWORD for p in params)
+
+
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+async def _get_cached_results(
+    system_message: str,
+    user_message: str,
+    values_list: List[Dict[str, Any]],
+    config: ModelConfig,
+    response_schema: Union[Type[BaseModel], Dict[str, Any], None],
+    options: LLMOptions,
+) -> Tuple[Optional[List[str]], Dict[int, LLMResult]]:
+    """
+    Look up items in the result cache when enabled for this call's stage.
+
+    Returns:
+        (cache keys per item, or None if caching is off; cached results by item index)
+    """
+    cache = get_llm_result_cache()
+    if cache is None or not is_stage_cached(options.stage, options.use_cache):
+        return None, {}
+
+    keys = [
+        llm_cache_key(
+            config,
+            response_schema,
+            _render_template(system_message, values),
+            _render_template(user_message, values),
+        )
+        for values in values_list
+    ]
+    hits = await cache.get_many(keys)
+    cached = {
+        idx: LLMResult(input=values, data=copy.deepcopy(hits[key].data), cached=True)
+        for idx, (key, values) in enumerate(zip(keys, values_list))
+        if key in hits
+    }
+    return keys, cached
+
+
+async def _store_results(keys: List[str], results: Dict[int, LLMResult], config: ModelConfig) -> None:
+    """Write freshly computed successful results to the result cache."""
+    cache = get_llm_result_cache()
+    if cache is None:
+        return
+    entries = [
+        (
+            keys[idx],
+            config.model_id,
+            CachedLLMResult(
+                data=result.data,
+                prompt_tokens=result.usage.prompt_tokens,
+                completion_tokens=result.usage.completion_tokens,
+                total_tokens=result.usage.total_tokens,
+            ),
+        )
+        for idx, result in results.items()
+        if result.ok and not result.cached and result.data is not None
+    ]
+    await cache.put_many(entries)
+
+
 # =============================================================================
 # Main Interface
 # =============================================================================
@@ -154,7 +380,12 @@ async def call_llm(
             options=opts,
         )
     else:
-        return await _call_llm_single(
+        keys, cached = await _get_cached_results(
+            system_message, user_message, [values], config, response_schema, opts
+        )
+        if cached:
+            return cached[0]
+        result = await _call_llm_single(
             system_message=system_message,
             user_message=user_message,
             values=values,
@@ -162,6 +393,9 @@ async def call_llm(
             response_schema=response_schema,
             options=opts,
         )
+        if keys:
+            await _store_results(keys, {0: result}, config)
+        return result
 
 
 async def _call_llm_single(
@@ -171,68 +405,54 @@ async def _call_llm_single(
     config: ModelConfig,
     response_schema: Union[Type[BaseModel], Dict[str, Any], None],
     options: LLMOptions,
+    prompt_caller: Optional[BasePromptCaller] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
 ) -> LLMResult:
-    """Execute a single LLM call."""
+    """
+    Execute a single LLM call.
+
+    Batch mode passes its shared prompt_caller and its semaphore; the semaphore
+    is released while a rate-limited call waits to be retried.
+    """
+    from config.settings import settings
+
     try:
         # Render templates
         rendered_system = _render_template(system_message, values)
         rendered_user = _render_template(user_message, values)
 
-        # Create prompt caller
-        prompt_caller = BasePromptCaller(
-            response_model=response_schema,
-            system_message=rendered_system,
-            messages_placeholder=True,
-            model=config.model_id,
-            temperature=config.temperature,
-            reasoning_effort=config.reasoning_effort if supports_reasoning_effort(config.model_id) else None,
-        )
+        if prompt_caller is None:
+            prompt_caller = _get_prompt_caller(config, response_schema)
 
         # Build user message
-        chat_message = ChatMessage(
-            id="llm_call",
-            chat_id="llm_call",
-            role=MessageRole.USER,
-            content=rendered_user,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-
-        # Invoke
-        response = await prompt_caller.invoke(
-            messages=[chat_message],
-            return_usage=True,
-            log_prompt=options.log_prompt,
-            max_tokens=config.max_tokens,
-        )
-
-        # Extract result and usage
-        llm_response = response.result
-        usage = LLMUsage(
-            prompt_tokens=response.usage.prompt_tokens,
-            completion_tokens=response.usage.completion_tokens,
-            total_tokens=response.usage.total_tokens,
-        )
-
-        # Convert response to appropriate type
-        if response_schema is None:
-            # Text mode - result is already a string
-            data = llm_response
-        else:
-            # Structured mode - convert Pydantic to dict
-            if hasattr(llm_response, 'model_dump'):
-                data = llm_response.model_dump()
-            elif hasattr(llm_response, 'dict'):
-                data = llm_response.dict()
-            else:
-                data = dict(llm_response)
-
-        return LLMResult(
-            input=values,
-            data=data,
-            error=None,
-            usage=usage,
-        )
+        chat_message = _user_chat_message(rendered_user)
+
+        # Invoke, re-queueing with backoff when rate limited
+        attempt = 0
+        while True:
+            try:
+                async with _llm_slot(config.model_id, semaphore):
+                    response = await prompt_caller.invoke(
+                        messages=[chat_message],
+                        return_usage=True,
+                        log_prompt=options.log_prompt and attempt == 0,
+                        log_stage=options.stage,
+                        max_tokens=config.max_tokens,
+                        system_message=rendered_system,
+                    )
+                break
+            except LLMRateLimitError as e:
+                if attempt >= settings.LLM_RATE_LIMIT_MAX_RETRIES:
+                    raise
+                delay = _rate_limit_backoff(attempt, e.retry_after)
+                attempt += 1
+                logger.warning(
+                    f"LLM call rate limited ({config.model_id}); retry {attempt}/"
+                    f"{settings.LLM_RATE_LIMIT_MAX_RETRIES} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+        return _to_llm_result(values, response, response_schema)
 
     except Exception as e:
         logger.error(f"LLM call failed: {e}", exc_info=True)
@@ -258,38 +478,83 @@ async def _call_llm_batch(
 
     logger.info(f"call_llm batch: {len(values_list)} items, max_concurrent={options.max_concurrent}")
 
+    # Build the caller (and compile the response schema) once for the whole batch
+    try:
+        prompt_caller = _get_prompt_caller(config, response_schema)
+    except Exception as e:
+        logger.error(f"call_llm batch setup failed: {e}", exc_info=True)
+        return [
+            LLMResult(input=values, data=None, error=str(e), usage=LLMUsage())
+            for values in values_list
+        ]
+
+    # Serve what we can from the result cache; only misses go to the LLM
+    cache_keys, results_by_idx = await _get_cached_results(
+        system_message, user_message, values_list, config, response_schema, options
+    )
+    completed = len(results_by_idx)
+    if completed:
+        logger.info(f"call_llm batch: {completed}/{len(values_list)} items served from cache")
+
     semaphore = asyncio.Semaphore(options.max_concurrent)
-    results_by_idx: Dict[int, LLMResult] = {}
-    completed = 0
+    report_concurrency = options.on_progress is not None and _progress_accepts_concurrency(options.on_progress)
 
     async def process_one(idx: int, values: Dict[str, Any]) -> None:
         nonlocal completed
-        async with semaphore:
-            result = await _call_llm_single(
-                system_message=system_message,
-                user_message=user_message,
-                values=values,
-                config=config,
-                response_schema=response_schema,
-                options=LLMOptions(
-                    max_concurrent=options.max_concurrent,
-                    on_progress=None,  # Don't pass progress to individual calls
-                    log_prompt=options.log_prompt,
-                ),
-            )
-            results_by_idx[idx] = result
-
-            completed += 1
-            if options.on_progress:
-                try:
+        result = await _call_llm_single(
+            system_message=system_message,
+            user_message=user_message,
+            values=values,
+            config=config,
+            response_schema=response_schema,
+            options=options,  # on_progress is only used here, never by the single call
+            prompt_caller=prompt_caller,
+            semaphore=semaphore,
+        )
+        results_by_idx[idx] = result
+
+        completed += 1
+        if options.on_progress:
+            try:
+                if report_concurrency:
+                    await options.on_progress(
+                        completed,
+                        len(values_list),
+                        concurrency=_effective_concurrency(config.model_id, options.max_concurrent),
+                    )
+                else:
                     await options.on_progress(completed, len(values_list))
-                except Exception as cb_err:
-                    logger.warning(f"Progress callback failed: {cb_err}")
+            except Exception as cb_err:
+                logger.warning(f"Progress callback failed: {cb_err}")
+
+    # Provider batch mode: send the misses as one batch job; whatever it does
+    # not return (deadline, per-item errors) falls through to real-time calls
+    if options.execution_mode == "batch":
+        batch_results = await _call_llm_provider_batch(
+            system_message=system_message,
+            user_message=user_message,
+            values_by_idx={i: v for i, v in enumerate(values_list) if i not in results_by_idx},
+            config=config,
+            response_schema=response_schema,
+            options=options,
+            prompt_caller=prompt_caller,
+        )
+        results_by_idx.update(batch_results)
+        completed = len(results_by_idx)
+
+    if completed and options.on_progress:
+        try:
+            await options.on_progress(completed, len(values_list))
+        except Exception as cb_err:
+            logger.warning(f"Progress callback failed: {cb_err}")
 
-    # Execute all in parallel with semaphore limiting
-    tasks = [process_one(i, values) for i, values in enumerate(values_list)]
+    # Execute all misses in parallel with semaphore limiting
+    tasks = [process_one(i, values) for i, values in enumerate(values_list) if i not in results_by_idx]
     await asyncio.gather(*tasks, return_exceptions=True)
 
+    if cache_keys:
+        await _store_results(cache_keys, results_by_idx, config)
+
     # Build results in original order
     results = []
     for i in range(len(values_list)):
@@ -306,6 +571,77 @@ async def _call_llm_batch(
 
     succeeded = sum(1 for r in results if r.ok)
     failed = len(results) - succeeded
-    logger.info(f"call_llm batch complete: {succeeded} succeeded, {failed} failed")
+    from_cache = sum(1 for r in results if r.cached)
+    logger.info(
+        f"call_llm batch complete: {succeeded} succeeded, {failed} failed"
+        + (f", {from_cache} from cache" if from_cache else "")
+    )
+
+    return results
 
+
+async def _call_llm_provider_batch(
+    system_message: str,
+    user_message: str,
+    values_by_idx: Dict[int, Dict[str, Any]],
+    config: ModelConfig,
+    response_schema: Union[Type[BaseModel], Dict[str, Any], None],
+    options: LLMOptions,
+    prompt_caller: BasePromptCaller,
+) -> Dict[int, LLMResult]:
+    """
+    Run batch items as one provider batch job.
+
+    Returns results only for items the job completed; the caller runs the rest
+    in real time. Returns {} (all real-time) when the batch is too small, the
+    deadline is already too close, or the job cannot be submitted.
+    """
+    from config.settings import settings
+
+    margin = settings.LLM_BATCH_DEADLINE_MARGIN_MINUTES * 60
+    remaining = seconds_until(options.batch_deadline)
+    if len(values_by_idx) < settings.LLM_BATCH_MIN_ITEMS:
+        return {}
+    if remaining is not None and remaining <= margin:
+        logger.info(f"call_llm batch: deadline in {remaining:.0f}s, using real-time calls")
+        return {}
+
+    try:
+        requests = {
+            idx: prompt_caller.build_request(
+                messages=[_user_chat_message(_render_template(user_message, values))],
+                log_prompt=options.log_prompt,
+                log_stage=options.stage,
+                max_tokens=config.max_tokens,
+                system_message=_render_template(system_message, values),
+            )
+            for idx, values in values_by_idx.items()
+        }
+        outcome = await run_provider_batch(
+            requests,
+            deadline=options.batch_deadline,
+            deadline_margin_seconds=margin,
+            poll_interval_seconds=settings.LLM_BATCH_POLL_SECONDS,
+            stage=options.stage,
+            resume_batch_id=options.resume_batch_id,
+            on_submit=options.on_batch_submitted,
+        )
+    except Exception as e:
+        logger.warning(f"Provider batch failed, falling back to real-time calls: {e}", exc_info=True)
+        return {}
+
+    results: Dict[int, LLMResult] = {}
+    for idx, completion in outcome.responses.items():
+        values = values_by_idx[idx]
+        try:
+            results[idx] = _to_llm_result(values, prompt_caller.parse_response(completion), response_schema)
+        except Exception as e:
+            # Same outcome a real-time call would have had for this response
+            results[idx] = LLMResult(input=values, data=None, error=str(e), usage=LLMUsage())
+
+    fallback = len(values_by_idx) - len(results)
+    logger.info(
+        f"call_llm provider batch {outcome.batch_id} ({outcome.status}): "
+        f"{len(results)} results, {fallback} items left for real-time calls"
+    )
     return results
@@ -0,0 +1,246 @@
+"""
+LLM Provider Batch - Run a whole stage as one OpenAI Batch API job
+
+Scheduled pipeline runs do not need interactive latency. Submitting a stage
+as a batch job costs roughly half of real-time chat completions and does not
+draw on the real-time rate limits during the weekly scheduled burst.
+
+FLOW:
+=====
+1. Upload every request as one JSONL file (custom_id = item index + request digest)
+2. Create a batch against /v1/chat/completions and poll until it finishes
+3. Download the output / error files and map responses back by request digest
+
+RESUMING:
+=========
+on_submit receives the batch ID as soon as the job exists, so the caller can
+persist it. Passing it back as resume_batch_id (e.g. after a worker restart)
+polls that job instead of submitting and paying for the requests again.
+Responses are matched by request digest, so a resumed call may pass fewer
+requests, or different indices, than the original submission; requests the
+job does not cover are left for the real-time path.
+
+DEADLINE:
+=========
+Batches can take hours. If the caller's deadline comes within the safety
+margin while polling, the batch is cancelled; whatever it finished is still
+returned, and call_llm runs the rest as real-time calls. Items the provider
+rejected individually are likewise left for the real-time path.
+
+Testing without the real API: scripts/fake_openai_batch_server.py is a local
+stand-in implementing the files/batches/chat endpoints; point the OpenAI
+client at it with OPENAI_BASE_URL=http://localhost:8099/v1.
+tests/test_llm_provider_batch.py runs this module against it in-process.
+
+Usage:
+    outcome = await run_provider_batch(requests, deadline=deadline, stage="semantic_filter")
+    for idx, completion in outcome.responses.items():
+        ...
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from openai.types import Batch
+from openai.types.chat import ChatCompletion
+
+from agents.prompts.base_prompt_caller import get_shared_openai_client
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+COMPLETION_WINDOW = "24h"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+CANCEL_WAIT_SECONDS = 120.0
+
+# Callback invoked after each poll: (provider-completed count, total)
+BatchPollCallback = Callable[[int, int], Awaitable[None]]
+# Callback invoked once the batch job exists: (batch ID)
+BatchSubmitCallback = Callable[[str], Awaitable[None]]
+
+
+@dataclass
+class ProviderBatchOutcome:
+    """What came back from a batch job. Items in neither dict were not processed."""
+    batch_id: Optional[str] = None
+    status: str = "not_submitted"
+    responses: Dict[int, ChatCompletion] = field(default_factory=dict)
+    errors: Dict[int, str] = field(default_factory=dict)
+
+
+def seconds_until(deadline: Optional[datetime]) -> Optional[float]:
+    """Seconds left before a deadline (None = no deadline)."""
+    if deadline is None:
+        return None
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=timezone.utc)
+    return (deadline - datetime.now(timezone.utc)).total_seconds()
+
+
+async def run_provider_batch(
+    requests: Dict[int, Dict[str, Any]],
+    deadline: Optional[datetime] = None,
+    deadline_margin_seconds: float = 0.0,
+    poll_interval_seconds: float = 30.0,
+    stage: Optional[str] = None,
+    on_poll: Optional[BatchPollCallback] = None,
+    resume_batch_id: Optional[str] = None,
+    on_submit: Optional[BatchSubmitCallback] = None,
+) -> ProviderBatchOutcome:
+    """
+    Submit chat completion requests as one batch job and wait for the results.
+
+    Args:
+        requests: item index -> Chat Completions request body (BasePromptCaller.build_request)
+        deadline: Cancel the batch once less than deadline_margin_seconds remain
+        deadline_margin_seconds: Time reserved for real-time fallback after cancelling
+        poll_interval_seconds: Delay between status checks
+        stage: Stage name, recorded in the batch metadata
+        on_poll: Optional async callback(completed, total) after each status check
+        resume_batch_id: A job submitted earlier for these requests; polled instead of submitting
+        on_submit: Optional async callback(batch_id) once the job is submitted
+
+    Returns:
+        ProviderBatchOutcome with parsed completions and per-item errors by index
+
+    Raises:
+        Exception from the provider if the batch cannot be submitted at all
+    """
+    client = get_shared_openai_client()
+    outcome = ProviderBatchOutcome()
+    if not requests:
+        return outcome
+
+    digests = {idx: _request_digest(body) for idx, body in requests.items()}
+    indices_by_digest: Dict[str, List[int]] = {}
+    for idx, digest in digests.items():
+        indices_by_digest.setdefault(digest, []).append(idx)
+
+    batch = await _resumable_batch(resume_batch_id) if resume_batch_id else None
+    if batch is not None:
+        logger.info(f"Resuming LLM batch {batch.id} ('{batch.status}') for {len(requests)} requests (stage={stage})")
+    else:
+        lines = [
+            json.dumps({"custom_id": f"{idx}:{digests[idx]}", "method": "POST", "url": BATCH_ENDPOINT, "body": body})
+            for idx, body in requests.items()
+        ]
+        input_file = await client.files.create(
+            file=("llm_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=COMPLETION_WINDOW,
+            metadata={"stage": stage or "", "items": str(len(requests))},
+        )
+        logger.info(f"Submitted LLM batch {batch.id}: {len(requests)} requests (stage={stage})")
+        if on_submit:
+            try:
+                await on_submit(batch.id)
+            except Exception as cb_err:
+                logger.warning(f"Batch submit callback failed: {cb_err}")
+    outcome.batch_id = batch.id
+
+    cancel_requested_at: Optional[float] = None
+    loop = asyncio.get_running_loop()
+    while batch.status not in TERMINAL_STATUSES:
+        remaining = seconds_until(deadline)
+        if cancel_requested_at is None and remaining is not None and remaining <= deadline_margin_seconds:
+            logger.warning(f"LLM batch {batch.id} cancelled: deadline in {remaining:.0f}s")
+            batch = await client.batches.cancel(batch.id)
+            cancel_requested_at = loop.time()
+            continue
+        if cancel_requested_at is not None and loop.time() - cancel_requested_at > CANCEL_WAIT_SECONDS:
+            logger.warning(f"LLM batch {batch.id} still '{batch.status}' after cancel; giving up on it")
+            break
+
+        await asyncio.sleep(poll_interval_seconds if cancel_requested_at is None else 5.0)
+        batch = await client.batches.retrieve(batch.id)
+        if on_poll and batch.request_counts:
+            try:
+                await on_poll(batch.request_counts.completed, len(requests))
+            except Exception as cb_err:
+                logger.warning(f"Batch poll callback failed: {cb_err}")
+
+    outcome.status = batch.status
+    counts = batch.request_counts
+    logger.info(
+        f"LLM batch {batch.id} finished with status '{batch.status}'"
+        + (f" ({counts.completed} completed, {counts.failed} failed)" if counts else "")
+    )
+
+    if batch.output_file_id:
+        for record in await _read_jsonl_file(batch.output_file_id):
+            _map_record(record, indices_by_digest, outcome)
+    if batch.error_file_id:
+        for record in await _read_jsonl_file(batch.error_file_id):
+            _map_record(record, indices_by_digest, outcome)
+
+    try:
+        await client.files.delete(batch.input_file_id)
+    except Exception as e:
+        logger.debug(f"Could not delete batch input file {batch.input_file_id}: {e}")
+
+    return outcome
+
+
+def _request_digest(body: Dict[str, Any]) -> str:
+    """Stable digest of a request body, used to match batch responses to requests."""
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+async def _resumable_batch(batch_id: str) -> Optional[Batch]:
+    """The earlier job if it can still deliver results, else None (submit a new one)."""
+    try:
+        batch = await get_shared_openai_client().batches.retrieve(batch_id)
+    except Exception as e:
+        logger.warning(f"Could not retrieve LLM batch {batch_id} to resume it: {e}")
+        return None
+    if batch.status == "failed" or batch.endpoint != BATCH_ENDPOINT:
+        logger.info(f"LLM batch {batch_id} is '{batch.status}', submitting a new one")
+        return None
+    return batch
+
+
+async def _read_jsonl_file(file_id: str) -> List[Dict[str, Any]]:
+    content = await get_shared_openai_client().files.content(file_id)
+    return [json.loads(line) for line in content.text.splitlines() if line.strip()]
+
+
+def _map_record(
+    record: Dict[str, Any],
+    indices_by_digest: Dict[str, List[int]],
+    outcome: ProviderBatchOutcome,
+) -> None:
+    """Sort one output/error line into responses or errors for every item with its request digest."""
+    custom_id = record.get("custom_id")
+    _, _, digest = str(custom_id).partition(":")
+    if not digest:
+        logger.warning(f"Ignoring batch record without a valid custom_id: {custom_id!r}")
+        return
+    indices = indices_by_digest.get(digest, [])
+
+    response = record.get("response") or {}
+    body = response.get("body") or {}
+    if response.get("status_code") == 200 and not record.get("error"):
+        try:
+            completion = ChatCompletion.model_validate(body)
+        except Exception as e:
+            for idx in indices:
+                outcome.errors[idx] = f"Invalid completion in batch output: {e}"
+            return
+        for idx in indices:
+            outcome.responses[idx] = completion
+        return
+
+    error = record.get("error") or body.get("error") or {}
+    message = error.get("message") if isinstance(error, dict) else str(error)
+    for idx in indices:
+        outcome.errors[idx] = message or "Batch request failed"
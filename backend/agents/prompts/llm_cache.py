@@ -0,0 +1,303 @@
+"""
+LLM Result Cache - Cross-run memoization for call_llm
+
+Re-running a stream, or previewing prompts in the retrieval and prompt
+testing workbenches, sends the exact same requests to the LLM again: same
+model settings, same rendered prompts, same response schema. This cache
+keeps successful results on disk so those repeats cost nothing.
+
+KEYING:
+=======
+SHA-256 over the model config (model, temperature, max_tokens,
+reasoning_effort), the response schema, and the rendered system and user
+messages - i.e. the templates with their values substituted. Any change to
+a prompt, an article field or a model setting is a different key.
+
+OPT-IN:
+=======
+Only calls whose LLMOptions.stage is listed in LLM_RESULT_CACHE_STAGES are
+cached (LLMOptions.use_cache=True/False overrides that per call). The list is
+empty by default, so pipeline runs only cache when a deployment names their
+stages; the testing workbenches pass use_cache=True. Cached
+results come back with cached=True and zero usage; the tokens the original
+call spent are counted in stats.tokens_saved.
+
+EVICTION:
+=========
+Entries expire after LLM_RESULT_CACHE_TTL_HOURS. Beyond
+LLM_RESULT_CACHE_MAX_ENTRIES the least recently used entries are removed.
+
+Like the PubMed article cache this is a single SQLite file per host; calls
+run in a worker thread.
+
+Usage:
+    cache = get_llm_result_cache()
+    key = llm_cache_key(config, response_schema, rendered_system, rendered_user)
+    hits = await cache.get_many([key])
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from schemas.llm import ModelConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedLLMResult:
+    """A stored result: response data plus the usage the original call spent."""
+    data: Union[Dict[str, Any], str]
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+
+@dataclass
+class LLMResultCacheStats:
+    """Counters for cache effectiveness since process start."""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    errors: int = 0
+    tokens_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+def llm_cache_key(
+    config: ModelConfig,
+    response_schema: Union[Type[BaseModel], Dict[str, Any], None],
+    rendered_system: str,
+    rendered_user: str,
+) -> str:
+    """Cache key for one call: model settings, response schema and rendered prompts."""
+    if response_schema is None:
+        schema: Any = None
+    elif isinstance(response_schema, dict):
+        schema = response_schema
+    else:
+        schema = response_schema.model_json_schema()
+    reasoning_effort = config.reasoning_effort
+    payload = json.dumps(
+        {
+            "model": config.model_id,
+            "temperature": config.temperature,
+            "max_tokens": config.max_tokens,
+            "reasoning_effort": getattr(reasoning_effort, "value", reasoning_effort),
+            "schema": schema,
+            "system": rendered_system,
+            "user": rendered_user,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResultCache:
+    """SQLite-backed cache of successful call_llm results with TTL and LRU eviction."""
+
+    def __init__(self, path: str, ttl_hours: int = 720, max_entries: int = 200000):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.stats = LLMResultCacheStats()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # =========================================================================
+    # Public API (async)
+    # =========================================================================
+
+    async def get_many(self, keys: List[str]) -> Dict[str, CachedLLMResult]:
+        """Look up keys. Returns hits keyed by cache key; anything missing is a miss."""
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+        try:
+            hits = await asyncio.to_thread(self._get_many_sync, unique)
+        except Exception as e:
+            logger.warning(f"LLM result cache read failed, treating as miss: {e}")
+            self.stats.errors += 1
+            hits = {}
+
+        for key in keys:
+            if key in hits:
+                self.stats.hits += 1
+                self.stats.tokens_saved += hits[key].total_tokens
+            else:
+                self.stats.misses += 1
+        return hits
+
+    async def put_many(self, entries: List[Tuple[str, str, CachedLLMResult]]) -> None:
+        """Store (key, model_id, result) entries. Failures are logged, never raised."""
+        if not entries:
+            return
+        try:
+            evicted = await asyncio.to_thread(self._put_many_sync, entries)
+            self.stats.stores += len(entries)
+            self.stats.evictions += evicted
+        except Exception as e:
+            logger.warning(f"LLM result cache write failed: {e}")
+            self.stats.errors += 1
+
+    # =========================================================================
+    # SQLite internals (run in worker thread)
+    # =========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_results (
+                    cache_key TEXT PRIMARY KEY,
+                    model_id TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    prompt_tokens INTEGER NOT NULL,
+                    completion_tokens INTEGER NOT NULL,
+                    total_tokens INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_llm_results_last_used ON llm_results (last_used_at)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get_many_sync(self, keys: List[str]) -> Dict[str, CachedLLMResult]:
+        now = time.time()
+        cutoff = now - self.ttl_seconds
+        hits: Dict[str, CachedLLMResult] = {}
+        with self._lock:
+            conn = self._connect()
+            # SQLite caps bound parameters at 999 on older builds
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT cache_key, payload, prompt_tokens, completion_tokens, total_tokens "
+                    f"FROM llm_results WHERE cache_key IN ({placeholders}) AND created_at >= ?",
+                    (*chunk, cutoff),
+                ).fetchall()
+                for key, payload, prompt_tokens, completion_tokens, total_tokens in rows:
+                    hits[key] = CachedLLMResult(
+                        data=json.loads(payload),
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        total_tokens=total_tokens,
+                    )
+            if hits:
+                conn.executemany(
+                    "UPDATE llm_results SET last_used_at = ? WHERE cache_key = ?",
+                    [(now, key) for key in hits],
+                )
+                conn.commit()
+        return hits
+
+    def _put_many_sync(self, entries: List[Tuple[str, str, CachedLLMResult]]) -> int:
+        now = time.time()
+        rows = [
+            (
+                key,
+                model_id,
+                json.dumps(result.data),
+                result.prompt_tokens,
+                result.completion_tokens,
+                result.total_tokens,
+                now,
+                now,
+            )
+            for key, model_id, result in entries
+        ]
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO llm_results "
+                "(cache_key, model_id, payload, prompt_tokens, completion_tokens, total_tokens, "
+                "created_at, last_used_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            evicted = conn.execute(
+                "DELETE FROM llm_results WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+            excess = conn.execute("SELECT COUNT(*) FROM llm_results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                evicted += conn.execute(
+                    "DELETE FROM llm_results WHERE cache_key IN ("
+                    "SELECT cache_key FROM llm_results ORDER BY last_used_at LIMIT ?)",
+                    (excess,),
+                ).rowcount
+            conn.commit()
+        return evicted
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# =============================================================================
+# Process-wide instance
+# =============================================================================
+
+_cache: Optional[LLMResultCache] = None
+
+
+def get_llm_result_cache() -> Optional[LLMResultCache]:
+    """Get the shared result cache, or None if disabled in settings."""
+    global _cache
+    from config.settings import settings
+
+    if not settings.LLM_RESULT_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = LLMResultCache(
+            path=settings.LLM_RESULT_CACHE_PATH,
+            ttl_hours=settings.LLM_RESULT_CACHE_TTL_HOURS,
+            max_entries=settings.LLM_RESULT_CACHE_MAX_ENTRIES,
+        )
+        logger.info(
+            f"LLM result cache at {settings.LLM_RESULT_CACHE_PATH} "
+            f"(ttl={settings.LLM_RESULT_CACHE_TTL_HOURS}h, max_entries={settings.LLM_RESULT_CACHE_MAX_ENTRIES})"
+        )
+    return _cache
+
+
+def is_stage_cached(stage: Optional[str], use_cache: Optional[bool] = None) -> bool:
+    """Whether results for this stage should go through the cache."""
+    from config.settings import settings
+
+    if use_cache is not None:
+        return use_cache
+    if not stage:
+        return False
+    enabled = {s.strip() for s in settings.LLM_RESULT_CACHE_STAGES.split(",") if s.strip()}
+    return stage in enabled
@@ -0,0 +1,171 @@
+"""
+Adaptive LLM concurrency - one AIMD limiter per model, shared process-wide.
+
+A fixed per-batch semaphore knows nothing about other batches: two pipelines
+running together in the worker either under-use the provider quota or burst
+into a wall of 429s. Every call_llm request now also takes a slot from the
+limiter for its model, which adjusts the limit from feedback:
+
+    success             additive increase (+1 per limit's worth of successes)
+    slow success        multiplicative decrease (x0.9) when latency exceeds
+                        LATENCY_TOLERANCE x the model's baseline latency
+    rate limited (429)  multiplicative decrease (x0.5)
+
+Decreases are rate-limited by DECREASE_COOLDOWN_SECONDS so that one burst of
+429s from the same window halves the limit once, not once per request.
+
+The per-batch max_concurrent still applies as an upper bound for that batch.
+
+Usage:
+    limiter = get_llm_concurrency_limiter("gpt-4.1")
+    if limiter:
+        async with limiter.slot():
+            response = await prompt_caller.invoke(...)
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Dict, Optional, Union
+
+from agents.prompts.base_prompt_caller import LLMRateLimitError
+
+logger = logging.getLogger(__name__)
+
+LATENCY_TOLERANCE = 3.0
+LATENCY_DECREASE_FACTOR = 0.9
+RATE_LIMIT_DECREASE_FACTOR = 0.5
+DECREASE_COOLDOWN_SECONDS = 2.0
+BASELINE_DRIFT = 0.05  # How fast the latency baseline creeps up towards slower calls
+
+
+@dataclass
+class AdaptiveLimiterStats:
+    """Counters for one model's limiter since process start."""
+    successes: int = 0
+    rate_limited: int = 0
+    slow_responses: int = 0
+    decreases: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter driven by rate-limit responses and latency."""
+
+    def __init__(self, name: str, initial: int, min_limit: int, max_limit: int):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.in_flight = 0
+        self.stats = AdaptiveLimiterStats()
+        self._baseline_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def current_limit(self) -> int:
+        return int(self.limit)
+
+    def _get_condition(self) -> asyncio.Condition:
+        # asyncio primitives belong to one event loop; start fresh on a new loop
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    async def acquire(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < self.current_limit)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for a call, feeding its outcome back into the limit."""
+        await self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except LLMRateLimitError:
+            self.record_rate_limited()
+            raise
+        else:
+            self.record_success(time.monotonic() - start)
+        finally:
+            await self.release()
+
+    def record_success(self, latency: float) -> None:
+        self.stats.successes += 1
+        baseline = self._baseline_latency
+        if baseline is None or latency < baseline:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency = baseline + BASELINE_DRIFT * (latency - baseline)
+
+        if baseline is not None and latency > LATENCY_TOLERANCE * baseline:
+            self.stats.slow_responses += 1
+            self._decrease(LATENCY_DECREASE_FACTOR, f"latency {latency:.1f}s vs baseline {baseline:.1f}s")
+        else:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def record_rate_limited(self) -> None:
+        self.stats.rate_limited += 1
+        self._decrease(RATE_LIMIT_DECREASE_FACTOR, "rate limited")
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        previous = self.current_limit
+        self.limit = max(float(self.min_limit), self.limit * factor)
+        self.stats.decreases += 1
+        logger.info(f"LLM concurrency for {self.name}: {previous} -> {self.current_limit} ({reason})")
+
+    def to_dict(self) -> Dict[str, Union[int, float, None]]:
+        return {
+            "limit": self.current_limit,
+            "in_flight": self.in_flight,
+            "baseline_latency": round(self._baseline_latency, 3) if self._baseline_latency else None,
+            **self.stats.to_dict(),
+        }
+
+
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_llm_concurrency_limiter(model_id: str) -> Optional[AdaptiveConcurrencyLimiter]:
+    """Get the shared limiter for a model, or None if adaptive concurrency is disabled."""
+    from config.settings import settings
+
+    if not settings.LLM_ADAPTIVE_CONCURRENCY_ENABLED:
+        return None
+    limiter = _limiters.get(model_id)
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(
+            name=model_id,
+            initial=settings.LLM_CONCURRENCY_INITIAL,
+            min_limit=settings.LLM_CONCURRENCY_MIN,
+            max_limit=settings.LLM_CONCURRENCY_MAX,
+        )
+        _limiters[model_id] = limiter
+    return limiter
+
+
+def get_llm_concurrency_stats() -> Dict[str, Dict[str, Union[int, float, None]]]:
+    """Current limit and counters for every model seen so far."""
+    return {model_id: limiter.to_dict() for model_id, limiter in _limiters.items()}
@@ -71,6 +71,94 @@ class Settings(BaseSettings):
     GOOGLE_SCHOLAR_MAX_RESULTS_PER_CALL: int = int(os.getenv("GOOGLE_SCHOLAR_MAX_RESULTS_PER_CALL", "20"))
     PUBMED_MAX_RESULTS_PER_CALL: int = int(os.getenv("PUBMED_MAX_RESULTS_PER_CALL", "10000"))
 
+    # PubMed article cache (parsed efetch records, keyed by PMID + DateRevised)
+    PUBMED_ARTICLE_CACHE_ENABLED: bool = os.getenv("PUBMED_ARTICLE_CACHE_ENABLED", "true").lower() == "true"
+    PUBMED_ARTICLE_CACHE_PATH: str = os.getenv("PUBMED_ARTICLE_CACHE_PATH", "cache/pubmed_articles.sqlite3")
+    PUBMED_ARTICLE_CACHE_TTL_HOURS: int = int(os.getenv("PUBMED_ARTICLE_CACHE_TTL_HOURS", "168"))
+
+    # NCBI request budget (0 = NCBI default: 10 req/s with API key, 3 without)
+    NCBI_MAX_REQUESTS_PER_SECOND: float = float(os.getenv("NCBI_MAX_REQUESTS_PER_SECOND", "0"))
+    PUBMED_EFETCH_MAX_CONCURRENCY: int = int(os.getenv("PUBMED_EFETCH_MAX_CONCURRENCY", "4"))
+
+    # PMC full text (content-addressed store + bounded-concurrency fetcher)
+    PMC_FULL_TEXT_CACHE_ENABLED: bool = os.getenv("PMC_FULL_TEXT_CACHE_ENABLED", "true").lower() == "true"
+    PMC_FULL_TEXT_CACHE_PATH: str = os.getenv("PMC_FULL_TEXT_CACHE_PATH", "cache/pmc_full_text.sqlite3")
+    PMC_FULL_TEXT_MAX_CONCURRENCY: int = int(os.getenv("PMC_FULL_TEXT_MAX_CONCURRENCY", "5"))
+    # Fetch full text after the semantic filter (included articles only) instead of at retrieval
+    PIPELINE_LAZY_FULL_TEXT: bool = os.getenv("PIPELINE_LAZY_FULL_TEXT", "true").lower() == "true"
+    # Concurrent retrieval units per source type (queries and web sources fan out within these limits)
+    RETRIEVAL_PUBMED_MAX_CONCURRENCY: int = int(os.getenv("RETRIEVAL_PUBMED_MAX_CONCURRENCY", "3"))
+    RETRIEVAL_FEED_MAX_CONCURRENCY: int = int(os.getenv("RETRIEVAL_FEED_MAX_CONCURRENCY", "8"))
+    RETRIEVAL_SITE_MAX_CONCURRENCY: int = int(os.getenv("RETRIEVAL_SITE_MAX_CONCURRENCY", "2"))
+    # Streaming pipeline: articles flow retrieval -> filter -> enrich through bounded queues.
+    # Work is handed on per retrieval unit (query or web source): the filter starts on a unit
+    # once it is fully stored, so a stream with a single broad query gains no overlap there.
+    PIPELINE_STREAMING_ENABLED: bool = os.getenv("PIPELINE_STREAMING_ENABLED", "false").lower() == "true"
+    PIPELINE_STREAMING_QUEUE_SIZE: int = int(os.getenv("PIPELINE_STREAMING_QUEUE_SIZE", "8"))
+    PIPELINE_STREAMING_CHUNK_SIZE: int = int(os.getenv("PIPELINE_STREAMING_CHUNK_SIZE", "25"))
+    PIPELINE_STREAMING_FILTER_WORKERS: int = int(os.getenv("PIPELINE_STREAMING_FILTER_WORKERS", "2"))
+    PIPELINE_STREAMING_ENRICH_WORKERS: int = int(os.getenv("PIPELINE_STREAMING_ENRICH_WORKERS", "4"))
+    # One LLM call per article for summary + stance + category (when the three stages share a model)
+    PIPELINE_FUSED_ENRICHMENT_ENABLED: bool = os.getenv("PIPELINE_FUSED_ENRICHMENT_ENABLED", "false").lower() == "true"
+
+    # Within-execution near-duplicate detection (MinHash/LSH over normalized title + first author).
+    # Opt-in until validated against recorded executions.
+    PIPELINE_NEAR_DUP_ENABLED: bool = os.getenv("PIPELINE_NEAR_DUP_ENABLED", "false").lower() == "true"
+    PIPELINE_NEAR_DUP_THRESHOLD: float = float(os.getenv("PIPELINE_NEAR_DUP_THRESHOLD", "0.85"))
+    PIPELINE_NEAR_DUP_NUM_PERM: int = int(os.getenv("PIPELINE_NEAR_DUP_NUM_PERM", "64"))
+    PIPELINE_NEAR_DUP_BANDS: int = int(os.getenv("PIPELINE_NEAR_DUP_BANDS", "16"))
+
+    # WipArticle writes: multi-row INSERT chunks (stay under MySQL max_allowed_packet)
+    WIP_INSERT_MAX_ROWS: int = int(os.getenv("WIP_INSERT_MAX_ROWS", "500"))
+    WIP_INSERT_MAX_CHUNK_BYTES: int = int(os.getenv("WIP_INSERT_MAX_CHUNK_BYTES", str(4 * 1024 * 1024)))
+    # Store WipArticle full text compressed in wip_article_full_texts instead of wip_articles.full_text
+    WIP_FULL_TEXT_SIDE_TABLE: bool = os.getenv("WIP_FULL_TEXT_SIDE_TABLE", "false").lower() == "true"
+
+    # Pooled HTTP client for NCBI/PMC calls
+    NCBI_HTTP2_ENABLED: bool = os.getenv("NCBI_HTTP2_ENABLED", "true").lower() == "true"
+    NCBI_HTTP_MAX_CONNECTIONS: int = int(os.getenv("NCBI_HTTP_MAX_CONNECTIONS", "20"))
+    NCBI_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("NCBI_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    NCBI_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("NCBI_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+
+    # Adaptive LLM concurrency (AIMD limiter per model, shared by all batches in the process)
+    LLM_ADAPTIVE_CONCURRENCY_ENABLED: bool = os.getenv("LLM_ADAPTIVE_CONCURRENCY_ENABLED", "true").lower() == "true"
+    LLM_CONCURRENCY_INITIAL: int = int(os.getenv("LLM_CONCURRENCY_INITIAL", "16"))
+    LLM_CONCURRENCY_MIN: int = int(os.getenv("LLM_CONCURRENCY_MIN", "1"))
+    LLM_CONCURRENCY_MAX: int = int(os.getenv("LLM_CONCURRENCY_MAX", "64"))
+    LLM_RATE_LIMIT_MAX_RETRIES: int = int(os.getenv("LLM_RATE_LIMIT_MAX_RETRIES", "6"))
+
+    # LLM result cache (cross-run memoization under call_llm, opt-in per stage)
+    LLM_RESULT_CACHE_ENABLED: bool = os.getenv("LLM_RESULT_CACHE_ENABLED", "true").lower() == "true"
+    LLM_RESULT_CACHE_PATH: str = os.getenv("LLM_RESULT_CACHE_PATH", "cache/llm_results.sqlite3")
+    LLM_RESULT_CACHE_TTL_HOURS: int = int(os.getenv("LLM_RESULT_CACHE_TTL_HOURS", "720"))
+    LLM_RESULT_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_RESULT_CACHE_MAX_ENTRIES", "200000"))
+    LLM_RESULT_CACHE_STAGES: str = os.getenv("LLM_RESULT_CACHE_STAGES", "")  # e.g. "semantic_filter,article_summary"; workbenches opt in per call
+
+    # Provider batch API for scheduled pipeline runs (opt-in; real-time fallback near the deadline).
+    # A run waiting on a batch holds one of the WORKER_MAX_CONCURRENT_JOBS slots until its deadline.
+    LLM_BATCH_MODE_ENABLED: bool = os.getenv("LLM_BATCH_MODE_ENABLED", "false").lower() == "true"
+    LLM_BATCH_MIN_ITEMS: int = int(os.getenv("LLM_BATCH_MIN_ITEMS", "20"))
+    LLM_BATCH_POLL_SECONDS: float = float(os.getenv("LLM_BATCH_POLL_SECONDS", "30"))
+    LLM_BATCH_MAX_WAIT_MINUTES: int = int(os.getenv("LLM_BATCH_MAX_WAIT_MINUTES", "90"))  # Per pipeline run
+    LLM_BATCH_DEADLINE_MARGIN_MINUTES: int = int(os.getenv("LLM_BATCH_DEADLINE_MARGIN_MINUTES", "30"))
+
+    # Prompt logging (queued to a background writer; per-stage rates override the global rate, 0 disables)
+    PROMPT_LOG_ENABLED: bool = os.getenv("PROMPT_LOG_ENABLED", "true").lower() == "true"
+    PROMPT_LOG_FORMAT: str = os.getenv("PROMPT_LOG_FORMAT", "jsonl")  # Options: "jsonl" (rotating) or "markdown" (file per prompt)
+    PROMPT_LOG_DIR: str = os.getenv("PROMPT_LOG_DIR", "logs/prompts")
+    PROMPT_LOG_SAMPLE_RATE: float = float(os.getenv("PROMPT_LOG_SAMPLE_RATE", "1.0"))
+    PROMPT_LOG_STAGE_SAMPLE_RATES: str = os.getenv("PROMPT_LOG_STAGE_SAMPLE_RATES", "")  # e.g. "semantic_filter=0.05,article_summary=0"
+    PROMPT_LOG_MAX_BYTES: int = int(os.getenv("PROMPT_LOG_MAX_BYTES", str(50 * 1024 * 1024)))
+    PROMPT_LOG_BACKUP_COUNT: int = int(os.getenv("PROMPT_LOG_BACKUP_COUNT", "10"))
+    PROMPT_LOG_QUEUE_SIZE: int = int(os.getenv("PROMPT_LOG_QUEUE_SIZE", "10000"))
+
+    # Chat agent: provider prompt caching of tool schemas, stable system prompt segments and the conversation
+    CHAT_PROMPT_CACHE_ENABLED: bool = os.getenv("CHAT_PROMPT_CACHE_ENABLED", "true").lower() == "true"
+    # In-process cache of chat_config / help overrides used to build the chat system prompt (0 disables)
+    CHAT_CONFIG_CACHE_TTL_SECONDS: int = int(os.getenv("CHAT_CONFIG_CACHE_TTL_SECONDS", "60"))
+    # Agent loops: side-effect-free tool calls of one model turn run concurrently, up to this many at a time (1 disables)
+    AGENT_MAX_PARALLEL_TOOLS: int = int(os.getenv("AGENT_MAX_PARALLEL_TOOLS", "4"))
+
     # Key Author Cross-Reference Settings
     KEY_AUTHOR_CROSSREF_FETCH_LIMIT: int = int(os.getenv("KEY_AUTHOR_CROSSREF_FETCH_LIMIT", "100"))
     
@@ -79,6 +167,14 @@ class Settings(BaseSettings):
 
     # Worker Service URL (for pipeline execution)
     WORKER_URL: str = os.getenv("WORKER_URL", "http://localhost:8002")
+    # Worker job scheduling: manual runs before resumed and scheduled ones, fair share across
+    # organizations, admission by estimated articles in flight (0 = no per-org cap / no budget)
+    WORKER_POLL_INTERVAL_SECONDS: int = int(os.getenv("WORKER_POLL_INTERVAL_SECONDS", "30"))
+    WORKER_MAX_CONCURRENT_JOBS: int = int(os.getenv("WORKER_MAX_CONCURRENT_JOBS", "4"))
+    WORKER_MAX_JOBS_PER_ORG: int = int(os.getenv("WORKER_MAX_JOBS_PER_ORG", "0"))
+    WORKER_ARTICLE_BUDGET: int = int(os.getenv("WORKER_ARTICLE_BUDGET", "3000"))
+    WORKER_DEFAULT_ARTICLE_ESTIMATE: int = int(os.getenv("WORKER_DEFAULT_ARTICLE_ESTIMATE", "500"))
+    WORKER_ARTICLE_ESTIMATE_RUNS: int = int(os.getenv("WORKER_ARTICLE_ESTIMATE_RUNS", "3"))
 
     # Environment
     IS_PRODUCTION: bool = _is_production
@@ -135,6 +135,16 @@ async def startup_event():
     #logger.info(f"ACCESS_TOKEN_EXPIRE_MINUTES value: {settings.ACCESS_TOKEN_EXPIRE_MINUTES}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    from services.ncbi_http_client import close_ncbi_http_client
+    from utils.prompt_logger import close_prompt_log_writer
+
+    logger.info("Application shutting down...")
+    await close_ncbi_http_client()
+    close_prompt_log_writer()
+
+
 @app.get("/")
 async def root():
     """Root endpoint - redirects to API health check"""
@@ -0,0 +1,64 @@
+"""
+Migration: Add checkpoint columns to pipeline_executions
+
+Adds columns used to resume interrupted pipeline runs:
+- checkpoints: JSON of completed stages and their results (see PipelineService.run_pipeline)
+- worker_id: Worker instance running the execution (NULL for direct runs), so a
+  restarted worker can tell which RUNNING executions it orphaned
+
+Run with: python migrations/add_checkpoints_to_pipeline_executions.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from sqlalchemy import create_engine, text
+from config.settings import settings
+
+
+def run_migration():
+    """Add checkpoints and worker_id columns to pipeline_executions table."""
+    engine = create_engine(settings.DATABASE_URL)
+
+    with engine.connect() as conn:
+        print("Adding checkpoint columns to pipeline_executions table...")
+
+        # Check if columns already exist
+        result = conn.execute(text("""
+            SELECT COLUMN_NAME
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = 'pipeline_executions'
+            AND COLUMN_NAME IN ('checkpoints', 'worker_id')
+        """))
+        existing_columns = [row[0] for row in result]
+
+        if 'checkpoints' not in existing_columns:
+            print("  Adding checkpoints column...")
+            conn.execute(text("""
+                ALTER TABLE pipeline_executions
+                ADD COLUMN checkpoints JSON NULL
+            """))
+        else:
+            print("  checkpoints column already exists, skipping")
+
+        if 'worker_id' not in existing_columns:
+            print("  Adding worker_id column...")
+            conn.execute(text("""
+                ALTER TABLE pipeline_executions
+                ADD COLUMN worker_id VARCHAR(255) NULL
+            """))
+        else:
+            print("  worker_id column already exists, skipping")
+
+        conn.commit()
+        print("\nMigration completed successfully!")
+        print("Added columns: checkpoints, worker_id")
+
+
+if __name__ == "__main__":
+    run_migration()
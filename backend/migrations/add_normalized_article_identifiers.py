@@ -0,0 +1,134 @@
+"""
+Migration: Add normalized identifier columns to articles and wip_articles
+
+Historical deduplication used to join wip_articles to articles on
+OR(pmid = pmid, LOWER(doi) = LOWER(doi)), which cannot use the pmid/doi
+indexes. This migration adds, on both tables:
+
+- doi_normalized: lowercased DOI without resolver prefix (indexed)
+- title_hash: SHA-1 of the normalized title, NULL for titles too generic to
+  identify an article (indexed)
+
+and backfills them (and canonical pmid values) with the same functions the
+application uses on insert (utils/article_identifiers.py). Safe to re-run:
+the backfill only rewrites rows whose values differ.
+
+Run with: python migrations/add_normalized_article_identifiers.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from sqlalchemy import create_engine, text
+from config.settings import settings
+from utils.article_identifiers import normalize_doi, normalize_pmid, title_hash
+
+BATCH_SIZE = 5000
+
+# (table, primary key column)
+TABLES = [("articles", "article_id"), ("wip_articles", "id")]
+
+
+def column_exists(conn, table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table."""
+    result = conn.execute(text("""
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_schema = DATABASE()
+        AND table_name = :table_name
+        AND column_name = :column_name
+    """), {"table_name": table_name, "column_name": column_name})
+    return result.fetchone() is not None
+
+
+def index_exists(conn, index_name: str) -> bool:
+    """Check if an index exists."""
+    result = conn.execute(text("""
+        SELECT index_name
+        FROM information_schema.statistics
+        WHERE table_schema = DATABASE()
+        AND index_name = :index_name
+        LIMIT 1
+    """), {"index_name": index_name})
+    return result.fetchone() is not None
+
+
+def add_columns(conn, table: str) -> None:
+    """Add doi_normalized / title_hash and their indexes (named as SQLAlchemy names index=True)."""
+    for column, column_type in (("doi_normalized", "VARCHAR(255)"), ("title_hash", "VARCHAR(40)")):
+        if not column_exists(conn, table, column):
+            print(f"Adding '{column}' column to {table}...")
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type} DEFAULT NULL"))
+        else:
+            print(f"Column '{table}.{column}' already exists")
+
+        index_name = f"ix_{table}_{column}"
+        if not index_exists(conn, index_name):
+            print(f"Creating index '{index_name}'...")
+            conn.execute(text(f"CREATE INDEX {index_name} ON {table}({column})"))
+        else:
+            print(f"Index '{index_name}' already exists")
+    conn.commit()
+
+
+def backfill(conn, table: str, key: str) -> None:
+    """Fill doi_normalized / title_hash and canonicalize pmid, in primary-key batches."""
+    print(f"Backfilling {table}...")
+    last_id = 0
+    updated = 0
+    while True:
+        rows = conn.execute(text(f"""
+            SELECT {key}, pmid, doi, title, doi_normalized, title_hash
+            FROM {table}
+            WHERE {key} > :last_id
+            ORDER BY {key}
+            LIMIT :batch_size
+        """), {"last_id": last_id, "batch_size": BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+
+        changes = []
+        for row_id, pmid, doi, title, current_doi, current_hash in rows:
+            values = {
+                "id": row_id,
+                "pmid": normalize_pmid(pmid),
+                "doi_normalized": normalize_doi(doi),
+                "title_hash": title_hash(title),
+            }
+            if (values["pmid"], values["doi_normalized"], values["title_hash"]) != (pmid, current_doi, current_hash):
+                changes.append(values)
+        if changes:
+            conn.execute(text(f"""
+                UPDATE {table}
+                SET pmid = :pmid, doi_normalized = :doi_normalized, title_hash = :title_hash
+                WHERE {key} = :id
+            """), changes)
+            conn.commit()
+            updated += len(changes)
+
+        last_id = rows[-1][0]
+        print(f"  ... up to {key} {last_id}: {updated} rows updated")
+
+    print(f"Backfilled {updated} rows in {table}")
+
+
+def run_migration():
+    """Add and backfill normalized identifier columns."""
+    engine = create_engine(settings.DATABASE_URL)
+
+    with engine.connect() as conn:
+        print("Starting normalized article identifiers migration...")
+
+        for table, key in TABLES:
+            add_columns(conn, table)
+            backfill(conn, table, key)
+
+        print("\nMigration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
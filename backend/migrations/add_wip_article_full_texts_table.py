@@ -0,0 +1,64 @@
+"""
+Migration: Add wip_article_full_texts table
+
+Side table for WipArticle full text (enabled with WIP_FULL_TEXT_SIDE_TABLE).
+PMC full text is stored zlib-compressed, one row per WipArticle, so the hot
+wip_articles rows read by dedup / filtering / promotion stay small.
+
+Existing wip_articles.full_text values are left in place; they are still
+read when present.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from sqlalchemy import create_engine, text
+from config.settings import settings
+
+
+def table_exists(conn, table_name: str) -> bool:
+    """Check if a table exists."""
+    result = conn.execute(text("""
+        SELECT table_name
+        FROM information_schema.tables
+        WHERE table_schema = DATABASE()
+        AND table_name = :table_name
+    """), {"table_name": table_name})
+    return result.fetchone() is not None
+
+
+def run_migration():
+    """Create wip_article_full_texts table."""
+    engine = create_engine(settings.DATABASE_URL)
+
+    with engine.connect() as conn:
+        print("Starting wip_article_full_texts migration...")
+
+        if not table_exists(conn, 'wip_article_full_texts'):
+            print("Creating 'wip_article_full_texts' table...")
+            conn.execute(text("""
+                CREATE TABLE wip_article_full_texts (
+                    wip_article_id INT PRIMARY KEY,
+                    content LONGBLOB NOT NULL,
+                    text_length INT NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+
+                    CONSTRAINT fk_wip_article_full_texts_wip_article
+                        FOREIGN KEY (wip_article_id) REFERENCES wip_articles(id) ON DELETE CASCADE
+                )
+            """))
+            print("Created 'wip_article_full_texts' table")
+        else:
+            print("Table 'wip_article_full_texts' already exists")
+
+        conn.commit()
+        print("\nMigration completed successfully!")
+        print("\nSet WIP_FULL_TEXT_SIDE_TABLE=true to store new WipArticle full text there.")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Date, Enum, JSON, Boolean, Float
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Date, Enum, JSON, Boolean, Float, LargeBinary
+from sqlalchemy.dialects.mysql import LONGBLOB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -306,6 +307,8 @@ class PipelineExecution(Base):
     completed_at = Column(DateTime, nullable=True)
     error = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    worker_id = Column(String(255), nullable=True)  # Worker instance running it (None for direct runs)
+    checkpoints = Column(JSON, nullable=True)  # Stage checkpoints: {stage: {"completed_at": ..., <stage results>}}
 
     # === EXECUTION CONFIGURATION (all determined at trigger time) ===
     start_date = Column(String(10), nullable=True)  # YYYY-MM-DD format for retrieval
@@ -359,6 +362,10 @@ class WipArticle(Base):
     issue = Column(String(50))
     pages = Column(String(50))
 
+    # Normalized identifiers for dedup lookups (as on Article)
+    doi_normalized = Column(String(255), index=True)
+    title_hash = Column(String(40), index=True)
+
     # Source-specific identifier (e.g., PubMed ID, Semantic Scholar ID, etc.)
     source_specific_id = Column(String(255), index=True)
 
@@ -393,6 +400,21 @@ class WipArticle(Base):
     curator = relationship("User", foreign_keys=[curated_by])
 
 
+class WipArticleFullText(Base):
+    """
+    Compressed PMC full text of a WipArticle, kept out of the hot wip_articles rows.
+
+    Used instead of wip_articles.full_text when WIP_FULL_TEXT_SIDE_TABLE is enabled.
+    Read and written only through WipArticleService.
+    """
+    __tablename__ = "wip_article_full_texts"
+
+    wip_article_id = Column(Integer, ForeignKey("wip_articles.id", ondelete="CASCADE"), primary_key=True)
+    content = Column(LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=False)  # zlib-compressed UTF-8
+    text_length = Column(Integer, nullable=False)  # Uncompressed length in characters
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 
 class Article(Base):
     """Individual articles from information sources"""
@@ -429,6 +451,10 @@ class Article(Base):
     doi = Column(String(255), index=True)  # Digital Object Identifier
     is_systematic = Column(Boolean, default=False)  # Is this a systematic review
 
+    # Normalized identifiers for dedup lookups (utils/article_identifiers; pmid is stored canonical)
+    doi_normalized = Column(String(255), index=True)  # Lowercased DOI without resolver prefix
+    title_hash = Column(String(40), index=True)  # SHA-1 of the normalized title
+
     # Relationships
     source = relationship("InformationSource", back_populates="articles")
     report_associations = relationship("ReportArticleAssociation", back_populates="article")
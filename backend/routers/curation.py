@@ -167,7 +167,7 @@ class CurationIncludedArticle(BaseModel):
 
 
 class CurationFilteredArticle(BaseModel):
-    """Filtered/duplicate/curated article data (from WipArticle)"""
+    """Filtered/duplicate/curated article data (from WipArticle). No abstract; see get_wip_article_abstract"""
     wip_article_id: int
     pmid: Optional[str] = None
     doi: Optional[str] = None
@@ -178,7 +178,6 @@ class CurationFilteredArticle(BaseModel):
     pub_year: Optional[int] = None
     pub_month: Optional[int] = None
     pub_day: Optional[int] = None
-    abstract: Optional[str] = None
     url: Optional[str] = None
     filter_score: Optional[float] = None
     filter_score_reason: Optional[str] = None
@@ -275,6 +274,12 @@ class UpdateWipArticleNotesResponse(BaseModel):
     curation_notes: str
 
 
+class WipArticleAbstractResponse(BaseModel):
+    """Response for get_wip_article_abstract endpoint"""
+    wip_article_id: int
+    abstract: Optional[str] = None
+
+
 class ExcludeArticleResponse(BaseModel):
     """Response for exclude_article endpoint"""
     article_id: int
@@ -475,7 +480,7 @@ async def get_curation_view(
             for item in data.included_articles
         ]
 
-        # Convert WipArticle models to CurationFilteredArticle
+        # Convert projected WipArticle rows to CurationFilteredArticle
         def wip_to_filtered(wip) -> CurationFilteredArticle:
             return CurationFilteredArticle(
                 wip_article_id=wip.id,
@@ -487,7 +492,6 @@ async def get_curation_view(
                 pub_year=wip.pub_year,
                 pub_month=wip.pub_month,
                 pub_day=wip.pub_day,
-                abstract=wip.abstract,
                 url=wip.url,
                 filter_score=wip.filter_score,
                 filter_score_reason=wip.filter_score_reason,
@@ -787,6 +791,35 @@ async def reset_curation(
         )
 
 
+@router.get("/{report_id}/wip-articles/{wip_article_id}/abstract", response_model=WipArticleAbstractResponse)
+async def get_wip_article_abstract(
+    report_id: int,
+    wip_article_id: int,
+    service: ReportService = Depends(get_report_service),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the abstract of a filtered/curated WipArticle.
+
+    The curation view omits abstracts from its article lists; the UI loads
+    one here when an article is expanded.
+    """
+    logger.info(f"get_wip_article_abstract - user_id={current_user.user_id}, report_id={report_id}, wip_article_id={wip_article_id}")
+
+    try:
+        abstract = await service.get_wip_article_abstract(report_id, current_user.user_id, wip_article_id)
+        return WipArticleAbstractResponse(wip_article_id=wip_article_id, abstract=abstract)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"get_wip_article_abstract failed - user_id={current_user.user_id}, report_id={report_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get abstract: {str(e)}"
+        )
+
+
 @router.patch("/{report_id}/wip-articles/{wip_article_id}/notes", response_model=UpdateWipArticleNotesResponse)
 async def update_wip_article_notes(
     report_id: int,
@@ -1063,10 +1096,8 @@ async def regenerate_executive_summary(
     try:
         summary_service = ReportSummaryService()
 
-        # Get report and stream via async curation view
-        curation_data = await service.get_curation_view(report_id, current_user.user_id)
-        report = curation_data.report
-        stream = curation_data.stream
+        # Get report and stream
+        report, _, stream = await service.get_report_with_access(report_id, current_user.user_id)
 
         # Get enrichment config from stream
         enrichment_config = stream.enrichment_config if stream else None
@@ -1129,9 +1160,7 @@ async def regenerate_category_summary(
         summary_service = ReportSummaryService()
 
         # Get report and stream
-        curation_data = await service.get_curation_view(report_id, current_user.user_id)
-        report = curation_data.report
-        stream = curation_data.stream
+        report, _, stream = await service.get_report_with_access(report_id, current_user.user_id)
 
         # Get enrichment config from stream
         enrichment_config = stream.enrichment_config if stream else None
@@ -1221,8 +1250,7 @@ async def regenerate_article_summary(
         summary_service = ReportSummaryService()
 
         # Get report and stream
-        curation_data = await service.get_curation_view(report_id, current_user.user_id)
-        stream = curation_data.stream
+        _, _, stream = await service.get_report_with_access(report_id, current_user.user_id)
 
         # Get enrichment config from stream
         enrichment_config = stream.enrichment_config if stream else None
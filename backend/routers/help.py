@@ -20,6 +20,7 @@ import logging
 from database import get_async_db
 from models import User, HelpContentOverride, ChatConfig
 from routers.auth import get_current_user
+from services.chat_config_cache import get_chat_config_cache
 from services.help_registry import (
     get_all_topic_ids,
     get_all_categories,
@@ -499,6 +500,7 @@ async def reload_help(
     """
     try:
         reload_help_content()
+        get_chat_config_cache().invalidate()
         topic_count = len(get_all_topic_ids())
         return {"status": "ok", "topics_loaded": topic_count}
     except Exception as e:
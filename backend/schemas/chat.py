@@ -104,8 +104,15 @@ class ToolDefinition(BaseModel):
 
 class TokenUsage(BaseModel):
     """Token counts from model response"""
-    input_tokens: int
+    input_tokens: int  # Uncached input tokens (excludes cache reads/writes)
     output_tokens: int
+    cache_creation_input_tokens: int = 0  # Input tokens written to the prompt cache
+    cache_read_input_tokens: int = 0  # Input tokens served from the prompt cache
+
+    @property
+    def context_tokens(self) -> int:
+        """All input tokens the call processed, cached or not."""
+        return self.input_tokens + self.cache_creation_input_tokens + self.cache_read_input_tokens
 
 
 class ToolCall(BaseModel):
@@ -138,8 +145,13 @@ class AgentIteration(BaseModel):
     """One complete iteration of the agent loop"""
     iteration: int  # 1-indexed
 
-    # EXACT messages array sent to model
-    messages_to_model: List[dict]
+    # Messages sent to model, stored as a delta: the full array is
+    # AgentTrace.initial_messages + new_messages of this and all earlier
+    # iterations (see AgentTrace.messages_to_model). message_count is its length.
+    new_messages: List[dict] = []
+    message_count: int = 0
+    # Full messages array (traces recorded before deltas were introduced)
+    messages_to_model: Optional[List[dict]] = None
 
     # Model response
     response_content: List[dict]  # Content blocks (text, tool_use)
@@ -201,11 +213,24 @@ class AgentTrace(BaseModel):
     total_input_tokens: int
     total_output_tokens: int
     total_duration_ms: int
-    # High-water mark: the largest single API call's input tokens.
+    # Prompt cache usage (total_input_tokens excludes these)
+    total_cache_creation_input_tokens: int = 0
+    total_cache_read_input_tokens: int = 0
+    # High-water mark: the largest single API call's input tokens (cached or not).
     # This is the actual context window pressure — system prompt + history +
     # tool results for the heaviest iteration (usually the last one).
     peak_input_tokens: Optional[int] = None
 
+    def messages_to_model(self, index: int) -> List[dict]:
+        """Full messages array sent to the model in iterations[index], rebuilt from the deltas."""
+        iteration = self.iterations[index]
+        if iteration.messages_to_model is not None:
+            return iteration.messages_to_model
+        messages = list(self.initial_messages)
+        for previous in self.iterations[:index + 1]:
+            messages.extend(previous.new_messages)
+        return messages
+
 
 # Backwards compatibility alias
 ChatDiagnostics = AgentTrace
@@ -262,6 +287,7 @@ class ToolProgressEvent(BaseModel):
     message: str
     progress: float  # 0.0 to 1.0
     data: Optional[Any] = None
+    tool_use_id: Optional[str] = None  # Tells concurrent calls of the same tool apart
 
 
 class ToolCompleteEvent(BaseModel):
@@ -269,6 +295,7 @@ class ToolCompleteEvent(BaseModel):
     type: Literal["tool_complete"] = "tool_complete"
     tool: str
     index: int  # Index for [[tool:N]] markers
+    tool_use_id: Optional[str] = None
 
 
 class CompleteEvent(BaseModel):
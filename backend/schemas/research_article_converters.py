@@ -75,6 +75,7 @@ def pubmed_article_to_research(article: PubMedArticle) -> CanonicalResearchArtic
             "pages": article.pages,
             "medium": article.medium,
             "article_date": article.article_date,
+            "pmc_id": article.pmc_id or None,
         },
         indexed_at=None,
         retrieved_at=datetime.utcnow().isoformat()
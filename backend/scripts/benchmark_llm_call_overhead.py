@@ -0,0 +1,104 @@
+"""
+Benchmark: per-item client-side overhead of batch call_llm.
+
+Measures the CPU work call_llm does for each item before the request goes on
+the wire (template rendering, prompt caller construction, response model
+compilation, message formatting) - no network calls are made.
+
+    per-item caller   what _call_llm_single used to do: a new BasePromptCaller
+                      per item, recompiling the JSON schema into a Pydantic
+                      model + output parser every time
+    shared caller     what the batch path does now: one cached caller for the
+                      batch, the rendered system message passed per call
+
+Uses the semantic filter's response schema and system message.
+
+Usage:
+    cd backend
+    python scripts/benchmark_llm_call_overhead.py --items 500
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.prompts import base_prompt_caller
+from agents.prompts.base_prompt_caller import BasePromptCaller
+from agents.prompts.llm import _get_prompt_caller, _render_template
+from config.llm_models import supports_reasoning_effort
+from schemas.llm import ChatMessage, MessageRole, ModelConfig
+from services.ai_evaluation_service import SYSTEM_MESSAGE_FILTER, get_filter_response_schema
+
+USER_MESSAGE = "## Article\nTitle: {title}\nAbstract: {abstract}\n\n## Task\nIs this article about melanocortin signalling?"
+
+
+def make_values(count: int) -> list:
+    return [
+        {"title": f"Article {i} on receptor signalling", "abstract": "Lorem ipsum dolor sit amet. " * 40}
+        for i in range(count)
+    ]
+
+
+def make_message(content: str) -> ChatMessage:
+    now = datetime.now(timezone.utc)
+    return ChatMessage(id="llm_call", chat_id="llm_call", role=MessageRole.USER, content=content, created_at=now, updated_at=now)
+
+
+def per_item_caller(values_list: list, config: ModelConfig, schema: dict) -> None:
+    for values in values_list:
+        # Reproduce the old behaviour: nothing compiled survives between items
+        base_prompt_caller._compiled_schema_cache.clear()
+        caller = BasePromptCaller(
+            response_model=schema,
+            system_message=_render_template(SYSTEM_MESSAGE_FILTER, values),
+            messages_placeholder=True,
+            model=config.model_id,
+            temperature=config.temperature,
+            reasoning_effort=config.reasoning_effort if supports_reasoning_effort(config.model_id) else None,
+        )
+        caller.get_formatted_messages([make_message(_render_template(USER_MESSAGE, values))])
+
+
+def shared_caller(values_list: list, config: ModelConfig, schema: dict) -> None:
+    caller = _get_prompt_caller(config, schema)
+    for values in values_list:
+        caller.get_formatted_messages(
+            [make_message(_render_template(USER_MESSAGE, values))],
+            system_message=_render_template(SYSTEM_MESSAGE_FILTER, values),
+        )
+
+
+def measure(label: str, fn, values_list: list, config: ModelConfig, schema: dict, repeat: int) -> float:
+    cpus = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn(values_list, config, schema)
+        cpus.append(time.process_time() - start)
+    per_item_us = min(cpus) / len(values_list) * 1_000_000
+    print(f"{label:<16} items={len(values_list):>5}  cpu={min(cpus) * 1000:8.1f} ms  per-item={per_item_us:8.1f} us")
+    return per_item_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500, help="Batch size")
+    parser.add_argument("--model", default="gpt-4.1", help="Model id used for the caller")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions (best is reported)")
+    args = parser.parse_args()
+
+    values_list = make_values(args.items)
+    config = ModelConfig(model_id=args.model, temperature=0.0)
+    schema = get_filter_response_schema(include_reasoning=True)
+
+    before = measure("per-item caller", per_item_caller, values_list, config, schema, args.repeat)
+    after = measure("shared caller", shared_caller, values_list, config, schema, args.repeat)
+    print(f"\nPer-item overhead: {before:.1f} us -> {after:.1f} us ({before / after:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""
+Benchmark: within-execution dedup - exact DOI/title vs exact + near-duplicate (MinHash/LSH).
+
+Runs PipelineService._mark_within_execution_duplicates over the WipArticles
+of one execution twice:
+
+    exact       DOI, or title without a DOI, lowercased (the previous behaviour)
+    near@T      exact + NearDuplicateIndex at threshold T (utils/near_duplicates.py)
+
+and reports duplicates found, wall time, and the near-duplicate pairs (the
+articles that would otherwise have reached the semantic filter). With
+--synthetic, injected variants are ground truth and precision / recall are
+reported too.
+
+Usage:
+    cd backend
+    # Record an execution's WipArticles once (reads the configured database)
+    python scripts/benchmark_near_duplicates.py --record exec.json --execution-id <uuid>
+    # Benchmark a recorded execution
+    python scripts/benchmark_near_duplicates.py --json exec.json --thresholds 0.8,0.85,0.9 --show 20
+    # No recording handy: synthetic execution with preprint / punctuation / web-mirror variants
+    python scripts/benchmark_near_duplicates.py --synthetic 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models import WipArticle
+from services.pipeline_service import PipelineService
+from services.wip_article_service import WipArticleService
+from utils.near_duplicates import NearDuplicateIndex
+
+FIELDS = ("id", "pmid", "doi", "title", "authors", "retrieval_group_id")
+
+WORDS = (
+    "receptor agonist melanocortin obesity trial patients cohort signalling pathway "
+    "dose response placebo randomized efficacy safety hypothalamic expression mice "
+    "weight energy appetite analysis outcome baseline treatment adolescents adults "
+    "genetic variants deficiency leptin setmelanotide hyperphagia syndrome"
+).split()
+SURNAMES = "Smith Jones Garcia Chen Muller Rossi Tanaka Novak Silva Kowalski Dubois Larsen".split()
+
+
+def record(execution_id: str, path: str) -> None:
+    """Dump an execution's WipArticles (dedup-relevant fields only) to JSON."""
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(WipArticle)
+            .filter(WipArticle.pipeline_execution_id == execution_id)
+            .order_by(WipArticle.id)
+            .all()
+        )
+        data = [{field: getattr(row, field) for field in FIELDS} for row in rows]
+    finally:
+        db.close()
+    with open(path, "w") as f:
+        json.dump(data, f)
+    print(f"Recorded {len(data)} WipArticles of execution {execution_id} to {path}")
+
+
+def synthetic(count: int) -> tuple:
+    """Articles plus ground truth {duplicate id: canonical id} for injected variants."""
+    rng = random.Random(11)
+    rows, truth = [], {}
+    next_id = 1
+    for i in range(count):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(7, 14))).capitalize()
+        if rng.random() < 0.2:
+            title += f" phase {rng.randint(1, 3)}"
+        authors = [f"{rng.choice(SURNAMES)} {rng.choice('ABCDEFG')}{rng.choice('JKLMN')}" for _ in range(4)]
+        canonical = {"id": next_id, "pmid": str(38000000 + i), "doi": f"10.1000/j.{i}",
+                     "title": title, "authors": authors, "retrieval_group_id": "q1"}
+        rows.append(canonical)
+        next_id += 1
+
+        variant = rng.random()
+        if variant < 0.05:
+            # Preprint of the same work: different DOI, no PMID, slightly different title
+            rows.append({"id": next_id, "pmid": None, "doi": f"10.1101/2024.{i}",
+                         "title": title.replace(" trial", " study").rstrip(".") + ": a preprint",
+                         "authors": authors, "retrieval_group_id": "q2"})
+        elif variant < 0.10:
+            # Punctuation / casing / British spelling variant from another query
+            rows.append({"id": next_id, "pmid": None, "doi": None,
+                         "title": title.upper().replace(" ", " - ", 1).replace("ize", "ise") + ".",
+                         "authors": authors[:1], "retrieval_group_id": "q3"})
+        elif variant < 0.13:
+            # Web-source mirror of the PubMed record (no identifiers, no authors)
+            rows.append({"id": next_id, "pmid": None, "doi": None, "title": f"{title} |",
+                         "authors": [], "retrieval_group_id": "web"})
+        else:
+            continue
+        truth[next_id] = canonical["id"]
+        next_id += 1
+    return rows, truth
+
+
+def to_articles(rows: list) -> list:
+    return [WipArticle(**{field: row.get(field) for field in FIELDS}, is_duplicate=False) for row in rows]
+
+
+def run(rows: list, near_duplicates) -> tuple:
+    articles = to_articles(rows)
+    stub = SimpleNamespace(wip_article_service=WipArticleService(None))
+    started = time.perf_counter()
+    count = PipelineService._mark_within_execution_duplicates(
+        stub, articles, set(), seen_dois={}, seen_titles={}, near_duplicates=near_duplicates
+    )
+    return count, time.perf_counter() - started, articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--record", help="Write the execution's WipArticles to this JSON file")
+    parser.add_argument("--execution-id", help="Execution to record")
+    parser.add_argument("--json", help="Recorded execution (JSON from --record)")
+    parser.add_argument("--synthetic", type=int, default=0, help="Synthetic canonical articles (with injected variants)")
+    parser.add_argument("--thresholds", default="0.8,0.85,0.9")
+    parser.add_argument("--num-perm", type=int, default=64)
+    parser.add_argument("--bands", type=int, default=16)
+    parser.add_argument("--show", type=int, default=10, help="Near-duplicate pairs to print (lowest threshold)")
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.execution_id:
+            parser.error("--record needs --execution-id")
+        record(args.execution_id, args.record)
+        return
+
+    truth = None
+    if args.json:
+        with open(args.json) as f:
+            rows = json.load(f)
+    else:
+        rows, truth = synthetic(args.synthetic or 2000)
+    by_id = {row["id"]: row for row in rows}
+    print(f"{len(rows)} WipArticles" + (f", {len(truth)} injected near-duplicates" if truth is not None else ""))
+
+    exact_count, exact_time, exact_articles = run(rows, None)
+    exact_ids = {a.id for a in exact_articles if a.is_duplicate}
+    print(f"{'exact':<10} duplicates={exact_count:>5}  wall={exact_time * 1000:8.1f} ms")
+
+    shown = False
+    for threshold in (float(t) for t in args.thresholds.split(",")):
+        index = NearDuplicateIndex(threshold=threshold, num_perm=args.num_perm, bands=args.bands)
+        count, elapsed, articles = run(rows, index)
+        near = [a for a in articles if a.is_duplicate and a.id not in exact_ids]
+        line = (
+            f"{'near@' + str(threshold):<10} duplicates={count:>5}  wall={elapsed * 1000:8.1f} ms  "
+            f"extra (LLM filter calls saved)={len(near):>5}"
+        )
+        if truth is not None:
+            found = {a.id for a in articles if a.is_duplicate}
+            hits = len(found & set(truth))
+            precision = hits / len(found) if found else 1.0
+            recall = hits / len(truth) if truth else 1.0
+            line += f"  precision={precision:.3f}  recall={recall:.3f}"
+        print(line)
+
+        if not shown and args.show:
+            shown = True
+            for article in near[:args.show]:
+                canonical = by_id.get(article.duplicate_of_id, {})
+                print(f"    {article.title[:70]!r}\n      -> {canonical.get('title', '?')[:70]!r}")
+
+
+if __name__ == '__main__':
+    main()
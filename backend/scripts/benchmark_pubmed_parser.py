@@ -0,0 +1,203 @@
+"""
+Benchmark: efetch XML parsing - reference parser vs streaming element parser.
+
+Compares the two ways PubMedService can turn an efetch response into
+PubMedArticle objects:
+
+    reference   ET.fromstring(whole response), then for every article
+                ET.tostring(node) -> PubMedArticle.from_xml / from_book_xml
+                (re-serialise + re-parse + descendant searches)
+    streaming   iter_efetch_article_elements(response) ->
+                PubMedArticle.from_element / from_book_element
+                (iterparse, direct child paths, elements freed once consumed)
+
+Reports wall time, CPU time and tracemalloc peak for each, and checks that
+both produce identical fields for every article.
+
+Usage:
+    cd backend
+    # Record a real payload once (needs network; NCBI_API_KEY optional)
+    python scripts/benchmark_pubmed_parser.py --record data.xml --query "melanocortin" --count 2000
+    # Benchmark a recorded payload
+    python scripts/benchmark_pubmed_parser.py --xml data.xml
+    # No payload handy: synthetic articles shaped like efetch output
+    python scripts/benchmark_pubmed_parser.py --synthetic 5000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.pubmed_service import PubMedArticle, iter_efetch_article_elements
+
+FIELDS = (
+    "PMID", "title", "abstract", "authors", "journal", "volume", "issue", "pages",
+    "medium", "pmc_id", "doi", "pub_year", "pub_month", "pub_day", "comp_date",
+    "date_revised", "article_date", "entry_date",
+)
+
+
+def parse_reference(xml: bytes) -> list:
+    root = ET.fromstring(xml)
+    articles = [PubMedArticle.from_xml(ET.tostring(n)) for n in root.findall(".//PubmedArticle")]
+    articles += [PubMedArticle.from_book_xml(ET.tostring(n)) for n in root.findall(".//PubmedBookArticle")]
+    return articles
+
+
+def parse_streaming(xml: bytes) -> list:
+    return [
+        PubMedArticle.from_book_element(n) if n.tag == "PubmedBookArticle" else PubMedArticle.from_element(n)
+        for n in iter_efetch_article_elements(xml)
+    ]
+
+
+def measure(label: str, fn, xml: bytes, repeat: int) -> list:
+    result = None
+    walls, cpus = [], []
+    for _ in range(repeat):
+        gc.collect()
+        wall, cpu = time.perf_counter(), time.process_time()
+        result = fn(xml)
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.process_time() - cpu)
+
+    gc.collect()
+    tracemalloc.start()
+    fn(xml)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{label:<10} articles={len(result):>6}  wall={min(walls) * 1000:8.1f} ms  "
+        f"cpu={min(cpus) * 1000:8.1f} ms  peak={peak / 1024 / 1024:7.1f} MiB"
+    )
+    return result
+
+
+def compare(reference: list, streaming: list) -> int:
+    def key(article):
+        return tuple(getattr(article, f) or "" for f in FIELDS)
+
+    ref_by_pmid = {a.PMID: key(a) for a in reference}
+    mismatches = 0
+    for article in streaming:
+        expected = ref_by_pmid.get(article.PMID)
+        if expected != key(article):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"  MISMATCH PMID {article.PMID}")
+    if len(reference) != len(streaming):
+        print(f"  COUNT MISMATCH reference={len(reference)} streaming={len(streaming)}")
+        mismatches += 1
+    return mismatches
+
+
+def synthetic_payload(count: int) -> bytes:
+    parts = ["<?xml version='1.0'?>\n<PubmedArticleSet>"]
+    for i in range(count):
+        pmid = 30000000 + i
+        authors = "".join(
+            f"<Author ValidYN='Y'><LastName>Author{a}</LastName><ForeName>F</ForeName>"
+            f"<Initials>F{a % 26}</Initials><AffiliationInfo><Affiliation>Dept {a}, University"
+            f"</Affiliation></AffiliationInfo></Author>"
+            for a in range(8)
+        )
+        abstract = "".join(
+            f"<AbstractText Label='SECTION{s}'>{'Lorem ipsum dolor sit amet. ' * 20}</AbstractText>"
+            for s in range(4)
+        )
+        mesh = "".join(
+            f"<MeshHeading><DescriptorName UI='D{m:06d}'>Term {m}</DescriptorName></MeshHeading>"
+            for m in range(15)
+        )
+        refs = "".join(
+            f"<Reference><Citation>Ref {r}</Citation><ArticleIdList>"
+            f"<ArticleId IdType='pubmed'>{20000000 + r}</ArticleId></ArticleIdList></Reference>"
+            for r in range(30)
+        )
+        parts.append(
+            f"<PubmedArticle><MedlineCitation Status='MEDLINE' Owner='NLM'><PMID Version='1'>{pmid}</PMID>"
+            f"<DateCompleted><Year>2024</Year><Month>03</Month><Day>{1 + i % 28}</Day></DateCompleted>"
+            f"<DateRevised><Year>2024</Year><Month>05</Month><Day>02</Day></DateRevised>"
+            f"<Article PubModel='Print-Electronic'><Journal><ISSN>1234-5678</ISSN>"
+            f"<JournalIssue CitedMedium='Internet'><Volume>{i % 90}</Volume><Issue>{i % 12}</Issue>"
+            f"<PubDate><Year>2024</Year><Month>Mar</Month></PubDate></JournalIssue>"
+            f"<Title>Journal of Synthetic Results</Title></Journal>"
+            f"<ArticleTitle>Synthetic article <i>{i}</i> on melanocortin signalling.</ArticleTitle>"
+            f"<Pagination><MedlinePgn>{i}-{i + 9}</MedlinePgn></Pagination>"
+            f"<Abstract>{abstract}</Abstract><AuthorList CompleteYN='Y'>{authors}</AuthorList>"
+            f"<ArticleDate DateType='Electronic'><Year>2024</Year><Month>02</Month><Day>11</Day></ArticleDate>"
+            f"</Article><MeshHeadingList>{mesh}</MeshHeadingList></MedlineCitation>"
+            f"<PubmedData><History><PubMedPubDate PubStatus='entrez'><Year>2024</Year><Month>2</Month>"
+            f"<Day>12</Day></PubMedPubDate></History><ArticleIdList>"
+            f"<ArticleId IdType='pubmed'>{pmid}</ArticleId><ArticleId IdType='doi'>10.1000/syn.{i}</ArticleId>"
+            f"<ArticleId IdType='pmc'>PMC{9000000 + i}</ArticleId></ArticleIdList>"
+            f"<ReferenceList>{refs}</ReferenceList></PubmedData></PubmedArticle>"
+        )
+    parts.append("</PubmedArticleSet>")
+    return "".join(parts).encode("utf-8")
+
+
+def record_payload(path: str, query: str, count: int) -> None:
+    import asyncio
+    import httpx
+    from services.pubmed_service import PubMedService
+
+    async def run():
+        service = PubMedService()
+        ids, _ = await service.get_article_ids(query, max_results=count)
+        params = {"db": "pubmed", "id": ",".join(ids)}
+        if service.api_key:
+            params["api_key"] = service.api_key
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            # POST: a few thousand PMIDs do not fit in a GET URL
+            response = await client.post(service.fetch_url, data=params)
+            response.raise_for_status()
+            return response.content
+
+    payload = asyncio.run(run())
+    with open(path, "wb") as f:
+        f.write(payload)
+    print(f"Recorded {len(payload) / 1024 / 1024:.1f} MiB to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--xml", help="Recorded efetch payload to benchmark")
+    parser.add_argument("--synthetic", type=int, default=0, help="Generate N synthetic articles instead")
+    parser.add_argument("--record", help="Record a payload to this path and exit")
+    parser.add_argument("--query", default="melanocortin", help="Query used with --record")
+    parser.add_argument("--count", type=int, default=2000, help="Articles to record")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions (best is reported)")
+    args = parser.parse_args()
+
+    if args.record:
+        record_payload(args.record, args.query, args.count)
+        return
+
+    if args.xml:
+        with open(args.xml, "rb") as f:
+            xml = f.read()
+        source = args.xml
+    else:
+        xml = synthetic_payload(args.synthetic or 5000)
+        source = f"synthetic ({args.synthetic or 5000} articles)"
+
+    print(f"Payload: {source}, {len(xml) / 1024 / 1024:.1f} MiB\n")
+    reference = measure("reference", parse_reference, xml, args.repeat)
+    streaming = measure("streaming", parse_streaming, xml, args.repeat)
+
+    mismatches = compare(reference, streaming)
+    print(f"\nField check: {'OK' if not mismatches else f'{mismatches} mismatches'}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
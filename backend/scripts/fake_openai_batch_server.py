@@ -0,0 +1,264 @@
+"""
+Local stand-in for the OpenAI files / batches / chat completions endpoints.
+
+Lets the provider batch path (agents/prompts/llm_batch.py) and the real-time
+fallback be exercised end to end without an API key, cost or network:
+
+    POST   /v1/files                 upload batch input (multipart)
+    GET    /v1/files/{id}/content    download input / output / error file
+    DELETE /v1/files/{id}
+    POST   /v1/batches               create a batch (completes after --delay seconds)
+    GET    /v1/batches/{id}
+    POST   /v1/batches/{id}/cancel   cancel; roughly half the items are returned
+    POST   /v1/chat/completions      real-time call
+
+Responses are stubs: for a json_schema response_format an object with a
+placeholder value per property (first enum value, 0.5 for numbers, ...),
+otherwise a short text. --fail-rate makes that fraction of batch items come
+back in the error file, which call_llm then retries in real time.
+
+Usage:
+    cd backend
+    python scripts/fake_openai_batch_server.py --port 8099 --delay 5
+    # In the process under test:
+    OPENAI_BASE_URL=http://localhost:8099/v1 OPENAI_API_KEY=test LLM_BATCH_POLL_SECONDS=1 ...
+    # Or run a batch against it directly:
+    python scripts/fake_openai_batch_server.py --demo 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import PlainTextResponse
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+app = FastAPI(title="Fake OpenAI batch server")
+
+FILES: Dict[str, Dict[str, Any]] = {}
+BATCHES: Dict[str, Dict[str, Any]] = {}
+CONFIG = {"delay": 5.0, "fail_rate": 0.0}
+
+
+def _stub_value(schema: Dict[str, Any]) -> Any:
+    schema_type = schema.get("type", "string")
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != "null"), "string")
+    if "enum" in schema:
+        return schema["enum"][0]
+    if schema_type == "number":
+        return 0.5
+    if schema_type == "integer":
+        return 1
+    if schema_type == "boolean":
+        return True
+    if schema_type == "array":
+        return []
+    if schema_type == "object":
+        return {name: _stub_value(prop) for name, prop in schema.get("properties", {}).items()}
+    return "stub"
+
+
+def _completion(body: Dict[str, Any]) -> Dict[str, Any]:
+    response_format = body.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        content = json.dumps(_stub_value(response_format["json_schema"]["schema"]))
+    else:
+        content = "Stub response."
+    prompt_tokens = sum(len(str(m.get("content", ""))) for m in body.get("messages", [])) // 4
+    completion_tokens = len(content) // 4
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "gpt-4.1"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content, "refusal": None},
+            "finish_reason": "stop",
+            "logprobs": None,
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def _store_file(content: str, purpose: str, filename: str) -> Dict[str, Any]:
+    file_id = f"file-{uuid.uuid4().hex[:12]}"
+    FILES[file_id] = {
+        "id": file_id,
+        "object": "file",
+        "bytes": len(content.encode("utf-8")),
+        "created_at": int(time.time()),
+        "filename": filename,
+        "purpose": purpose,
+        "status": "processed",
+        "_content": content,
+    }
+    return {k: v for k, v in FILES[file_id].items() if not k.startswith("_")}
+
+
+def _public(batch: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in batch.items() if not k.startswith("_")}
+
+
+def _finish_batch(batch: Dict[str, Any], status: str, fraction: float = 1.0) -> None:
+    lines = [json.loads(line) for line in FILES[batch["input_file_id"]]["_content"].splitlines() if line.strip()]
+    lines = lines[: int(len(lines) * fraction)]
+    outputs, errors = [], []
+    for line in lines:
+        if random.random() < CONFIG["fail_rate"]:
+            errors.append({
+                "id": f"batch_req_{uuid.uuid4().hex[:8]}",
+                "custom_id": line["custom_id"],
+                "response": {"status_code": 429, "body": {"error": {"message": "Rate limit reached (stub)"}}},
+                "error": None,
+            })
+        else:
+            outputs.append({
+                "id": f"batch_req_{uuid.uuid4().hex[:8]}",
+                "custom_id": line["custom_id"],
+                "response": {"status_code": 200, "request_id": uuid.uuid4().hex, "body": _completion(line["body"])},
+                "error": None,
+            })
+    if outputs:
+        batch["output_file_id"] = _store_file("\n".join(json.dumps(o) for o in outputs), "batch_output", "output.jsonl")["id"]
+    if errors:
+        batch["error_file_id"] = _store_file("\n".join(json.dumps(e) for e in errors), "batch_output", "errors.jsonl")["id"]
+    batch["request_counts"] = {"total": batch["request_counts"]["total"], "completed": len(outputs), "failed": len(errors)}
+    batch["status"] = status
+    batch[f"{status}_at"] = int(time.time())
+
+
+async def _run_batch(batch_id: str) -> None:
+    await asyncio.sleep(CONFIG["delay"])
+    batch = BATCHES[batch_id]
+    if batch["status"] == "in_progress":
+        _finish_batch(batch, "completed")
+
+
+@app.post("/v1/files")
+async def create_file(file: UploadFile = File(...), purpose: str = Form(...)):
+    content = (await file.read()).decode("utf-8")
+    return _store_file(content, purpose, file.filename or "upload.jsonl")
+
+
+@app.get("/v1/files/{file_id}/content")
+async def file_content(file_id: str):
+    if file_id not in FILES:
+        raise HTTPException(status_code=404, detail="No such file")
+    return PlainTextResponse(FILES[file_id]["_content"])
+
+
+@app.delete("/v1/files/{file_id}")
+async def delete_file(file_id: str):
+    FILES.pop(file_id, None)
+    return {"id": file_id, "object": "file", "deleted": True}
+
+
+@app.post("/v1/batches")
+async def create_batch(request: Request):
+    body = await request.json()
+    input_file_id = body["input_file_id"]
+    if input_file_id not in FILES:
+        raise HTTPException(status_code=404, detail="No such file")
+    total = len([line for line in FILES[input_file_id]["_content"].splitlines() if line.strip()])
+    batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+    BATCHES[batch_id] = {
+        "id": batch_id,
+        "object": "batch",
+        "endpoint": body["endpoint"],
+        "completion_window": body["completion_window"],
+        "input_file_id": input_file_id,
+        "status": "in_progress",
+        "created_at": int(time.time()),
+        "output_file_id": None,
+        "error_file_id": None,
+        "request_counts": {"total": total, "completed": 0, "failed": 0},
+        "metadata": body.get("metadata"),
+    }
+    asyncio.create_task(_run_batch(batch_id))
+    return _public(BATCHES[batch_id])
+
+
+@app.get("/v1/batches/{batch_id}")
+async def get_batch(batch_id: str):
+    if batch_id not in BATCHES:
+        raise HTTPException(status_code=404, detail="No such batch")
+    return _public(BATCHES[batch_id])
+
+
+@app.post("/v1/batches/{batch_id}/cancel")
+async def cancel_batch(batch_id: str):
+    batch = BATCHES.get(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="No such batch")
+    if batch["status"] == "in_progress":
+        _finish_batch(batch, "cancelled", fraction=0.5)
+    return _public(batch)
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    return _completion(await request.json())
+
+
+async def demo(items: int, base_url: str) -> None:
+    """Run call_llm in batch mode against this server (must already be running)."""
+    os.environ["OPENAI_BASE_URL"] = base_url
+    os.environ.setdefault("OPENAI_API_KEY", "test")
+    os.environ.setdefault("LLM_BATCH_POLL_SECONDS", "1")
+    os.environ.setdefault("LLM_RESULT_CACHE_ENABLED", "false")
+    from agents.prompts.llm import LLMOptions, call_llm
+
+    schema = {
+        "type": "object",
+        "properties": {"value": {"type": "boolean"}, "confidence": {"type": "number"}},
+        "required": ["value", "confidence"],
+    }
+    started = time.perf_counter()
+    results = await call_llm(
+        system_message="You are a relevance filter.",
+        user_message="Is article {i} relevant?",
+        values=[{"i": i} for i in range(items)],
+        response_schema=schema,
+        options=LLMOptions(execution_mode="batch", log_prompt=False, stage="semantic_filter"),
+    )
+    ok = sum(1 for r in results if r.ok)
+    ordered = all(r.input["i"] == i for i, r in enumerate(results))
+    print(f"{ok}/{items} ok, order preserved: {ordered}, {time.perf_counter() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--delay", type=float, default=5.0, help="Seconds before a batch completes")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of batch items returned as errors")
+    parser.add_argument("--demo", type=int, default=0, help="Run N items through call_llm against a running server")
+    args = parser.parse_args()
+
+    if args.demo:
+        asyncio.run(demo(args.demo, f"http://localhost:{args.port}/v1"))
+        return
+
+    import uvicorn
+
+    CONFIG["delay"] = args.delay
+    CONFIG["fail_rate"] = args.fail_rate
+    uvicorn.run(app, host="127.0.0.1", port=args.port)
+
+
+if __name__ == '__main__':
+    main()
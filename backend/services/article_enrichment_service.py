@@ -0,0 +1,235 @@
+"""
+Article Enrichment Service - Fused summary, stance and category in one LLM call
+
+The pipeline normally enriches report articles in three passes (article
+summary, stance analysis, categorization), each sending the article's title
+and abstract to the LLM again. This service asks for all three in a single
+structured call per article:
+
+    {"summary": "...", "stance_analysis": {...}, "category_id": "..."}
+
+PROMPTS:
+========
+The system message stacks each task's system prompt under its own heading.
+The article is given once in the user message, followed by each task's
+instructions. Default user templates are reduced to their closing
+instruction (the article fields they repeat are already in the shared
+header); custom user templates are included verbatim, so stream-specific
+instructions still apply - at the cost of some of the token savings.
+
+Stance and categorization normally see the AI summary. In a fused call the
+summary is written in the same response, so {article_summary} / {ai_summary}
+point the model at its own Task 1 output instead.
+
+Usage:
+    system, user = build_fused_prompts(summary_prompts, stance_prompts, categorization_prompts)
+    results = await analyze_articles_fused(items, system, user, include_stance=True, ...)
+    saved = estimate_prompt_tokens_saved(results, system, user, separate_calls)
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from agents.prompts.llm import call_llm, LLMOptions, LLMResult
+from schemas.llm import ModelConfig
+from services.article_analysis_service import DEFAULT_STANCE_USER_PROMPT, STANCE_RESULT_SCHEMA
+from services.article_categorization_service import USER_PROMPT_TEMPLATE as DEFAULT_CATEGORIZATION_USER_PROMPT
+from services.report_summary_service import DEFAULT_PROMPTS as DEFAULT_SUMMARY_PROMPTS
+
+logger = logging.getLogger(__name__)
+
+# Stands in for the AI summary in stance/categorization templates
+SUMMARY_FROM_TASK_1 = "(Not yet available - use the summary you write for Task 1.)"
+
+FUSED_SYSTEM_HEADER = """You analyze one research article and complete {task_count} tasks in a single response.
+Treat each task independently and follow its instructions exactly. Return all results in one JSON object."""
+
+FUSED_ARTICLE_HEADER = """# Research Stream
+Stream: {stream_name}
+Purpose: {stream_purpose}
+
+# Article Information
+Title: {title}
+Authors: {authors}
+Journal: {journal} ({publication_date})
+
+# Abstract
+{abstract}"""
+
+# Closing instructions of the default user templates (their article fields are in the shared header)
+DEFAULT_SUMMARY_INSTRUCTION = "Generate a concise summary that captures the key contributions and findings of this article."
+DEFAULT_STANCE_INSTRUCTION = DEFAULT_STANCE_USER_PROMPT.rsplit("\n\n", 1)[-1]
+DEFAULT_CATEGORIZATION_INSTRUCTION = """## Available Categories
+{categories_json}
+
+Select the single best-matching category ID, or null if no good fit."""
+
+
+def build_fused_response_schema(include_stance: bool) -> Dict[str, Any]:
+    """JSON schema for the fused response (stance_analysis only when stance is configured)."""
+    properties: Dict[str, Any] = {
+        "summary": {
+            "type": "string",
+            "description": "Task 1: the article summary, with no heading or other text",
+        },
+        "category_id": {
+            "type": ["string", "null"],
+            "description": "Task 3: the single category ID that best fits this article, or null if no good fit",
+        },
+    }
+    if include_stance:
+        properties["stance_analysis"] = {**STANCE_RESULT_SCHEMA, "description": "Task 2: stance analysis"}
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+    }
+
+
+def build_fused_prompts(
+    summary_prompts: Tuple[str, str],
+    stance_prompts: Optional[Tuple[str, str]],
+    categorization_prompts: Tuple[str, str],
+) -> Tuple[str, str]:
+    """
+    Combine the per-task (system, user) prompt pairs into one fused prompt pair.
+
+    Args:
+        summary_prompts: Article summary prompts (flat placeholders)
+        stance_prompts: Stance prompts (flat placeholders), or None if stance is not configured
+        categorization_prompts: Categorization prompts
+
+    Returns:
+        Tuple of (system_message, user_message) templates
+    """
+    tasks = [
+        (
+            "Summary",
+            "summary",
+            summary_prompts,
+            DEFAULT_SUMMARY_PROMPTS["article_summary"]["user_prompt_template"],
+            DEFAULT_SUMMARY_INSTRUCTION,
+        ),
+    ]
+    if stance_prompts:
+        tasks.append(
+            ("Stance", "stance_analysis", stance_prompts, DEFAULT_STANCE_USER_PROMPT, DEFAULT_STANCE_INSTRUCTION)
+        )
+    tasks.append(
+        (
+            "Category",
+            "category_id",
+            categorization_prompts,
+            DEFAULT_CATEGORIZATION_USER_PROMPT,
+            DEFAULT_CATEGORIZATION_INSTRUCTION,
+        )
+    )
+
+    system_parts = [FUSED_SYSTEM_HEADER.replace("{task_count}", str(len(tasks)))]
+    user_parts = [FUSED_ARTICLE_HEADER]
+    for number, (name, field, (system, user), default_user, default_instruction) in enumerate(tasks, start=1):
+        system_parts.append(f'## Task {number} - {name} (field "{field}")\n{system}')
+        instruction = default_instruction if user == default_user else user
+        user_parts.append(f"# Task {number} - {name}\n{instruction}")
+
+    return "\n\n".join(system_parts), "\n\n".join(user_parts)
+
+
+def build_fused_item(
+    summary_item: Dict[str, Any],
+    stance_item: Optional[Dict[str, Any]],
+    categorization_item: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Merge the per-task item dicts into one set of template values."""
+    item = {**categorization_item, **(stance_item or {}), **summary_item}
+    item["ai_summary"] = SUMMARY_FROM_TASK_1
+    if stance_item is not None:
+        item["article_summary"] = SUMMARY_FROM_TASK_1
+    return item
+
+
+async def analyze_articles_fused(
+    items: List[Dict[str, Any]],
+    system_message: str,
+    user_message: str,
+    include_stance: bool,
+    model_config: ModelConfig,
+    options: Optional[LLMOptions] = None,
+) -> List[LLMResult]:
+    """
+    Run the fused summary / stance / category call for each item.
+
+    Args:
+        items: Item dicts from build_fused_item
+        system_message: Fused system template (build_fused_prompts)
+        user_message: Fused user template (build_fused_prompts)
+        include_stance: Whether the prompts include the stance task
+        model_config: Model configuration (shared by all three tasks)
+        options: LLMOptions with max_concurrent and on_progress
+
+    Returns:
+        List[LLMResult] in the same order as items; .data has summary,
+        category_id and (with stance) stance_analysis
+    """
+    if not items:
+        return []
+
+    logger.info(
+        f"analyze_articles_fused - items={len(items)}, model={model_config.model_id}, stance={include_stance}"
+    )
+    return await call_llm(
+        system_message=system_message,
+        user_message=user_message,
+        values=items,
+        model_config=model_config,
+        response_schema=build_fused_response_schema(include_stance),
+        options=options or LLMOptions(max_concurrent=5),
+    )
+
+
+def _rendered_length(template: str, values: Dict[str, Any]) -> int:
+    """Length of the template once call_llm substitutes values (without building the string)."""
+    length = len(template)
+    for key, value in values.items():
+        placeholder = f"{{{key}}}"
+        count = template.count(placeholder) if value is not None else 0
+        if count:
+            text = ", ".join(str(v) for v in value) if isinstance(value, list) else str(value)
+            length += count * (len(text) - len(placeholder))
+    return length
+
+
+def estimate_prompt_tokens_saved(
+    results: List[LLMResult],
+    system_message: str,
+    user_message: str,
+    separate_calls: List[Tuple[str, str, List[Dict[str, Any]]]],
+) -> int:
+    """
+    Estimate the prompt tokens the separate per-task calls would have sent beyond the fused call.
+
+    The fused call's actual prompt tokens are scaled by the ratio of rendered
+    prompt lengths (separate / fused), so no tokenizer is needed.
+
+    Args:
+        results: LLMResults of the fused call (.input holds the fused item)
+        system_message: Fused system template
+        user_message: Fused user template
+        separate_calls: (system, user, items) per task, with items as the separate stage would send them
+
+    Returns:
+        Estimated prompt tokens saved (0 if nothing was sent, e.g. all cached)
+    """
+    prompt_tokens = sum(result.usage.prompt_tokens for result in results)
+    fused_chars = sum(
+        _rendered_length(system_message, result.input) + _rendered_length(user_message, result.input)
+        for result in results
+    )
+    if not prompt_tokens or not fused_chars:
+        return 0
+    separate_chars = sum(
+        _rendered_length(system, item) + _rendered_length(user, item)
+        for system, user, items in separate_calls
+        for item in items
+    )
+    return max(0, round(prompt_tokens * (separate_chars / fused_chars - 1)))
@@ -2,23 +2,27 @@
 Article Service - Single source of truth for Article table operations.
 
 This service owns:
-- Article lookups (by PMID, DOI, ID)
-- Article creation from WipArticle (deduplication by PMID/DOI)
+- Article lookups (by PMID, DOI, ID), on canonical PMID / normalized DOI
+- Article creation from WipArticle (deduplication by PMID/DOI), single or in bulk
 - Conversion to canonical schema
 """
 
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, or_, select
 from fastapi import Depends
 
 from models import Article, WipArticle
+from utils.article_identifiers import normalize_doi, normalize_pmid, title_hash
 from schemas.canonical_types import CanonicalResearchArticle
 from database import get_async_db
 
 logger = logging.getLogger(__name__)
 
+# Identifiers per IN (...) clause when resolving articles in bulk
+LOOKUP_CHUNK_SIZE = 500
+
 
 class ArticleService:
     """
@@ -80,15 +84,21 @@ class ArticleService:
 
     async def find_by_pmid(self, pmid: str) -> Optional[Article]:
         """Find an article by PMID, returning the ORM model."""
+        pmid = normalize_pmid(pmid)
+        if not pmid:
+            return None
         result = await self.db.execute(
             select(Article).where(Article.pmid == pmid)
         )
         return result.scalars().first()
 
     async def find_by_doi(self, doi: str) -> Optional[Article]:
-        """Find an article by DOI, returning the ORM model."""
+        """Find an article by DOI (case and resolver prefix insensitive), returning the ORM model."""
+        doi = normalize_doi(doi)
+        if not doi:
+            return None
         result = await self.db.execute(
-            select(Article).where(Article.doi == doi)
+            select(Article).where(Article.doi_normalized == doi)
         )
         return result.scalars().first()
 
@@ -96,7 +106,9 @@ class ArticleService:
     # Writers (async, stages DB writes - caller must commit)
     # =========================================================================
 
-    async def find_or_create_from_wip(self, wip_article: WipArticle) -> Article:
+    async def find_or_create_from_wip(
+        self, wip_article: WipArticle, full_text: Optional[str] = None
+    ) -> Article:
         """
         Find existing Article by PMID/DOI or create new one from WipArticle.
 
@@ -105,6 +117,10 @@ class ArticleService:
         2. Check by DOI if no PMID match
         3. Create new Article if no match found
 
+        Args:
+            full_text: Full text for a new Article when it is not on the WipArticle
+                itself (see WipArticleService.get_stored_full_texts)
+
         Returns the Article ORM model (existing or newly created).
         """
         article = None
@@ -119,33 +135,167 @@ class ArticleService:
 
         # Create new article if not found
         if not article:
-            article = Article(
-                source_id=wip_article.source_id,
-                title=wip_article.title,
-                url=wip_article.url,
-                authors=wip_article.authors,
-                summary=wip_article.summary,
-                abstract=wip_article.abstract,
-                full_text=wip_article.full_text,
-                article_metadata=wip_article.article_metadata,
-                pmid=wip_article.pmid,
-                doi=wip_article.doi,
-                journal=wip_article.journal,
-                volume=wip_article.volume,
-                issue=wip_article.issue,
-                pages=wip_article.pages,
-                pub_year=wip_article.pub_year,
-                pub_month=wip_article.pub_month,
-                pub_day=wip_article.pub_day,
-                entry_date=wip_article.entry_date,
-                fetch_count=1,
-            )
+            article = Article(**self._values_from_wip(wip_article, full_text))
             self.db.add(article)
             await self.db.flush()
             logger.debug(f"Created new Article: pmid={wip_article.pmid}, doi={wip_article.doi}")
 
         return article
 
+    async def bulk_find_or_create_from_wip(
+        self,
+        wip_articles: List[WipArticle],
+        full_texts: Optional[Dict[int, str]] = None,
+    ) -> List[int]:
+        """
+        Set-based find_or_create_from_wip for a batch of WipArticles.
+
+        Same deduplication strategy (PMID first, then DOI), in a fixed number of
+        round trips instead of up to three per article:
+        1. One SELECT resolves existing Articles by PMID/DOI for the whole batch
+        2. One multi-row INSERT creates the missing ones (WipArticles sharing a
+           PMID/DOI within the batch share one new Article)
+        3. One SELECT reads back the new article IDs by PMID/DOI
+
+        Articles without PMID or DOI (e.g. web sources) cannot be read back by
+        identifier, so they are added through the ORM and flushed together.
+
+        Note: articles.pmid/doi are not unique keys, so INSERT ... ON DUPLICATE
+        KEY UPDATE would not deduplicate; the lookup in step 1 does.
+
+        Args:
+            wip_articles: WipArticles to promote
+            full_texts: Full text by WipArticle ID for new Articles when it is not
+                on the WipArticle itself (see WipArticleService.get_stored_full_texts)
+
+        Returns:
+            article_id for each WipArticle, in input order
+        """
+        full_texts = full_texts or {}
+        by_pmid, by_doi = await self._find_ids_by_identifiers(
+            {normalize_pmid(w.pmid) for w in wip_articles if normalize_pmid(w.pmid)},
+            {normalize_doi(w.doi) for w in wip_articles if normalize_doi(w.doi)},
+        )
+
+        # Rows to insert, plus the identifier keys of every pending row so later
+        # WipArticles in the batch match it as they would a flushed Article
+        new_rows: List[Dict[str, Any]] = []
+        pending_keys: set = set()
+        unkeyed: List[Article] = []
+        unkeyed_index: Dict[int, Article] = {}
+        for wip_article in wip_articles:
+            if self._resolve(wip_article, by_pmid, by_doi) is not None:
+                continue
+            keys = self._identifier_keys(wip_article)
+            if not keys:
+                article = Article(**self._values_from_wip(wip_article, full_texts.get(wip_article.id)))
+                unkeyed.append(article)
+                unkeyed_index[id(wip_article)] = article
+            elif not pending_keys.intersection(keys):
+                new_rows.append(self._values_from_wip(wip_article, full_texts.get(wip_article.id)))
+                pending_keys.update(keys)
+
+        if new_rows:
+            # Core executemany (not an ORM bulk insert): aiomysql sends it as one multi-row INSERT
+            await self.db.execute(insert(Article.__table__), new_rows)
+            created_pmid, created_doi = await self._find_ids_by_identifiers(
+                {row["pmid"] for row in new_rows if row["pmid"]},
+                {row["doi_normalized"] for row in new_rows if row["doi_normalized"]},
+            )
+            by_pmid = {**created_pmid, **by_pmid}
+            by_doi = {**created_doi, **by_doi}
+        if unkeyed:
+            self.db.add_all(unkeyed)
+            await self.db.flush()
+        logger.debug(
+            f"Bulk promoted {len(wip_articles)} WipArticles: "
+            f"{len(new_rows) + len(unkeyed)} new Articles"
+        )
+
+        return [
+            unkeyed_index[id(w)].article_id if id(w) in unkeyed_index else self._resolve(w, by_pmid, by_doi)
+            for w in wip_articles
+        ]
+
+    async def _find_ids_by_identifiers(self, pmids: set, dois: set) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Look up article IDs by canonical PMID and normalized DOI, in chunks.
+
+        Returns:
+            ({pmid: article_id}, {normalized doi: article_id}); the lowest
+            article_id wins where several articles share an identifier
+        """
+        by_pmid: Dict[str, int] = {}
+        by_doi: Dict[str, int] = {}
+        pmid_list, doi_list = sorted(pmids), sorted(dois)
+        for i in range(0, max(len(pmid_list), len(doi_list)), LOOKUP_CHUNK_SIZE):
+            pmid_chunk = pmid_list[i:i + LOOKUP_CHUNK_SIZE]
+            doi_chunk = doi_list[i:i + LOOKUP_CHUNK_SIZE]
+            conditions = []
+            if pmid_chunk:
+                conditions.append(Article.pmid.in_(pmid_chunk))
+            if doi_chunk:
+                conditions.append(Article.doi_normalized.in_(doi_chunk))
+            result = await self.db.execute(
+                select(Article.article_id, Article.pmid, Article.doi_normalized)
+                .where(or_(*conditions))
+                .order_by(Article.article_id)
+            )
+            for article_id, pmid, doi in result.all():
+                if pmid:
+                    by_pmid.setdefault(pmid, article_id)
+                if doi:
+                    by_doi.setdefault(doi, article_id)
+        return by_pmid, by_doi
+
+    @staticmethod
+    def _resolve(wip_article: WipArticle, by_pmid: Dict[str, int], by_doi: Dict[str, int]) -> Optional[int]:
+        """Article ID for a WipArticle by PMID, then DOI (as find_or_create_from_wip)."""
+        pmid, doi = normalize_pmid(wip_article.pmid), normalize_doi(wip_article.doi)
+        if pmid and pmid in by_pmid:
+            return by_pmid[pmid]
+        if doi and doi in by_doi:
+            return by_doi[doi]
+        return None
+
+    @staticmethod
+    def _identifier_keys(wip_article: WipArticle) -> set:
+        """Identifier keys ("pmid:..." / "doi:...") a WipArticle can be matched on."""
+        keys = set()
+        pmid, doi = normalize_pmid(wip_article.pmid), normalize_doi(wip_article.doi)
+        if pmid:
+            keys.add(f"pmid:{pmid}")
+        if doi:
+            keys.add(f"doi:{doi}")
+        return keys
+
+    @staticmethod
+    def _values_from_wip(wip_article: WipArticle, full_text: Optional[str] = None) -> Dict[str, Any]:
+        """Column values for a new Article created from a WipArticle."""
+        return {
+            "source_id": wip_article.source_id,
+            "title": wip_article.title,
+            "url": wip_article.url,
+            "authors": wip_article.authors,
+            "summary": wip_article.summary,
+            "abstract": wip_article.abstract,
+            "full_text": full_text or wip_article.full_text,
+            "article_metadata": wip_article.article_metadata,
+            "pmid": normalize_pmid(wip_article.pmid),
+            "doi": wip_article.doi,
+            "doi_normalized": normalize_doi(wip_article.doi),
+            "title_hash": title_hash(wip_article.title),
+            "journal": wip_article.journal,
+            "volume": wip_article.volume,
+            "issue": wip_article.issue,
+            "pages": wip_article.pages,
+            "pub_year": wip_article.pub_year,
+            "pub_month": wip_article.pub_month,
+            "pub_day": wip_article.pub_day,
+            "entry_date": wip_article.entry_date,
+            "fetch_count": 1,
+        }
+
 
 # Dependency injection provider for async article service
 async def get_article_service(
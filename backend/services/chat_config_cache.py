@@ -0,0 +1,190 @@
+"""
+Chat Config Cache - in-process snapshot of the configuration the chat system prompt reads.
+
+Every chat turn used to query chat_config (global preamble, page instructions,
+stream instructions, help settings, max tool iterations), all
+help_content_override summaries, and key_authors, and then re-render the help
+TOC. ChatConfigCache loads chat_config and the help summary overrides in two
+queries into a ChatConfigSnapshot and keeps it for CHAT_CONFIG_CACHE_TTL_SECONDS.
+Derived values (the rendered help section per role, key authors per stream,
+a report's stream) are memoized on the snapshot, so steady-state prompt
+assembly needs no config queries.
+
+Invalidation:
+- Commits that insert, update or delete ChatConfig / HelpContentOverride rows
+  through the ORM invalidate the cache (Session event hooks below).
+- Other changes (help YAML reload, key_authors edited in SQL) call invalidate()
+  or are picked up when the TTL expires. The TTL also bounds staleness in
+  other processes, which do not see this process's invalidations.
+- The cache is versioned: a snapshot that started loading before an
+  invalidation is used for that turn but not kept.
+
+Usage:
+    snapshot = await get_chat_config_cache().get_snapshot(db)
+    preamble = snapshot.system.get("global_preamble")
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from models import ChatConfig, HelpContentOverride, Report
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChatConfigSnapshot:
+    """chat_config and help override contents at one point in time."""
+    version: int
+    system: Dict[str, str] = field(default_factory=dict)  # scope 'system': setting -> content
+    pages: Dict[str, str] = field(default_factory=dict)  # scope 'page': page -> instructions
+    streams: Dict[str, str] = field(default_factory=dict)  # scope 'stream': stream_id -> instructions
+    help: Dict[str, str] = field(default_factory=dict)  # scope 'help': config key -> content
+    help_summary_overrides: Dict[str, str] = field(default_factory=dict)  # "category/topic" -> summary
+    # Memoized per snapshot
+    help_sections: Dict[str, Optional[str]] = field(default_factory=dict)
+    key_authors: Dict[int, List[str]] = field(default_factory=dict)
+    report_streams: Dict[int, Optional[int]] = field(default_factory=dict)
+
+    def help_section(self, role: str) -> Optional[str]:
+        """Rendered HELP section for a role (narrative + TOC), rendered once per snapshot."""
+        if role not in self.help_sections:
+            from services.help_registry import get_help_section_for_role
+
+            try:
+                self.help_sections[role] = get_help_section_for_role(
+                    role=role,
+                    narrative=self.help.get("narrative"),
+                    preamble=self.help.get("toc-preamble"),
+                    summary_overrides=self.help_summary_overrides or None,
+                )
+            except Exception as e:
+                logger.error(f"Failed to build help section: {e}")
+                return None
+        return self.help_sections[role]
+
+    async def get_key_authors(self, db: AsyncSession, stream_id: int) -> List[str]:
+        """Key author names for a stream, loaded once per snapshot."""
+        if stream_id not in self.key_authors:
+            from services.key_authors_service import get_key_authors_list
+
+            self.key_authors[stream_id] = await get_key_authors_list(db, stream_id=stream_id)
+        return self.key_authors[stream_id]
+
+    async def get_report_stream_id(self, db: AsyncSession, report_id: int) -> Optional[int]:
+        """The stream a report belongs to, loaded once per snapshot."""
+        if report_id not in self.report_streams:
+            result = await db.execute(
+                select(Report.research_stream_id).where(Report.report_id == report_id)
+            )
+            self.report_streams[report_id] = result.scalar()
+        return self.report_streams[report_id]
+
+
+class ChatConfigCache:
+    """Versioned, TTL-bounded ChatConfigSnapshot (see module docstring)."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._snapshot: Optional[ChatConfigSnapshot] = None
+        self._loaded_at = 0.0
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next get_snapshot() reloads it."""
+        self.version += 1
+        self._snapshot = None
+        logger.debug(f"Chat config cache invalidated (version {self.version})")
+
+    async def get_snapshot(self, db: AsyncSession) -> ChatConfigSnapshot:
+        """The current snapshot, loading it if missing or older than the TTL."""
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._loaded_at < self.ttl_seconds:
+            return snapshot
+
+        version = self.version
+        try:
+            snapshot = await self._load(db, version)
+        except Exception as e:
+            logger.warning(f"Failed to load chat configuration, using defaults: {e}")
+            return ChatConfigSnapshot(version=version)
+
+        if self.ttl_seconds > 0 and self.version == version:
+            self._snapshot = snapshot
+            self._loaded_at = time.monotonic()
+        return snapshot
+
+    async def _load(self, db: AsyncSession, version: int) -> ChatConfigSnapshot:
+        snapshot = ChatConfigSnapshot(version=version)
+        by_scope = {
+            "system": snapshot.system,
+            "page": snapshot.pages,
+            "stream": snapshot.streams,
+            "help": snapshot.help,
+        }
+
+        result = await db.execute(
+            select(ChatConfig.scope, ChatConfig.scope_key, ChatConfig.content)
+        )
+        for scope, scope_key, content in result.all():
+            if content and scope in by_scope:
+                by_scope[scope][scope_key] = content
+
+        result = await db.execute(
+            select(
+                HelpContentOverride.category,
+                HelpContentOverride.topic,
+                HelpContentOverride.summary,
+            ).where(HelpContentOverride.summary.isnot(None))
+        )
+        for category, topic, summary in result.all():
+            if summary:
+                snapshot.help_summary_overrides[f"{category}/{topic}"] = summary
+
+        return snapshot
+
+
+# =============================================================================
+# Invalidation on commit
+# =============================================================================
+
+_CONFIG_MODELS = (ChatConfig, HelpContentOverride)
+_CHANGED_KEY = "chat_config_changed"
+
+
+@event.listens_for(Session, "after_flush")
+def _track_config_writes(session, flush_context):
+    # new / dirty / deleted still hold the pre-flush state here
+    if any(isinstance(obj, _CONFIG_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info[_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop(_CHANGED_KEY, False):
+        get_chat_config_cache().invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_writes(session):
+    session.info.pop(_CHANGED_KEY, None)
+
+
+_cache: Optional[ChatConfigCache] = None
+
+
+def get_chat_config_cache() -> ChatConfigCache:
+    """Get the process-wide chat config cache."""
+    global _cache
+    if _cache is None:
+        from config.settings import settings
+
+        _cache = ChatConfigCache(ttl_seconds=settings.CHAT_CONFIG_CACHE_TTL_SECONDS)
+    return _cache
@@ -261,6 +261,16 @@ class ChatService:
 
     DEFAULT_MAX_TOOL_ITERATIONS = 5
 
+    @classmethod
+    def parse_max_tool_iterations(cls, content: Optional[str]) -> int:
+        """The max_tool_iterations setting from its stored content (clamped to 1-20), or default."""
+        if content:
+            try:
+                return max(1, min(int(content.strip()), 20))
+            except ValueError:
+                logger.warning(f"Invalid max_tool_iterations config: {content!r}")
+        return cls.DEFAULT_MAX_TOOL_ITERATIONS
+
     async def get_max_tool_iterations(self) -> int:
         """Get the maximum tool iterations setting, or default."""
         from models import ChatConfig
@@ -273,9 +283,7 @@ class ChatService:
                 )
             )
             config = result.scalars().first()
-            if config and config.content:
-                value = int(config.content.strip())
-                return max(1, min(value, 20))
+            return self.parse_max_tool_iterations(config.content if config else None)
         except Exception as e:
             logger.warning(f"Failed to load max_tool_iterations config: {e}")
 
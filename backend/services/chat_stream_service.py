@@ -51,6 +51,8 @@ from agents.agent_loop import (
     AgentError,
 )
 from services.chat_service import ChatService
+from services.chat_config_cache import ChatConfigSnapshot, get_chat_config_cache
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -162,6 +164,8 @@ class ChatStreamService:
                 cancellation_token=cancellation_token,
                 stream_text=True,
                 temperature=0.0,
+                prompt_caching=settings.CHAT_PROMPT_CACHE_ENABLED,
+                max_parallel_tools=settings.AGENT_MAX_PARALLEL_TOOLS,
             ):
                 if isinstance(event, AgentThinking):
                     yield StatusEvent(message=event.message).model_dump_json()
@@ -184,6 +188,7 @@ class ChatStreamService:
                         message=event.message,
                         progress=event.progress,
                         data=event.data,
+                        tool_use_id=event.tool_use_id,
                     ).model_dump_json()
 
                 elif isinstance(event, AgentToolComplete):
@@ -191,7 +196,7 @@ class ChatStreamService:
                     collected_text += tool_marker
                     yield TextDeltaEvent(text=tool_marker).model_dump_json()
                     yield ToolCompleteEvent(
-                        tool=event.tool_name, index=tool_call_index
+                        tool=event.tool_name, index=tool_call_index, tool_use_id=event.tool_use_id
                     ).model_dump_json()
                     tool_call_index += 1
 
@@ -505,18 +510,29 @@ class ChatStreamService:
         context: Dict[str, Any],
         chat_id: Optional[int] = None,
         db_messages: Optional[List] = None,
-    ) -> str:
+    ) -> List[Dict[str, Any]]:
         """
-        Build system prompt with clean structure (async).
+        Build the system prompt as text blocks, most stable first (async).
+
+        Order rationale - the provider caches the prompt prefix up to each
+        breakpoint, so segments go from least to most likely to change:
 
-        Order rationale:
-        1. GLOBAL PREAMBLE - What KH is, your role, two types of questions (always same)
+        STABLE (same for every conversation on this page, for this role) - breakpoint
+        1. GLOBAL PREAMBLE - What KH is, your role, two types of questions
         2. PAGE INSTRUCTIONS - Page-specific guidance (varies by page)
-        3. STREAM INSTRUCTIONS - Domain-specific context from the stream
-        4. CONTEXT - Current page state, user role, loaded data
-        5. CAPABILITIES - Available tools and actions
-        6. HELP - Help system TOC
-        7. FORMAT RULES - Technical formatting
+        3. CAPABILITIES - Available tools and actions
+        4. HELP - Help system TOC
+        5. FORMAT RULES - Technical formatting
+
+        STREAM (same for every turn about this stream / report) - breakpoint
+        6. STREAM INSTRUCTIONS - Domain-specific context from the stream
+        7. KEY AUTHORS - Curated researchers for the stream
+        8. REPORT DATA - Report enrichments and articles (reports page)
+
+        VOLATILE (changes between turns)
+        9. CONTEXT - Current page state, user role, current article
+        10. CONVERSATION DATA - Payloads from conversation history
+        11. Current date and time
 
         Args:
             context: Page context dict
@@ -528,57 +544,76 @@ class ChatStreamService:
         active_subtab = context.get("active_subtab")
         user_role = context.get("user_role", "member")
 
-        sections = []
+        stable = []
 
         # 1. GLOBAL PREAMBLE (explains KH, your role, question types)
         # Use override from database if available, otherwise use default
-        preamble = await self._get_global_preamble()
-        current_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
-        sections.append(f"{preamble}\n\nCurrent date and time: {current_time}")
+        stable.append(await self._get_global_preamble())
 
         # 2. PAGE INSTRUCTIONS (page-specific guidance)
         page_instructions = await self._get_page_instructions(current_page)
         if page_instructions:
-            sections.append(f"== PAGE INSTRUCTIONS ==\n{page_instructions}")
+            stable.append(f"== PAGE INSTRUCTIONS ==\n{page_instructions}")
+
+        # 3. CAPABILITIES (tools + payloads + client actions)
+        capabilities = self._build_capabilities_section(
+            current_page, active_tab, active_subtab, user_role=user_role
+        )
+        if capabilities:
+            stable.append(f"== CAPABILITIES ==\n{capabilities}")
+
+        # 4. HELP (consolidated: narrative + tool usage + TOC)
+        help_section = await self._build_help_section(user_role)
+        if help_section:
+            stable.append(f"== HELP ==\n{help_section}")
+
+        # 5. FORMAT RULES (fixed technical instructions)
+        stable.append(f"== FORMAT RULES ==\n{self.FORMAT_INSTRUCTIONS}")
 
-        # 3. STREAM INSTRUCTIONS (domain-specific, stream-level)
+        stream = []
+
+        # 6. STREAM INSTRUCTIONS (domain-specific, stream-level)
         stream_instructions = await self._load_stream_instructions(context)
         if stream_instructions:
-            sections.append(f"== STREAM CONTEXT ==\n{stream_instructions}")
+            stream.append(f"== STREAM CONTEXT ==\n{stream_instructions}")
 
-        # 4. CONTEXT (page context + user role + loaded data)
-        page_context = await self._build_page_context(current_page, context)
-        if page_context:
-            sections.append(f"== CURRENT CONTEXT ==\n{page_context}")
-
-        # 4b. KEY AUTHORS (curated list of important researchers, stream-scoped)
+        # 7. KEY AUTHORS (curated list of important researchers, stream-scoped)
         stream_id = await self._resolve_stream_id(context)
         if stream_id:
             key_authors_section = await self._build_key_authors_section(stream_id)
             if key_authors_section:
-                sections.append(f"== KEY AUTHORS ==\n{key_authors_section}")
+                stream.append(f"== KEY AUTHORS ==\n{key_authors_section}")
 
-        # 5. PAYLOAD MANIFEST (payloads from conversation history, if any)
-        payload_manifest = self._build_payload_manifest(db_messages)
-        if payload_manifest:
-            sections.append(f"== CONVERSATION DATA ==\n{payload_manifest}")
+        # 8. REPORT DATA (reports page: report loaded from database)
+        report_section = await self._build_report_section(current_page, context)
+        if report_section:
+            stream.append(report_section)
 
-        # 6. CAPABILITIES (tools + payloads + client actions)
-        capabilities = self._build_capabilities_section(
-            current_page, active_tab, active_subtab, user_role=user_role
-        )
-        if capabilities:
-            sections.append(f"== CAPABILITIES ==\n{capabilities}")
+        volatile = []
 
-        # 7. HELP (consolidated: narrative + tool usage + TOC)
-        help_section = await self._build_help_section(user_role)
-        if help_section:
-            sections.append(f"== HELP ==\n{help_section}")
+        # 9. CONTEXT (page context + user role + current article)
+        page_context = await self._build_page_context(current_page, context)
+        if page_context:
+            volatile.append(f"== CURRENT CONTEXT ==\n{page_context}")
 
-        # 8. FORMAT RULES (fixed technical instructions)
-        sections.append(f"== FORMAT RULES ==\n{self.FORMAT_INSTRUCTIONS}")
+        # 10. PAYLOAD MANIFEST (payloads from conversation history, if any)
+        payload_manifest = self._build_payload_manifest(db_messages)
+        if payload_manifest:
+            volatile.append(f"== CONVERSATION DATA ==\n{payload_manifest}")
 
-        return "\n\n".join(sections)
+        # 11. CURRENT TIME (last: it changes every minute)
+        current_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+        volatile.append(f"Current date and time: {current_time}")
+
+        blocks = []
+        for sections, cached in ((stable, True), (stream, True), (volatile, False)):
+            if not sections:
+                continue
+            block = {"type": "text", "text": "\n\n".join(sections)}
+            if cached and settings.CHAT_PROMPT_CACHE_ENABLED:
+                block["cache_control"] = {"type": "ephemeral"}
+            blocks.append(block)
+        return blocks
 
     def _build_capabilities_section(
         self,
@@ -705,8 +740,8 @@ Users can be on different pages in the app, each with its own context and capabi
     async def _build_key_authors_section(self, stream_id: int) -> Optional[str]:
         """Load key authors for a stream and build a system prompt section."""
         try:
-            from services.key_authors_service import get_key_authors_list
-            authors = await get_key_authors_list(self.db, stream_id=stream_id)
+            config = await self._get_config()
+            authors = await config.get_key_authors(self.db, stream_id)
             if not authors:
                 return None
             authors_str = ", ".join(authors)
@@ -733,22 +768,8 @@ Users can be on different pages in the app, each with its own context and capabi
 
     async def _get_global_preamble(self) -> str:
         """Get the global preamble, checking for database override first."""
-        from models import ChatConfig
-
-        try:
-            result = await self.db.execute(
-                select(ChatConfig).where(
-                    ChatConfig.scope == "system",
-                    ChatConfig.scope_key == "global_preamble",
-                )
-            )
-            config = result.scalars().first()
-            if config and config.content:
-                return config.content
-        except Exception as e:
-            logger.warning(f"Failed to load global_preamble: {e}")
-
-        return self.GLOBAL_PREAMBLE
+        config = await self._get_config()
+        return config.system.get("global_preamble") or self.GLOBAL_PREAMBLE
 
     # Default page instructions (used if page doesn't define its own)
     DEFAULT_PAGE_INSTRUCTIONS = """No special instructions for this page. Use your general capabilities and the help system as needed."""
@@ -769,54 +790,11 @@ SUGGESTED_ACTIONS:
         """
         Build the consolidated help section with narrative, tool usage, and TOC.
 
-        Loads configuration from database (narrative, preamble, category labels, summary overrides)
-        and falls back to defaults.
+        Uses configuration from database (narrative, preamble, category labels, summary overrides)
+        and falls back to defaults. Rendered once per role per config snapshot.
         """
-        from models import ChatConfig, HelpContentOverride
-        from services.help_registry import get_help_section_for_role
-
-        narrative = None
-        preamble = None
-        summary_overrides = {}
-
-        try:
-            # Load help configuration from database
-            result = await self.db.execute(
-                select(ChatConfig).where(ChatConfig.scope == "help")
-            )
-            help_configs = result.scalars().all()
-
-            for config in help_configs:
-                if config.scope_key == "narrative" and config.content:
-                    narrative = config.content
-                elif config.scope_key == "toc-preamble" and config.content:
-                    preamble = config.content
-
-            # Load summary overrides from help_content_override table
-            result = await self.db.execute(
-                select(HelpContentOverride).where(
-                    HelpContentOverride.summary.isnot(None)
-                )
-            )
-            overrides = result.scalars().all()
-            for override in overrides:
-                if override.summary:
-                    topic_id = f"{override.category}/{override.topic}"
-                    summary_overrides[topic_id] = override.summary
-
-        except Exception as e:
-            logger.warning(f"Failed to load help configuration: {e}")
-
-        try:
-            return get_help_section_for_role(
-                role=user_role,
-                narrative=narrative,
-                preamble=preamble,
-                summary_overrides=summary_overrides if summary_overrides else None,
-            )
-        except Exception as e:
-            logger.error(f"Failed to build help section: {e}")
-            return None
+        config = await self._get_config()
+        return config.help_section(user_role)
 
     async def _get_page_instructions(self, current_page: str) -> str:
         """
@@ -828,23 +806,11 @@ SUGGESTED_ACTIONS:
         Note: The global preamble is now separate and always included.
         This function only returns page-specific guidance.
         """
-        from models import ChatConfig
         from services.chat_page_config import get_persona as get_code_page_instructions
 
-        instructions = None
-
         # 1. Check DB for page-level override
-        try:
-            result = await self.db.execute(
-                select(ChatConfig).where(
-                    ChatConfig.scope == "page", ChatConfig.scope_key == current_page
-                )
-            )
-            page_config = result.scalars().first()
-            if page_config and page_config.content:
-                instructions = page_config.content
-        except Exception as e:
-            logger.warning(f"Failed to check page instructions override: {e}")
+        config = await self._get_config()
+        instructions = config.pages.get(current_page)
 
         # 2. Fall back to code page default
         if not instructions:
@@ -883,32 +849,37 @@ SUGGESTED_ACTIONS:
         role_description = self.ROLE_DESCRIPTIONS.get(user_role, user_role)
         base_context = f"User role: {role_description}\n\n{base_context}"
 
-        # For reports page, enrich with report data from database
-        if current_page == "reports" and context.get("report_id"):
-            report_id = context.get("report_id")
-            try:
-                report_data = await self._load_report_context(report_id, context)
-                if report_data:
-                    base_context += "\n" + report_data
-                else:
-                    base_context += "\n\n(Unable to load report data - report may not exist or access denied)"
-            except Exception as e:
-                logger.warning(
-                    f"Failed to load report context for report_id={report_id}: {e}"
-                )
-                base_context += f"\n\n(Error loading report data: {str(e)})"
+        # Report article being viewed (report data itself is in the REPORT DATA section)
+        if current_page == "reports" and context.get("report_id") and context.get("current_article"):
+            base_context += "\n" + self._format_current_article(context["current_article"])
 
         return base_context
 
+    async def _build_report_section(
+        self, current_page: str, context: Dict[str, Any]
+    ) -> Optional[str]:
+        """Build the REPORT DATA section for the reports page (async)."""
+        if current_page != "reports" or not context.get("report_id"):
+            return None
+
+        report_id = context.get("report_id")
+        try:
+            report_data = await self._load_report_context(report_id)
+            if report_data:
+                return report_data
+            return "(Unable to load report data - report may not exist or access denied)"
+        except Exception as e:
+            logger.warning(
+                f"Failed to load report context for report_id={report_id}: {e}"
+            )
+            return f"(Error loading report data: {str(e)})"
+
     async def _resolve_stream_id(self, context: Dict[str, Any]) -> Optional[int]:
         """Resolve stream_id from context, falling back to report's stream if needed."""
         stream_id = context.get("stream_id")
         if not stream_id and context.get("report_id"):
-            from services.report_service import ReportService
-            report_service = ReportService(self.db)
-            report = await report_service.get_report_by_id_internal(context["report_id"])
-            if report:
-                stream_id = report.research_stream_id
+            config = await self._get_config()
+            stream_id = await config.get_report_stream_id(self.db, context["report_id"])
         return stream_id
 
     async def _load_stream_instructions(self, context: Dict[str, Any]) -> Optional[str]:
@@ -916,34 +887,24 @@ SUGGESTED_ACTIONS:
 
         Instructions are stored in the chat_config table (scope='stream').
         """
-        from models import ChatConfig
-
         stream_id = await self._resolve_stream_id(context)
         if not stream_id:
             return None
 
-        # Get instructions from chat_config table
-        try:
-            result = await self.db.execute(
-                select(ChatConfig).where(
-                    ChatConfig.scope == "stream", ChatConfig.scope_key == str(stream_id)
-                )
-            )
-            config = result.scalars().first()
-            if config and config.content:
-                return config.content.strip()
-        except Exception as e:
-            logger.warning(f"Failed to load stream instructions: {e}")
-
-        return None
+        config = await self._get_config()
+        content = config.streams.get(str(stream_id))
+        return content.strip() if content else None
 
     async def _get_max_tool_iterations(self) -> int:
         """Get the maximum tool iterations from config, or default."""
-        return await self.chat_service.get_max_tool_iterations()
+        config = await self._get_config()
+        return ChatService.parse_max_tool_iterations(config.system.get("max_tool_iterations"))
 
-    async def _load_report_context(
-        self, report_id: int, context: Dict[str, Any]
-    ) -> Optional[str]:
+    async def _get_config(self) -> ChatConfigSnapshot:
+        """Chat configuration snapshot (cached in-process, see chat_config_cache)."""
+        return await get_chat_config_cache().get_snapshot(self.db)
+
+    async def _load_report_context(self, report_id: int) -> Optional[str]:
         """Load report data from database and format it for LLM context (async)."""
         from models import Report
 
@@ -1001,18 +962,12 @@ SUGGESTED_ACTIONS:
         if report.key_highlights:
             highlights_text = "\n".join(f"- {h}" for h in report.key_highlights)
 
-        current_article = context.get("current_article")
-        current_article_section = (
-            self._format_current_article(current_article) if current_article else ""
-        )
-
         return f"""
         === REPORT DATA (loaded from database) ===
 
         Report Name: {report.report_name}
         Report Date: {report.report_date}
         Total Articles: {len(articles_context)}
-        {current_article_section}
 
         === EXECUTIVE SUMMARY ===
         {executive_summary if executive_summary else "No executive summary available."}
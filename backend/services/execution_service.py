@@ -58,6 +58,22 @@ class ExecutionService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_interrupted(self, exclude_worker_ids: List[str]) -> List[PipelineExecution]:
+        """
+        Find RUNNING executions started by a worker not in exclude_worker_ids.
+
+        The caller excludes itself and any worker still heartbeating, so the
+        rest were orphaned when their worker died. Direct runs (worker_id NULL)
+        are not included.
+        """
+        stmt = select(PipelineExecution).where(
+            PipelineExecution.status == ExecutionStatus.RUNNING,
+            PipelineExecution.worker_id.isnot(None),
+            PipelineExecution.worker_id.notin_(exclude_worker_ids),
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def find_by_stream(
         self,
         stream_id: int,
@@ -90,7 +106,8 @@ class ExecutionService:
         enrichment_config: Optional[Dict[str, Any]] = None,
         llm_config: Optional[Dict[str, Any]] = None,
         article_analysis_config: Optional[Dict[str, Any]] = None,
-        status: ExecutionStatus = ExecutionStatus.PENDING
+        status: ExecutionStatus = ExecutionStatus.PENDING,
+        worker_id: Optional[str] = None
     ) -> PipelineExecution:
         """
         Create a new pipeline execution.
@@ -114,7 +131,8 @@ class ExecutionService:
             presentation_config=presentation_config or {},
             enrichment_config=enrichment_config,
             llm_config=llm_config,
-            article_analysis_config=article_analysis_config
+            article_analysis_config=article_analysis_config,
+            worker_id=worker_id
         )
 
         self.db.add(execution)
@@ -130,7 +148,8 @@ class ExecutionService:
         start_date: str,
         end_date: str,
         report_name: Optional[str] = None,
-        status: ExecutionStatus = ExecutionStatus.PENDING
+        status: ExecutionStatus = ExecutionStatus.PENDING,
+        worker_id: Optional[str] = None
     ) -> PipelineExecution:
         """
         Create a new execution by snapshotting configuration from a stream.
@@ -149,7 +168,8 @@ class ExecutionService:
             enrichment_config=stream.enrichment_config if stream.enrichment_config else None,
             llm_config=stream.llm_config if stream.llm_config else None,
             article_analysis_config=stream.article_analysis_config if stream.article_analysis_config else None,
-            status=status
+            status=status,
+            worker_id=worker_id
         )
 
     # =========================================================================
@@ -199,8 +219,51 @@ class ExecutionService:
         logger.debug(f"Linked execution {execution_id} to report {report_id}")
         return execution
 
-    async def mark_running(self, execution_id: str) -> PipelineExecution:
-        """Mark execution as RUNNING."""
+    async def record_checkpoint(
+        self,
+        execution_id: str,
+        stage: str,
+        data: Optional[Dict[str, Any]] = None,
+        completed: bool = True
+    ) -> PipelineExecution:
+        """
+        Merge data into a stage's entry in execution.checkpoints.
+
+        completed=True also stamps the entry's completed_at, which is what
+        marks the stage as done for a resumed run. Does not commit.
+        """
+        execution = await self.get_by_id_or_raise(execution_id)
+        checkpoints = dict(execution.checkpoints or {})
+        entry = {**checkpoints.get(stage, {}), **(data or {})}
+        if completed:
+            entry["completed_at"] = datetime.utcnow().isoformat()
+        checkpoints[stage] = entry
+        # Reassign (not mutate) so the JSON column is marked dirty
+        execution.checkpoints = checkpoints
+        await self.db.flush()
+        return execution
+
+    async def requeue(self, execution_id: str) -> PipelineExecution:
+        """
+        Put an interrupted or failed execution back to PENDING.
+
+        Checkpoints are kept, so the worker resumes it after its last completed stage.
+        """
+        execution = await self.get_by_id_or_raise(execution_id)
+        execution.status = ExecutionStatus.PENDING
+        execution.error = None
+        execution.completed_at = None
+        await self.db.flush()
+
+        completed = [stage for stage, entry in (execution.checkpoints or {}).items() if "completed_at" in entry]
+        logger.info(f"Requeued execution {execution_id}, completed stages: {completed}")
+        return execution
+
+    async def mark_running(self, execution_id: str, worker_id: Optional[str] = None) -> PipelineExecution:
+        """Mark execution as RUNNING (by worker_id, if run by the worker)."""
+        if worker_id:
+            execution = await self.get_by_id_or_raise(execution_id)
+            execution.worker_id = worker_id
         return await self.update_status(execution_id, ExecutionStatus.RUNNING)
 
     async def mark_completed(self, execution_id: str) -> PipelineExecution:
@@ -0,0 +1,99 @@
+"""
+NCBI HTTP Client - Process-wide pooled client for E-utilities and PMC
+
+Every PubMed call used to open its own httpx.AsyncClient, paying a fresh
+TLS handshake per request and never reusing a connection. This module owns
+one long-lived client per process with keep-alive, configurable connection
+limits and HTTP/2 when the h2 package is installed.
+
+Used by PubMedService (and therefore the pipeline, the PubMedAdapter search
+provider and the tools/builtin/pubmed.py chat tools). Closed on API and
+worker shutdown via close_ncbi_http_client().
+
+Pass a per-request timeout to client.get() when a call needs something other
+than the default.
+
+Usage:
+    client = get_ncbi_http_client()
+    response = await client.get(url, params=params, timeout=15.0)
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30.0
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_ncbi_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared NCBI client, creating it on first use.
+
+    Connections belong to the event loop that opened them, so a client created
+    under a different (e.g. finished asyncio.run) loop is replaced rather than
+    reused; see _discard_stale_client for what happens to the old one.
+    """
+    global _client, _client_loop
+    from config.settings import settings
+
+    loop = asyncio.get_running_loop()
+    if _client is not None and not _client.is_closed and _client_loop is loop:
+        return _client
+
+    _discard_stale_client()
+    http2 = settings.NCBI_HTTP2_ENABLED and _http2_available()
+    _client = httpx.AsyncClient(
+        timeout=DEFAULT_TIMEOUT,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.NCBI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.NCBI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.NCBI_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    _client_loop = loop
+    logger.info(
+        f"NCBI HTTP client created (http2={http2}, "
+        f"max_connections={settings.NCBI_HTTP_MAX_CONNECTIONS})"
+    )
+    return _client
+
+
+def _discard_stale_client() -> None:
+    """
+    Release the client of another event loop before it is replaced.
+
+    Its connections can only be closed on the loop that opened them: if that
+    loop is still running (another thread), aclose() is scheduled there. A
+    closed loop already tore its transports down, so the client is just dropped.
+    """
+    global _client, _client_loop
+    client, loop, _client, _client_loop = _client, _client_loop, None, None
+    if client is None or client.is_closed:
+        return
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        logger.info("NCBI HTTP client of a previous event loop scheduled for closing")
+    else:
+        logger.info("NCBI HTTP client of a finished event loop dropped")
+
+
+async def close_ncbi_http_client() -> None:
+    """Close the shared client. Safe to call when it was never created."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.info("NCBI HTTP client closed")
@@ -0,0 +1,78 @@
+"""
+NCBI Rate Limiter - Process-wide token bucket for E-utilities requests
+
+NCBI allows 3 requests/second per client without an API key and 10/second
+with one. The budget is per key, not per PubMedService instance, so every
+caller in the process (pipeline runs, chat tools, Tablizer, workbenches)
+draws from the same bucket.
+
+The bucket hands out reservations: acquire() computes how long the caller
+must wait for its token under a thread lock and then sleeps outside it.
+No asyncio primitives are held, so the limiter is safe to share across
+event loops and threads.
+
+Usage:
+    limiter = get_ncbi_rate_limiter(api_key)
+    await limiter.acquire()
+    response = await client.get(...)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# NCBI published limits (requests per second)
+NCBI_RPS_WITHOUT_KEY = 3
+NCBI_RPS_WITH_KEY = 10
+
+
+class TokenBucket:
+    """Token bucket with reservation semantics (tokens may go negative)."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_limiters: Dict[bool, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_ncbi_rate_limiter(api_key: Optional[str]) -> TokenBucket:
+    """Get the shared limiter for keyed or anonymous NCBI access."""
+    from config.settings import settings
+
+    keyed = bool(api_key)
+    with _limiters_lock:
+        if keyed not in _limiters:
+            default_rps = NCBI_RPS_WITH_KEY if keyed else NCBI_RPS_WITHOUT_KEY
+            rps = settings.NCBI_MAX_REQUESTS_PER_SECOND or default_rps
+            _limiters[keyed] = TokenBucket(rate=rps)
+            logger.info(f"NCBI rate limiter: {rps} req/s ({'with' if keyed else 'without'} API key)")
+        return _limiters[keyed]
@@ -20,13 +20,15 @@ from typing import AsyncGenerator, Dict, List, Optional, Tuple, Any, Callable, C
 from dataclasses import dataclass, field
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_, or_, select
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import asyncio
 import json
+import time
 import uuid
 import logging
 
 from utils.date_utils import format_pub_date
+from utils.near_duplicates import NearDuplicateIndex
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,7 @@ from models import (
     Report,
     Article,
     WipArticle,
+    ReportArticleAssociation,
     RunType,
     PipelineExecution,
 )
@@ -83,6 +86,9 @@ class PipelineContext:
     llm_config: Optional[PipelineLLMConfig]
     article_analysis_config: Optional[ArticleAnalysisConfig]
     web_sources: Optional[WebSourceConfig] = None
+    # Resuming an interrupted run: checkpoints recorded before it (see _run_stage)
+    resumed: bool = False
+    checkpoints: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     # === Mutable (accumulated during execution) ===
     total_retrieved: int = 0
@@ -93,9 +99,12 @@ class PipelineContext:
     categorize_errors: int = 0
     stance_analyzed_count: int = 0
     stance_analysis_errors: int = 0
+    full_text_fetched: int = 0
     executive_summary: str = ""
     category_summaries: Dict[str, str] = field(default_factory=dict)
+    enrichment_metrics: Dict[str, Any] = field(default_factory=dict)
     report: Optional["Report"] = None
+    retrieved_units: Dict[str, int] = field(default_factory=dict)  # unit_id -> articles stored
 
     def final_metrics(self) -> Dict[str, Any]:
         """Build metrics dict for completion status."""
@@ -107,9 +116,94 @@ class PipelineContext:
             "global_duplicates": self.global_duplicates,
             "included_count": self.included_count,
             "categorized_count": self.categorized_count,
+            "article_enrichment": self.enrichment_metrics,
         }
 
 
+@dataclass
+class ArticleBudget:
+    """
+    Cap on articles stored by one retrieval stage, shared by all retrieval units.
+
+    Units size their fetches with plan() in configuration order. A unit that
+    can list its results first plans exactly what it found, so the fetches
+    running concurrently download no more than the budget between them.
+    Stores then claim() in the same order, trimming to what is left.
+    Neither has an await, so two units cannot both take the last slots.
+    """
+
+    limit: int
+    used: int = 0  # Stored
+    planned: int = 0  # Committed to fetches of units that listed their results
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self.used)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.used >= self.limit
+
+    def plan(self, wanted: int, commit: bool) -> int:
+        """
+        How many of `wanted` articles a unit should fetch. commit=True (the
+        unit knows its result count) counts them against later plans.
+        """
+        size = max(0, min(wanted, self.limit - self.planned))
+        if commit:
+            self.planned += size
+        return size
+
+    def claim(self, requested: int) -> int:
+        """Take up to `requested` articles for storing. Returns how many were granted."""
+        granted = min(requested, self.remaining)
+        self.used += granted
+        return granted
+
+
+@dataclass
+class RetrievalUnit:
+    """One broad query or web source to retrieve in _stage_retrieval."""
+
+    kind: str  # "pubmed", "feed" or "site" - selects the concurrency limit
+    unit_id: str  # query_id or web source_id (WipArticle.retrieval_group_id)
+    label: str
+    data: Dict[str, Any]
+    # fetch(max_results) -> articles; network only, runs concurrently with other units
+    fetch: Callable[[int], Coroutine[Any, Any, List[CanonicalResearchArticle]]]
+    # store(articles) -> stored count; touches the DB session, runs one unit at a time
+    store: Callable[[List[CanonicalResearchArticle]], Coroutine[Any, Any, int]]
+    max_results: int
+    query: Optional[BroadQuery] = None  # Set for broad queries (semantic filter config)
+    # search(max_results) -> number of results, for sources that can list results
+    # before downloading them; lets the budget be planned before any fetch starts
+    search: Optional[Callable[[int], Coroutine[Any, Any, int]]] = None
+
+
+@dataclass
+class FusedEnrichmentPlan:
+    """Model and prompts for enriching each article in one LLM call (see _fused_enrichment_plan)."""
+
+    stage_config: StageConfig
+    system_message: str
+    user_message: str
+    summary_prompts: Tuple[str, str]
+    stance_prompts: Optional[Tuple[str, str]]
+    categorization_prompts: Tuple[str, str]
+
+
+async def _gather_or_cancel(*coros: Coroutine[Any, Any, Any]) -> List[Any]:
+    """Run coroutines concurrently; if one fails, cancel the rest and re-raise."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 class PipelineStatus:
     """Status update yielded during pipeline execution"""
 
@@ -135,6 +229,30 @@ class PipelineService:
     MAX_ARTICLES_PER_SOURCE = 1000
     MAX_TOTAL_ARTICLES = 1000
 
+    # Per-article LLM stages that scheduled runs send through the provider batch API
+    PROVIDER_BATCH_STAGES = {
+        "semantic_filter", "article_summary", "stance_analysis", "categorization", "article_enrichment",
+    }
+
+    # Checkpointed stages -> the PipelineContext fields saved with the checkpoint
+    # and restored when a resumed run skips the stage
+    STAGE_CHECKPOINT_FIELDS = {
+        "retrieval": ("total_retrieved",),
+        "dedup_global": ("global_duplicates",),
+        "filter": ("filter_stats", "included_count"),
+        "full_text": ("full_text_fetched",),
+        "report": (),
+        "article_enrichment": (
+            "enrichment_metrics", "categorized_count", "categorize_errors",
+            "stance_analyzed_count", "stance_analysis_errors",
+        ),
+        "category_summaries": (),
+        "executive_summary": (),
+    }
+
+    # Checkpoints _stage_streaming completes
+    STREAMING_STAGES = ("retrieval", "dedup_global", "filter", "full_text", "report", "article_enrichment")
+
     def __init__(self, db: AsyncSession):
         self.db = db
         self.research_stream_service = ResearchStreamService(db)
@@ -148,6 +266,18 @@ class PipelineService:
         self.eval_service = get_ai_evaluation_service()
         self.categorization_service = ArticleCategorizationService()
         self.summary_service = ReportSummaryService()
+        # LLM execution mode for the current run (see _configure_llm_execution)
+        self.llm_execution_mode = "realtime"
+        self.llm_batch_deadline: Optional[datetime] = None
+        # Provider batch IDs of the running stage by LLM stage, checkpointed so a resume can pick them up
+        self.provider_batch_ids: Dict[str, str] = {}
+        self._running_stage: Optional[Tuple[PipelineContext, str]] = None
+        # Pipelined stages for the current run (see _stage_streaming)
+        self.streaming_mode = False
+        # Token usage per LLM stage for the current run (see _record_llm_usage)
+        self.llm_usage: Dict[str, Dict[str, int]] = {}
+        # Serializes use of the session by concurrently running pipeline work
+        self.db_lock = asyncio.Lock()
 
     # =========================================================================
     # ENTITY LOOKUPS
@@ -172,21 +302,82 @@ class PipelineService:
     # MODEL CONFIGURATION HELPERS
     # =========================================================================
 
-    def _get_llm_options(self, stage_config: StageConfig, on_progress: Optional[callable] = None) -> LLMOptions:
+    def _get_llm_options(
+        self,
+        stage_config: StageConfig,
+        on_progress: Optional[callable] = None,
+        stage: Optional[str] = None,
+    ) -> LLMOptions:
         """
         Create LLMOptions from a StageConfig.
 
         Args:
             stage_config: Stage configuration with max_concurrent
             on_progress: Optional progress callback
+            stage: Stage name, used for per-stage prompt log sampling and result caching
 
         Returns:
             LLMOptions ready to pass to services
         """
+        batch = self.llm_execution_mode == "batch" and stage in self.PROVIDER_BATCH_STAGES
         return LLMOptions(
             max_concurrent=stage_config.max_concurrent,
             on_progress=on_progress,
+            stage=stage,
+            execution_mode="batch" if batch else "realtime",
+            batch_deadline=self.llm_batch_deadline if batch else None,
+            resume_batch_id=self.provider_batch_ids.get(stage) if batch else None,
+            on_batch_submitted=(
+                (lambda batch_id: self._checkpoint_provider_batch(stage, batch_id)) if batch else None
+            ),
+        )
+
+    async def _checkpoint_provider_batch(self, llm_stage: str, batch_id: str) -> None:
+        """Record a submitted provider batch in the running stage's checkpoint."""
+        self.provider_batch_ids[llm_stage] = batch_id
+        if self._running_stage is None:
+            return
+        ctx, name = self._running_stage
+        async with self.db_lock:
+            await self._record_checkpoint(
+                ctx, name, {"provider_batches": dict(self.provider_batch_ids)}, completed=False
+            )
+
+    def _record_llm_usage(self, stage: str, results: List[Any]) -> None:
+        """Add the token usage of a batch of LLMResults to the run's per-stage totals."""
+        totals = self.llm_usage.setdefault(
+            stage, {"calls": 0, "cached": 0, "prompt_tokens": 0, "completion_tokens": 0}
         )
+        for result in results:
+            totals["calls"] += 1
+            totals["cached"] += 1 if result.cached else 0
+            totals["prompt_tokens"] += result.usage.prompt_tokens
+            totals["completion_tokens"] += result.usage.completion_tokens
+
+    def _configure_llm_execution(self, ctx: PipelineContext) -> None:
+        """
+        Scheduled runs have no one waiting on them: send per-article LLM stages
+        through the provider batch API (cheaper, off the real-time rate limits),
+        with a deadline after which stages fall back to real-time calls.
+        """
+        from config.settings import settings
+
+        # A resumed run finishes on the staged path, which picks up per-item progress
+        self.streaming_mode = settings.PIPELINE_STREAMING_ENABLED and not ctx.resumed
+        self.llm_usage = {}
+        # Streaming feeds LLM stages a chunk at a time - provider batches would stall it
+        if ctx.execution.run_type == RunType.SCHEDULED and settings.LLM_BATCH_MODE_ENABLED and not self.streaming_mode:
+            self.llm_execution_mode = "batch"
+            self.llm_batch_deadline = datetime.now(timezone.utc) + timedelta(
+                minutes=settings.LLM_BATCH_MAX_WAIT_MINUTES
+            )
+            logger.info(
+                f"LLM provider batch mode for execution_id={ctx.execution_id} "
+                f"(deadline {self.llm_batch_deadline.isoformat()})"
+            )
+        else:
+            self.llm_execution_mode = "realtime"
+            self.llm_batch_deadline = None
 
     # =========================================================================
     # PIPELINE ORCHESTRATION
@@ -217,16 +408,16 @@ class PipelineService:
             progress_interval: Report progress every N items
             heartbeat_timeout: Seconds to wait before yielding heartbeat
         """
-        progress_queue: asyncio.Queue[Tuple[int, int]] = asyncio.Queue()
+        progress_queue: asyncio.Queue[Tuple[int, int, Optional[int]]] = asyncio.Queue()
         extra = extra_data or {}
 
-        async def progress_callback(completed: int, total: int):
+        async def progress_callback(completed: int, total: int, concurrency: Optional[int] = None):
             if (
                 completed == 1
                 or completed == total
                 or completed % progress_interval == 0
             ):
-                await progress_queue.put((completed, total))
+                await progress_queue.put((completed, total, concurrency))
 
         # Start the task - inject the progress callback
         task = asyncio.create_task(task_coro(on_progress=progress_callback))
@@ -234,13 +425,16 @@ class PipelineService:
         # Yield progress updates while task runs
         while not task.done():
             try:
-                completed, total = await asyncio.wait_for(
+                completed, total, concurrency = await asyncio.wait_for(
                     progress_queue.get(), timeout=heartbeat_timeout
                 )
+                data = {"completed": completed, "total": total, **extra}
+                if concurrency is not None:
+                    data["concurrency"] = concurrency
                 yield PipelineStatus(
                     stage,
                     progress_msg_template.format(completed=completed, total=total),
-                    {"completed": completed, "total": total, **extra},
+                    data,
                 ), None
             except asyncio.TimeoutError:
                 yield PipelineStatus(
@@ -258,10 +452,13 @@ class PipelineService:
         result = await task
         yield PipelineStatus(stage, "Complete", extra), result
 
-    async def _load_execution_context(self, execution_id: str) -> PipelineContext:
+    async def _load_execution_context(self, execution_id: str, resume: bool = False) -> PipelineContext:
         """
         Load execution record and build PipelineContext.
 
+        With resume, the execution's checkpoints are loaded too (a run without
+        checkpoints starts from scratch either way).
+
         Raises ValueError if execution not found or configuration invalid.
         """
         # Load execution record (single source of truth)
@@ -311,6 +508,8 @@ class PipelineService:
             except Exception as e:
                 logger.warning(f"Failed to parse article_analysis_config, skipping stance analysis: {e}")
 
+        checkpoints = dict(execution.checkpoints or {}) if resume else {}
+
         return PipelineContext(
             execution_id=execution_id,
             execution=execution,
@@ -327,6 +526,9 @@ class PipelineService:
             llm_config=llm_config,
             article_analysis_config=article_analysis_config,
             web_sources=retrieval_config.web_sources,
+            resumed=bool(checkpoints),
+            checkpoints=checkpoints,
+            retrieved_units=dict(checkpoints.get("retrieval", {}).get("units", {})),
         )
 
     async def run_pipeline_direct(
@@ -411,7 +613,7 @@ class PipelineService:
             raise
 
     async def run_pipeline(
-        self, execution_id: str
+        self, execution_id: str, resume: bool = False
     ) -> AsyncGenerator[PipelineStatus, None]:
         """
         Execute the full pipeline for a research stream and yield status updates.
@@ -419,8 +621,15 @@ class PipelineService:
         ALL configuration is read from the PipelineExecution record.
         Each stage is independently testable and owns its commit.
 
+        Each finished stage is checkpointed in execution.checkpoints. With
+        resume, checkpointed stages are skipped (their results restored), and
+        the interrupted stage only processes items without results: retrieval
+        units not yet stored, unfiltered WipArticles, included articles not yet
+        in the report, associations without a summary / stance / category.
+
         Args:
             execution_id: The PipelineExecution ID - ALL config is read from this record
+            resume: Continue an interrupted run from its checkpoints
 
         Yields:
             PipelineStatus: Status updates at each stage
@@ -428,7 +637,17 @@ class PipelineService:
         try:
             # Load configuration
             yield PipelineStatus("init", "Loading execution configuration...")
-            ctx = await self._load_execution_context(execution_id)
+            ctx = await self._load_execution_context(execution_id, resume=resume)
+            self._configure_llm_execution(ctx)
+            if ctx.resumed:
+                await self._restore_from_checkpoints(ctx)
+                completed = [stage for stage, entry in ctx.checkpoints.items() if "completed_at" in entry]
+                logger.info(f"Resuming execution_id={execution_id}, completed stages: {completed}")
+                yield PipelineStatus(
+                    "init",
+                    f"Resuming interrupted run ({len(completed)} stages already completed)",
+                    {"completed_stages": completed, "retrieved_units": len(ctx.retrieved_units)},
+                )
             logger.info(
                 f"Starting pipeline for execution_id={execution_id}, stream_id={ctx.research_stream_id}"
             )
@@ -446,23 +665,27 @@ class PipelineService:
             )
 
             # Execute pipeline stages
-            async for status in self._stage_retrieval(ctx):
-                yield status
-            async for status in self._stage_deduplicate(ctx):
-                yield status
-            async for status in self._stage_semantic_filter(ctx):
-                yield status
-            async for status in self._stage_generate_report(ctx):
-                yield status  # Creates bare associations
-            async for status in self._stage_generate_article_summaries(ctx):
-                yield status  # Writes ai_summary to associations (needed for categorization)
-            async for status in self._stage_stance_analysis(ctx):
-                yield status  # Writes stance analysis to ai_enrichments (uses ai_summary)
-            async for status in self._stage_categorize(ctx):
-                yield status  # Writes categories to associations (can use ai_summary)
-            async for status in self._stage_generate_category_summaries(ctx):
+            if self.streaming_mode:
+                async for status in self._stage_streaming(ctx):
+                    yield status  # Retrieval through categorization, pipelined
+                for stage in self.STREAMING_STAGES:
+                    await self._record_checkpoint(ctx, stage)
+            else:
+                async for status in self._run_stage(ctx, "retrieval", self._stage_retrieval):
+                    yield status
+                async for status in self._run_stage(ctx, "dedup_global", self._stage_deduplicate):
+                    yield status
+                async for status in self._run_stage(ctx, "filter", self._stage_semantic_filter):
+                    yield status
+                async for status in self._run_stage(ctx, "full_text", self._stage_fetch_full_text):
+                    yield status  # PMC full text for included articles only (lazy mode)
+                async for status in self._run_stage(ctx, "report", self._stage_generate_report):
+                    yield status  # Creates bare associations
+                async for status in self._run_stage(ctx, "article_enrichment", self._stage_article_enrichment):
+                    yield status  # Summaries, then stance + categories (fused or scheduled)
+            async for status in self._run_stage(ctx, "category_summaries", self._stage_generate_category_summaries):
                 yield status  # Category summaries
-            async for status in self._stage_generate_executive_summary(ctx):
+            async for status in self._run_stage(ctx, "executive_summary", self._stage_generate_executive_summary):
                 yield status  # Executive summary
 
             # Complete
@@ -475,6 +698,9 @@ class PipelineService:
                 f"Pipeline failed for execution_id={execution_id}: {type(e).__name__}: {str(e)}",
                 exc_info=True,
             )
+            # Drop what the failed stage left uncommitted (its checkpoint was never
+            # written), so the caller can still record the failure on this session
+            await self.db.rollback()
             yield PipelineStatus(
                 "error",
                 f"Pipeline failed: {str(e)}",
@@ -482,6 +708,89 @@ class PipelineService:
             )
             raise
 
+    async def _run_stage(
+        self,
+        ctx: PipelineContext,
+        name: str,
+        stage: Callable[[PipelineContext], AsyncGenerator[PipelineStatus, None]],
+    ) -> AsyncGenerator[PipelineStatus, None]:
+        """
+        Run a stage and checkpoint it; a resumed run skips a checkpointed stage
+        and restores its STAGE_CHECKPOINT_FIELDS into ctx instead.
+        """
+        checkpoint = ctx.checkpoints.get(name, {})
+        if "completed_at" in checkpoint:
+            for attr in self.STAGE_CHECKPOINT_FIELDS[name]:
+                if attr in checkpoint:
+                    setattr(ctx, attr, checkpoint[attr])
+            yield PipelineStatus(
+                name,
+                "Already completed before the run was interrupted - skipping",
+                {"resumed": True, "completed_at": checkpoint["completed_at"]},
+            )
+            return
+
+        # Provider batches this stage submitted before an interruption are polled, not resubmitted
+        self.provider_batch_ids = dict(checkpoint.get("provider_batches") or {})
+        self._running_stage = (ctx, name)
+        try:
+            async for status in stage(ctx):
+                yield status
+        finally:
+            self._running_stage = None
+        await self._record_checkpoint(ctx, name)
+
+    async def _record_checkpoint(
+        self,
+        ctx: PipelineContext,
+        name: str,
+        data: Optional[Dict[str, Any]] = None,
+        completed: bool = True,
+    ) -> None:
+        """
+        Save a stage checkpoint (with its STAGE_CHECKPOINT_FIELDS when completed) and commit.
+
+        Callers running alongside other pipeline work must hold db_lock.
+        """
+        if completed:
+            data = {
+                **{attr: getattr(ctx, attr) for attr in self.STAGE_CHECKPOINT_FIELDS[name]},
+                **(data or {}),
+            }
+        await self.execution_service.record_checkpoint(ctx.execution_id, name, data, completed=completed)
+        await self.db.commit()
+
+    async def _restore_from_checkpoints(self, ctx: PipelineContext) -> None:
+        """
+        Reload what a resumed run needs beyond the checkpointed fields: the
+        report, if one was created, and the summaries already written to it.
+        """
+        if not ctx.execution.report_id:
+            return
+        ctx.report = await self.report_service.get_report_by_id_internal(ctx.execution.report_id)
+        enrichments = (ctx.report.enrichments or {}) if ctx.report else {}
+        ctx.category_summaries = enrichments.get("category_summaries") or {}
+        ctx.executive_summary = enrichments.get("executive_summary") or ""
+
+    async def _associations_lacking(
+        self, ctx: PipelineContext, *results: str
+    ) -> Optional[List[ReportArticleAssociation]]:
+        """
+        On a resumed run, the report's visible associations missing any of the
+        given results ("summary", "stance", "category"). None otherwise - the
+        enrichment helpers then take all visible associations, as before.
+        """
+        if not ctx.resumed:
+            return None
+        missing = {
+            "summary": lambda assoc: not assoc.ai_summary,
+            "stance": lambda assoc: not (assoc.ai_enrichments or {}).get("stance_analysis"),
+            "category": lambda assoc: not assoc.presentation_categories,
+        }
+        async with self.db_lock:
+            associations = await self.association_service.get_visible_for_report(ctx.report.report_id)
+        return [assoc for assoc in associations if any(missing[result](assoc) for result in results)]
+
     # =========================================================================
     # PIPELINE STAGES
     # =========================================================================
@@ -492,101 +801,537 @@ class PipelineService:
         """
         Stage: Execute retrieval for each broad search query and web source.
         Commits: WipArticle records for all retrieved articles.
+
+        All units search and fetch concurrently, within a per-source-type limit
+        (RETRIEVAL_*_MAX_CONCURRENCY). Broad queries list their PMIDs first, and
+        each unit's fetch is sized from the article budget in configuration
+        order, so concurrent fetches do not download articles the budget would
+        drop. Storing runs one unit at a time in configuration order, trimming
+        to what is left of the budget, so the budget is handed out - and
+        within-execution duplicates are resolved - as in a sequential run.
+        (PMIDs PubMed returns no record for are not re-offered to later units.)
+        Status updates are yielded as each unit starts, finishes fetching and
+        is stored.
+
+        Resumed: units stored before the interruption are not fetched again;
+        articles of the unit that was being stored are deleted and re-retrieved.
         """
-        num_web_sources = len(ctx.web_sources.sources) if ctx.web_sources else 0
+        if ctx.resumed:
+            deleted = await self.wip_article_service.delete_retrieval_groups_except(
+                ctx.execution_id, list(ctx.retrieved_units)
+            )
+            yield PipelineStatus(
+                "retrieval",
+                f"Resuming retrieval: {len(ctx.retrieved_units)} units already stored",
+                {"resumed": True, "units_stored": len(ctx.retrieved_units), "partial_articles_deleted": deleted},
+            )
+
+        events: asyncio.Queue[PipelineStatus] = asyncio.Queue()
+        runner = asyncio.create_task(self._run_retrieval(ctx, events))
+        async for status in self._pump_events(runner, events, "retrieval", "Retrieving..."):
+            yield status
+
         yield PipelineStatus(
             "retrieval",
-            f"Starting retrieval for {len(ctx.queries)} queries and {num_web_sources} web sources",
-            {"num_queries": len(ctx.queries), "num_web_sources": num_web_sources},
+            f"Retrieval complete: {ctx.total_retrieved} articles",
+            {"total_retrieved": ctx.total_retrieved},
         )
 
-        # --- Broad search queries ---
-        for query in ctx.queries:
-            # Check limits
-            if ctx.total_retrieved >= self.MAX_TOTAL_ARTICLES:
-                yield PipelineStatus(
+    async def _run_retrieval(
+        self,
+        ctx: PipelineContext,
+        events: "asyncio.Queue[PipelineStatus]",
+        on_stored: Optional[Callable[[RetrievalUnit], Coroutine[Any, Any, None]]] = None,
+    ) -> None:
+        """
+        Search and fetch all retrieval units concurrently and store them in order (see _stage_retrieval).
+
+        Each stored unit is recorded in the "retrieval" checkpoint (and in
+        ctx.retrieved_units); units already there are skipped.
+
+        Args:
+            ctx: Pipeline context (total_retrieved and retrieved_units are updated)
+            events: Queue that receives status updates
+            on_stored: Optional async callback(unit), awaited in the unit's store
+                turn - later units do not store until it returns
+        """
+        from config.settings import settings
+
+        units = self._build_retrieval_units(ctx)
+        num_queries = sum(1 for u in units if u.kind == "pubmed")
+        num_web_sources = len(units) - num_queries
+        await events.put(PipelineStatus(
+            "retrieval",
+            f"Starting retrieval for {num_queries} queries and {num_web_sources} web sources",
+            {"num_queries": num_queries, "num_web_sources": num_web_sources},
+        ))
+
+        budget = ArticleBudget(limit=self.MAX_TOTAL_ARTICLES)
+        for unit in units:
+            already_stored = ctx.retrieved_units.get(unit.unit_id, 0)
+            budget.plan(already_stored, commit=True)
+            budget.claim(already_stored)
+        limits = {
+            "pubmed": asyncio.Semaphore(max(1, settings.RETRIEVAL_PUBMED_MAX_CONCURRENCY)),
+            "feed": asyncio.Semaphore(max(1, settings.RETRIEVAL_FEED_MAX_CONCURRENCY)),
+            "site": asyncio.Semaphore(max(1, settings.RETRIEVAL_SITE_MAX_CONCURRENCY)),
+        }
+        # plan_turns[i] is set once unit i may plan its fetch (all earlier units have planned);
+        # store_turns[i] once it may store (all earlier units are stored)
+        plan_turns = [asyncio.Event() for _ in units]
+        store_turns = [asyncio.Event() for _ in units]
+        if units:
+            plan_turns[0].set()
+            store_turns[0].set()
+        limit_reported = False
+
+        async def report_limit() -> None:
+            nonlocal limit_reported
+            if not limit_reported:
+                limit_reported = True
+                await events.put(PipelineStatus(
                     "retrieval",
                     f"Hit MAX_TOTAL_ARTICLES limit ({self.MAX_TOTAL_ARTICLES})",
                     {"limit_reached": True},
+                ))
+
+        async def run_unit(index: int, unit: RetrievalUnit) -> None:
+            articles: List[CanonicalResearchArticle] = []
+            stored = ctx.retrieved_units.get(unit.unit_id)
+            cut_by_budget = False
+            try:
+                if stored is None:
+                    try:
+                        found = unit.max_results
+                        if unit.search:
+                            async with limits[unit.kind]:
+                                found = await unit.search(unit.max_results)
+                        await plan_turns[index].wait()
+                        size = budget.plan(found, commit=unit.search is not None)
+                        cut_by_budget = unit.search is not None and size < found
+                    finally:
+                        if index + 1 < len(plan_turns):
+                            plan_turns[index + 1].set()
+
+                    if size:
+                        async with limits[unit.kind]:
+                            await events.put(PipelineStatus("retrieval", f"Fetching: {unit.label}", unit.data))
+                            articles = await unit.fetch(size)
+                        await events.put(PipelineStatus(
+                            "retrieval",
+                            f"Fetched {len(articles)} articles: {unit.label}",
+                            {**unit.data, "fetched": len(articles)},
+                        ))
+                elif index + 1 < len(plan_turns):
+                    plan_turns[index + 1].set()
+
+                await store_turns[index].wait()
+                if stored is not None:
+                    # Stored before a resumed run was interrupted (claimed from the budget above)
+                    ctx.total_retrieved += stored
+                    await events.put(PipelineStatus(
+                        "retrieval",
+                        f"Already retrieved {stored} articles: {unit.label}",
+                        {**unit.data, "count": stored, "total": ctx.total_retrieved, "resumed": True},
+                    ))
+                    return
+                granted = budget.claim(len(articles))
+                async with self.db_lock:
+                    count = await unit.store(articles[:granted])
+                    ctx.retrieved_units[unit.unit_id] = count
+                    await self._record_checkpoint(
+                        ctx, "retrieval", {"units": dict(ctx.retrieved_units)}, completed=False
+                    )
+                ctx.total_retrieved += count
+                if cut_by_budget or granted < len(articles) or budget.exhausted:
+                    await report_limit()
+                await events.put(PipelineStatus(
+                    "retrieval",
+                    f"Retrieved {count} articles",
+                    {**unit.data, "count": count, "total": ctx.total_retrieved},
+                ))
+                if on_stored:
+                    await on_stored(unit)
+            finally:
+                if index + 1 < len(store_turns):
+                    store_turns[index + 1].set()
+
+        await _gather_or_cancel(*(run_unit(i, unit) for i, unit in enumerate(units)))
+
+    async def _pump_events(
+        self,
+        runner: "asyncio.Task[Any]",
+        events: "asyncio.Queue[PipelineStatus]",
+        stage: str,
+        heartbeat_msg: str,
+        heartbeat_timeout: float = 3.0,
+    ) -> AsyncGenerator[PipelineStatus, None]:
+        """
+        Yield status updates that a background task puts on `events` until it finishes.
+
+        Yields a heartbeat when nothing arrives for heartbeat_timeout seconds.
+        Re-raises the task's exception; cancels it if the consumer stops early.
+        """
+        try:
+            while True:
+                getter = asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait(
+                    {getter, runner}, timeout=heartbeat_timeout, return_when=asyncio.FIRST_COMPLETED
                 )
-                break
+                if getter in done:
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                if runner in done:
+                    break
+                yield PipelineStatus(stage, heartbeat_msg, {"heartbeat": True})
 
-            yield PipelineStatus(
-                "retrieval",
-                f"Fetching: {query.search_terms}",
-                {
-                    "query_id": query.query_id,
-                    "query_expression": query.query_expression,
-                },
-            )
+            while not events.empty():
+                yield events.get_nowait()
+            await runner
+        finally:
+            if not runner.done():
+                runner.cancel()
 
-            count = await self._fetch_and_store_articles(
-                research_stream_id=ctx.research_stream_id,
-                execution_id=ctx.execution_id,
-                retrieval_unit_id=query.query_id,
-                source_id=query.source_id,
-                query_expression=query.query_expression,
-                start_date=ctx.start_date,
-                end_date=ctx.end_date,
-            )
+    async def _run_stage_graph(
+        self,
+        stages: Dict[str, Tuple[Tuple[str, ...], Callable[[], AsyncGenerator[PipelineStatus, None]]]],
+        events: "asyncio.Queue[PipelineStatus]",
+    ) -> Dict[str, float]:
+        """
+        Run stage generators as soon as the stages they depend on have finished.
 
-            ctx.total_retrieved += count
+        Args:
+            stages: name -> (names of the stages it depends on, factory for its generator)
+            events: Receives every status the stages yield
 
-            yield PipelineStatus(
-                "retrieval",
-                f"Retrieved {count} articles",
-                {
-                    "query_id": query.query_id,
-                    "count": count,
-                    "total": ctx.total_retrieved,
-                },
-            )
+        Returns:
+            Seconds each stage took, by name
+        """
+        finished = {name: asyncio.Event() for name in stages}
+        durations: Dict[str, float] = {}
+
+        async def run(name: str) -> None:
+            deps, factory = stages[name]
+            for dep in deps:
+                await finished[dep].wait()
+            started = time.perf_counter()
+            async for status in factory():
+                await events.put(status)
+            durations[name] = round(time.perf_counter() - started, 2)
+            finished[name].set()
+
+        await _gather_or_cancel(*(run(name) for name in stages))
+        return durations
+
+    def _build_retrieval_units(self, ctx: PipelineContext) -> List[RetrievalUnit]:
+        """Broad queries first, then enabled web sources - the order articles are stored in."""
+        units: List[RetrievalUnit] = []
+
+        for query in ctx.queries:
+            # IDs found by the unit's search; fetch(n) downloads the first n
+            found_ids: List[str] = []
+
+            async def search_query(max_results: int, q=query, found_ids=found_ids) -> int:
+                found_ids[:] = await self._search_query_ids(
+                    source_id=q.source_id,
+                    query_expression=q.query_expression,
+                    start_date=ctx.start_date,
+                    end_date=ctx.end_date,
+                    max_results=max_results,
+                )
+                return len(found_ids)
+
+            units.append(RetrievalUnit(
+                kind="pubmed",
+                unit_id=query.query_id,
+                label=query.search_terms,
+                data={"query_id": query.query_id, "query_expression": query.query_expression},
+                search=search_query,
+                fetch=lambda max_results, q=query, found_ids=found_ids: self._fetch_query_articles(
+                    source_id=q.source_id, ids=found_ids[:max_results]
+                ),
+                store=lambda articles, q=query: self._store_articles(
+                    research_stream_id=ctx.research_stream_id,
+                    execution_id=ctx.execution_id,
+                    retrieval_unit_id=q.query_id,
+                    source_id=q.source_id,
+                    articles=articles,
+                ),
+                max_results=self.MAX_ARTICLES_PER_SOURCE,
+                query=query,
+            ))
 
-        # --- Web sources ---
         if ctx.web_sources:
             for ws in ctx.web_sources.sources:
                 if not ws.enabled:
                     continue
-
-                if ctx.total_retrieved >= self.MAX_TOTAL_ARTICLES:
-                    yield PipelineStatus(
-                        "retrieval",
-                        f"Hit MAX_TOTAL_ARTICLES limit ({self.MAX_TOTAL_ARTICLES})",
-                        {"limit_reached": True},
+                # The site agent's updated memo is written back when the unit stores
+                site_memo: Dict[str, Optional[str]] = {}
+
+                async def fetch_web(max_results: int, ws=ws, site_memo=site_memo):
+                    articles, site_memo["value"] = await self._fetch_web_source(
+                        web_source=ws,
+                        start_date=ctx.start_date,
+                        max_items=max_results,
+                        user_id=ctx.user_id,
                     )
-                    break
+                    return articles
+
+                units.append(RetrievalUnit(
+                    kind="feed" if ws.source_type == "feed" else "site",
+                    unit_id=ws.source_id,
+                    label=f"web source {ws.url}",
+                    data={"web_source_id": ws.source_id, "url": ws.url},
+                    fetch=fetch_web,
+                    store=lambda articles, ws=ws, site_memo=site_memo: self._store_web_source_articles(
+                        ctx=ctx,
+                        web_source=ws,
+                        articles=articles,
+                        site_memo=site_memo.get("value"),
+                    ),
+                    max_results=ctx.web_sources.max_articles_per_source,
+                ))
+
+        return units
+
+    async def _stage_streaming(
+        self, ctx: PipelineContext
+    ) -> AsyncGenerator[PipelineStatus, None]:
+        """
+        Stages retrieval through categorization, pipelined (PIPELINE_STREAMING_ENABLED).
+        Commits: the same records as the staged path, unit by unit and chunk by chunk.
+
+        FLOW:
+            retrieval ---- dedup each unit in its store turn (store order, as in the batch dedup)
+              --[unit queue]--> filter workers: semantic filter, mark included, lazy full text
+              --[chunk queue]--> enrich workers: promote to report, summaries, then stance + categorize
+                                 (or one fused call, see _stage_article_enrichment)
+
+        The report is created up front so included articles can be promoted as
+        they arrive. Queues are bounded (PIPELINE_STREAMING_QUEUE_SIZE): a slow
+        stage holds back the one feeding it instead of buffering the whole run.
+        Category and executive summaries still run afterwards, on the full set.
+
+        The unit queue carries whole retrieval units, since dedup and the
+        semantic filter work per unit: a stream with one query only overlaps
+        enrichment with filtering, not filtering with retrieval.
+        """
+        from config.settings import settings
 
-                yield PipelineStatus(
-                    "retrieval",
-                    f"Fetching web source: {ws.url}",
-                    {"web_source_id": ws.source_id, "url": ws.url},
-                )
+        queue_size = max(1, settings.PIPELINE_STREAMING_QUEUE_SIZE)
+        chunk_size = max(1, settings.PIPELINE_STREAMING_CHUNK_SIZE)
+        filter_workers = max(1, settings.PIPELINE_STREAMING_FILTER_WORKERS)
+        enrich_workers = max(1, settings.PIPELINE_STREAMING_ENRICH_WORKERS)
 
-                count = await self._fetch_web_source_articles(
-                    research_stream_id=ctx.research_stream_id,
-                    execution_id=ctx.execution_id,
-                    web_source=ws,
-                    start_date=ctx.start_date,
-                    max_items=ctx.web_sources.max_articles_per_source,
-                    ctx=ctx,
+        events: asyncio.Queue[PipelineStatus] = asyncio.Queue()
+        unit_queue: asyncio.Queue[Optional[RetrievalUnit]] = asyncio.Queue(maxsize=queue_size)
+        chunk_queue: asyncio.Queue[Optional[List[WipArticle]]] = asyncio.Queue(maxsize=queue_size)
+
+        yield PipelineStatus("report", "Creating report (streaming mode)...")
+        ctx.report = await self._create_report(
+            ctx=ctx,
+            executive_summary=ctx.executive_summary,
+            category_summaries=ctx.category_summaries,
+            metrics={},
+            wip_articles=[],
+        )
+
+        filter_config = get_stage_config(ctx.llm_config, "semantic_filter")
+        summary_config = get_stage_config(ctx.llm_config, "article_summary")
+        stance_config = get_stage_config(ctx.llm_config, "stance_analysis")
+        categorize_config = get_stage_config(ctx.llm_config, "categorization")
+        stance_prompt = self._stance_prompt(ctx)
+        fused_plan = self._fused_enrichment_plan(ctx)
+
+        seen_dois: Dict[str, str] = {}
+        seen_titles: Dict[str, str] = {}
+        near_duplicates = self._near_duplicate_index()
+        duplicates = {"historical": 0, "within_execution": 0}
+        next_ranking = 1
+        summarized = 0
+        prompt_tokens_saved = 0
+
+        async def on_stored(unit: RetrievalUnit) -> None:
+            async with self.db_lock:
+                historical, within = await self._deduplicate_retrieval_unit(
+                    ctx.research_stream_id, ctx.execution_id, unit.unit_id, seen_dois, seen_titles,
+                    near_duplicates,
+                )
+                await self.wip_article_service.commit()
+            duplicates["historical"] += historical
+            duplicates["within_execution"] += within
+            ctx.global_duplicates += historical + within
+            if historical or within:
+                await events.put(PipelineStatus(
+                    "dedup_global",
+                    f"Found {historical + within} duplicates: {unit.label}",
+                    {**unit.data, "historical": historical, "within_execution": within},
+                ))
+            await unit_queue.put(unit)
+
+        async def filter_unit(unit: RetrievalUnit) -> None:
+            query = unit.query
+            if query is not None:
+                if query.semantic_filter.enabled:
+                    passed, rejected, errors = await self._apply_semantic_filter(
+                        execution_id=ctx.execution_id,
+                        retrieval_unit_id=query.query_id,
+                        filter_criteria=query.semantic_filter.criteria,
+                        threshold=query.semantic_filter.threshold,
+                        stage_config=filter_config,
+                    )
+                    ctx.filter_stats[query.query_id] = {"passed": passed, "rejected": rejected, "errors": errors}
+                    await events.put(PipelineStatus(
+                        "filter",
+                        f"Filtered: {passed} passed, {rejected} rejected",
+                        {"query_id": query.query_id, "passed": passed, "rejected": rejected},
+                    ))
+                else:
+                    async with self.db_lock:
+                        articles = await self.wip_article_service.get_for_filtering(
+                            ctx.execution_id, query.query_id
+                        )
+                        count = await self.wip_article_service.bulk_update_filter_bypassed(articles)
+                    await events.put(PipelineStatus(
+                        "filter",
+                        f"Filter disabled - {count} articles auto-passed",
+                        {"query_id": query.query_id, "filtered": False, "auto_passed": count},
+                    ))
+            # Web source articles are pre-approved at creation
+
+            async with self.db_lock:
+                included = [
+                    a for a in await self.wip_article_service.get_passed_filter(ctx.execution_id, unit.unit_id)
+                    if not a.included_in_report
+                ]
+                self.wip_article_service.mark_all_for_inclusion(included)
+                await self.wip_article_service.commit()
+            ctx.included_count += len(included)
+
+            if included and settings.PIPELINE_LAZY_FULL_TEXT:
+                ctx.full_text_fetched += await self._fetch_full_text_for_included(
+                    execution_id=ctx.execution_id, articles=included
                 )
 
-                ctx.total_retrieved += count
+            for i in range(0, len(included), chunk_size):
+                await chunk_queue.put(included[i:i + chunk_size])
 
-                yield PipelineStatus(
-                    "retrieval",
-                    f"Retrieved {count} articles from web source",
-                    {
-                        "web_source_id": ws.source_id,
-                        "count": count,
-                        "total": ctx.total_retrieved,
-                    },
+        async def enrich_chunk(chunk: List[WipArticle]) -> None:
+            nonlocal next_ranking, summarized, prompt_tokens_saved
+            report_id = ctx.report.report_id
+            async with self.db_lock:
+                first_ranking = next_ranking
+                next_ranking += len(chunk)
+                await self._add_articles_to_report(report_id, chunk, first_ranking=first_ranking)
+                await self.db.commit()
+                associations = await self.association_service.get_visible_for_wip_articles(
+                    report_id, [a.id for a in chunk]
+                )
+
+            if fused_plan:
+                counts = await self._enrich_articles_fused(
+                    ctx=ctx, report_id=report_id, plan=fused_plan, associations=associations
+                )
+                summarized += counts["summarized"]
+                prompt_tokens_saved += counts["prompt_tokens_saved"]
+                ctx.stance_analyzed_count += counts["stance_analyzed"]
+                ctx.stance_analysis_errors += counts["stance_errors"]
+                ctx.categorized_count += counts["categorized"]
+                ctx.categorize_errors += counts["categorize_errors"]
+            else:
+                summarized += await self._generate_article_summaries(
+                    report_id=report_id,
+                    stream=ctx.stream,
+                    enrichment_config=ctx.enrichment_config,
+                    stage_config=summary_config,
+                    associations=associations,
                 )
+                await _gather_or_cancel(analyze_stances(associations), categorize(associations))
+
+            await events.put(PipelineStatus(
+                "enrich",
+                f"Enriched {len(chunk)} articles ({next_ranking - 1} in report)",
+                {"chunk": len(chunk), "in_report": next_ranking - 1, "summarized": summarized},
+            ))
+
+        async def analyze_stances(associations: List[ReportArticleAssociation]) -> None:
+            if stance_prompt:
+                analyzed, errors = await self._analyze_stances(
+                    report_id=ctx.report.report_id,
+                    stream=ctx.stream,
+                    stance_prompt=stance_prompt,
+                    stage_config=stance_config,
+                    associations=associations,
+                )
+                ctx.stance_analyzed_count += analyzed
+                ctx.stance_analysis_errors += errors
+
+        async def categorize(associations: List[ReportArticleAssociation]) -> None:
+            categorized, errors = await self._categorize_articles(
+                report_id=ctx.report.report_id,
+                presentation_config=ctx.presentation_config,
+                stage_config=categorize_config,
+                associations=associations,
+            )
+            ctx.categorized_count += categorized
+            ctx.categorize_errors += errors
+
+        async def filter_worker() -> None:
+            while (unit := await unit_queue.get()) is not None:
+                await filter_unit(unit)
+
+        async def enrich_worker() -> None:
+            while (chunk := await chunk_queue.get()) is not None:
+                await enrich_chunk(chunk)
+
+        async def retrieve() -> None:
+            await self._run_retrieval(ctx, events, on_stored=on_stored)
+            for _ in range(filter_workers):
+                await unit_queue.put(None)
+
+        async def filter_all() -> None:
+            await _gather_or_cancel(*(filter_worker() for _ in range(filter_workers)))
+            for _ in range(enrich_workers):
+                await chunk_queue.put(None)
+
+        runner = asyncio.create_task(_gather_or_cancel(
+            retrieve(), filter_all(), *(enrich_worker() for _ in range(enrich_workers))
+        ))
+        async for status in self._pump_events(runner, events, "streaming", "Processing..."):
+            yield status
+
+        ctx.enrichment_metrics = {"mode": "fused" if fused_plan else "scheduled"}
+        if fused_plan:
+            ctx.enrichment_metrics["estimated_prompt_tokens_saved"] = prompt_tokens_saved
+        ctx.enrichment_metrics["tokens"] = self._enrichment_token_usage()
+        ctx.report.pipeline_metrics = {
+            "total_retrieved": ctx.total_retrieved,
+            "filter_stats": ctx.filter_stats,
+            "global_duplicates": ctx.global_duplicates,
+            "included_in_report": ctx.included_count,
+            "categorized": ctx.categorized_count,
+            "article_enrichment": ctx.enrichment_metrics,
+        }
+        await self.db.commit()
 
         yield PipelineStatus(
-            "retrieval",
-            f"Retrieval complete: {ctx.total_retrieved} articles",
-            {"total_retrieved": ctx.total_retrieved},
+            "streaming",
+            f"Retrieved {ctx.total_retrieved}, {ctx.global_duplicates} duplicates "
+            f"({duplicates['historical']} from previous reports, {duplicates['within_execution']} within execution), "
+            f"{ctx.included_count} included, {summarized} summarized, {ctx.categorized_count} categorized",
+            {
+                "total_retrieved": ctx.total_retrieved,
+                "duplicates": ctx.global_duplicates,
+                **duplicates,
+                "stats": ctx.filter_stats,
+                "included": ctx.included_count,
+                "full_text_fetched": ctx.full_text_fetched,
+                "summarized": summarized,
+                "stance_analyzed": ctx.stance_analyzed_count,
+                "categorized": ctx.categorized_count,
+                "report_id": ctx.report.report_id,
+            },
         )
 
     async def _stage_semantic_filter(
@@ -652,6 +1397,14 @@ class PipelineService:
         # Web source articles are pre-approved (passed_semantic_filter=True at creation)
         # so no semantic filter loop is needed for them.
 
+        if ctx.resumed:
+            # Count articles filtered before the run was interrupted too
+            counts = await self.wip_article_service.get_execution_counts(ctx.execution_id)
+            for query_id, stats in ctx.filter_stats.items():
+                if query_id in counts:
+                    stats["passed"] = counts[query_id].passed_filter
+                    stats["rejected"] = counts[query_id].filtered_out - stats["errors"]
+
         # Mark articles for inclusion (after filtering completes)
         ctx.included_count = await self._mark_articles_for_report(ctx.execution_id)
         await self.wip_article_service.commit()
@@ -662,6 +1415,45 @@ class PipelineService:
             {"stats": ctx.filter_stats, "included": ctx.included_count}
         )
 
+    async def _stage_fetch_full_text(
+        self, ctx: PipelineContext
+    ) -> AsyncGenerator[PipelineStatus, None]:
+        """
+        Stage: Fetch PMC full text for articles marked for inclusion.
+        Commits: full_text on included WipArticles.
+
+        Only runs when PIPELINE_LAZY_FULL_TEXT is on - retrieval then skips full
+        text, so articles rejected by the semantic filter are never downloaded.
+        """
+        from config.settings import settings
+
+        if not settings.PIPELINE_LAZY_FULL_TEXT:
+            return
+
+        yield PipelineStatus("full_text", "Fetching full text for included articles...")
+
+        result = None
+        async for status, res in self._stream_with_progress(
+            task_coro=lambda on_progress: self._fetch_full_text_for_included(
+                execution_id=ctx.execution_id,
+                on_progress=on_progress,
+            ),
+            stage="full_text",
+            progress_msg_template="Full text: {completed}/{total}",
+            heartbeat_msg="Fetching full text...",
+        ):
+            if res is not None:
+                result = res
+            else:
+                yield status
+
+        ctx.full_text_fetched = result
+        yield PipelineStatus(
+            "full_text",
+            f"Fetched full text for {result} articles",
+            {"fetched": result},
+        )
+
     async def _stage_deduplicate(
         self, ctx: PipelineContext
     ) -> AsyncGenerator[PipelineStatus, None]:
@@ -685,6 +1477,98 @@ class PipelineService:
             {"duplicates": ctx.global_duplicates, "historical": historical_dupes, "within_execution": execution_dupes},
         )
 
+    async def _stage_article_enrichment(
+        self, ctx: PipelineContext
+    ) -> AsyncGenerator[PipelineStatus, None]:
+        """
+        Stage: Article summaries, stance analysis and categorization.
+        Commits: ai_summary, ai_enrichments.stance_analysis and presentation_categories
+        on ReportArticleAssociations, then the enrichment metrics on the report.
+
+        FUSED (PIPELINE_FUSED_ENRICHMENT_ENABLED and all three stages on the same model):
+            one LLM call per article returns summary, stance and category.
+        SCHEDULED (otherwise):
+            summaries first; stance and categorization both only need the summary,
+            so they run concurrently once it is written.
+
+        Resumed: only associations still missing a result are sent (see _associations_lacking).
+        """
+        plan = self._fused_enrichment_plan(ctx)
+        started = time.perf_counter()
+
+        if plan:
+            yield PipelineStatus("article_enrichment", "Enriching articles (fused summary, stance, category)...")
+            pending = await self._associations_lacking(
+                ctx, "summary", "category", *(("stance",) if plan.stance_prompts else ())
+            )
+            result = None
+            async for status, res in self._stream_with_progress(
+                task_coro=lambda on_progress: self._enrich_articles_fused(
+                    ctx=ctx,
+                    report_id=ctx.report.report_id,
+                    plan=plan,
+                    on_progress=on_progress,
+                    associations=pending,
+                ),
+                stage="article_enrichment",
+                progress_msg_template="Enriching: {completed}/{total}",
+                heartbeat_msg="Enriching articles...",
+            ):
+                if res is not None:
+                    result = res
+                else:
+                    yield status
+            ctx.stance_analyzed_count = result["stance_analyzed"]
+            ctx.stance_analysis_errors = result["stance_errors"]
+            ctx.categorized_count = result["categorized"]
+            ctx.categorize_errors = result["categorize_errors"]
+            ctx.enrichment_metrics = {
+                "mode": "fused",
+                "estimated_prompt_tokens_saved": result["prompt_tokens_saved"],
+            }
+            yield PipelineStatus(
+                "article_enrichment",
+                f"Enriched {result['enriched']} articles: {result['summarized']} summaries, "
+                f"{ctx.stance_analyzed_count} stances, {ctx.categorized_count} categorized",
+                result,
+            )
+        else:
+            events: asyncio.Queue[PipelineStatus] = asyncio.Queue()
+            runner = asyncio.create_task(self._run_stage_graph(
+                {
+                    "article_summaries": ((), lambda: self._stage_generate_article_summaries(ctx)),
+                    "stance_analysis": (("article_summaries",), lambda: self._stage_stance_analysis(ctx)),
+                    "categorize": (("article_summaries",), lambda: self._stage_categorize(ctx)),
+                },
+                events,
+            ))
+            async for status in self._pump_events(runner, events, "article_enrichment", "Enriching articles..."):
+                yield status
+            durations = runner.result()
+            ctx.enrichment_metrics = {
+                "mode": "scheduled",
+                "stage_seconds": durations,
+                "wall_seconds_saved": round(max(0.0, sum(durations.values()) - (time.perf_counter() - started)), 2),
+            }
+
+        if ctx.resumed:
+            # Count articles enriched before the run was interrupted too
+            async with self.db_lock:
+                associations = await self.association_service.get_visible_for_report(ctx.report.report_id)
+            ctx.categorized_count = sum(1 for assoc in associations if assoc.presentation_categories)
+            ctx.stance_analyzed_count = sum(
+                1 for assoc in associations if (assoc.ai_enrichments or {}).get("stance_analysis")
+            )
+
+        ctx.enrichment_metrics["wall_seconds"] = round(time.perf_counter() - started, 2)
+        ctx.enrichment_metrics["tokens"] = self._enrichment_token_usage()
+        async with self.db_lock:
+            ctx.report.pipeline_metrics = {
+                **(ctx.report.pipeline_metrics or {}),
+                "article_enrichment": ctx.enrichment_metrics,
+            }
+            await self.db.commit()
+
     async def _stage_categorize(
         self, ctx: PipelineContext
     ) -> AsyncGenerator[PipelineStatus, None]:
@@ -698,6 +1582,7 @@ class PipelineService:
 
         # Get configuration for categorization stage
         stage_config = get_stage_config(ctx.llm_config, "categorization")
+        pending = await self._associations_lacking(ctx, "category")
 
         # Stream progress while categorizing
         result = None
@@ -707,6 +1592,7 @@ class PipelineService:
                 presentation_config=ctx.presentation_config,
                 stage_config=cfg,
                 on_progress=on_progress,
+                associations=pending,
             ),
             stage="categorize",
             progress_msg_template="Categorizing: {completed}/{total}",
@@ -746,6 +1632,7 @@ class PipelineService:
         stage_config = get_stage_config(ctx.llm_config, "article_summary")
 
         yield PipelineStatus("article_summaries", "Generating article summaries...")
+        pending = await self._associations_lacking(ctx, "summary")
 
         # Stream progress while generating
         result = None
@@ -756,6 +1643,7 @@ class PipelineService:
                 enrichment_config=enrichment_config,
                 stage_config=cfg,
                 on_progress=on_progress,
+                associations=pending,
             ),
             stage="article_summaries",
             progress_msg_template="Summarizing: {completed}/{total}",
@@ -779,15 +1667,21 @@ class PipelineService:
         enrichment_config: Optional[EnrichmentConfig],
         stage_config: StageConfig,
         on_progress: Optional[ProgressCallback] = None,
+        associations: Optional[List[ReportArticleAssociation]] = None,
     ) -> int:
         """
         Generate AI summaries for articles in a report.
 
+        Args:
+            associations: Only summarize these (default: all visible in the report)
+
         Returns:
             Number of summaries generated
         """
         # RETRIEVE: Get associations with articles
-        associations = await self.association_service.get_visible_for_report(report_id)
+        if associations is None:
+            async with self.db_lock:
+                associations = await self.association_service.get_visible_for_report(report_id)
 
         # Filter to associations with articles that have abstracts
         articles_to_summarize = [
@@ -808,8 +1702,9 @@ class PipelineService:
             items=items,
             enrichment_config=enrichment_config,
             model_config=stage_config,
-            options=self._get_llm_options(stage_config, on_progress),
+            options=self._get_llm_options(stage_config, on_progress, stage="article_summary"),
         )
+        self._record_llm_usage("article_summary", results)
 
         # WRITE: Build association updates from results
         # Results are in same order as items/articles_to_summarize
@@ -821,9 +1716,10 @@ class PipelineService:
 
         # Write to associations and commit
         if association_updates:
-            return await self.association_service.bulk_update_ai_summaries_from_pipeline(
-                association_updates
-            )
+            async with self.db_lock:
+                return await self.association_service.bulk_update_ai_summaries_from_pipeline(
+                    association_updates
+                )
         return 0
 
     async def _stage_stance_analysis(
@@ -851,6 +1747,7 @@ class PipelineService:
 
         # Convert PromptTemplate to dict for the analysis function
         stance_prompt_dict = ctx.article_analysis_config.stance_analysis_prompt.model_dump()
+        pending = await self._associations_lacking(ctx, "stance")
 
         # Stream progress while analyzing
         result = None
@@ -861,6 +1758,7 @@ class PipelineService:
                 stance_prompt=prompt,
                 stage_config=cfg,
                 on_progress=on_progress,
+                associations=pending,
             ),
             stage="stance_analysis",
             progress_msg_template="Analyzing: {completed}/{total}",
@@ -895,17 +1793,23 @@ class PipelineService:
         stance_prompt: Dict[str, Any],
         stage_config: StageConfig,
         on_progress: Optional[ProgressCallback] = None,
+        associations: Optional[List[ReportArticleAssociation]] = None,
     ) -> Tuple[int, int]:
         """
         Analyze stances for articles in a report.
 
+        Args:
+            associations: Only analyze these (default: all visible in the report)
+
         Returns:
             Tuple of (analyzed_count, error_count)
         """
         from services.article_analysis_service import analyze_article_stance, build_stance_item
 
         # RETRIEVE: Get associations with articles
-        associations = await self.association_service.get_visible_for_report(report_id)
+        if associations is None:
+            async with self.db_lock:
+                associations = await self.association_service.get_visible_for_report(report_id)
 
         # Filter to associations with articles that have abstracts
         articles_to_analyze = [
@@ -926,8 +1830,9 @@ class PipelineService:
             items=items,
             stance_analysis_prompt=stance_prompt,
             model_config=stage_config,
-            options=self._get_llm_options(stage_config, on_progress),
+            options=self._get_llm_options(stage_config, on_progress, stage="stance_analysis"),
         )
+        self._record_llm_usage("stance_analysis", results)
 
         # WRITE: Build association updates from results
         analyzed_count = 0
@@ -943,9 +1848,10 @@ class PipelineService:
                 error_count += 1
 
         if stance_results:
-            await self.association_service.bulk_update_stance_analysis_from_pipeline(
-                stance_results
-            )
+            async with self.db_lock:
+                await self.association_service.bulk_update_stance_analysis_from_pipeline(
+                    stance_results
+                )
 
         return analyzed_count, error_count
 
@@ -990,7 +1896,7 @@ class PipelineService:
             items=items,
             enrichment_config=ctx.enrichment_config,
             model_config=stage_config,
-            options=self._get_llm_options(stage_config),
+            options=self._get_llm_options(stage_config, stage="category_summary"),
         )
 
         # Build category summaries dict from results
@@ -1055,6 +1961,7 @@ class PipelineService:
             items=item,
             enrichment_config=ctx.enrichment_config,
             model_config=stage_config,
+            options=self._get_llm_options(stage_config, stage="executive_summary"),
         )
 
         if result.ok and result.data:
@@ -1086,7 +1993,38 @@ class PipelineService:
         Commits: Report, execution.report_id, Articles, ReportArticleAssociations.
 
         CRITICAL: This stage sets execution.report_id and commits it properly.
+
+        Resumed with a report already created (streaming mode creates it up
+        front), promotes only the included articles not yet in it.
         """
+        if ctx.report is not None:
+            yield PipelineStatus("report", "Adding remaining articles to report...")
+            promoted = await self.association_service.get_wip_article_ids(ctx.report.report_id)
+            remaining = [
+                wip for wip in await self.wip_article_service.get_included_articles(ctx.execution_id)
+                if wip.id not in promoted
+            ]
+            await self._add_articles_to_report(
+                ctx.report.report_id,
+                remaining,
+                first_ranking=await self.association_service.get_next_ranking(ctx.report.report_id),
+            )
+            ctx.report.pipeline_metrics = {
+                **(ctx.report.pipeline_metrics or {}),
+                "total_retrieved": ctx.total_retrieved,
+                "filter_stats": ctx.filter_stats,
+                "global_duplicates": ctx.global_duplicates,
+                "included_in_report": ctx.included_count,
+                "categorized": ctx.categorized_count,
+            }
+            await self.db.commit()
+            yield PipelineStatus(
+                "report",
+                f"Added {len(remaining)} articles to report",
+                {"report_id": ctx.report.report_id, "added": len(remaining), "resumed": True},
+            )
+            return
+
         yield PipelineStatus("report", "Generating report...")
 
         ctx.report = await self._create_report(
@@ -1117,6 +2055,7 @@ class PipelineService:
         executive_summary: str,
         category_summaries: Dict[str, str],
         metrics: Dict,
+        wip_articles: Optional[List[WipArticle]] = None,
     ) -> Report:
         """
         Create report with proper execution.report_id linkage.
@@ -1127,6 +2066,11 @@ class PipelineService:
 
         CRITICAL: This method sets ctx.execution.report_id and commits everything
         in a single transaction to ensure the link is persisted.
+
+        Args:
+            wip_articles: Articles to promote (default: all included in the execution).
+                Streaming mode passes [] and promotes articles later via
+                _add_articles_to_report.
         """
         # Build enrichments
         enrichments = {
@@ -1163,25 +2107,10 @@ class PipelineService:
         report.original_enrichments = enrichments.copy()
 
         # Get only INCLUDED articles (included_in_report=True)
-        wip_articles = await self.wip_article_service.get_included_articles(ctx.execution_id)
+        if wip_articles is None:
+            wip_articles = await self.wip_article_service.get_included_articles(ctx.execution_id)
 
-        # Create Article records and build association items
-        association_items = []
-        for idx, wip_article in enumerate(wip_articles):
-            # Find or create Article record (via ArticleService)
-            article = await self.article_service.find_or_create_from_wip(wip_article)
-
-            # Build item for bulk_create - categories and summaries populated in later stages
-            association_items.append({
-                "article_id": article.article_id,
-                "wip_article_id": wip_article.id,
-                "ranking": idx + 1,
-                "relevance_score": wip_article.filter_score,
-                "relevance_rationale": wip_article.filter_score_reason,
-            })
-
-        # Bulk create associations
-        await self.association_service.bulk_create(report.report_id, association_items)
+        await self._add_articles_to_report(report.report_id, wip_articles, first_ranking=1)
 
         # Set bidirectional link: execution -> report
         # This MUST be set before commit to persist the link
@@ -1192,68 +2121,143 @@ class PipelineService:
 
         return report
 
+    async def _add_articles_to_report(
+        self,
+        report_id: int,
+        wip_articles: List[WipArticle],
+        first_ranking: int,
+    ) -> List[ReportArticleAssociation]:
+        """
+        Promote WipArticles to Article records and create their report associations.
+
+        Rankings are assigned in list order starting at first_ranking. Does not commit.
+        """
+        # Find or create Article records for the whole batch (via ArticleService)
+        full_texts = await self.wip_article_service.get_stored_full_texts(wip_articles)
+        article_ids = await self.article_service.bulk_find_or_create_from_wip(wip_articles, full_texts)
+
+        # Build items for bulk_create - categories and summaries populated in later stages
+        association_items = []
+        for idx, (wip_article, article_id) in enumerate(zip(wip_articles, article_ids)):
+            association_items.append({
+                "article_id": article_id,
+                "wip_article_id": wip_article.id,
+                "ranking": first_ranking + idx,
+                "relevance_score": wip_article.filter_score,
+                "relevance_rationale": wip_article.filter_score_reason,
+            })
+
+        # Bulk create associations
+        return await self.association_service.bulk_create(report_id, association_items)
+
     # =========================================================================
     # STAGE HELPER METHODS
     # =========================================================================
 
-    async def _fetch_and_store_articles(
+    async def _search_query_ids(
         self,
-        research_stream_id: int,
-        execution_id: str,
-        retrieval_unit_id: str,
         source_id: int,
         query_expression: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-    ) -> int:
+        max_results: Optional[int] = None,
+    ) -> List[str]:
         """
-        Fetch articles from a source and store all results in wip_articles table.
+        Run a broad search query against its source and return the matching IDs (no articles).
 
         Args:
-            research_stream_id: Stream ID
-            execution_id: UUID of this pipeline execution
-            retrieval_unit_id: Retrieval unit ID (concept_id or query_id)
             source_id: Database source ID (integer FK)
             query_expression: Query to execute
             start_date: Start date for retrieval (YYYY/MM/DD format)
             end_date: End date for retrieval (YYYY/MM/DD format)
+            max_results: Cap on results (defaults to MAX_ARTICLES_PER_SOURCE)
 
         Returns:
-            Number of articles retrieved and stored
+            Article IDs in result order
 
         Raises:
-            Exception: If fetching or storing fails
+            Exception: If the search fails
         """
         logger.info(
-            f"Fetching articles: query='{query_expression[:100]}...', "
+            f"Searching: query='{query_expression[:100]}...', "
             f"source_id={source_id}, dates={start_date} to {end_date}"
         )
 
         # Execute query - currently only PubMed is implemented
         # TODO: Use source_id to determine which service to call when more sources are added
         try:
-            articles, metadata = await self.pubmed_service.search_articles(
+            ids, total_results = await self.pubmed_service.get_article_ids(
                 query=query_expression,
-                max_results=self.MAX_ARTICLES_PER_SOURCE,
+                max_results=max_results if max_results is not None else self.MAX_ARTICLES_PER_SOURCE,
                 start_date=start_date,
                 end_date=end_date,
                 date_type="entry",  # Search by EDAT — when article was added to PubMed (always precise Y/M/D)
                 sort_by="relevance",
-                include_full_text=True,  # Fetch full text from PMC for articles with PMC IDs
             )
         except Exception as e:
             logger.error(
-                f"Failed to fetch articles: query='{query_expression[:100]}...', "
+                f"Failed to search: query='{query_expression[:100]}...', "
                 f"source_id={source_id}, error={e}"
             )
             raise
 
-        logger.info(
-            f"Fetched {len(articles)} articles from source_id={source_id}, "
-            f"total_results={metadata.get('total_results', 'unknown')}"
-        )
+        logger.info(f"Found {len(ids)} IDs from source_id={source_id}, total_results={total_results}")
+        return ids
+
+    async def _fetch_query_articles(self, source_id: int, ids: List[str]) -> List[CanonicalResearchArticle]:
+        """
+        Fetch the articles for IDs found by _search_query_ids.
+
+        Returns:
+            Retrieved articles (not yet stored)
+
+        Raises:
+            Exception: If fetching fails
+        """
+        from config.settings import settings
+
+        try:
+            articles = await self.pubmed_service.get_canonical_articles(
+                ids,
+                # Lazy mode defers PMC full text to _stage_fetch_full_text (included articles only)
+                include_full_text=not settings.PIPELINE_LAZY_FULL_TEXT,
+            )
+        except Exception as e:
+            logger.error(f"Failed to fetch {len(ids)} articles from source_id={source_id}: {e}")
+            raise
+
+        logger.info(f"Fetched {len(articles)} of {len(ids)} articles from source_id={source_id}")
+        return articles
+
+    async def _store_articles(
+        self,
+        research_stream_id: int,
+        execution_id: str,
+        retrieval_unit_id: str,
+        source_id: int,
+        articles: List[CanonicalResearchArticle],
+        pre_approved: bool = False,
+    ) -> int:
+        """
+        Store retrieved articles in the wip_articles table.
+
+        Args:
+            research_stream_id: Stream ID
+            execution_id: UUID of this pipeline execution
+            retrieval_unit_id: Retrieval unit ID (query_id or web source_id)
+            source_id: Database source ID (integer FK)
+            articles: Articles to store
+            pre_approved: Mark as passed_semantic_filter (web sources)
+
+        Returns:
+            Number of articles stored
+
+        Raises:
+            Exception: If storing fails
+        """
+        if not articles:
+            return 0
 
-        # Store results in wip_articles
         try:
             count = await self.wip_article_service.create_wip_articles(
                 research_stream_id=research_stream_id,
@@ -1261,6 +2265,7 @@ class PipelineService:
                 retrieval_group_id=retrieval_unit_id,
                 source_id=source_id,
                 articles=articles,
+                pre_approved=pre_approved,
             )
         except Exception as e:
             logger.error(
@@ -1269,38 +2274,31 @@ class PipelineService:
             )
             raise
 
-        logger.info(f"Stored {count} articles for execution_id={execution_id}")
+        logger.info(f"Stored {count} articles for execution_id={execution_id}, retrieval_unit_id={retrieval_unit_id}")
         return count
 
-    async def _fetch_web_source_articles(
+    async def _fetch_web_source(
         self,
-        research_stream_id: int,
-        execution_id: str,
         web_source: Any,
         start_date: Optional[str] = None,
         max_items: int = 20,
-        ctx: Optional["PipelineContext"] = None,
-    ) -> int:
+        user_id: int = 0,
+    ) -> Tuple[List[CanonicalResearchArticle], Optional[str]]:
         """
-        Fetch articles from a web source and store in wip_articles.
+        Fetch articles from a web source.
 
         Routes by source_type:
         - 'feed': Deterministic RSS/Atom parsing via fetch_feed()
         - 'site': Agent-driven exploration via run_site_agent()
 
-        Feed and site articles are stored as pre-approved (passed_semantic_filter=True)
-        since relevance filtering is handled by the directive/agent, not a separate LLM filter.
-
         Args:
-            research_stream_id: Stream ID
-            execution_id: UUID of this pipeline execution
             web_source: WebSource configuration
             start_date: Only items published after this date
             max_items: Maximum items to fetch per source
-            ctx: Pipeline context (needed for site agent memo writeback)
+            user_id: User ID (passed to the site agent loop)
 
         Returns:
-            Number of articles retrieved and stored
+            Tuple of (articles, updated_site_memo) - the memo is only set by the site agent
         """
         source_type = getattr(web_source, "source_type", "site")
         logger.info(
@@ -1319,13 +2317,14 @@ class PipelineService:
                     max_items=max_items,
                 )
             else:
-                # Site agent path
+                # Site agent path. Its tools never touch the session, which other
+                # retrieval units may be using concurrently.
                 articles, updated_site_memo = await self.web_monitor_service.run_site_agent(
                     source=web_source,
                     since_date=start_date,
                     max_items=max_items,
                     db=self.db,
-                    user_id=ctx.user_id if ctx else 0,
+                    user_id=user_id,
                 )
         except Exception as e:
             logger.error(
@@ -1338,13 +2337,30 @@ class PipelineService:
             f"Fetched {len(articles)} articles from web source '{web_source.url}' "
             f"(type={source_type})"
         )
+        return articles, updated_site_memo
 
+    async def _store_web_source_articles(
+        self,
+        ctx: "PipelineContext",
+        web_source: Any,
+        articles: List[CanonicalResearchArticle],
+        site_memo: Optional[str] = None,
+    ) -> int:
+        """
+        Write back the site memo and store web source articles in wip_articles.
+
+        Feed and site articles are stored as pre-approved (passed_semantic_filter=True)
+        since relevance filtering is handled by the directive/agent, not a separate LLM filter.
+
+        Returns:
+            Number of articles stored
+        """
         # Write back site_memo if the agent produced one
-        if updated_site_memo and ctx:
+        if site_memo:
             await self._write_back_site_memo(
                 ctx=ctx,
                 web_source_id=web_source.source_id,
-                site_memo=updated_site_memo,
+                site_memo=site_memo,
             )
 
         if not articles:
@@ -1353,25 +2369,14 @@ class PipelineService:
         # Look up the Web Monitor source_id from information_sources table
         db_source_id = await self._get_web_monitor_source_id()
 
-        # Store results in wip_articles (pre-approved — no separate semantic filter needed)
-        try:
-            count = await self.wip_article_service.create_wip_articles(
-                research_stream_id=research_stream_id,
-                execution_id=execution_id,
-                retrieval_group_id=web_source.source_id,
-                source_id=db_source_id,
-                articles=articles,
-                pre_approved=True,
-            )
-        except Exception as e:
-            logger.error(
-                f"Failed to store web source articles: execution_id={execution_id}, "
-                f"web_source_id={web_source.source_id}, count={len(articles)}, error={e}"
-            )
-            raise
-
-        logger.info(f"Stored {count} web source articles for execution_id={execution_id}")
-        return count
+        return await self._store_articles(
+            research_stream_id=ctx.research_stream_id,
+            execution_id=ctx.execution_id,
+            retrieval_unit_id=web_source.source_id,
+            source_id=db_source_id,
+            articles=articles,
+            pre_approved=True,
+        )
 
     async def _write_back_site_memo(
         self,
@@ -1441,9 +2446,10 @@ class PipelineService:
             Tuple of (passed_count, rejected_count, error_count)
         """
         # Get all non-duplicate articles for this unit that haven't been filtered yet
-        articles = await self.wip_article_service.get_for_filtering(
-            execution_id, retrieval_unit_id
-        )
+        async with self.db_lock:
+            articles = await self.wip_article_service.get_for_filtering(
+                execution_id, retrieval_unit_id
+            )
 
         if not articles:
             logger.info(
@@ -1480,21 +2486,81 @@ Score from {{min_value}} to {{max_value}}."""
             max_value=1.0,
             include_reasoning=True,
             model_config=stage_config,
-            options=self._get_llm_options(stage_config, on_progress),
+            options=self._get_llm_options(stage_config, on_progress, stage="semantic_filter"),
         )
 
         # Update database with results and commit
-        passed, rejected, errors = await self.wip_article_service.bulk_update_filter_results(
-            results=results,
-            article_map=article_map,
-            threshold=threshold
-        )
+        async with self.db_lock:
+            passed, rejected, errors = await self.wip_article_service.bulk_update_filter_results(
+                results=results,
+                article_map=article_map,
+                threshold=threshold
+            )
 
         logger.info(
             f"Filtering complete: {passed} passed, {rejected} rejected, {errors} errors out of {len(articles)} total"
         )
         return passed, rejected, errors
 
+    async def _fetch_full_text_for_included(
+        self,
+        execution_id: str,
+        on_progress: Optional[ProgressCallback] = None,
+        articles: Optional[List[WipArticle]] = None,
+    ) -> int:
+        """
+        Fetch PMC full text for included WipArticles that have a PMC ID but no text yet.
+
+        Texts are attached to the articles as each fetch completes; one commit at the end.
+        Attaching takes db_lock: in streaming mode enrichment may be flushing the
+        same session concurrently.
+
+        Args:
+            articles: Only these included articles (default: all included in the execution)
+
+        Returns:
+            Number of articles that received full text
+        """
+        from services.pmc_full_text_service import fetch_pmc_full_texts
+
+        if articles is None:
+            async with self.db_lock:
+                articles = await self.wip_article_service.get_included_articles(execution_id)
+        async with self.db_lock:
+            have_full_text = await self.wip_article_service.find_ids_with_full_text(articles)
+        by_pmc_id: Dict[str, List[WipArticle]] = {}
+        for article in articles:
+            pmc_id = (article.article_metadata or {}).get("pmc_id")
+            if pmc_id and article.id not in have_full_text:
+                by_pmc_id.setdefault(pmc_id, []).append(article)
+
+        if not by_pmc_id:
+            return 0
+
+        total = len(by_pmc_id)
+        completed = 0
+        fetched = 0
+
+        async def on_result(pmc_id: str, full_text: Optional[str]) -> None:
+            nonlocal completed, fetched
+            completed += 1
+            if full_text:
+                async with self.db_lock:
+                    for article in by_pmc_id[pmc_id]:
+                        self.wip_article_service.set_full_text(article, full_text)
+                        fetched += 1
+            if on_progress:
+                await on_progress(completed, total)
+
+        await fetch_pmc_full_texts(
+            list(by_pmc_id), pubmed_service=self.pubmed_service, on_result=on_result
+        )
+        async with self.db_lock:
+            await self.wip_article_service.commit()
+
+        logger.info(f"Fetched full text for {fetched} of {len(articles)} included articles")
+        return fetched
+
     async def _deduplicate_globally(
         self, research_stream_id: int, execution_id: str
     ) -> Tuple[int, int]:
@@ -1503,7 +2569,8 @@ Score from {{min_value}} to {{max_value}}."""
 
         Deduplication checks (in order):
         1. Historical: Articles that appeared in previous reports for this stream (via SQL join)
-        2. Within-execution: Duplicates within the current execution (by DOI or title)
+        2. Within-execution: Duplicates within the current execution (by DOI or title,
+           then near-duplicate title / first author, see utils/near_duplicates.py)
 
         Args:
             research_stream_id: Stream ID for historical deduplication
@@ -1521,47 +2588,130 @@ Score from {{min_value}} to {{max_value}}."""
             execution_id=execution_id
         )
 
+        # Historical duplicates already marked before a resumed run was interrupted
+        # (streaming mode deduplicates unit by unit) are not matched again
+        marked_historical_ids = {
+            a.id for a in all_articles
+            if a.is_duplicate and (a.duplicate_of_pmid or "").startswith("historical:")
+        }
+
         # Track historical duplicate IDs to skip in within-execution check
-        historical_dup_ids = {wip_id for wip_id, _ in historical_matches}
+        historical_dup_ids = {wip_id for wip_id, _ in historical_matches} | marked_historical_ids
 
         # Mark historical duplicates
         historical_duplicates = await self.wip_article_service.bulk_update_duplicates(
             [(wip_id, identifier) for wip_id, identifier in historical_matches]
-        )
+        ) + len(marked_historical_ids)
 
         # 2. Within-execution deduplication
-        within_execution_duplicates = 0
-        seen_dois = {}
-        seen_titles = {}
+        within_execution_duplicates = self._mark_within_execution_duplicates(
+            all_articles, historical_dup_ids, seen_dois={}, seen_titles={},
+            near_duplicates=self._near_duplicate_index(),
+        )
 
-        for article in all_articles:
+        # No commit here - stage manages the transaction
+        return historical_duplicates, within_execution_duplicates
+
+    async def _deduplicate_retrieval_unit(
+        self,
+        research_stream_id: int,
+        execution_id: str,
+        retrieval_unit_id: str,
+        seen_dois: Dict[str, str],
+        seen_titles: Dict[str, str],
+        near_duplicates: Optional[NearDuplicateIndex] = None,
+    ) -> Tuple[int, int]:
+        """
+        Incremental _deduplicate_globally for one just-stored retrieval unit (streaming mode).
+
+        seen_dois / seen_titles / near_duplicates carry over between calls; units
+        must be passed in the order they were stored for the result to match the
+        batch version.
+
+        Returns:
+            Tuple of (historical_duplicates, within_execution_duplicates)
+        """
+        unit_articles = await self.wip_article_service.get_by_retrieval_group(execution_id, retrieval_unit_id)
+        historical_matches = await self.association_service.find_historical_duplicates(
+            stream_id=research_stream_id, execution_id=execution_id, retrieval_group_id=retrieval_unit_id
+        )
+        historical_duplicates = await self.wip_article_service.bulk_update_duplicates(historical_matches)
+
+        within_execution_duplicates = self._mark_within_execution_duplicates(
+            unit_articles, {wip_id for wip_id, _ in historical_matches}, seen_dois, seen_titles,
+            near_duplicates,
+        )
+        return historical_duplicates, within_execution_duplicates
+
+    @staticmethod
+    def _near_duplicate_index() -> Optional[NearDuplicateIndex]:
+        """A fresh near-duplicate index for one execution, or None if disabled."""
+        from config.settings import settings
+
+        if not settings.PIPELINE_NEAR_DUP_ENABLED:
+            return None
+        return NearDuplicateIndex(
+            threshold=settings.PIPELINE_NEAR_DUP_THRESHOLD,
+            num_perm=settings.PIPELINE_NEAR_DUP_NUM_PERM,
+            bands=settings.PIPELINE_NEAR_DUP_BANDS,
+        )
+
+    def _mark_within_execution_duplicates(
+        self,
+        articles: List[WipArticle],
+        skip_ids: set,
+        seen_dois: Dict[str, str],
+        seen_titles: Dict[str, str],
+        near_duplicates: Optional[NearDuplicateIndex] = None,
+    ) -> int:
+        """
+        Mark articles whose DOI (or, without a DOI, title) was already seen, or -
+        with near_duplicates - whose title and first author nearly match an
+        earlier article (preprint vs published version, punctuation, web
+        mirrors of PubMed records). Near-duplicates record the canonical
+        WipArticle in duplicate_of_id.
+
+        Articles in skip_ids (historical duplicates) are ignored. seen_dois,
+        seen_titles and near_duplicates are updated in place. Returns the
+        number marked.
+        """
+        duplicates = 0
+        near = 0
+        for article in articles:
             # Skip articles already marked as historical duplicates
-            if article.id in historical_dup_ids:
+            if article.id in skip_ids:
                 continue
-            # Check DOI-based deduplication
-            if article.doi and article.doi.strip():
-                doi_normalized = article.doi.lower().strip()
-                if doi_normalized in seen_dois:
-                    self.wip_article_service.mark_as_duplicate(
-                        article, seen_dois[doi_normalized]
-                    )
-                    within_execution_duplicates += 1
-                else:
-                    seen_dois[doi_normalized] = article.pmid or str(article.id)
 
-            # Check title-based deduplication
+            # Exact key: DOI, or title for articles without a DOI
+            if article.doi and article.doi.strip():
+                exact_key, seen = article.doi.lower().strip(), seen_dois
             elif article.title:
-                title_normalized = article.title.lower().strip()
-                if title_normalized in seen_titles:
-                    self.wip_article_service.mark_as_duplicate(
-                        article, seen_titles[title_normalized]
-                    )
-                    within_execution_duplicates += 1
-                else:
-                    seen_titles[title_normalized] = article.pmid or str(article.id)
+                exact_key, seen = article.title.lower().strip(), seen_titles
+            else:
+                exact_key, seen = None, None
 
-        # No commit here - stage manages the transaction
-        return historical_duplicates, within_execution_duplicates
+            if exact_key is not None and exact_key in seen:
+                self.wip_article_service.mark_as_duplicate(article, seen[exact_key])
+                duplicates += 1
+                continue
+
+            identifier = article.pmid or str(article.id)
+            if near_duplicates is not None:
+                match = near_duplicates.match_or_add(
+                    article.id, identifier, article.title, article.authors, pmid=article.pmid
+                )
+                if match:
+                    self.wip_article_service.mark_as_duplicate(article, match.key, match.article_id)
+                    duplicates += 1
+                    near += 1
+                    identifier = match.key
+
+            if exact_key is not None:
+                seen[exact_key] = identifier
+
+        if near:
+            logger.info(f"Within-execution dedup: {duplicates} duplicates ({near} near-duplicates)")
+        return duplicates
 
     async def _mark_articles_for_report(self, execution_id: str) -> int:
         """
@@ -1583,12 +2733,233 @@ Score from {{min_value}} to {{max_value}}."""
         # No commit here - stage manages the transaction
         return len(articles)
 
+    def _enrichment_token_usage(self) -> Dict[str, Dict[str, int]]:
+        """Token usage of this run's article enrichment stages (see _record_llm_usage)."""
+        return {
+            stage: dict(usage)
+            for stage, usage in self.llm_usage.items()
+            if stage in ("article_enrichment", "article_summary", "stance_analysis", "categorization")
+        }
+
+    @staticmethod
+    def _stance_prompt(ctx: PipelineContext) -> Optional[Dict[str, Any]]:
+        """The stream's stance analysis prompt as a dict, or None if stance analysis is not configured."""
+        if ctx.article_analysis_config and ctx.article_analysis_config.stance_analysis_prompt:
+            return ctx.article_analysis_config.stance_analysis_prompt.model_dump()
+        return None
+
+    def _fused_enrichment_plan(self, ctx: PipelineContext) -> Optional[FusedEnrichmentPlan]:
+        """
+        Decide whether this run enriches articles with one fused LLM call.
+
+        Requires PIPELINE_FUSED_ENRICHMENT_ENABLED and the summary, stance (if
+        configured) and categorization stages on the same model settings - a
+        stream that picked different models per stage keeps its separate calls.
+
+        Returns:
+            FusedEnrichmentPlan, or None to run the stages separately
+        """
+        from config.settings import settings
+        from services.article_analysis_service import get_stance_prompts
+        from services.article_categorization_service import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+        from services.article_enrichment_service import build_fused_prompts
+
+        if not settings.PIPELINE_FUSED_ENRICHMENT_ENABLED:
+            return None
+
+        stance_prompt = self._stance_prompt(ctx)
+        configs = [
+            get_stage_config(ctx.llm_config, "article_summary"),
+            get_stage_config(ctx.llm_config, "categorization"),
+        ]
+        if stance_prompt:
+            configs.append(get_stage_config(ctx.llm_config, "stance_analysis"))
+        if len({(c.model_id, c.temperature, c.reasoning_effort) for c in configs}) > 1:
+            logger.info(
+                f"Fused enrichment skipped for execution_id={ctx.execution_id}: stages use different models"
+            )
+            return None
+
+        # The fused response carries all three outputs, so it gets their combined token limit
+        max_tokens = [c.max_tokens for c in configs]
+        stage_config = configs[0].model_copy(
+            update={"max_tokens": sum(max_tokens) if all(max_tokens) else None}
+        )
+
+        custom_categorization = getattr(ctx.presentation_config, "categorization_prompt", None)
+        summary_prompts = self.summary_service._get_prompts("article_summary", ctx.enrichment_config)
+        stance_prompts = get_stance_prompts(stance_prompt) if stance_prompt else None
+        categorization_prompts = (
+            (custom_categorization.system_prompt, custom_categorization.user_prompt_template)
+            if custom_categorization
+            else (SYSTEM_PROMPT, USER_PROMPT_TEMPLATE)
+        )
+        system_message, user_message = build_fused_prompts(
+            summary_prompts, stance_prompts, categorization_prompts
+        )
+        return FusedEnrichmentPlan(
+            stage_config=stage_config,
+            system_message=system_message,
+            user_message=user_message,
+            summary_prompts=summary_prompts,
+            stance_prompts=stance_prompts,
+            categorization_prompts=categorization_prompts,
+        )
+
+    async def _enrich_articles_fused(
+        self,
+        ctx: PipelineContext,
+        report_id: int,
+        plan: FusedEnrichmentPlan,
+        on_progress: Optional[ProgressCallback] = None,
+        associations: Optional[List[ReportArticleAssociation]] = None,
+    ) -> Dict[str, int]:
+        """
+        Summarize, analyze stance and categorize report articles with one LLM call each.
+
+        Articles without an abstract get no summary or stance in the separate
+        stages either; they are only categorized, with the regular call.
+
+        Args:
+            associations: Only enrich these (default: all visible in the report)
+
+        Returns:
+            Counts: enriched, summarized, stance_analyzed, stance_errors,
+            categorized, categorize_errors, prompt_tokens_saved (estimate)
+        """
+        from services.article_analysis_service import build_stance_item
+        from services.article_enrichment_service import (
+            analyze_articles_fused,
+            build_fused_item,
+            estimate_prompt_tokens_saved,
+        )
+
+        # RETRIEVE: Get associations with articles
+        if associations is None:
+            async with self.db_lock:
+                associations = await self.association_service.get_visible_for_report(report_id)
+
+        to_enrich = [assoc for assoc in associations if assoc.article and assoc.article.abstract]
+        to_categorize_only = [assoc for assoc in associations if assoc.article and not assoc.article.abstract]
+
+        counts = {
+            "enriched": len(to_enrich),
+            "summarized": 0,
+            "stance_analyzed": 0,
+            "stance_errors": 0,
+            "categorized": 0,
+            "categorize_errors": 0,
+            "prompt_tokens_saved": 0,
+        }
+
+        if to_categorize_only:
+            categorized, errors = await self._categorize_articles(
+                report_id=report_id,
+                presentation_config=ctx.presentation_config,
+                stage_config=get_stage_config(ctx.llm_config, "categorization"),
+                associations=to_categorize_only,
+            )
+            counts["categorized"] += categorized
+            counts["categorize_errors"] += errors
+
+        if not to_enrich:
+            return counts
+
+        # BUILD ITEMS: one fused item from each task's own item builder
+        categories_json = self.categorization_service.format_categories_json(
+            self.categorization_service.prepare_category_definitions(ctx.presentation_config.categories)
+        )
+        summary_items = self.summary_service.build_article_summary_items(to_enrich, ctx.stream)
+        stance_items = (
+            [build_stance_item(ctx.stream, assoc.article) for assoc in to_enrich]
+            if plan.stance_prompts
+            else [None] * len(to_enrich)
+        )
+        categorization_items = [self._build_categorization_item(assoc, categories_json) for assoc in to_enrich]
+        items = [
+            build_fused_item(summary_item, stance_item, categorization_item)
+            for summary_item, stance_item, categorization_item in zip(summary_items, stance_items, categorization_items)
+        ]
+
+        # GENERATE: one call per article
+        results = await analyze_articles_fused(
+            items=items,
+            system_message=plan.system_message,
+            user_message=plan.user_message,
+            include_stance=plan.stance_prompts is not None,
+            model_config=plan.stage_config,
+            options=self._get_llm_options(plan.stage_config, on_progress, stage="article_enrichment"),
+        )
+        self._record_llm_usage("article_enrichment", results)
+
+        # WRITE: split each result back into the three association updates
+        summary_updates = []
+        stance_updates = []
+        category_updates = []
+        for assoc, result in zip(to_enrich, results):
+            data = result.data if result.ok and isinstance(result.data, dict) else {}
+            if data.get("summary"):
+                summary_updates.append((assoc, data["summary"]))
+            if plan.stance_prompts:
+                if data.get("stance_analysis"):
+                    stance_updates.append((assoc, data["stance_analysis"]))
+                    counts["stance_analyzed"] += 1
+                else:
+                    counts["stance_errors"] += 1
+            if not data:
+                counts["categorize_errors"] += 1
+            category_updates.append((assoc, data.get("category_id")))
+
+        async with self.db_lock:
+            if summary_updates:
+                counts["summarized"] = await self.association_service.bulk_update_ai_summaries_from_pipeline(
+                    summary_updates
+                )
+            if stance_updates:
+                await self.association_service.bulk_update_stance_analysis_from_pipeline(stance_updates)
+            counts["categorized"] += await self.association_service.bulk_update_categories_from_pipeline(
+                category_updates
+            )
+
+        # MEASURE: what the three separate calls would have sent (with the summary as input)
+        separate_calls = [(*plan.summary_prompts, summary_items)]
+        if plan.stance_prompts:
+            separate_calls.append((*plan.stance_prompts, [
+                build_stance_item(ctx.stream, assoc.article, assoc.ai_summary) for assoc in to_enrich
+            ]))
+        separate_calls.append((*plan.categorization_prompts, [
+            self._build_categorization_item(assoc, categories_json) for assoc in to_enrich
+        ]))
+        counts["prompt_tokens_saved"] = estimate_prompt_tokens_saved(
+            results, plan.system_message, plan.user_message, separate_calls
+        )
+
+        logger.info(
+            f"Fused enrichment complete for report_id={report_id}: {len(to_enrich)} articles, "
+            f"~{counts['prompt_tokens_saved']} prompt tokens saved"
+        )
+        return counts
+
+    @staticmethod
+    def _build_categorization_item(assoc: ReportArticleAssociation, categories_json: str) -> Dict[str, Any]:
+        """Template values for categorizing one report article."""
+        article = assoc.article
+        return {
+            "title": article.title or "Untitled",
+            "abstract": article.abstract or "",
+            "ai_summary": assoc.ai_summary or "",  # Use AI summary if available
+            "journal": article.journal or "Unknown",
+            "publication_date": format_pub_date(article.pub_year, article.pub_month, article.pub_day) or "Unknown",
+            "categories_json": categories_json,
+        }
+
     async def _categorize_articles(
         self,
         report_id: int,
         presentation_config: PresentationConfig,
         stage_config: StageConfig,
         on_progress: Optional[callable] = None,
+        associations: Optional[List[ReportArticleAssociation]] = None,
     ) -> Tuple[int, int]:
         """
         Use LLM to categorize report articles and write directly to associations.
@@ -1598,12 +2969,15 @@ Score from {{min_value}} to {{max_value}}."""
             presentation_config: Presentation configuration with categories
             stage_config: Stage configuration (model + concurrency settings)
             on_progress: Optional async callback(completed, total) for progress updates
+            associations: Only categorize these (default: all visible in the report)
 
         Returns:
             Tuple of (categorized_count, error_count)
         """
         # Get visible associations with their articles
-        associations = await self.association_service.get_visible_for_report(report_id)
+        if associations is None:
+            async with self.db_lock:
+                associations = await self.association_service.get_visible_for_report(report_id)
 
         if not associations:
             logger.info(f"No articles to categorize for report_id={report_id}")
@@ -1624,16 +2998,8 @@ Score from {{min_value}} to {{max_value}}."""
         items = []
         valid_associations = []
         for assoc in associations:
-            article = assoc.article
-            if article:
-                items.append({
-                    "title": article.title or "Untitled",
-                    "abstract": article.abstract or "",
-                    "ai_summary": assoc.ai_summary or "",  # Use AI summary if available
-                    "journal": article.journal or "Unknown",
-                    "publication_date": format_pub_date(article.pub_year, article.pub_month, article.pub_day) or "Unknown",
-                    "categories_json": categories_json,
-                })
+            if assoc.article:
+                items.append(self._build_categorization_item(assoc, categories_json))
                 valid_associations.append(assoc)
 
         if not items:
@@ -1647,9 +3013,10 @@ Score from {{min_value}} to {{max_value}}."""
         results = await self.categorization_service.categorize(
             items=items,
             model_config=stage_config,
-            options=self._get_llm_options(stage_config, on_progress),
+            options=self._get_llm_options(stage_config, on_progress, stage="categorization"),
             custom_prompt=custom_prompt,
         )
+        self._record_llm_usage("categorization", results)
 
         # Map results back to associations: (Association, category_id)
         # Results are in same order as items/valid_associations
@@ -1665,9 +3032,10 @@ Score from {{min_value}} to {{max_value}}."""
                 association_results.append((assoc, None))
 
         # Update associations with results and commit
-        categorized = await self.association_service.bulk_update_categories_from_pipeline(
-            association_results
-        )
+        async with self.db_lock:
+            categorized = await self.association_service.bulk_update_categories_from_pipeline(
+                association_results
+            )
         logger.info(
             f"Categorization complete: {categorized} articles categorized, {error_count} errors"
         )
@@ -0,0 +1,207 @@
+"""
+PMC Full Text Service - Cached, bounded-concurrency full text retrieval
+
+Published PMC full text almost never changes, yet every pipeline run used to
+re-download it for every retrieved article (including the ones the semantic
+filter later rejects), in fixed chunks of 5 with a sleep between chunks.
+
+STORE:
+======
+Content-addressed: each body is stored once under its SHA-256 digest
+(zlib-compressed), and a PMCID index points at the digest. Re-fetching an
+unchanged article rewrites nothing but the index timestamp. Like the PubMed
+article cache this is a single SQLite file per host; calls run in a worker
+thread.
+
+FETCHER:
+========
+fetch_pmc_full_texts() runs every PMCID as its own task behind a semaphore,
+so a slow article never holds up the rest of a chunk. Requests still go
+through PubMedService, i.e. the shared NCBI rate limiter and pooled client.
+An optional on_result callback receives each text as soon as it arrives, so
+callers can write results progressively.
+
+Usage:
+    texts = await fetch_pmc_full_texts(["PMC123", "PMC456"], on_result=save)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, asdict
+from typing import Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from services.pubmed_service import PubMedService
+
+logger = logging.getLogger(__name__)
+
+# Callback invoked as each full text arrives: (pmc_id, text or None)
+FullTextCallback = Callable[[str, Optional[str]], Awaitable[None]]
+
+
+def normalize_pmc_id(pmc_id: str) -> str:
+    """Canonical PMCID form used as the store key, e.g. 'PMC1234567'."""
+    pmc_id = pmc_id.strip().upper()
+    return pmc_id if pmc_id.startswith("PMC") else f"PMC{pmc_id}"
+
+
+@dataclass
+class PmcFullTextStoreStats:
+    """Counters for store effectiveness since process start."""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class PmcFullTextStore:
+    """SQLite-backed, content-addressed store of PMC full text keyed by PMCID."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stats = PmcFullTextStoreStats()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    async def get(self, pmc_id: str) -> Optional[str]:
+        """Return stored full text for a PMCID, or None on miss."""
+        try:
+            text = await asyncio.to_thread(self._get_sync, normalize_pmc_id(pmc_id))
+        except Exception as e:
+            logger.warning(f"PMC full text store read failed for {pmc_id}: {e}")
+            self.stats.errors += 1
+            text = None
+        if text is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return text
+
+    async def put(self, pmc_id: str, text: str) -> None:
+        """Store full text for a PMCID. Failures are logged, never raised."""
+        try:
+            await asyncio.to_thread(self._put_sync, normalize_pmc_id(pmc_id), text)
+            self.stats.stores += 1
+        except Exception as e:
+            logger.warning(f"PMC full text store write failed for {pmc_id}: {e}")
+            self.stats.errors += 1
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pmc_full_text_blobs (
+                    digest TEXT PRIMARY KEY,
+                    body BLOB NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pmc_full_text_index (
+                    pmc_id TEXT PRIMARY KEY,
+                    digest TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get_sync(self, pmc_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT b.body FROM pmc_full_text_index i "
+                "JOIN pmc_full_text_blobs b ON b.digest = i.digest "
+                "WHERE i.pmc_id = ?",
+                (pmc_id,),
+            ).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    def _put_sync(self, pmc_id: str, text: str) -> None:
+        raw = text.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR IGNORE INTO pmc_full_text_blobs (digest, body) VALUES (?, ?)",
+                (digest, zlib.compress(raw)),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO pmc_full_text_index (pmc_id, digest, fetched_at) "
+                "VALUES (?, ?, ?)",
+                (pmc_id, digest, time.time()),
+            )
+            conn.commit()
+
+
+_store: Optional[PmcFullTextStore] = None
+
+
+def get_pmc_full_text_store() -> Optional[PmcFullTextStore]:
+    """Get the shared full text store, or None if disabled in settings."""
+    global _store
+    from config.settings import settings
+
+    if not settings.PMC_FULL_TEXT_CACHE_ENABLED:
+        return None
+    if _store is None:
+        _store = PmcFullTextStore(settings.PMC_FULL_TEXT_CACHE_PATH)
+        logger.info(f"PMC full text store at {settings.PMC_FULL_TEXT_CACHE_PATH}")
+    return _store
+
+
+async def fetch_pmc_full_texts(
+    pmc_ids: List[str],
+    pubmed_service: Optional["PubMedService"] = None,
+    max_concurrency: Optional[int] = None,
+    on_result: Optional[FullTextCallback] = None,
+) -> Dict[str, Optional[str]]:
+    """
+    Fetch full text for many PMCIDs with bounded concurrency.
+
+    Args:
+        pmc_ids: PMC IDs to fetch (duplicates are fetched once)
+        pubmed_service: Service to fetch through (default: new PubMedService)
+        max_concurrency: In-flight fetch limit (default: PMC_FULL_TEXT_MAX_CONCURRENCY)
+        on_result: Optional async callback(pmc_id, text) invoked as each fetch completes
+
+    Returns:
+        Dict of pmc_id -> full text (None where unavailable or failed)
+    """
+    from config.settings import settings
+    from services.pubmed_service import PubMedService
+
+    service = pubmed_service or PubMedService()
+    limit = max_concurrency or settings.PMC_FULL_TEXT_MAX_CONCURRENCY
+    semaphore = asyncio.Semaphore(max(1, limit))
+    results: Dict[str, Optional[str]] = {}
+
+    async def fetch_one(pmc_id: str) -> None:
+        async with semaphore:
+            try:
+                text = await service.get_pmc_full_text(pmc_id)
+            except Exception as e:
+                logger.error(f"Error fetching full text for {pmc_id}: {e}")
+                text = None
+        results[pmc_id] = text
+        if on_result is not None:
+            await on_result(pmc_id, text)
+
+    await asyncio.gather(*[fetch_one(pmc_id) for pmc_id in dict.fromkeys(pmc_ids)])
+    return results
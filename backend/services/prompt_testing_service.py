@@ -16,6 +16,7 @@ from utils.date_utils import format_pub_date
 
 from schemas.research_stream import EnrichmentConfig, PromptTemplate, CategorizationPrompt
 from schemas.llm import ModelConfig, DEFAULT_MODEL_CONFIG
+from agents.prompts.llm import LLMOptions
 from services.report_summary_service import ReportSummaryService, DEFAULT_PROMPTS, AVAILABLE_SLUGS
 from services.research_stream_service import ResearchStreamService
 from services.report_service import ReportService
@@ -126,23 +127,28 @@ class PromptTestingService:
         )
 
         # Call appropriate summary service method (same path as pipeline)
+        # Repeat previews are served from the LLM result cache
+        options = LLMOptions(stage=prompt_type, use_cache=True)
         if prompt_type == "article_summary":
             result = await self.summary_service.generate_article_summary(
                 items=item,
                 enrichment_config=enrichment_config,
                 model_config=llm_config,
+                options=options,
             )
         elif prompt_type == "category_summary":
             result = await self.summary_service.generate_category_summary(
                 items=item,
                 enrichment_config=enrichment_config,
                 model_config=llm_config,
+                options=options,
             )
         elif prompt_type == "executive_summary":
             result = await self.summary_service.generate_executive_summary(
                 items=item,
                 enrichment_config=enrichment_config,
                 model_config=llm_config,
+                options=options,
             )
         else:
             raise ValueError(f"Unknown prompt type: {prompt_type}")
@@ -353,6 +359,7 @@ class PromptTestingService:
         result = await categorization_service.categorize(
             items=sample_data,
             model_config=llm_config,
+            options=LLMOptions(stage="categorization", use_cache=True),
             custom_prompt=prompt
         )
 
@@ -533,6 +540,7 @@ class PromptTestingService:
                 "user_prompt_template": user_prompt
             },
             model_config=llm_config,
+            options=LLMOptions(stage="stance_analysis", use_cache=True),
         )
 
         # Format response
@@ -0,0 +1,224 @@
+"""
+PubMed Article Cache - Local store of parsed efetch records
+
+Every pipeline run, retrieval test, Tablizer search and chat tool call goes
+through PubMedService._get_articles_from_ids, and streams with overlapping
+queries pull the same PMIDs over and over. This cache keeps the parsed
+PubMedArticle fields on disk so repeat lookups skip the efetch round trip.
+
+KEYING:
+=======
+Entries are keyed by PMID and carry the record's DateRevised. A fresh fetch
+only replaces an entry when its DateRevised is the same or newer, so an older
+revision can never overwrite a newer one. Entries older than the TTL are
+treated as misses and re-fetched, which is how revisions are picked up.
+
+Full text is NOT cached here - PMC full text is fetched separately.
+
+STORAGE:
+========
+A single SQLite file (stdlib, no server) shared by every PubMedService in
+the process. SQLite calls are run in a worker thread so the event loop is
+never blocked on disk I/O.
+
+Usage:
+    cache = get_pubmed_article_cache()
+    hits, misses = await cache.get_many(pmids)
+    ...fetch misses...
+    await cache.put_many(fetched_articles)
+    cache.stats  # hits / misses / stores since process start
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from services.pubmed_service import PubMedArticle
+
+logger = logging.getLogger(__name__)
+
+# PubMedArticle attributes persisted in the cache (full_text deliberately excluded)
+_CACHED_FIELDS = (
+    "PMID", "title", "abstract", "authors", "journal", "volume", "issue",
+    "pages", "medium", "pmc_id", "doi", "pub_year", "pub_month", "pub_day",
+    "comp_date", "date_revised", "article_date", "entry_date",
+)
+
+
+@dataclass
+class PubMedArticleCacheStats:
+    """Counters for cache effectiveness since process start."""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class PubMedArticleCache:
+    """SQLite-backed cache of parsed PubMed articles keyed by PMID + DateRevised."""
+
+    def __init__(self, path: str, ttl_hours: int = 168):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.stats = PubMedArticleCacheStats()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # =========================================================================
+    # Public API (async)
+    # =========================================================================
+
+    async def get_many(
+        self, pmids: List[str]
+    ) -> Tuple[Dict[str, "PubMedArticle"], List[str]]:
+        """
+        Look up PMIDs in the cache.
+
+        Returns:
+            Tuple of (hits keyed by PMID, list of PMIDs that missed, in input order)
+        """
+        if not pmids:
+            return {}, []
+        try:
+            hits = await asyncio.to_thread(self._get_many_sync, pmids)
+        except Exception as e:
+            logger.warning(f"PubMed article cache read failed, treating as miss: {e}")
+            self.stats.errors += 1
+            hits = {}
+
+        misses = [pmid for pmid in pmids if pmid not in hits]
+        self.stats.hits += len(pmids) - len(misses)
+        self.stats.misses += len(misses)
+        return hits, misses
+
+    async def put_many(self, articles: List["PubMedArticle"]) -> None:
+        """Store freshly parsed articles. Failures are logged, never raised."""
+        articles = [a for a in articles if a.PMID]
+        if not articles:
+            return
+        try:
+            await asyncio.to_thread(self._put_many_sync, articles)
+            self.stats.stores += len(articles)
+        except Exception as e:
+            logger.warning(f"PubMed article cache write failed: {e}")
+            self.stats.errors += 1
+
+    # =========================================================================
+    # SQLite internals (run in worker thread)
+    # =========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pubmed_articles (
+                    pmid TEXT PRIMARY KEY,
+                    date_revised TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    cached_at REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get_many_sync(self, pmids: List[str]) -> Dict[str, "PubMedArticle"]:
+        from services.pubmed_service import PubMedArticle
+
+        cutoff = time.time() - self.ttl_seconds
+        hits: Dict[str, PubMedArticle] = {}
+        with self._lock:
+            conn = self._connect()
+            # SQLite caps bound parameters at 999 on older builds
+            for i in range(0, len(pmids), 500):
+                chunk = pmids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT pmid, payload FROM pubmed_articles "
+                    f"WHERE pmid IN ({placeholders}) AND cached_at >= ?",
+                    (*chunk, cutoff),
+                ).fetchall()
+                for pmid, payload in rows:
+                    hits[pmid] = PubMedArticle(**json.loads(payload))
+        return hits
+
+    def _put_many_sync(self, articles: List["PubMedArticle"]) -> None:
+        now = time.time()
+        rows = [
+            (
+                a.PMID,
+                a.date_revised or "",
+                json.dumps({field: getattr(a, field) for field in _CACHED_FIELDS}),
+                now,
+            )
+            for a in articles
+        ]
+        with self._lock:
+            conn = self._connect()
+            # Only overwrite when the incoming revision is the same or newer
+            conn.executemany(
+                """
+                INSERT INTO pubmed_articles (pmid, date_revised, payload, cached_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(pmid) DO UPDATE SET
+                    date_revised = excluded.date_revised,
+                    payload = excluded.payload,
+                    cached_at = excluded.cached_at
+                WHERE excluded.date_revised >= pubmed_articles.date_revised
+                """,
+                rows,
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# =============================================================================
+# Process-wide instance
+# =============================================================================
+
+_cache: Optional[PubMedArticleCache] = None
+
+
+def get_pubmed_article_cache() -> Optional[PubMedArticleCache]:
+    """Get the shared article cache, or None if disabled in settings."""
+    global _cache
+    from config.settings import settings
+
+    if not settings.PUBMED_ARTICLE_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = PubMedArticleCache(
+            path=settings.PUBMED_ARTICLE_CACHE_PATH,
+            ttl_hours=settings.PUBMED_ARTICLE_CACHE_TTL_HOURS,
+        )
+        logger.info(
+            f"PubMed article cache at {settings.PUBMED_ARTICLE_CACHE_PATH} "
+            f"(ttl={settings.PUBMED_ARTICLE_CACHE_TTL_HOURS}h)"
+        )
+    return _cache
@@ -1,10 +1,14 @@
 import httpx
 import asyncio
+import io
+import random
 import xml.etree.ElementTree as ET
 import urllib.parse
 import logging
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+
+from services.ncbi_http_client import get_ncbi_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,7 @@ There are several ways to get article text content, depending on what's needed:
    - search_articles(query) or get_articles_from_ids([pmid])
    - Returns metadata + abstract for all articles
    - Fastest, always available
+   - Served from the local article cache when possible (see pubmed_article_cache.py)
 
 2. Full Text from PubMed Central (PMC)
    - search_articles(query, include_full_text=True)
@@ -76,8 +81,21 @@ class PubMedArticle:
 
     """
 
+    _MONTHS = {
+        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+    }
+
     @classmethod
     def from_xml(cls, article_xml: bytes) -> "PubMedArticle":
+        """
+        Parse a single serialized PubmedArticle.
+
+        Reference parser using descendant searches. Batch fetches use
+        from_element() on the already-parsed tree instead; this is kept for
+        callers holding raw XML and as the baseline for
+        scripts/benchmark_pubmed_parser.py.
+        """
         pubmed_article_node = ET.fromstring(article_xml)
         medline_citation_node = pubmed_article_node.find(".//MedlineCitation")
 
@@ -292,7 +310,9 @@ class PubMedArticle:
     @classmethod
     def from_book_xml(cls, book_xml: bytes) -> "PubMedArticle":
         """
-        Parse a PubmedBookArticle XML element (e.g., StatPearls chapters).
+        Parse a serialized PubmedBookArticle (e.g., StatPearls chapters).
+
+        Reference parser - batch fetches use from_book_element().
 
         Maps book-specific fields to the standard PubMedArticle structure:
         - journal -> BookTitle (e.g., "StatPearls")
@@ -421,6 +441,232 @@ class PubMedArticle:
             pub_day=pub_day,
         )
 
+    @classmethod
+    def from_element(cls, pubmed_article_node: ET.Element) -> "PubMedArticle":
+        """
+        Parse an already-parsed PubmedArticle element using direct child paths.
+
+        Produces the same fields as from_xml() without re-serialising the node
+        or walking the whole subtree for every lookup.
+        """
+        medline_citation_node = pubmed_article_node.find("MedlineCitation")
+        article_node = medline_citation_node.find("Article")
+        pubmed_data_node = pubmed_article_node.find("PubmedData")
+
+        PMID = medline_citation_node.findtext("PMID") or ""
+        date_completed = cls._get_date_from_node(medline_citation_node.find("DateCompleted"))
+        date_revised = cls._get_date_from_node(medline_citation_node.find("DateRevised"))
+
+        # ArticleDate can be in Article or directly in MedlineCitation
+        article_date_node = article_node.find("ArticleDate") if article_node is not None else None
+        if article_date_node is None:
+            article_date_node = medline_citation_node.find("ArticleDate")
+        article_date = cls._get_date_from_node(article_date_node)
+
+        entry_date = ""
+        if pubmed_data_node is not None:
+            entry_date = cls._get_date_from_node(
+                pubmed_data_node.find('History/PubMedPubDate[@PubStatus="entrez"]')
+            )
+
+        journal_node = article_node.find("Journal")
+        journal_issue_node = journal_node.find("JournalIssue")
+        pubdate_node = journal_issue_node.find("PubDate") if journal_issue_node is not None else None
+
+        title_node = article_node.find("ArticleTitle")
+        title = "".join(title_node.itertext()) if title_node is not None else ""
+        journal = journal_node.findtext("Title") or ""
+        medium = journal_issue_node.attrib["CitedMedium"] if journal_issue_node is not None else ""
+        volume = (journal_issue_node.findtext("Volume") if journal_issue_node is not None else None) or ""
+        issue = (journal_issue_node.findtext("Issue") if journal_issue_node is not None else None) or ""
+        pages = article_node.findtext("Pagination/MedlinePgn") or ""
+
+        # Journal PubDate, then prefer ArticleDate (epub) if it is earlier
+        pub_year: Optional[int] = None
+        pub_month: Optional[int] = None
+        pub_day: Optional[int] = None
+        year = pubdate_node.findtext("Year") if pubdate_node is not None else None
+        if year:
+            try:
+                pub_year = int(year)
+            except (ValueError, TypeError):
+                pass
+            month_text = pubdate_node.findtext("Month")
+            if month_text:
+                month_text = month_text.strip()
+                if month_text.lower()[:3] in cls._MONTHS:
+                    pub_month = cls._MONTHS[month_text.lower()[:3]]
+                elif month_text.isdigit():
+                    pub_month = int(month_text)
+                day_text = pubdate_node.findtext("Day")
+                if day_text:
+                    try:
+                        pub_day = int(day_text.strip())
+                    except (ValueError, TypeError):
+                        pass
+
+        if article_date_node is not None:
+            epub_year_text = article_date_node.findtext("Year")
+            if epub_year_text:
+                try:
+                    epub_month_text = article_date_node.findtext("Month")
+                    epub_day_text = article_date_node.findtext("Day")
+                    epub_year = int(epub_year_text)
+                    epub_month = int(epub_month_text) if epub_month_text else None
+                    epub_day = int(epub_day_text) if epub_day_text else None
+                    if pub_year is not None:
+                        journal_tuple = (pub_year, pub_month or 12, pub_day or 28)
+                        epub_tuple = (epub_year, epub_month or 12, epub_day or 28)
+                        if epub_tuple < journal_tuple:
+                            pub_year, pub_month, pub_day = epub_year, epub_month, epub_day
+                    else:
+                        pub_year, pub_month, pub_day = epub_year, epub_month, epub_day
+                except (ValueError, TypeError):
+                    pass
+
+        pmc_id, doi = cls._get_ids_from_node(
+            pubmed_data_node.find("ArticleIdList") if pubmed_data_node is not None else None,
+            accession_type="pmc",
+        )
+
+        return PubMedArticle(
+            PMID=PMID,
+            comp_date=date_completed,
+            date_revised=date_revised,
+            article_date=article_date,
+            entry_date=entry_date,
+            title=title,
+            abstract=cls._get_abstract_from_node(article_node.find("Abstract")),
+            authors=cls._get_authors_from_node(article_node.find("AuthorList")),
+            journal=journal,
+            medium=medium,
+            volume=volume,
+            issue=issue,
+            pages=pages,
+            pmc_id=pmc_id,
+            doi=doi,
+            pub_year=pub_year,
+            pub_month=pub_month,
+            pub_day=pub_day,
+        )
+
+    @classmethod
+    def from_book_element(cls, book_article_node: ET.Element) -> "PubMedArticle":
+        """
+        Parse an already-parsed PubmedBookArticle element using direct child paths.
+
+        Produces the same fields as from_book_xml().
+        """
+        book_document = book_article_node.find("BookDocument")
+        book_node = book_document.find("Book")
+
+        PMID = book_document.findtext("PMID") or ""
+        title_node = book_document.find("ArticleTitle")
+        title = "".join(title_node.itertext()) if title_node is not None else ""
+
+        journal = ""
+        pub_year: Optional[int] = None
+        pub_month: Optional[int] = None
+        # The book's own AuthorList (editors) precedes the chapter's in document order
+        author_list_node = None
+        if book_node is not None:
+            book_title = book_node.findtext("BookTitle")
+            if book_title:
+                journal = book_title
+                publisher = book_node.findtext("Publisher/PublisherName")
+                if publisher:
+                    journal += f" ({publisher})"
+            pubdate_node = book_node.find("PubDate")
+            if pubdate_node is not None:
+                year_text = pubdate_node.findtext("Year")
+                if year_text:
+                    try:
+                        pub_year = int(year_text)
+                    except (ValueError, TypeError):
+                        pass
+                    month_text = pubdate_node.findtext("Month")
+                    if month_text:
+                        try:
+                            pub_month = int(month_text)
+                        except (ValueError, TypeError):
+                            pass
+            author_list_node = book_node.find("AuthorList")
+        if author_list_node is None:
+            author_list_node = book_document.find("AuthorList")
+
+        pmc_id, doi = cls._get_ids_from_node(
+            book_document.find("ArticleIdList"), accession_type="bookaccession"
+        )
+
+        entry_date = cls._get_date_from_node(
+            book_article_node.find('PubmedBookData/History/PubMedPubDate[@PubStatus="entrez"]')
+        )
+
+        return PubMedArticle(
+            PMID=PMID,
+            comp_date="",
+            date_revised="",
+            article_date="",
+            entry_date=entry_date,
+            title=title,
+            abstract=cls._get_abstract_from_node(book_document.find("Abstract")),
+            authors=cls._get_authors_from_node(author_list_node),
+            journal=journal,
+            medium="Book",
+            volume="",
+            issue="",
+            pages="",
+            pmc_id=pmc_id,
+            doi=doi,
+            pub_year=pub_year,
+            pub_month=pub_month,
+            pub_day=None,
+        )
+
+    @staticmethod
+    def _get_authors_from_node(author_list_node: Optional[ET.Element]) -> str:
+        """Format an AuthorList as 'Last Initials, ...' (collective names skipped)."""
+        if author_list_node is None:
+            return ""
+        author_list = []
+        for author_node in author_list_node.iterfind("Author"):
+            last_name = author_node.findtext("LastName")
+            if last_name is not None:
+                initials = author_node.findtext("Initials") or ""
+                author_list.append(f"{last_name} {initials}".strip())
+        return ", ".join(author_list)
+
+    @staticmethod
+    def _get_abstract_from_node(abstract_node: Optional[ET.Element]) -> str:
+        """Join AbstractText sections, rendering labels as markdown headers."""
+        if abstract_node is None:
+            return ""
+        abstract_parts = []
+        for abstract_text in abstract_node.iterfind("AbstractText"):
+            text_content = "".join(abstract_text.itertext()).strip()
+            label = abstract_text.get("Label")
+            if label:
+                abstract_parts.append(f"**{label}**\n{text_content}")
+            else:
+                abstract_parts.append(text_content)
+        return "\n\n".join(abstract_parts)
+
+    @staticmethod
+    def _get_ids_from_node(
+        article_id_list: Optional[ET.Element], accession_type: str
+    ) -> tuple[str, str]:
+        """Extract (accession id of the given IdType, doi) from an ArticleIdList."""
+        accession = ""
+        doi = ""
+        if article_id_list is not None:
+            for article_id in article_id_list.iterfind("ArticleId"):
+                id_type = article_id.get("IdType", "")
+                if id_type == accession_type and article_id.text:
+                    accession = article_id.text
+                elif id_type == "doi" and article_id.text:
+                    doi = article_id.text
+        return accession, doi
+
     def __init__(self, **kwargs: Any) -> None:
         # print(kwargs)
         self.PMID = kwargs["PMID"]
@@ -485,39 +731,39 @@ class PubMedArticle:
 
     @staticmethod
     def _get_date_from_node(date_node: Optional[ET.Element]) -> str:
+        """Format a Year/Month/Day date element as YYYY-MM-DD ("" if no year)."""
         if date_node is None:
             return ""
 
-        year_node = date_node.find(".//Year")
-        month_node = date_node.find(".//Month")
-        day_node = date_node.find(".//Day")
-
-        # Debug logging
-        logger.debug(f"Date node tag: {date_node.tag}")
-        logger.debug(
-            f"Year node: {year_node.text if year_node is not None else 'None'}"
-        )
-        logger.debug(
-            f"Month node: {month_node.text if month_node is not None else 'None'}"
-        )
-        logger.debug(f"Day node: {day_node.text if day_node is not None else 'None'}")
-
         # Year is required
-        if year_node is None or year_node.text is None:
-            logger.debug("No year found, returning empty string")
+        year = date_node.findtext("Year")
+        if year is None:
             return ""
 
-        year = year_node.text
-        month = month_node.text if month_node is not None and month_node.text else "01"
-        day = day_node.text if day_node is not None and day_node.text else "01"
+        month = date_node.findtext("Month") or "01"
+        day = date_node.findtext("Day") or "01"
 
         # Ensure month and day are zero-padded
-        month = month.zfill(2)
-        day = day.zfill(2)
+        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
 
-        result = f"{year}-{month}-{day}"
-        logger.debug(f"Returning date: {result}")
-        return result
+
+def iter_efetch_article_elements(xml: bytes) -> Iterator[ET.Element]:
+    """
+    Stream PubmedArticle / PubmedBookArticle elements from an efetch response.
+
+    Uses iterparse so the document is never held as one full tree: each
+    top-level article element is yielded once complete and cleared from the
+    root as soon as the consumer moves on.
+    """
+    root = None
+    for event, elem in ET.iterparse(io.BytesIO(xml), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            continue
+        if elem.tag in ("PubmedArticle", "PubmedBookArticle"):
+            yield elem
+            root.clear()
 
 
 def get_citation_from_article(article: PubMedArticle) -> str:
@@ -629,8 +875,6 @@ class PubMedService:
             date_type: Type of date to filter on ("publication", "completion", "entry", "revised")
             include_full_text: If True, fetch full text from PMC for articles with PMC IDs
         """
-        from schemas.research_article_converters import pubmed_article_to_research
-
         logger.info(
             f"PubMed search: query='{query}', max_results={max_results}, offset={offset}"
         )
@@ -656,9 +900,46 @@ class PubMedService:
             return [], {"total_results": total_count, "offset": offset, "returned": 0}
 
         # Get full article data for the current page
-        logger.info(f"Fetching article data for {len(paginated_ids)} articles")
+        canonical_articles = await self.get_canonical_articles(
+            paginated_ids, include_full_text=include_full_text, first_position=offset + 1
+        )
+
+        # Trim to requested max_results if we got extra
+        if len(canonical_articles) > max_results:
+            canonical_articles = canonical_articles[:max_results]
+
+        metadata = {
+            "total_results": total_count,
+            "offset": offset,
+            "returned": len(canonical_articles),
+        }
+
+        return canonical_articles, metadata
+
+    async def get_canonical_articles(
+        self,
+        article_ids: List[str],
+        include_full_text: bool = False,
+        first_position: int = 1,
+    ) -> List["CanonicalResearchArticle"]:
+        """
+        Fetch articles by PubMed ID and convert them to canonical format (async).
+
+        Articles that fail conversion are logged and dropped.
+
+        Args:
+            article_ids: PMIDs, in result order
+            include_full_text: If True, fetch full text from PMC for articles with PMC IDs
+            first_position: search_position of the first article
+        """
+        from schemas.research_article_converters import pubmed_article_to_research
+
+        if not article_ids:
+            return []
+
+        logger.info(f"Fetching article data for {len(article_ids)} articles")
         articles = await self._get_articles_from_ids(
-            paginated_ids, include_full_text=include_full_text
+            article_ids, include_full_text=include_full_text
         )
         logger.info(f"Retrieved {len(articles)} articles")
 
@@ -668,7 +949,7 @@ class PubMedService:
         for i, article in enumerate(articles):
             try:
                 research_article = pubmed_article_to_research(article)
-                research_article.search_position = offset + i + 1
+                research_article.search_position = first_position + i
                 # Pass through full_text if fetched
                 if article.full_text:
                     research_article.full_text = article.full_text
@@ -690,17 +971,7 @@ class PubMedService:
             )
             logger.warning(f"Failed PMIDs and errors: {conversion_failures}")
 
-        # Trim to requested max_results if we got extra
-        if len(canonical_articles) > max_results:
-            canonical_articles = canonical_articles[:max_results]
-
-        metadata = {
-            "total_results": total_count,
-            "offset": offset,
-            "returned": len(canonical_articles),
-        }
-
-        return canonical_articles, metadata
+        return canonical_articles
 
     def _get_date_clause(
         self, start_date: str, end_date: str, date_type: str = "publication"
@@ -784,55 +1055,59 @@ class PubMedService:
         max_retries = 3
         retry_delay = 1
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for attempt in range(max_retries):
-                try:
-                    response = await client.get(url, params=params, headers=headers)
-                    break
-                except httpx.RequestError as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(
-                            f"Request failed (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {retry_delay}s..."
-                        )
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2
-                    else:
-                        logger.error(
-                            f"Request failed after {max_retries} attempts: {e}"
-                        )
-                        raise
+        from services.ncbi_rate_limiter import get_ncbi_rate_limiter
 
+        limiter = get_ncbi_rate_limiter(self.api_key)
+        client = get_ncbi_http_client()
+        for attempt in range(max_retries):
             try:
-                response.raise_for_status()
-
-                content_type = response.headers.get("content-type", "")
-                if "application/json" not in content_type:
-                    logger.error(f"Expected JSON but got content-type: {content_type}")
-                    raise Exception(
-                        f"PubMed API returned non-JSON response. Content-Type: {content_type}"
+                await limiter.acquire()
+                response = await client.get(url, params=params, headers=headers)
+                break
+            except httpx.RequestError as e:
+                if attempt < max_retries - 1:
+                    logger.warning(
+                        f"Request failed (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {retry_delay}s..."
                     )
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2
+                else:
+                    logger.error(
+                        f"Request failed after {max_retries} attempts: {e}"
+                    )
+                    raise
+
+        try:
+            response.raise_for_status()
 
-                if not response.text:
-                    logger.error("PubMed API returned empty response body")
-                    raise Exception("PubMed API returned empty response")
+            content_type = response.headers.get("content-type", "")
+            if "application/json" not in content_type:
+                logger.error(f"Expected JSON but got content-type: {content_type}")
+                raise Exception(
+                    f"PubMed API returned non-JSON response. Content-Type: {content_type}"
+                )
 
-                content = response.json()
+            if not response.text:
+                logger.error("PubMed API returned empty response body")
+                raise Exception("PubMed API returned empty response")
 
-                if "esearchresult" not in content:
-                    raise Exception("Invalid response format from PubMed API")
+            content = response.json()
 
-                count = int(content["esearchresult"]["count"])
-                ids = content["esearchresult"]["idlist"]
+            if "esearchresult" not in content:
+                raise Exception("Invalid response format from PubMed API")
 
-                logger.info(f"Found {count} articles, returning {len(ids)} IDs")
-                return ids, count
+            count = int(content["esearchresult"]["count"])
+            ids = content["esearchresult"]["idlist"]
 
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error in PubMed search: {e}", exc_info=True)
-                raise Exception(f"PubMed API request failed: {str(e)}")
-            except Exception as e:
-                logger.error(f"Error in PubMed search: {e}", exc_info=True)
-                raise
+            logger.info(f"Found {count} articles, returning {len(ids)} IDs")
+            return ids, count
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error in PubMed search: {e}", exc_info=True)
+            raise Exception(f"PubMed API request failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error in PubMed search: {e}", exc_info=True)
+            raise
 
     async def get_articles_from_ids(
         self, ids: List[str], include_full_text: bool = False
@@ -856,115 +1131,113 @@ class PubMedService:
     ) -> List[PubMedArticle]:
         """Fetch full article data from PubMed IDs (async).
 
+        Serves PMIDs from the local article cache where possible and only sends
+        misses to efetch. Results are returned in the order of the input IDs.
+
         Args:
             ids: List of PubMed IDs
             include_full_text: If True, also fetch full text from PMC for articles with PMC IDs
         """
-        BATCH_SIZE = 100
-        articles = []
-        batch_size = BATCH_SIZE
-        low = 0
-        high = low + batch_size
-        dropped_pmids: List[str] = []
-        failed_batches: List[tuple[int, int, str]] = []
+        from services.pubmed_article_cache import get_pubmed_article_cache
 
-        MAX_RETRIES = 3
-        RETRY_DELAYS = [2, 5, 10]  # seconds
+        cache = get_pubmed_article_cache()
+        if cache is not None:
+            cached, ids_to_fetch = await cache.get_many(ids)
+            if cached:
+                logger.info(
+                    f"PubMed article cache: {len(cached)} hits, {len(ids_to_fetch)} misses "
+                    f"(process totals: {cache.stats.hits} hits, {cache.stats.misses} misses)"
+                )
+        else:
+            cached, ids_to_fetch = {}, ids
+
+        fetched = await self._efetch_articles(ids_to_fetch) if ids_to_fetch else []
+        if cache is not None and fetched:
+            await cache.put_many(fetched)
+
+        # Reassemble in requested order; keep any PMIDs efetch returned that we
+        # did not ask for (e.g. merged records) at the end
+        by_pmid: Dict[str, PubMedArticle] = dict(cached)
+        extra: List[PubMedArticle] = []
+        requested = set(ids)
+        for article in fetched:
+            if article.PMID in requested:
+                by_pmid[article.PMID] = article
+            else:
+                extra.append(article)
+        articles: List[PubMedArticle] = []
+        seen: set = set()
+        for pmid in ids:
+            if pmid in by_pmid and pmid not in seen:
+                seen.add(pmid)
+                articles.append(by_pmid[pmid])
+        articles.extend(extra)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            while low < len(ids):
+        # Fetch full text for articles with PMC IDs if requested
+        if include_full_text:
+            articles_with_pmc = [a for a in articles if a.pmc_id]
+            if articles_with_pmc:
+                logger.info(
+                    f"Fetching full text for {len(articles_with_pmc)} articles with PMC IDs"
+                )
+                await self._fetch_full_text_for_articles(articles_with_pmc)
+
+        return articles
+
+    async def _efetch_articles(self, ids: List[str]) -> List[PubMedArticle]:
+        """Download and parse articles from efetch in batches of 100 (async).
+
+        Batches run concurrently (up to PUBMED_EFETCH_MAX_CONCURRENCY) and every
+        request draws from the process-wide NCBI rate limiter. A failed batch is
+        retried on its own with jittered backoff. Articles are returned in
+        batch order.
+
+        Raises RuntimeError if any batch fails due to network/server errors.
+        """
+        from config.settings import settings
+
+        BATCH_SIZE = 100
+        batches = [ids[i : i + BATCH_SIZE] for i in range(0, len(ids), BATCH_SIZE)]
+        semaphore = asyncio.Semaphore(max(1, settings.PUBMED_EFETCH_MAX_CONCURRENCY))
+
+        async def run_batch(
+            client: httpx.AsyncClient, low: int, id_batch: List[str]
+        ) -> tuple[List[PubMedArticle], List[str], Optional[tuple[int, int, str]]]:
+            high = low + len(id_batch)
+            async with semaphore:
                 logger.info(f"Processing articles {low} to {high}")
-                id_batch = ids[low:high]
-                url = self.fetch_url
-                params = {"db": "pubmed", "id": ",".join(id_batch)}
-                xml = ""
                 try:
-                    last_err = None
-                    for attempt in range(MAX_RETRIES):
-                        try:
-                            response = await client.get(url, params=params)
-                            response.raise_for_status()
-                            xml = response.text
-                            last_err = None
-                            break
-                        except (httpx.RemoteProtocolError, httpx.ConnectError,
-                                httpx.ReadTimeout, httpx.ConnectTimeout) as retry_err:
-                            last_err = retry_err
-                            if attempt < MAX_RETRIES - 1:
-                                delay = RETRY_DELAYS[attempt]
-                                logger.warning(
-                                    f"Transient error fetching batch {low}-{high} "
-                                    f"(attempt {attempt + 1}/{MAX_RETRIES}): {retry_err}. "
-                                    f"Retrying in {delay}s..."
-                                )
-                                await asyncio.sleep(delay)
-                    if last_err is not None:
-                        raise last_err
+                    xml = await self._efetch_batch_xml(client, id_batch, low, high)
                 except Exception as e:
                     logger.error(
                         f"Error fetching articles batch {low}-{high}: {e}",
                         exc_info=True,
                     )
-                    failed_batches.append((low, high, str(e)))
-                    dropped_pmids.extend(id_batch)
-                    low += batch_size
-                    high += batch_size
-                    continue
-
-                try:
-                    root = ET.fromstring(xml)
-                except ET.ParseError as e:
-                    logger.error(f"Error parsing XML for batch {low}-{high}: {e}")
-                    failed_batches.append((low, high, f"XML parse error: {e}"))
-                    dropped_pmids.extend(id_batch)
-                    low += batch_size
-                    high += batch_size
-                    continue
-
-                # Track which PMIDs we successfully parsed from this batch
-                batch_parsed_pmids = set()
-
-                # Parse regular PubmedArticle elements
-                for article_node in root.findall(".//PubmedArticle"):
-                    try:
-                        article = PubMedArticle.from_xml(ET.tostring(article_node))
-                        articles.append(article)
-                        batch_parsed_pmids.add(article.PMID)
-                    except Exception as e:
-                        # Try to extract PMID from the XML node for error reporting
-                        pmid_node = article_node.find(".//PMID")
-                        pmid = pmid_node.text if pmid_node is not None else "unknown"
-                        logger.error(
-                            f"Error parsing article PMID {pmid}: {e}", exc_info=True
-                        )
-                        if pmid:
-                            dropped_pmids.append(pmid)
+                    return [], list(id_batch), (low, high, str(e))
 
-                # Parse book articles (PubmedBookArticle) - e.g., StatPearls chapters
-                for book_node in root.findall(".//PubmedBookArticle"):
-                    try:
-                        article = PubMedArticle.from_book_xml(ET.tostring(book_node))
-                        articles.append(article)
-                        batch_parsed_pmids.add(article.PMID)
-                    except Exception as e:
-                        pmid_node = book_node.find(".//PMID")
-                        pmid = pmid_node.text if pmid_node is not None else "unknown"
-                        logger.error(
-                            f"Error parsing book article PMID {pmid}: {e}",
-                            exc_info=True,
-                        )
-                        dropped_pmids.append(f"{pmid} (book parse error)")
-
-                # Check for PMIDs that were requested but not returned in XML at all
-                for pmid in id_batch:
-                    if pmid not in batch_parsed_pmids:
-                        logger.warning(
-                            f"PMID {pmid} was requested but not found in PubMed response at all"
-                        )
-                        dropped_pmids.append(pmid)
+            try:
+                batch_articles, batch_dropped = self._parse_efetch_xml(xml, id_batch)
+            except ET.ParseError as e:
+                logger.error(f"Error parsing XML for batch {low}-{high}: {e}")
+                return [], list(id_batch), (low, high, f"XML parse error: {e}")
+            return batch_articles, batch_dropped, None
+
+        client = get_ncbi_http_client()
+        results = await asyncio.gather(
+            *[
+                run_batch(client, i * BATCH_SIZE, id_batch)
+                for i, id_batch in enumerate(batches)
+            ]
+        )
 
-                low += batch_size
-                high += batch_size
+        articles: List[PubMedArticle] = []
+        dropped_pmids: List[str] = []
+        failed_batches: List[tuple[int, int, str]] = []
+        for batch_articles, batch_dropped, failure in results:
+            articles.extend(batch_articles)
+            dropped_pmids.extend(batch_dropped)
+            if failure is not None:
+                failed_batches.append(failure)
 
         # Summary logging for dropped articles
         if dropped_pmids:
@@ -989,30 +1262,110 @@ class PubMedService:
                 f"Failures: {failed_batches}"
             )
 
-        # Fetch full text for articles with PMC IDs if requested
-        if include_full_text:
-            articles_with_pmc = [a for a in articles if a.pmc_id]
-            if articles_with_pmc:
-                logger.info(
-                    f"Fetching full text for {len(articles_with_pmc)} articles with PMC IDs"
+        return articles
+
+    async def _efetch_batch_xml(
+        self, client: httpx.AsyncClient, id_batch: List[str], low: int, high: int
+    ) -> bytes:
+        """Fetch one efetch batch, retrying transient failures with jittered backoff."""
+        from services.ncbi_rate_limiter import get_ncbi_rate_limiter
+
+        MAX_RETRIES = 3
+        RETRY_BASE_DELAY = 2  # seconds, doubled per attempt
+
+        limiter = get_ncbi_rate_limiter(self.api_key)
+        params = {"db": "pubmed", "id": ",".join(id_batch)}
+        if self.api_key:
+            params["api_key"] = self.api_key
+
+        for attempt in range(MAX_RETRIES):
+            try:
+                await limiter.acquire()
+                response = await client.get(self.fetch_url, params=params)
+                response.raise_for_status()
+                return response.content
+            except (httpx.RemoteProtocolError, httpx.ConnectError,
+                    httpx.ReadTimeout, httpx.ConnectTimeout,
+                    httpx.HTTPStatusError) as retry_err:
+                # Only throttling and server errors are worth retrying
+                if isinstance(retry_err, httpx.HTTPStatusError):
+                    status_code = retry_err.response.status_code
+                    if status_code != 429 and status_code < 500:
+                        raise
+                if attempt >= MAX_RETRIES - 1:
+                    raise
+                delay = RETRY_BASE_DELAY * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.warning(
+                    f"Transient error fetching batch {low}-{high} "
+                    f"(attempt {attempt + 1}/{MAX_RETRIES}): {retry_err}. "
+                    f"Retrying in {delay:.1f}s..."
                 )
-                await self._fetch_full_text_for_articles(articles_with_pmc)
+                await asyncio.sleep(delay)
+        raise RuntimeError("unreachable")
 
-        return articles
+    def _parse_efetch_xml(
+        self, xml: bytes, id_batch: List[str]
+    ) -> tuple[List[PubMedArticle], List[str]]:
+        """Parse one efetch response into articles plus the PMIDs that were dropped.
+
+        Streams the response so each article element is freed once parsed.
+        Raises ET.ParseError if the response is not valid XML.
+        """
+        articles: List[PubMedArticle] = []
+        dropped_pmids: List[str] = []
+
+        # Track which PMIDs we successfully parsed from this batch
+        batch_parsed_pmids = set()
+
+        for node in iter_efetch_article_elements(xml):
+            is_book = node.tag == "PubmedBookArticle"
+            try:
+                if is_book:
+                    # Book articles (PubmedBookArticle) - e.g., StatPearls chapters
+                    article = PubMedArticle.from_book_element(node)
+                else:
+                    article = PubMedArticle.from_element(node)
+                articles.append(article)
+                batch_parsed_pmids.add(article.PMID)
+            except Exception as e:
+                # Try to extract PMID from the XML node for error reporting
+                pmid_node = node.find(".//PMID")
+                pmid = pmid_node.text if pmid_node is not None else "unknown"
+                logger.error(
+                    f"Error parsing {'book ' if is_book else ''}article PMID {pmid}: {e}",
+                    exc_info=True,
+                )
+                if is_book:
+                    dropped_pmids.append(f"{pmid} (book parse error)")
+                elif pmid:
+                    dropped_pmids.append(pmid)
+
+        # Check for PMIDs that were requested but not returned in XML at all
+        for pmid in id_batch:
+            if pmid not in batch_parsed_pmids:
+                logger.warning(
+                    f"PMID {pmid} was requested but not found in PubMed response at all"
+                )
+                dropped_pmids.append(pmid)
+
+        return articles, dropped_pmids
 
     async def _fetch_full_text_for_articles(
         self, articles: List[PubMedArticle]
     ) -> None:
         """Fetch full text from PMC for a list of articles that have PMC IDs.
 
-        Updates the articles in place with their full_text attribute.
+        Updates the articles in place with their full_text attribute. Fetches run
+        with bounded concurrency and are served from the full text store when cached.
         """
-        # Fetch full text concurrently but with some rate limiting
-        import asyncio
+        from services.pmc_full_text_service import fetch_pmc_full_texts
 
-        async def fetch_one(article: PubMedArticle) -> None:
-            try:
-                full_text = await self.get_pmc_full_text(article.pmc_id)
+        by_pmc_id: Dict[str, List[PubMedArticle]] = {}
+        for article in articles:
+            by_pmc_id.setdefault(article.pmc_id, []).append(article)
+
+        async def on_result(pmc_id: str, full_text: Optional[str]) -> None:
+            for article in by_pmc_id[pmc_id]:
                 if full_text:
                     article.full_text = full_text
                     logger.info(
@@ -1020,19 +1373,12 @@ class PubMedService:
                     )
                 else:
                     logger.warning(
-                        f"No full text returned for PMID {article.PMID} (PMC {article.pmc_id})"
+                        f"No full text returned for PMID {article.PMID} (PMC {pmc_id})"
                     )
-            except Exception as e:
-                logger.error(f"Error fetching full text for PMID {article.PMID}: {e}")
 
-        # Process in batches to avoid overwhelming the PMC API
-        BATCH_SIZE = 5
-        for i in range(0, len(articles), BATCH_SIZE):
-            batch = articles[i : i + BATCH_SIZE]
-            await asyncio.gather(*[fetch_one(article) for article in batch])
-            # Small delay between batches to be nice to the API
-            if i + BATCH_SIZE < len(articles):
-                await asyncio.sleep(0.5)
+        await fetch_pmc_full_texts(
+            list(by_pmc_id), pubmed_service=self, on_result=on_result
+        )
 
     async def get_full_text_links(self, pmid: str) -> List[Dict[str, Any]]:
         """
@@ -1050,11 +1396,14 @@ class PubMedService:
         if self.api_key:
             params["api_key"] = self.api_key
 
+        from services.ncbi_rate_limiter import get_ncbi_rate_limiter
+
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            await get_ncbi_rate_limiter(self.api_key).acquire()
+            client = get_ncbi_http_client()
+            response = await client.get(url, params=params, timeout=15.0)
+            response.raise_for_status()
+            data = response.json()
 
             links = []
 
@@ -1125,6 +1474,21 @@ class PubMedService:
         Returns:
             The full text of the article as plain text, or None if not available.
         """
+        from services.pmc_full_text_service import get_pmc_full_text_store
+
+        store = get_pmc_full_text_store()
+        if store is not None:
+            cached = await store.get(pmc_id)
+            if cached is not None:
+                return cached
+
+        full_text = await self._download_pmc_full_text(pmc_id)
+        if full_text and store is not None:
+            await store.put(pmc_id, full_text)
+        return full_text
+
+    async def _download_pmc_full_text(self, pmc_id: str) -> Optional[str]:
+        """Download and flatten PMC article XML to markdown-ish text (no cache)."""
         # Normalize PMC ID
         if pmc_id.upper().startswith("PMC"):
             pmc_id = pmc_id[3:]
@@ -1135,11 +1499,14 @@ class PubMedService:
         if self.api_key:
             params["api_key"] = self.api_key
 
+        from services.ncbi_rate_limiter import get_ncbi_rate_limiter
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                xml_content = response.text
+            await get_ncbi_rate_limiter(self.api_key).acquire()
+            client = get_ncbi_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            xml_content = response.text
 
             # Parse the XML to extract text content
             root = ET.fromstring(xml_content)
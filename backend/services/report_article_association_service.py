@@ -89,6 +89,40 @@ class ReportArticleAssociationService:
         )
         return list(result.scalars().all())
 
+    async def get_visible_for_wip_articles(
+        self, report_id: int, wip_article_ids: List[int]
+    ) -> List[ReportArticleAssociation]:
+        """Get visible associations of a report that were promoted from the given WipArticles (async)."""
+        if not wip_article_ids:
+            return []
+        result = await self.db.execute(
+            select(ReportArticleAssociation)
+            .options(
+                selectinload(ReportArticleAssociation.article),
+                selectinload(ReportArticleAssociation.wip_article)
+            )
+            .where(
+                and_(
+                    ReportArticleAssociation.report_id == report_id,
+                    ReportArticleAssociation.wip_article_id.in_(wip_article_ids),
+                    ReportArticleAssociation.is_hidden == False
+                )
+            ).order_by(ReportArticleAssociation.ranking)
+        )
+        return list(result.scalars().all())
+
+    async def get_wip_article_ids(self, report_id: int) -> set:
+        """Get the IDs of the WipArticles already promoted to a report, hidden or not (async)."""
+        result = await self.db.execute(
+            select(ReportArticleAssociation.wip_article_id).where(
+                and_(
+                    ReportArticleAssociation.report_id == report_id,
+                    ReportArticleAssociation.wip_article_id.isnot(None)
+                )
+            )
+        )
+        return set(result.scalars().all())
+
     async def count_visible(self, report_id: int) -> int:
         """Count visible articles in a report (async)."""
         result = await self.db.execute(
@@ -123,46 +157,60 @@ class ReportArticleAssociationService:
     async def find_historical_duplicates(
         self,
         stream_id: int,
-        execution_id: str
+        execution_id: str,
+        retrieval_group_id: Optional[str] = None
     ) -> List[Tuple[int, str]]:
         """
         Find WipArticles that match articles already visible in previous reports for this stream.
 
-        Uses a single SQL join to efficiently find duplicates in the database.
+        Matches on canonical PMID, normalized DOI or (for WipArticles with
+        neither) normalized-title hash. Generic titles ("Editorial", "Weekly
+        update") have no hash, so they never match. Each is a plain equality join on
+        an indexed column; the branches are combined with UNION rather than an
+        OR join condition, which MySQL cannot resolve with the indexes.
 
         Args:
             stream_id: The research stream ID
             execution_id: Current execution ID (WipArticles to check)
+            retrieval_group_id: Only check the WipArticles of this retrieval group
 
         Returns:
             List of (wip_article_id, matched_identifier) tuples for duplicates found
         """
         from models import Report, Article, WipArticle
-        from sqlalchemy import or_
-
-        # Single query: join WipArticle with historical visible articles by PMID or DOI
-        query = (
-            select(WipArticle.id, Article.pmid, Article.doi)
-            .select_from(WipArticle)
-            .join(
-                Article,
-                or_(
-                    and_(WipArticle.pmid != None, WipArticle.pmid == Article.pmid),
-                    and_(WipArticle.doi != None, func.lower(WipArticle.doi) == func.lower(Article.doi))
+        from sqlalchemy import union
+
+        scope = [WipArticle.pipeline_execution_id == execution_id]
+        if retrieval_group_id is not None:
+            scope.append(WipArticle.retrieval_group_id == retrieval_group_id)
+
+        def matches(join_condition, *conditions):
+            return (
+                select(WipArticle.id, Article.article_id, Article.pmid, Article.doi)
+                .select_from(WipArticle)
+                .join(Article, join_condition)
+                .join(ReportArticleAssociation, Article.article_id == ReportArticleAssociation.article_id)
+                .join(Report, ReportArticleAssociation.report_id == Report.report_id)
+                .where(
+                    and_(
+                        *scope,
+                        WipArticle.is_duplicate == False,
+                        Report.research_stream_id == stream_id,
+                        Report.pipeline_execution_id != execution_id,
+                        ReportArticleAssociation.is_hidden == False,
+                        *conditions
+                    )
                 )
             )
-            .join(ReportArticleAssociation, Article.article_id == ReportArticleAssociation.article_id)
-            .join(Report, ReportArticleAssociation.report_id == Report.report_id)
-            .where(
-                and_(
-                    WipArticle.pipeline_execution_id == execution_id,
-                    WipArticle.is_duplicate == False,
-                    Report.research_stream_id == stream_id,
-                    Report.pipeline_execution_id != execution_id,
-                    ReportArticleAssociation.is_hidden == False
-                )
-            )
-            .distinct()
+
+        query = union(
+            matches(WipArticle.pmid == Article.pmid),
+            matches(WipArticle.doi_normalized == Article.doi_normalized),
+            matches(
+                WipArticle.title_hash == Article.title_hash,
+                WipArticle.pmid == None,
+                WipArticle.doi_normalized == None,
+            ),
         )
 
         result = await self.db.execute(query)
@@ -171,7 +219,7 @@ class ReportArticleAssociationService:
         # Return (wip_id, identifier) tuples
         duplicates = []
         for row in rows:
-            identifier = row.pmid if row.pmid else row.doi
+            identifier = row.pmid or row.doi or f"article:{row.article_id}"
             duplicates.append((row.id, f"historical:{identifier}"))
 
         return duplicates
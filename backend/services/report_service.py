@@ -26,6 +26,7 @@ from models import (
 from config.settings import settings
 from database import get_async_db
 from services.user_service import UserService
+from services.wip_article_service import WipArticleCounts, WipArticleRow
 from services.email_template_service import (
     EmailTemplateService, EmailReportData, EmailCategory, EmailArticle
 )
@@ -57,7 +58,7 @@ class WipArticleAnalytics:
     pub_day: Optional[int]
     pmid: Optional[str]
     doi: Optional[str]
-    abstract: Optional[str]
+    abstract: Optional[str] = None  # Not loaded for analytics (see ReportService.get_wip_article_abstract)
 
 
 @dataclass
@@ -171,8 +172,8 @@ class CurationViewData:
     report: Report
     stream: ResearchStream
     included_articles: List[IncludedArticleData]
-    filtered_articles: List[WipArticle]
-    curated_articles: List[WipArticle]
+    filtered_articles: List[WipArticleRow]
+    curated_articles: List[WipArticleRow]
     categories: List[Dict[str, Any]]
     stats: CurationStats
     execution: Optional[PipelineExecution] = None  # For retrieval config access
@@ -314,6 +315,7 @@ class CompareReportResultData:
     """Result of comparing a report to supplied PubMed IDs."""
     supplied_articles: List[SuppliedArticleStatusData]
     report_only_articles: List[ReportOnlyArticleData]
+    statistics: Dict[str, int]
 
 
 @dataclass
@@ -1518,22 +1520,14 @@ class ReportService:
         # Get VISIBLE articles (curator_excluded=False)
         visible_associations = await self.association_service.get_visible_for_report(report_id)
 
-        # Get WIP articles for this execution and compute stats
-        filtered_articles: List[WipArticle] = []
-        curated_articles: List[WipArticle] = []
-
-        # Pipeline stats (what pipeline originally decided)
-        pipeline_included_count = 0
-        pipeline_filtered_count = 0
-        pipeline_duplicate_count = 0
-
-        # Curator stats
-        curator_added_count = 0
-        curator_removed_count = 0
+        # Pipeline stats (what pipeline originally decided) and curator overrides,
+        # counted in SQL; lists are column-projected rows (abstract loaded on expand)
+        counts = WipArticleCounts()
+        filtered_articles: List[WipArticleRow] = []
+        curated_articles: List[WipArticleRow] = []
 
         # Fetch execution for retrieval config access
         execution: Optional[PipelineExecution] = None
-        wip_articles: List[WipArticle] = []
 
         if report.pipeline_execution_id:
             exec_result = await self.db.execute(
@@ -1543,26 +1537,12 @@ class ReportService:
             )
             execution = exec_result.scalars().first()
 
-            wip_articles = await self.wip_article_service.get_by_execution_id(
-                report.pipeline_execution_id
-            )
-
-            for wip in wip_articles:
-                # Count pipeline decisions
-                if wip.is_duplicate:
-                    pipeline_duplicate_count += 1
-                    continue
-                elif wip.passed_semantic_filter:
-                    pipeline_included_count += 1
-                else:
-                    pipeline_filtered_count += 1
-
-                # Count curator overrides
-                if wip.curator_included:
-                    curator_added_count += 1
-                if wip.curator_excluded:
-                    curator_removed_count += 1
+            for group_counts in (
+                await self.wip_article_service.get_execution_counts(report.pipeline_execution_id)
+            ).values():
+                counts.add(group_counts)
 
+            for wip in await self.wip_article_service.get_curation_rows(report.pipeline_execution_id):
                 # Filtered = not currently visible in report
                 if not wip.included_in_report:
                     filtered_articles.append(wip)
@@ -1589,12 +1569,12 @@ class ReportService:
         current_included_count = len(included_articles)
 
         stats = CurationStats(
-            pipeline_included=pipeline_included_count,
-            pipeline_filtered=pipeline_filtered_count,
-            pipeline_duplicates=pipeline_duplicate_count,
+            pipeline_included=counts.passed_filter,
+            pipeline_filtered=counts.filtered_out,
+            pipeline_duplicates=counts.duplicates,
             current_included=current_included_count,
-            curator_added=curator_added_count,
-            curator_removed=curator_removed_count,
+            curator_added=counts.curator_included,
+            curator_removed=counts.curator_excluded,
         )
 
         return CurationViewData(
@@ -1608,6 +1588,28 @@ class ReportService:
             execution=execution,
         )
 
+    async def get_wip_article_abstract(
+        self, report_id: int, user_id: int, wip_article_id: int
+    ) -> Optional[str]:
+        """
+        Get the abstract of one of a report's WipArticles (async).
+
+        The curation view lists WipArticles without their abstracts; the UI
+        fetches one here when the curator expands an article.
+        """
+        report, _, _ = await self.get_report_with_access(report_id, user_id)
+        if not report.pipeline_execution_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report does not have pipeline execution data"
+            )
+        try:
+            return await self.wip_article_service.get_abstract(
+                wip_article_id, report.pipeline_execution_id
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
     async def update_report_content(
         self,
         report_id: int,
@@ -1755,7 +1757,10 @@ class ReportService:
             )
 
         # Find or create Article record (via ArticleService)
-        article = await self.article_service.find_or_create_from_wip(wip_article)
+        full_texts = await self.wip_article_service.get_stored_full_texts([wip_article])
+        article = await self.article_service.find_or_create_from_wip(
+            wip_article, full_text=full_texts.get(wip_article.id)
+        )
 
         # Check if association already exists
         existing_association = await self.association_service.find(report_id, article.article_id)
@@ -1968,59 +1973,54 @@ class ReportService:
         wip_articles_data: List[WipArticleAnalytics] = []
 
         if report.pipeline_execution_id:
-            wip_articles = await self.wip_article_service.get_by_execution_id(
+            group_counts = await self.wip_article_service.get_execution_counts(
+                report.pipeline_execution_id
+            )
+            wip_articles = await self.wip_article_service.get_rows_by_execution_id(
                 report.pipeline_execution_id
             )
 
-            # Get associations for category info
+            # Categories of the report's articles, matched to WipArticles by PMID or DOI
             associations = await self.association_service.get_all_for_report(report_id)
-            article_categories: Dict[int, List[str]] = {}
+            categories_by_pmid: Dict[str, List[str]] = {}
+            categories_by_doi: Dict[str, List[str]] = {}
             for assoc in associations:
-                article_categories[assoc.article_id] = assoc.presentation_categories or []
-
-            # Group stats
-            group_stats: Dict[str, Dict[str, int]] = {}
+                article = assoc.article
+                if not article:
+                    continue
+                cats = assoc.presentation_categories or []
+                if article.pmid:
+                    categories_by_pmid.setdefault(article.pmid, cats)
+                if article.doi:
+                    categories_by_doi.setdefault(article.doi, cats)
+
+            for gid, counts in group_counts.items():
+                summary.total_retrieved += counts.total
+                summary.duplicates += counts.duplicates
+                summary.filtered_out += counts.filtered_out
+                summary.passed_filter += counts.passed_filter
+                summary.included_in_report += counts.included
+                summary.curator_added += counts.curator_included
+                summary.curator_removed += counts.curator_excluded
+                by_group.append(GroupAnalytics(
+                    group_id=gid or "unknown",
+                    total=counts.total,
+                    duplicates=counts.duplicates,
+                    filtered_out=counts.filtered_out,
+                    passed_filter=counts.passed_filter,
+                    included=counts.included,
+                ))
 
             for wip in wip_articles:
-                summary.total_retrieved += 1
-                group_id = wip.retrieval_group_id or "unknown"
-
-                if group_id not in group_stats:
-                    group_stats[group_id] = {
-                        'total': 0, 'duplicates': 0, 'filtered_out': 0,
-                        'passed_filter': 0, 'included': 0
-                    }
-                group_stats[group_id]['total'] += 1
-
-                if wip.is_duplicate:
-                    summary.duplicates += 1
-                    group_stats[group_id]['duplicates'] += 1
-                elif not wip.passed_semantic_filter:
-                    summary.filtered_out += 1
-                    group_stats[group_id]['filtered_out'] += 1
-                    if wip.filter_score_reason:
-                        reason = wip.filter_score_reason[:50]
-                        filter_reasons[reason] = filter_reasons.get(reason, 0) + 1
-                else:
-                    summary.passed_filter += 1
-                    group_stats[group_id]['passed_filter'] += 1
-
-                if wip.included_in_report:
-                    summary.included_in_report += 1
-                    group_stats[group_id]['included'] += 1
-
-                # Find categories via Article lookup
-                article_result = await self.db.execute(
-                    select(Article.article_id).where(
-                        or_(
-                            and_(Article.pmid.isnot(None), Article.pmid == wip.pmid),
-                            and_(Article.doi.isnot(None), Article.doi == wip.doi)
-                        )
-                    )
+                if not wip.is_duplicate and not wip.passed_semantic_filter and wip.filter_score_reason:
+                    reason = wip.filter_score_reason[:50]
+                    filter_reasons[reason] = filter_reasons.get(reason, 0) + 1
+
+                cats = (
+                    (wip.pmid and categories_by_pmid.get(wip.pmid))
+                    or (wip.doi and categories_by_doi.get(wip.doi))
+                    or []
                 )
-                article_id = article_result.scalar()
-                cats = article_categories.get(article_id, []) if article_id else []
-
                 for cat in cats:
                     category_counts[cat] = category_counts.get(cat, 0) + 1
 
@@ -2042,21 +2042,8 @@ class ReportService:
                     pub_day=wip.pub_day,
                     pmid=wip.pmid,
                     doi=wip.doi,
-                    abstract=wip.abstract,
                 ))
 
-            by_group = [
-                GroupAnalytics(
-                    group_id=gid,
-                    total=stats['total'],
-                    duplicates=stats['duplicates'],
-                    filtered_out=stats['filtered_out'],
-                    passed_filter=stats['passed_filter'],
-                    included=stats['included'],
-                )
-                for gid, stats in group_stats.items()
-            ]
-
         # Get execution for pipeline_metrics
         exec_result = await self.db.execute(
             select(PipelineExecution).where(
@@ -2114,14 +2101,6 @@ class ReportService:
                 detail="Report does not have pipeline execution data"
             )
 
-        # Get all wip_articles for this execution
-        wip_articles = await self.wip_article_service.get_by_execution_id(
-            report.pipeline_execution_id
-        )
-
-        # Create PMID lookup map
-        wip_by_pmid = {wip.pmid: wip for wip in wip_articles if wip.pmid}
-
         # Get all articles in the report with their associations
         # (article is already loaded via selectinload)
         associations = await self.association_service.get_all_for_report(report_id)
@@ -2135,6 +2114,15 @@ class ReportService:
                 report_pmids.add(article.pmid)
                 report_articles_map[article.pmid] = article
 
+        # Get the wip_articles with a supplied or reported PMID (projected rows)
+        supplied_pmids_set = set(pmid.strip() for pmid in pubmed_ids if pmid.strip())
+        wip_articles = await self.wip_article_service.get_rows_by_pmids(
+            report.pipeline_execution_id, sorted(supplied_pmids_set | report_pmids)
+        )
+
+        # Create PMID lookup map
+        wip_by_pmid = {wip.pmid: wip for wip in wip_articles if wip.pmid}
+
         # Analyze each supplied PMID
         supplied_articles = []
         for pmid in pubmed_ids:
@@ -2178,7 +2166,6 @@ class ReportService:
                 ))
 
         # Find articles in report but not in supplied list
-        supplied_pmids_set = set(pmid.strip() for pmid in pubmed_ids if pmid.strip())
         report_only_articles = []
 
         for pmid in report_pmids:
@@ -253,7 +253,7 @@ class RetrievalTestingService:
         # Convert articles to dicts for evaluation
         items = [article.model_dump() for article in articles]
 
-        options = LLMOptions(max_concurrent=50)
+        options = LLMOptions(max_concurrent=50, stage="semantic_filter", use_cache=True)
 
         # Base prompt template - filter_criteria is embedded directly
         prompt_template = f"""## Article
@@ -396,7 +396,7 @@ Journal: {{journal}}
         llm_results = await self.categorization_service.categorize(
             items=items,
             model_config=model_config,
-            options=LLMOptions(max_concurrent=10),
+            options=LLMOptions(max_concurrent=10, stage="categorization", use_cache=True),
         )
 
         # Count errors
@@ -7,7 +7,6 @@ Implements the SearchProvider interface for PubMed searches.
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import httpx
 
 from services.search_providers.base import (
     SearchProvider, UnifiedSearchParams, SearchResponse, 
@@ -166,11 +165,14 @@ class PubMedAdapter(SearchProvider):
 
         try:
             # Simple health check - search for a known PMID
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{self._base_url}esummary.fcgi",
-                    params={"db": "pubmed", "id": "1"}
-                )
+            from services.ncbi_http_client import get_ncbi_http_client
+
+            client = get_ncbi_http_client()
+            response = await client.get(
+                f"{self._base_url}esummary.fcgi",
+                params={"db": "pubmed", "id": "1"},
+                timeout=5.0
+            )
 
             is_available = response.status_code == 200
 
@@ -20,6 +20,7 @@ import httpx
 import feedparser
 import trafilatura
 
+from config.settings import settings
 from schemas.canonical_types import CanonicalResearchArticle
 from schemas.research_stream import WebSource
 
@@ -323,6 +324,7 @@ class WebMonitorService:
                 context={"web_source_id": source.source_id},
                 stream_text=False,
                 temperature=0.0,
+                max_parallel_tools=settings.AGENT_MAX_PARALLEL_TOOLS,
             ):
                 if isinstance(event, AgentComplete):
                     final_text = event.text
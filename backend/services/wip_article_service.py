@@ -3,16 +3,32 @@ WIP Article Service - Single source of truth for WipArticle operations
 
 This service is the ONLY place that should write to the WipArticle table.
 All other services should use this service for WipArticle operations.
+
+Retrieved articles are written with multi-row INSERTs, chunked by row count
+and estimated size (WIP_INSERT_MAX_ROWS / WIP_INSERT_MAX_CHUNK_BYTES) to stay
+under MySQL's max_allowed_packet. With WIP_FULL_TEXT_SIDE_TABLE, PMC full
+text is stored zlib-compressed in wip_article_full_texts instead of
+wip_articles.full_text; use get_stored_full_texts / find_ids_with_full_text
+to read it either way.
+
+List views (curation, pipeline analytics, PMID comparison) read
+column-projected WipArticleRow objects (no abstract / full text) and SQL
+GROUP BY counts (get_execution_counts) instead of full WipArticle rows;
+the abstract is fetched per article with get_abstract when it is opened.
 """
 
+import json
 import logging
+import zlib
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, select
+from sqlalchemy import and_, case, func, insert, or_, select
 from fastapi import Depends
 
-from models import WipArticle
+from models import ExecutionStatus, PipelineExecution, WipArticle, WipArticleFullText
+from utils.article_identifiers import normalize_doi, normalize_pmid, title_hash
 
 
 def _parse_date(date_str: Optional[str]) -> Optional[date]:
@@ -28,6 +44,98 @@ from database import get_async_db
 
 logger = logging.getLogger(__name__)
 
+# Estimated per-row overhead (bytes) on top of the values when sizing INSERT chunks
+ROW_OVERHEAD_BYTES = 256
+
+
+def _compress_full_text(full_text: str) -> bytes:
+    # Level 1: ~6x faster than the default on article text for most of the size reduction
+    return zlib.compress(full_text.encode("utf-8"), 1)
+
+
+def _decompress_full_text(content: bytes) -> str:
+    return zlib.decompress(content).decode("utf-8")
+
+
+def _estimated_row_bytes(row: Dict[str, Any]) -> int:
+    """Rough size of a row in the INSERT statement."""
+    size = ROW_OVERHEAD_BYTES
+    for value in row.values():
+        if isinstance(value, (str, bytes)):
+            size += len(value)
+        elif isinstance(value, (list, dict)):
+            size += len(json.dumps(value))
+        else:
+            size += 8
+    return size
+
+
+def _insert_chunks(
+    rows: List[Dict[str, Any]], max_rows: int, max_bytes: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Split rows into INSERT chunks of at most max_rows and ~max_bytes (an oversized row goes alone)."""
+    chunk: List[Dict[str, Any]] = []
+    chunk_bytes = 0
+    for row in rows:
+        size = _estimated_row_bytes(row)
+        if chunk and (len(chunk) >= max_rows or chunk_bytes + size > max_bytes):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(row)
+        chunk_bytes += size
+    if chunk:
+        yield chunk
+
+
+@dataclass
+class WipArticleRow:
+    """Column projection of a WipArticle for list views (no abstract, summary, full text or metadata)."""
+    id: int
+    retrieval_group_id: str
+    title: str
+    url: Optional[str]
+    authors: Optional[List[str]]
+    pmid: Optional[str]
+    doi: Optional[str]
+    journal: Optional[str]
+    pub_year: Optional[int]
+    pub_month: Optional[int]
+    pub_day: Optional[int]
+    is_duplicate: Optional[bool]
+    duplicate_of_id: Optional[int]
+    duplicate_of_pmid: Optional[str]
+    passed_semantic_filter: Optional[bool]
+    filter_score: Optional[float]
+    filter_score_reason: Optional[str]
+    included_in_report: Optional[bool]
+    curator_included: Optional[bool]
+    curator_excluded: Optional[bool]
+    curation_notes: Optional[str]
+
+
+WIP_ARTICLE_ROW_COLUMNS = [getattr(WipArticle, name) for name in WipArticleRow.__dataclass_fields__]
+
+
+@dataclass
+class WipArticleCounts:
+    """
+    Pipeline/curation counts for one retrieval group (or a whole execution).
+
+    filtered_out, passed_filter and the curator counts only cover
+    non-duplicates; included counts every article included in the report.
+    """
+    total: int = 0
+    duplicates: int = 0
+    filtered_out: int = 0
+    passed_filter: int = 0
+    included: int = 0
+    curator_included: int = 0
+    curator_excluded: int = 0
+
+    def add(self, other: "WipArticleCounts") -> None:
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
 
 class WipArticleService:
     """
@@ -69,35 +177,146 @@ class WipArticleService:
         )
         return list(result.scalars().all())
 
-    async def get_for_filtering(
+    async def get_by_retrieval_group(
         self, execution_id: str, retrieval_group_id: str
     ) -> List[WipArticle]:
-        """Get articles ready for semantic filtering."""
+        """Get the WipArticles of one retrieval group (query or source) of a pipeline execution."""
         result = await self.db.execute(
             select(WipArticle).where(
                 and_(
                     WipArticle.pipeline_execution_id == execution_id,
                     WipArticle.retrieval_group_id == retrieval_group_id,
-                    WipArticle.is_duplicate == False,
-                    WipArticle.passed_semantic_filter == None,
                 )
             )
         )
         return list(result.scalars().all())
 
-    async def get_passed_filter(self, execution_id: str) -> List[WipArticle]:
-        """Get non-duplicate articles that passed the semantic filter."""
+    async def get_execution_counts(self, execution_id: str) -> Dict[str, WipArticleCounts]:
+        """Counts per retrieval group, aggregated in SQL (GROUP BY retrieval_group_id)."""
+        not_duplicate = WipArticle.is_duplicate.isnot(True)
+
+        def count_where(condition):
+            return func.sum(case((condition, 1), else_=0))
+
+        result = await self.db.execute(
+            select(
+                WipArticle.retrieval_group_id,
+                func.count(WipArticle.id),
+                count_where(WipArticle.is_duplicate == True),
+                count_where(and_(not_duplicate, WipArticle.passed_semantic_filter.isnot(True))),
+                count_where(and_(not_duplicate, WipArticle.passed_semantic_filter == True)),
+                count_where(WipArticle.included_in_report == True),
+                count_where(and_(not_duplicate, WipArticle.curator_included == True)),
+                count_where(and_(not_duplicate, WipArticle.curator_excluded == True)),
+            )
+            .where(WipArticle.pipeline_execution_id == execution_id)
+            .group_by(WipArticle.retrieval_group_id)
+        )
+        # MySQL returns SUM() as Decimal
+        return {
+            group_id: WipArticleCounts(*(int(value or 0) for value in counts))
+            for group_id, *counts in result.all()
+        }
+
+    async def get_recent_article_volumes(self, stream_ids: List[int], recent_runs: int = 3) -> Dict[int, int]:
+        """
+        Average WipArticles per execution over each stream's last completed runs.
+
+        Used by the worker to estimate a run's size before starting it.
+        Streams without a completed run are omitted.
+        """
+        if not stream_ids:
+            return {}
+        result = await self.db.execute(
+            select(PipelineExecution.stream_id, func.count(WipArticle.id))
+            .join(WipArticle, WipArticle.pipeline_execution_id == PipelineExecution.id)
+            .where(
+                PipelineExecution.stream_id.in_(stream_ids),
+                PipelineExecution.status == ExecutionStatus.COMPLETED,
+            )
+            .group_by(PipelineExecution.id, PipelineExecution.stream_id, PipelineExecution.completed_at)
+            .order_by(PipelineExecution.completed_at.desc())
+        )
+        counts: Dict[int, List[int]] = {}
+        for stream_id, count in result.all():
+            runs = counts.setdefault(stream_id, [])
+            if len(runs) < recent_runs:
+                runs.append(int(count))
+        return {stream_id: sum(runs) // len(runs) for stream_id, runs in counts.items()}
+
+    async def _get_rows(self, execution_id: str, *criteria) -> List[WipArticleRow]:
+        result = await self.db.execute(
+            select(*WIP_ARTICLE_ROW_COLUMNS)
+            .where(WipArticle.pipeline_execution_id == execution_id, *criteria)
+            .order_by(WipArticle.id)
+        )
+        return [WipArticleRow(*row) for row in result.all()]
+
+    async def get_rows_by_execution_id(self, execution_id: str) -> List[WipArticleRow]:
+        """Projected rows for all WipArticles of a pipeline execution."""
+        return await self._get_rows(execution_id)
+
+    async def get_curation_rows(self, execution_id: str) -> List[WipArticleRow]:
+        """Projected non-duplicate rows that are not in the report or carry a curator override."""
+        return await self._get_rows(
+            execution_id,
+            WipArticle.is_duplicate.isnot(True),
+            or_(
+                WipArticle.included_in_report.isnot(True),
+                WipArticle.curator_included == True,
+                WipArticle.curator_excluded == True,
+            ),
+        )
+
+    async def get_rows_by_pmids(self, execution_id: str, pmids: List[str]) -> List[WipArticleRow]:
+        """Projected rows of a pipeline execution with any of the given PMIDs."""
+        if not pmids:
+            return []
+        return await self._get_rows(execution_id, WipArticle.pmid.in_(pmids))
+
+    async def get_abstract(self, wip_article_id: int, execution_id: str) -> Optional[str]:
+        """Get the abstract of a WipArticle in an execution, raises ValueError if not found."""
+        result = await self.db.execute(
+            select(WipArticle.abstract).where(
+                WipArticle.id == wip_article_id,
+                WipArticle.pipeline_execution_id == execution_id,
+            )
+        )
+        row = result.first()
+        if row is None:
+            raise ValueError(f"WipArticle {wip_article_id} not found in execution {execution_id}")
+        return row.abstract
+
+    async def get_for_filtering(
+        self, execution_id: str, retrieval_group_id: str
+    ) -> List[WipArticle]:
+        """Get articles ready for semantic filtering."""
         result = await self.db.execute(
             select(WipArticle).where(
                 and_(
                     WipArticle.pipeline_execution_id == execution_id,
+                    WipArticle.retrieval_group_id == retrieval_group_id,
                     WipArticle.is_duplicate == False,
-                    WipArticle.passed_semantic_filter == True,
+                    WipArticle.passed_semantic_filter == None,
                 )
             )
         )
         return list(result.scalars().all())
 
+    async def get_passed_filter(
+        self, execution_id: str, retrieval_group_id: Optional[str] = None
+    ) -> List[WipArticle]:
+        """Get non-duplicate articles that passed the semantic filter (optionally of one retrieval group)."""
+        conditions = [
+            WipArticle.pipeline_execution_id == execution_id,
+            WipArticle.is_duplicate == False,
+            WipArticle.passed_semantic_filter == True,
+        ]
+        if retrieval_group_id is not None:
+            conditions.append(WipArticle.retrieval_group_id == retrieval_group_id)
+        result = await self.db.execute(select(WipArticle).where(and_(*conditions)))
+        return list(result.scalars().all())
+
     async def get_included_articles(self, execution_id: str) -> List[WipArticle]:
         """Get articles marked for report inclusion."""
         result = await self.db.execute(
@@ -110,6 +329,37 @@ class WipArticleService:
         )
         return list(result.scalars().all())
 
+    async def find_ids_with_full_text(self, articles: List[WipArticle]) -> set:
+        """IDs of the given articles that already have full text (inline or in the side table)."""
+        from config.settings import settings
+
+        ids = {article.id for article in articles if article.full_text}
+        missing = [article.id for article in articles if article.id not in ids]
+        if missing and settings.WIP_FULL_TEXT_SIDE_TABLE:
+            result = await self.db.execute(
+                select(WipArticleFullText.wip_article_id).where(
+                    WipArticleFullText.wip_article_id.in_(missing)
+                )
+            )
+            ids.update(result.scalars().all())
+        return ids
+
+    async def get_stored_full_texts(self, articles: List[WipArticle]) -> Dict[int, str]:
+        """Full text of the given articles by ID (inline or from the side table); absent if none."""
+        from config.settings import settings
+
+        full_texts = {article.id: article.full_text for article in articles if article.full_text}
+        missing = [article.id for article in articles if article.id not in full_texts]
+        if missing and settings.WIP_FULL_TEXT_SIDE_TABLE:
+            result = await self.db.execute(
+                select(WipArticleFullText.wip_article_id, WipArticleFullText.content).where(
+                    WipArticleFullText.wip_article_id.in_(missing)
+                )
+            )
+            for wip_article_id, content in result.all():
+                full_texts[wip_article_id] = _decompress_full_text(content)
+        return full_texts
+
     async def get_articles_with_curation_notes_by_stream(
         self, stream_id: int
     ) -> List[WipArticle]:
@@ -137,16 +387,33 @@ class WipArticleService:
     # Setters (in-memory, no DB I/O - caller must commit)
     # =========================================================================
 
-    def mark_as_duplicate(self, article: WipArticle, duplicate_of_pmid: str) -> None:
-        """Mark an article as a duplicate."""
+    def mark_as_duplicate(
+        self, article: WipArticle, duplicate_of_pmid: str, duplicate_of_id: Optional[int] = None
+    ) -> None:
+        """Mark an article as a duplicate (of the WipArticle duplicate_of_id, when known)."""
         article.is_duplicate = True
         article.duplicate_of_pmid = duplicate_of_pmid
+        if duplicate_of_id is not None:
+            article.duplicate_of_id = duplicate_of_id
 
     def mark_all_for_inclusion(self, articles: List[WipArticle]) -> None:
         """Mark multiple articles for inclusion in the report."""
         for article in articles:
             article.included_in_report = True
 
+    def set_full_text(self, article: WipArticle, full_text: str) -> None:
+        """Attach PMC full text fetched after retrieval (to the side table if enabled)."""
+        from config.settings import settings
+
+        if settings.WIP_FULL_TEXT_SIDE_TABLE:
+            self.db.add(WipArticleFullText(
+                wip_article_id=article.id,
+                content=_compress_full_text(full_text),
+                text_length=len(full_text),
+            ))
+        else:
+            article.full_text = full_text
+
     def set_curator_included(
         self, article: WipArticle, user_id: int, notes: Optional[str] = None
     ) -> None:
@@ -208,6 +475,9 @@ class WipArticleService:
     ) -> int:
         """Create WipArticle records from canonical articles and commit.
 
+        Rows go in as multi-row INSERTs (see module docstring), not one ORM
+        object per article.
+
         Args:
             pre_approved: If True, sets passed_semantic_filter=True immediately
                 (used for web source articles where the agent/feed already
@@ -215,35 +485,63 @@ class WipArticleService:
 
         Returns the number of articles created.
         """
+        from config.settings import settings
+
         logger.debug(
             f"Creating {len(articles)} WipArticles: "
             f"execution_id={execution_id}, retrieval_group_id={retrieval_group_id}"
         )
 
+        now = datetime.utcnow()
+        rows = []
+        side_table_full_texts: Dict[str, str] = {}  # source_specific_id -> full text
         for article in articles:
-            wip_article = WipArticle(
-                research_stream_id=research_stream_id,
-                pipeline_execution_id=execution_id,
-                retrieval_group_id=retrieval_group_id,
-                source_id=source_id,
-                title=article.title,
-                url=article.url,
-                authors=article.authors or [],
-                abstract=article.abstract,
-                full_text=article.full_text,  # Full text from PMC if fetched during search
-                pmid=article.pmid or (article.id if article.source == "pubmed" else None),
-                doi=article.doi,
-                journal=article.journal,
-                pub_year=article.pub_year,
-                pub_month=article.pub_month,
-                pub_day=article.pub_day,
-                entry_date=_parse_date(article.date_entered),
-                source_specific_id=article.id,
-                is_duplicate=False,
-                passed_semantic_filter=True if pre_approved else None,
-                included_in_report=False,
+            # Keep the PMC ID so full text can be fetched later for included articles
+            pmc_id = (article.source_metadata or {}).get("pmc_id")
+            # Full text from PMC if fetched during search (non-lazy mode)
+            full_text = article.full_text
+            if full_text and settings.WIP_FULL_TEXT_SIDE_TABLE:
+                side_table_full_texts[article.id] = full_text
+                full_text = None
+            rows.append({
+                "research_stream_id": research_stream_id,
+                "pipeline_execution_id": execution_id,
+                "retrieval_group_id": retrieval_group_id,
+                "source_id": source_id,
+                "title": article.title,
+                "url": article.url,
+                "authors": article.authors or [],
+                "abstract": article.abstract,
+                "full_text": full_text,
+                "pmid": normalize_pmid(article.pmid or (article.id if article.source == "pubmed" else None)),
+                "doi": article.doi,
+                "doi_normalized": normalize_doi(article.doi),
+                "title_hash": title_hash(article.title),
+                "journal": article.journal,
+                "pub_year": article.pub_year,
+                "pub_month": article.pub_month,
+                "pub_day": article.pub_day,
+                "entry_date": _parse_date(article.date_entered),
+                "source_specific_id": article.id,
+                "article_metadata": {"pmc_id": pmc_id} if pmc_id else {},
+                "is_duplicate": False,
+                "passed_semantic_filter": True if pre_approved else None,
+                "included_in_report": False,
+                "curator_included": False,
+                "curator_excluded": False,
+                "retrieved_at": now,
+                "created_at": now,
+            })
+
+        # Core executemany per chunk: compiled once (a .values([...]) statement would be
+        # recompiled per chunk), and aiomysql sends it as multi-row INSERT statements
+        for chunk in _insert_chunks(rows, settings.WIP_INSERT_MAX_ROWS, settings.WIP_INSERT_MAX_CHUNK_BYTES):
+            await self.db.execute(insert(WipArticle.__table__), chunk)
+
+        if side_table_full_texts:
+            await self._insert_side_table_full_texts(
+                execution_id, retrieval_group_id, side_table_full_texts
             )
-            self.db.add(wip_article)
 
         await self.db.commit()
         logger.info(
@@ -252,6 +550,67 @@ class WipArticleService:
         )
         return len(articles)
 
+    async def _insert_side_table_full_texts(
+        self, execution_id: str, retrieval_group_id: str, full_texts: Dict[str, str]
+    ) -> None:
+        """Store compressed full text for just-inserted rows, matched by source_specific_id. Does not commit."""
+        from config.settings import settings
+
+        result = await self.db.execute(
+            select(WipArticle.id, WipArticle.source_specific_id).where(
+                and_(
+                    WipArticle.pipeline_execution_id == execution_id,
+                    WipArticle.retrieval_group_id == retrieval_group_id,
+                    WipArticle.source_specific_id.in_(list(full_texts)),
+                )
+            )
+        )
+        now = datetime.utcnow()
+        rows = [
+            {
+                "wip_article_id": wip_article_id,
+                "content": _compress_full_text(full_texts[source_specific_id]),
+                "text_length": len(full_texts[source_specific_id]),
+                "created_at": now,
+            }
+            for wip_article_id, source_specific_id in result.all()
+        ]
+        for chunk in _insert_chunks(rows, settings.WIP_INSERT_MAX_ROWS, settings.WIP_INSERT_MAX_CHUNK_BYTES):
+            await self.db.execute(insert(WipArticleFullText.__table__), chunk)
+
+    async def delete_retrieval_groups_except(
+        self, execution_id: str, keep_retrieval_group_ids: List[str]
+    ) -> int:
+        """
+        Delete an execution's WipArticles outside the given retrieval groups and commit.
+
+        Used when resuming an interrupted retrieval: a unit whose store was not
+        checkpointed may have been stored partially, and is retrieved again.
+
+        Returns the number of WipArticles deleted.
+        """
+        from sqlalchemy import delete
+
+        stale_ids = select(WipArticle.id).where(
+            and_(
+                WipArticle.pipeline_execution_id == execution_id,
+                WipArticle.retrieval_group_id.notin_(keep_retrieval_group_ids),
+            )
+        )
+        await self.db.execute(
+            delete(WipArticleFullText).where(WipArticleFullText.wip_article_id.in_(stale_ids))
+        )
+        result = await self.db.execute(
+            delete(WipArticle).where(
+                and_(
+                    WipArticle.pipeline_execution_id == execution_id,
+                    WipArticle.retrieval_group_id.notin_(keep_retrieval_group_ids),
+                )
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
     async def bulk_update_filter_bypassed(
         self, articles: List[WipArticle]
     ) -> int:
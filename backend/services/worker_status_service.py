@@ -11,7 +11,7 @@ The worker reads this each poll cycle.
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Set
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
@@ -116,6 +116,17 @@ class WorkerStatusService:
         row = result.fetchone()
         return row is not None
 
+    async def get_live_worker_ids(self, exclude_worker_id: str) -> Set[str]:
+        """IDs of other workers with a recent heartbeat (within 120s)."""
+        from datetime import timedelta
+        cutoff = datetime.utcnow() - timedelta(seconds=HEARTBEAT_STALE_SECONDS)
+        result = await self.db.execute(
+            select(WorkerStatus.worker_id)
+            .where(WorkerStatus.last_heartbeat > cutoff)
+            .where(WorkerStatus.worker_id != exclude_worker_id)
+        )
+        return set(result.scalars().all())
+
     async def delete_all(self) -> int:
         """Delete all rows. Called on startup to clean up stale entries."""
         from sqlalchemy import delete as sa_delete
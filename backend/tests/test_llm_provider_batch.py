@@ -0,0 +1,123 @@
+"""
+Provider batch path (agents/prompts/llm_batch.py) against the local stand-in server.
+
+The OpenAI client is pointed at scripts/fake_openai_batch_server.py in-process
+through an httpx ASGI transport, so no API key, network or running server is needed.
+
+Run with: pytest tests/test_llm_provider_batch.py -v
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import fake_openai_batch_server as fake  # noqa: E402
+from agents.prompts import base_prompt_caller  # noqa: E402
+from agents.prompts.llm import LLMOptions, call_llm  # noqa: E402
+from agents.prompts.llm_batch import run_provider_batch  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"value": {"type": "boolean"}, "confidence": {"type": "number"}},
+    "required": ["value", "confidence"],
+}
+
+
+def _request(i: int) -> dict:
+    return {
+        "model": "gpt-4.1",
+        "messages": [{"role": "user", "content": f"Is article {i} relevant?"}],
+        "response_format": {"type": "json_schema", "json_schema": {"name": "result", "schema": SCHEMA}},
+    }
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    """Route the shared OpenAI client to a fresh fake server."""
+    fake.FILES.clear()
+    fake.BATCHES.clear()
+    monkeypatch.setitem(fake.CONFIG, "delay", 0.05)
+    monkeypatch.setitem(fake.CONFIG, "fail_rate", 0.0)
+    client = AsyncOpenAI(
+        api_key="test",
+        base_url="http://fake-openai/v1",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app)),
+    )
+    monkeypatch.setattr(base_prompt_caller, "_shared_openai_client", client)
+    return fake
+
+
+async def test_batch_completes(fake_server):
+    requests = {i: _request(i) for i in range(10)}
+    submitted = []
+
+    async def on_submit(batch_id: str) -> None:
+        submitted.append(batch_id)
+
+    outcome = await run_provider_batch(requests, poll_interval_seconds=0.01, on_submit=on_submit)
+
+    assert outcome.status == "completed"
+    assert submitted == [outcome.batch_id]
+    assert sorted(outcome.responses) == list(range(10))
+    assert outcome.errors == {}
+
+
+async def test_cancel_near_deadline_returns_partial_results(fake_server):
+    fake_server.CONFIG["delay"] = 60.0
+    requests = {i: _request(i) for i in range(10)}
+
+    outcome = await run_provider_batch(
+        requests,
+        deadline=datetime.now(timezone.utc) + timedelta(seconds=5),
+        deadline_margin_seconds=10.0,
+        poll_interval_seconds=0.01,
+    )
+
+    assert outcome.status == "cancelled"
+    # The fake server returns half of the items of a cancelled batch
+    assert len(outcome.responses) == 5
+    assert outcome.errors == {}
+
+
+async def test_resume_polls_submitted_batch(fake_server):
+    requests = {i: _request(i) for i in range(6)}
+    first = await run_provider_batch(requests, poll_interval_seconds=0.01)
+
+    # Resumed with fewer items at different indices: matched by request body, nothing resubmitted
+    remaining = {0: requests[4], 1: requests[5]}
+    resumed = await run_provider_batch(remaining, poll_interval_seconds=0.01, resume_batch_id=first.batch_id)
+
+    assert resumed.batch_id == first.batch_id
+    assert len(fake_server.BATCHES) == 1
+    assert sorted(resumed.responses) == [0, 1]
+
+
+async def test_error_file_items_fall_back_to_realtime(fake_server, monkeypatch):
+    fake_server.CONFIG["fail_rate"] = 1.0
+    monkeypatch.setattr(settings, "LLM_BATCH_MIN_ITEMS", 1)
+    monkeypatch.setattr(settings, "LLM_BATCH_POLL_SECONDS", 0.01)
+
+    results = await call_llm(
+        system_message="You are a relevance filter.",
+        user_message="Is article {i} relevant?",
+        values=[{"i": i} for i in range(8)],
+        response_schema=SCHEMA,
+        options=LLMOptions(
+            execution_mode="batch",
+            batch_deadline=datetime.now(timezone.utc) + timedelta(hours=1),
+            log_prompt=False,
+        ),
+    )
+
+    [batch] = fake_server.BATCHES.values()
+    assert batch["request_counts"]["failed"] == 8
+    assert all(result.ok for result in results)
+    assert [result.input["i"] for result in results] == list(range(8))
@@ -0,0 +1,39 @@
+"""
+Near-duplicate matching (utils/near_duplicates.py).
+
+Run with: pytest tests/test_near_duplicates.py -v
+"""
+
+from utils.near_duplicates import NearDuplicateIndex
+
+
+TITLE = "Semaglutide and cardiovascular outcomes in obesity without diabetes"
+AUTHORS = ["Lincoff AM", "Brown-Frandsen K"]
+
+
+def test_preprint_matches_published_version():
+    index = NearDuplicateIndex()
+    assert index.match_or_add(1, "111", TITLE + ".", AUTHORS, pmid="111") is None
+
+    match = index.match_or_add(2, "2", TITLE.upper(), ["A M Lincoff"])
+
+    assert match is not None and match.article_id == 1
+
+
+def test_notices_do_not_collapse_the_original_paper():
+    # PubMed returns newest first, so the notices are usually indexed before the paper
+    index = NearDuplicateIndex()
+    assert index.match_or_add(1, "300", f"Erratum: {TITLE}", AUTHORS, pmid="300") is None
+    assert index.match_or_add(2, "200", f"Correction to: {TITLE}", AUTHORS, pmid="200") is None
+
+    assert index.match_or_add(3, "100", TITLE, AUTHORS, pmid="100") is None
+    assert index.find(f"Retraction: {TITLE}", AUTHORS) is None
+
+
+def test_distinct_pmids_never_match():
+    index = NearDuplicateIndex()
+    index.add(1, "100", TITLE, AUTHORS, pmid="100")
+
+    assert index.find(TITLE, AUTHORS, pmid="101") is None
+    assert index.find(TITLE, AUTHORS, pmid="100") is not None
+    assert index.find(TITLE, AUTHORS) is not None  # Web mirror without a PMID
@@ -129,5 +129,6 @@ register_tool(ToolConfig(
     },
     executor=execute_get_help,
     category="help",
-    is_global=True  # Available on all pages
+    is_global=True,  # Available on all pages
+    side_effect_free=True
 ))
@@ -107,5 +107,6 @@ register_tool(ToolConfig(
     },
     executor=execute_get_key_author_articles,
     category="research",
-    is_global=True
+    is_global=True,
+    side_effect_free=True
 ))
@@ -397,7 +397,8 @@ register_tool(ToolConfig(
     },
     executor=execute_search_pubmed,
     category="research",
-    payload_type="pubmed_search_results"
+    payload_type="pubmed_search_results",
+    side_effect_free=True
 ))
 
 register_tool(ToolConfig(
@@ -415,7 +416,8 @@ register_tool(ToolConfig(
     },
     executor=execute_get_pubmed_article,
     category="research",
-    payload_type="pubmed_article"
+    payload_type="pubmed_article",
+    side_effect_free=True
 ))
 
 register_tool(ToolConfig(
@@ -450,5 +452,6 @@ Provide either pmc_id (if known) or pmid (tool will check if article has a PMC I
     },
     executor=execute_get_full_text,
     category="research",
-    payload_type="pubmed_article"
+    payload_type="pubmed_article",
+    side_effect_free=True
 ))
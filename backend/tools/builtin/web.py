@@ -207,7 +207,8 @@ register_tool(ToolConfig(
     executor=execute_search_web,
     category="web",
     payload_type="web_search_results",
-    is_global=True
+    is_global=True,
+    side_effect_free=True
 ))
 
 register_tool(ToolConfig(
@@ -226,5 +227,6 @@ register_tool(ToolConfig(
     executor=execute_fetch_webpage,
     category="web",
     payload_type="webpage_content",
-    is_global=True
+    is_global=True,
+    side_effect_free=True
 ))
@@ -64,6 +64,10 @@ class ToolConfig:
     - Async: async def executor(params, db, user_id, context) -> str | ToolResult
 
     The agent loop automatically detects async executors and awaits them.
+
+    side_effect_free tools (lookups that write nothing and do not depend on the
+    caller's uncommitted changes) may run concurrently with each other when the
+    model calls several in one turn; they then get their own database session.
     """
     name: str                           # Tool name (e.g., "search_pubmed")
     description: str                    # Description for LLM
@@ -74,6 +78,7 @@ class ToolConfig:
     payload_type: Optional[str] = None  # Payload type from schemas/payloads.py (e.g., "pubmed_search_results")
     is_global: bool = True              # If True, available on all pages by default
     required_role: Optional[str] = None # If set, only users with this role can see the tool (e.g., "platform_admin")
+    side_effect_free: bool = False      # If True, may run concurrently with other side-effect-free calls of the same turn
 
 
 # =============================================================================
@@ -184,6 +184,7 @@ def create_web_monitor_tools(
         executor=execute_fetch_page,
         category="web_monitor",
         is_global=False,
+        side_effect_free=True,
     )
 
     submit_article = ToolConfig(
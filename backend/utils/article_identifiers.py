@@ -0,0 +1,57 @@
+"""
+Normalized article identifiers used for deduplication lookups.
+
+Articles and WipArticles store these next to the raw values (pmid is stored
+canonical; doi_normalized and title_hash are separate indexed columns), so
+dedup queries can join on plain equality instead of OR / LOWER() expressions
+that prevent index use.
+
+    normalize_pmid(" PMID: 12345 ")              -> "12345"
+    normalize_doi("https://doi.org/10.1/ABC ")   -> "10.1/abc"
+    title_hash("The  Title of a Trial.")         -> sha1 hex of "the title of a trial"
+    title_hash("Editorial")                      -> None (too generic to identify an article)
+"""
+
+import hashlib
+import re
+from typing import Optional
+
+__all__ = ["MIN_TITLE_WORDS", "normalize_pmid", "normalize_doi", "normalize_title", "title_hash"]
+
+_PMID_PREFIX = re.compile(r"^pmid:\s*", re.IGNORECASE)
+_DOI_PREFIX = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)", re.IGNORECASE)
+_NON_ALNUM = re.compile(r"[\W_]+")
+
+# Titles shorter than this (in words) are too generic to identify an article ("Editorial", "Weekly update")
+MIN_TITLE_WORDS = 4
+
+
+def normalize_pmid(pmid: Optional[str]) -> Optional[str]:
+    """Canonical PMID: trimmed, without a "PMID:" prefix; None if empty."""
+    if pmid is None:
+        return None
+    pmid = _PMID_PREFIX.sub("", str(pmid).strip())
+    return pmid or None
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Lowercased DOI without resolver URL or "doi:" prefix; None if empty."""
+    if not doi:
+        return None
+    doi = _DOI_PREFIX.sub("", doi.strip()).strip().lower()
+    return doi or None
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Lowercased title with punctuation removed and whitespace collapsed."""
+    if not title:
+        return ""
+    return _NON_ALNUM.sub(" ", title.lower()).strip()
+
+
+def title_hash(title: Optional[str]) -> Optional[str]:
+    """SHA-1 hex digest of the normalized title; None below MIN_TITLE_WORDS words."""
+    normalized = normalize_title(title)
+    if len(normalized.split()) < MIN_TITLE_WORDS:
+        return None
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
@@ -0,0 +1,204 @@
+"""
+Near-duplicate detection for articles within a pipeline execution.
+
+Exact DOI / title matching misses preprint vs published versions (different
+DOIs), punctuation and casing differences, and web-source items that mirror
+PubMed records. NearDuplicateIndex finds those with MinHash / LSH:
+
+1. The normalized title (utils/article_identifiers.normalize_title) is split
+   into character shingles, and a MinHash signature of num_perm values is
+   computed for it.
+2. The signature is cut into bands; articles sharing any band bucket are
+   candidates (LSH). With the defaults (64 values, 16 bands of 4), titles of
+   Jaccard similarity ~0.5 and above become candidates.
+3. Candidates are verified exactly: shingle Jaccard >= threshold, the same
+   numbers in both titles ("Part 1" vs "Part 2", "2023 update" vs "2024
+   update"), and compatible first authors (same surname, or one side
+   without authors, as is common for web sources).
+
+Two articles that both have a PMID, and different ones, are distinct PubMed
+records and never match. Notices about another article (erratum,
+correction, retraction, reply, ...) repeat its title but are articles of
+their own, so they are neither matched nor indexed.
+
+Each add / find costs O(shingles x num_perm) plus the candidates in its
+buckets, so an execution is processed in roughly linear time. The first
+article added is the canonical one; later matches point to it.
+
+Usage:
+    index = NearDuplicateIndex(threshold=0.85)
+    match = index.match_or_add(article.id, article.pmid or str(article.id), title, authors, pmid=article.pmid)
+    if match:
+        mark_duplicate(article, match.key, match.article_id)
+"""
+
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from utils.article_identifiers import MIN_TITLE_WORDS, normalize_title
+
+__all__ = ["NearDuplicateIndex", "NearDuplicateMatch", "first_author_key"]
+
+_PRIME = np.uint64((1 << 61) - 1)
+_NUMBER = re.compile(r"\d+")
+_INITIALS = re.compile(r"^[A-Z]{1,3}$")
+# Normalized titles of notices about another article, which repeat its title
+_NOTICE = re.compile(
+    r"^(?:erratum|errata|corrigendum|corrigenda|correction|retraction|retracted|withdrawn|"
+    r"expression of concern|notice of|reply|response|comment on|commentary on|addendum)\b"
+)
+
+
+def first_author_key(authors: Union[Sequence[str], str, None]) -> Optional[str]:
+    """
+    Normalized surname of the first author, or None without authors.
+
+    Handles PubMed "Smith JA", "Smith, John" and "John Smith" forms.
+    """
+    if not authors:
+        return None
+    first = authors.split(",")[0] if isinstance(authors, str) else authors[0]
+    if not first:
+        return None
+    if "," in first:
+        surname = first.split(",")[0]
+    else:
+        tokens = first.split()
+        if not tokens:
+            return None
+        if len(tokens) > 1 and _INITIALS.match(tokens[-1]):
+            surname = " ".join(tokens[:-1])
+        else:
+            surname = tokens[-1]
+    return normalize_title(surname) or None
+
+
+@dataclass
+class NearDuplicateMatch:
+    """The canonical article a near-duplicate matched."""
+    article_id: int
+    key: str
+    similarity: float
+
+
+@dataclass
+class _Entry:
+    article_id: int
+    key: str
+    shingles: Set[str]
+    numbers: Tuple[str, ...]
+    author: Optional[str]
+    pmid: Optional[str]
+
+
+class NearDuplicateIndex:
+    """MinHash / LSH index of article titles (see module docstring)."""
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 4,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold
+        self.bands = bands
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        # a, b < 2^31 and shingle hashes < 2^32 keep a * x + b within uint64
+        self._a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._entries: List[_Entry] = []
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _shingles(self, normalized: str) -> Set[str]:
+        k = self.shingle_size
+        if len(normalized) <= k:
+            return {normalized}
+        return {normalized[i:i + k] for i in range(len(normalized) - k + 1)}
+
+    def _band_keys(self, shingles: Set[str]) -> List[Tuple[int, bytes]]:
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+        signature = ((np.outer(hashes, self._a) + self._b) % _PRIME).min(axis=0)
+        return [(band, rows.tobytes()) for band, rows in enumerate(np.split(signature, self.bands))]
+
+    def _prepare(self, title: Optional[str]):
+        normalized = normalize_title(title)
+        if len(normalized.split()) < MIN_TITLE_WORDS or _NOTICE.match(normalized):
+            return None
+        shingles = self._shingles(normalized)
+        return shingles, tuple(_NUMBER.findall(normalized)), self._band_keys(shingles)
+
+    def _best_match(self, shingles: Set[str], numbers: Tuple[str, ...], author: Optional[str],
+                    pmid: Optional[str], band_keys: List[Tuple[int, bytes]]) -> Optional[NearDuplicateMatch]:
+        candidates = sorted({i for band_key in band_keys for i in self._buckets.get(band_key, ())})
+        best: Optional[NearDuplicateMatch] = None
+        for i in candidates:
+            entry = self._entries[i]
+            if entry.numbers != numbers:
+                continue
+            if author and entry.author and author != entry.author:
+                continue
+            if pmid and entry.pmid and pmid != entry.pmid:
+                continue
+            similarity = len(shingles & entry.shingles) / len(shingles | entry.shingles)
+            if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                best = NearDuplicateMatch(entry.article_id, entry.key, similarity)
+        return best
+
+    def find(self, title: Optional[str], authors: Union[Sequence[str], str, None] = None,
+             pmid: Optional[str] = None) -> Optional[NearDuplicateMatch]:
+        """The closest indexed article this title/author is a near-duplicate of, or None."""
+        prepared = self._prepare(title)
+        if prepared is None:
+            return None
+        shingles, numbers, band_keys = prepared
+        return self._best_match(shingles, numbers, first_author_key(authors), pmid, band_keys)
+
+    def _insert(self, article_id: int, key: str, shingles: Set[str], numbers: Tuple[str, ...],
+                author: Optional[str], pmid: Optional[str], band_keys: List[Tuple[int, bytes]]) -> None:
+        index = len(self._entries)
+        self._entries.append(_Entry(article_id, key, shingles, numbers, author, pmid))
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, []).append(index)
+
+    def add(self, article_id: int, key: str, title: Optional[str],
+            authors: Union[Sequence[str], str, None] = None, pmid: Optional[str] = None) -> None:
+        """Index an article as a canonical candidate (short titles and notices are skipped)."""
+        prepared = self._prepare(title)
+        if prepared is not None:
+            shingles, numbers, band_keys = prepared
+            self._insert(article_id, key, shingles, numbers, first_author_key(authors), pmid, band_keys)
+
+    def match_or_add(self, article_id: int, key: str, title: Optional[str],
+                     authors: Union[Sequence[str], str, None] = None,
+                     pmid: Optional[str] = None) -> Optional[NearDuplicateMatch]:
+        """
+        find() and, if there is no match, add() - computing the signature once.
+
+        Args:
+            article_id: ID recorded as NearDuplicateMatch.article_id for later matches
+            key: Identifier recorded as NearDuplicateMatch.key (e.g. the PMID)
+            pmid: The article's PMID; never matches an entry with a different one
+        """
+        prepared = self._prepare(title)
+        if prepared is None:
+            return None
+        shingles, numbers, band_keys = prepared
+        author = first_author_key(authors)
+        match = self._best_match(shingles, numbers, author, pmid, band_keys)
+        if match is None:
+            self._insert(article_id, key, shingles, numbers, author, pmid, band_keys)
+        return match
@@ -1,38 +1,45 @@
+"""
+Prompt logging.
+
+Two ways to record the messages sent to an LLM:
+
+- submit_prompt_log(): used by BasePromptCaller on every call. Never touches
+  the disk on the caller's thread - records are sampled, queued and written by
+  a background thread, batched into rotating JSONL files (or, with
+  PROMPT_LOG_FORMAT=markdown, one readable file per prompt as before).
+- log_prompt_messages(): synchronous, one markdown file per call. Kept for
+  ad-hoc debugging and the hop implementer helper.
+
+SAMPLING:
+=========
+PROMPT_LOG_SAMPLE_RATE (0-1) applies to every prompt. PROMPT_LOG_STAGE_SAMPLE_RATES
+overrides it per pipeline stage or prompt type, e.g.
+"semantic_filter=0.05,article_summary=0" (0 disables that stage).
+
+Usage:
+    submit_prompt_log(messages, prompt_type="basepromptcaller", stage="semantic_filter")
+"""
+
 import json
+import logging
 import os
+import queue
+import random
+import threading
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-def log_prompt_messages(
-    messages: List[Dict[str, str]], 
+logger = logging.getLogger(__name__)
+
+
+def _format_prompt_markdown(
+    messages: List[Dict[str, str]],
     prompt_type: str,
     additional_context: Dict[str, Any] = None,
-    log_dir: str = "logs/prompts"
 ) -> str:
-    """
-    Log prompt messages to a file in a well-formatted, readable way.
-    
-    Args:
-        messages: List of formatted messages being sent to the LLM
-        prompt_type: Type of prompt (e.g., "hop_implementer", "hop_designer")
-        additional_context: Any additional context to include in the log
-        log_dir: Directory to save log files in
-        
-    Returns:
-        Path to the created log file
-    """
-    
-    # Create logs directory if it doesn't exist
-    log_path = Path(log_dir)
-    log_path.mkdir(parents=True, exist_ok=True)
-    
-    # Generate filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]  # Include milliseconds
-    filename = f"{prompt_type}_prompt_{timestamp}.md"
-    filepath = log_path / filename
-    
-    # Format the log content
+    """Render prompt messages as a readable markdown document."""
     log_content = []
     
     # Header
@@ -90,10 +97,41 @@ def log_prompt_messages(
     
     for role, count in role_counts.items():
         log_content.append(f"  - {role}: {count}")
+
+    return '\n'.join(log_content)
+
+
+def log_prompt_messages(
+    messages: List[Dict[str, str]], 
+    prompt_type: str,
+    additional_context: Dict[str, Any] = None,
+    log_dir: str = "logs/prompts"
+) -> str:
+    """
+    Log prompt messages to a file in a well-formatted, readable way.
+    
+    Args:
+        messages: List of formatted messages being sent to the LLM
+        prompt_type: Type of prompt (e.g., "hop_implementer", "hop_designer")
+        additional_context: Any additional context to include in the log
+        log_dir: Directory to save log files in
+        
+    Returns:
+        Path to the created log file
+    """
+    
+    # Create logs directory if it doesn't exist
+    log_path = Path(log_dir)
+    log_path.mkdir(parents=True, exist_ok=True)
+    
+    # Generate filename with timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]  # Include milliseconds
+    filename = f"{prompt_type}_prompt_{timestamp}.md"
+    filepath = log_path / filename
     
     # Write to file
     with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(log_content))
+        f.write(_format_prompt_markdown(messages, prompt_type, additional_context))
     
     return str(filepath)
 
@@ -131,3 +169,218 @@ def log_hop_implementer_prompt(
         additional_context=additional_context
     ) 
 
+
+
+# =============================================================================
+# Background writer
+# =============================================================================
+
+JSONL_FILENAME = "prompts.jsonl"
+_WRITE_BATCH_SIZE = 200
+
+
+@dataclass
+class PromptLogStats:
+    """Counters for the background prompt log writer since process start."""
+    submitted: int = 0
+    sampled_out: int = 0
+    dropped: int = 0
+    written: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def parse_stage_sample_rates(spec: str) -> Dict[str, float]:
+    """Parse "stage=rate,stage=rate" into a dict. Malformed entries are skipped."""
+    rates: Dict[str, float] = {}
+    for entry in (spec or "").split(","):
+        name, sep, rate = entry.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            logger.warning(f"Ignoring invalid prompt log sample rate: {entry!r}")
+    return rates
+
+
+class PromptLogWriter:
+    """
+    Queues prompt log records and writes them from a daemon thread.
+
+    submit() never blocks: when the queue is full the record is dropped and
+    counted. JSONL output is written in batches and rotated by size
+    (prompts.jsonl -> prompts.1.jsonl -> ... -> prompts.<backup_count>.jsonl).
+    """
+
+    def __init__(
+        self,
+        log_dir: str,
+        log_format: str = "jsonl",
+        sample_rate: float = 1.0,
+        stage_sample_rates: Optional[Dict[str, float]] = None,
+        max_bytes: int = 50 * 1024 * 1024,
+        backup_count: int = 10,
+        queue_size: int = 10000,
+    ):
+        self.log_dir = Path(log_dir)
+        self.log_format = log_format
+        self.sample_rate = sample_rate
+        self.stage_sample_rates = stage_sample_rates or {}
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.stats = PromptLogStats()
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="prompt-log-writer", daemon=True)
+        self._thread.start()
+
+    def should_log(self, prompt_type: str, stage: Optional[str] = None) -> bool:
+        """Sampling decision: stage rate, then prompt type rate, then the global rate."""
+        if stage and stage in self.stage_sample_rates:
+            rate = self.stage_sample_rates[stage]
+        else:
+            rate = self.stage_sample_rates.get(prompt_type, self.sample_rate)
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def submit(self, record: Dict[str, Any]) -> bool:
+        """Queue a record for writing. Returns False if it was dropped."""
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.stats.dropped += 1
+            return False
+        self.stats.submitted += 1
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush queued records and stop the writer thread."""
+        if self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                logger.warning("Prompt log queue full at shutdown; pending records discarded")
+                return
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            batch = [record]
+            stop = False
+            while len(batch) < _WRITE_BATCH_SIZE:
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(record)
+            try:
+                self.log_dir.mkdir(parents=True, exist_ok=True)
+                if self.log_format == "markdown":
+                    self._write_markdown(batch)
+                else:
+                    self._write_jsonl(batch)
+                self.stats.written += len(batch)
+            except Exception as e:
+                self.stats.errors += 1
+                logger.warning(f"Failed to write {len(batch)} prompt log records: {e}")
+            if stop:
+                return
+
+    def _write_jsonl(self, batch: List[Dict[str, Any]]) -> None:
+        path = self.log_dir / JSONL_FILENAME
+        data = "".join(json.dumps(record, default=str) + "\n" for record in batch)
+        if path.exists() and path.stat().st_size + len(data) > self.max_bytes:
+            self._rotate(path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(data)
+
+    def _rotate(self, path: Path) -> None:
+        if self.backup_count <= 0:
+            path.unlink()
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            src = self.log_dir / f"prompts.{i}.jsonl"
+            if src.exists():
+                os.replace(src, self.log_dir / f"prompts.{i + 1}.jsonl")
+        os.replace(path, self.log_dir / "prompts.1.jsonl")
+
+    def _write_markdown(self, batch: List[Dict[str, Any]]) -> None:
+        for record in batch:
+            timestamp = datetime.fromisoformat(record["timestamp"]).strftime("%Y%m%d_%H%M%S_%f")[:-3]
+            context = {k: record[k] for k in ("stage", "model") if record.get(k)}
+            context.update(record.get("context") or {})
+            filepath = self.log_dir / f"{record['prompt_type']}_prompt_{timestamp}.md"
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(_format_prompt_markdown(record["messages"], record["prompt_type"], context))
+
+
+_writer: Optional[PromptLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_prompt_log_writer() -> Optional[PromptLogWriter]:
+    """Get the shared writer, starting it on first use. None if prompt logging is disabled."""
+    global _writer
+    from config.settings import settings
+
+    if not settings.PROMPT_LOG_ENABLED:
+        return None
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = PromptLogWriter(
+                    log_dir=settings.PROMPT_LOG_DIR,
+                    log_format=settings.PROMPT_LOG_FORMAT,
+                    sample_rate=settings.PROMPT_LOG_SAMPLE_RATE,
+                    stage_sample_rates=parse_stage_sample_rates(settings.PROMPT_LOG_STAGE_SAMPLE_RATES),
+                    max_bytes=settings.PROMPT_LOG_MAX_BYTES,
+                    backup_count=settings.PROMPT_LOG_BACKUP_COUNT,
+                    queue_size=settings.PROMPT_LOG_QUEUE_SIZE,
+                )
+    return _writer
+
+
+def submit_prompt_log(
+    messages: List[Dict[str, str]],
+    prompt_type: str,
+    stage: Optional[str] = None,
+    model: Optional[str] = None,
+    additional_context: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Queue prompt messages for the background writer, subject to sampling.
+
+    Safe to call from the event loop: no disk I/O happens here.
+
+    Returns:
+        True if the record was queued, False if disabled, sampled out or dropped
+    """
+    writer = get_prompt_log_writer()
+    if writer is None:
+        return False
+    if not writer.should_log(prompt_type, stage):
+        writer.stats.sampled_out += 1
+        return False
+    return writer.submit({
+        "timestamp": datetime.now().isoformat(),
+        "prompt_type": prompt_type,
+        "stage": stage,
+        "model": model,
+        "context": additional_context,
+        "messages": messages,
+    })
+
+
+def close_prompt_log_writer(timeout: float = 5.0) -> None:
+    """Flush and stop the shared writer. Safe to call when it was never started."""
+    global _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        writer.close(timeout)
@@ -4,6 +4,7 @@ Management Plane API
 External control interface for the worker:
 - Trigger runs
 - Check status
+- Resume failed runs
 - Cancel jobs
 - Health checks
 """
@@ -372,6 +373,69 @@ async def stream_run_status(
     )
 
 
+@router.post("/runs/{execution_id}/resume", response_model=TriggerRunResponse)
+async def resume_run(
+    execution_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Requeue a failed execution to resume from its stage checkpoints.
+
+    Completed stages are skipped; the stage that failed only processes items
+    that lack results. (RUNNING executions orphaned by a worker restart are
+    requeued automatically on startup.)
+    """
+    logger.info(f"resume_run called - execution_id={execution_id}")
+
+    try:
+        execution_service = ExecutionService(db)
+        execution = await execution_service.get_by_id(execution_id)
+
+        if not execution:
+            logger.warning(f"resume_run - execution {execution_id} not found")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Execution {execution_id} not found"
+            )
+
+        if execution.status != ExecutionStatus.FAILED:
+            logger.warning(f"resume_run - cannot resume execution {execution_id} with status {execution.status.value}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot resume execution with status: {execution.status.value}"
+            )
+
+        await execution_service.requeue(execution_id)
+        await db.commit()
+
+        # Wake up the scheduler immediately so it picks up this job
+        worker_state.wake_scheduler()
+
+        logger.info(f"resume_run success - execution_id={execution_id}")
+        return TriggerRunResponse(
+            execution_id=execution_id,
+            stream_id=execution.stream_id,
+            status="pending",
+            message="Pipeline run queued to resume"
+        )
+
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        logger.error(f"resume_run database error - execution_id={execution_id}: {e}", exc_info=True)
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while resuming execution"
+        )
+    except Exception as e:
+        logger.error(f"resume_run unexpected error - execution_id={execution_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to resume run"
+        )
+
+
 @router.delete("/runs/{execution_id}")
 async def cancel_run(
     execution_id: str,
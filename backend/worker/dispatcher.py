@@ -6,12 +6,16 @@ Manages job lifecycle (status updates, error handling).
 
 The dispatcher reads ALL configuration from PipelineExecution.
 run_pipeline() only takes execution_id - it reads everything else from the execution record.
+
+Executions are stamped with the worker's ID. After a crash or deploy, the
+next worker requeues the RUNNING executions the previous one left behind
+(requeue_interrupted); they are resumed from their stage checkpoints.
 """
 
 import logging
 import asyncio
 from datetime import date, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import ResearchStream, PipelineExecution, ExecutionStatus, RunType
@@ -30,8 +34,9 @@ logger = logging.getLogger('worker.dispatcher')
 class JobDispatcher:
     """Dispatches and manages pipeline jobs"""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, worker_id: Optional[str] = None):
         self.db = db
+        self.worker_id = worker_id
         self.pipeline_service = PipelineService(db)
         self.execution_service = ExecutionService(db)
         self.stream_service = ResearchStreamService(db)
@@ -44,31 +49,49 @@ class JobDispatcher:
 
         All configuration is already stored in the execution record.
         Updates execution status throughout lifecycle.
+
+        A requeued execution (interrupted or failed) has stage checkpoints and
+        is resumed from them. A resumed scheduled run notifies admins on
+        completion, as execute_scheduled would have.
         """
         execution_id = execution.id
         logger.info(f"Dispatching pending execution: {execution_id} for stream {execution.stream_id}")
 
         try:
             # Re-query and mark as running (via execution_service)
-            execution = await self.execution_service.mark_running(execution_id)
+            execution = await self.execution_service.mark_running(execution_id, worker_id=self.worker_id)
             await self.db.commit()
-            logger.info(f"Execution {execution_id} marked as RUNNING")
+            resume = bool(execution.checkpoints)
+            logger.info(f"Execution {execution_id} marked as RUNNING{' (resuming)' if resume else ''}")
+            notify_stream = None
+            if resume and execution.run_type == RunType.SCHEDULED:
+                notify_stream = await self.stream_service.get_stream_by_id(execution.stream_id)
 
             # Publish starting status
-            await broker.publish(execution_id, "starting", f"Starting pipeline for stream {execution.stream_id}")
+            await broker.publish(
+                execution_id,
+                "starting",
+                f"{'Resuming' if resume else 'Starting'} pipeline for stream {execution.stream_id}",
+            )
 
             # Run pipeline - only pass execution_id, pipeline reads config from execution
-            async for status in self.pipeline_service.run_pipeline(execution_id):
+            async for status in self.pipeline_service.run_pipeline(execution_id, resume=resume):
                 logger.debug(f"[{execution_id}] {status.stage}: {status.message}")
                 await broker.publish(execution_id, status.stage, status.message)
 
             # Mark as completed
-            await self.execution_service.mark_completed(execution_id)
+            execution = await self.execution_service.mark_completed(execution_id)
             await self.db.commit()
 
             logger.info(f"Execution {execution_id} completed successfully")
             await broker.publish_complete(execution_id, success=True)
 
+            if notify_stream:
+                await self._notify_admins_scheduled_complete(
+                    execution=execution,
+                    stream_name=notify_stream.stream_name,
+                )
+
         except Exception as e:
             logger.error(f"Execution {execution_id} failed: {e}", exc_info=True)
             try:
@@ -113,7 +136,8 @@ class JobDispatcher:
             start_date=start_date,
             end_date=end_date,
             report_name=None,  # Auto-generated for scheduled runs
-            status=ExecutionStatus.RUNNING
+            status=ExecutionStatus.RUNNING,
+            worker_id=self.worker_id
         )
         execution_id = execution.id
         await self.db.commit()
@@ -168,6 +192,34 @@ class JobDispatcher:
 
         return execution_id
 
+    async def requeue_interrupted(self, live_worker_ids: Iterable[str] = ()) -> List[str]:
+        """
+        Requeue RUNNING executions left behind by a worker instance that stopped.
+
+        Executions owned by a worker in live_worker_ids (one still heartbeating,
+        e.g. the old instance during an immutable deploy) are left running.
+
+        They go back to PENDING and are resumed from their checkpoints by
+        execute_pending. For scheduled runs the stream's next_scheduled_run is
+        advanced now (a finished run would have done it), so the schedule does
+        not start a second run for the same period.
+
+        Returns the requeued execution IDs.
+        """
+        interrupted = await self.execution_service.find_interrupted(
+            exclude_worker_ids=[self.worker_id, *live_worker_ids]
+        )
+        for execution in interrupted:
+            logger.warning(
+                f"Execution {execution.id} was interrupted (worker {execution.worker_id}), requeueing to resume"
+            )
+            await self.execution_service.requeue(execution.id)
+            if execution.run_type == RunType.SCHEDULED:
+                stream = await self.stream_service.get_stream_by_id(execution.stream_id)
+                await self._update_next_scheduled_run(stream)
+        await self.db.commit()
+        return [execution.id for execution in interrupted]
+
     async def _notify_admins_scheduled_complete(
         self,
         stream_name: str,
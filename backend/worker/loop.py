@@ -9,11 +9,13 @@ import asyncio
 import logging
 import os
 import platform
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Set
 
+from config.settings import settings
 from database import AsyncSessionLocal
-from worker.scheduler import JobDiscovery
+from worker.scheduler import JobDiscovery, JobScheduler, llm_budget_scale
 from worker.dispatcher import JobDispatcher
 from worker.state import worker_state
 
@@ -22,13 +24,23 @@ logger = logging.getLogger('worker.loop')
 
 # ==================== Configuration ====================
 
-POLL_INTERVAL_SECONDS = 30  # How often to check for ready jobs
-MAX_CONCURRENT_JOBS = 2     # Maximum simultaneous pipeline runs
+POLL_INTERVAL_SECONDS = settings.WORKER_POLL_INTERVAL_SECONDS  # How often to check for ready jobs
+MAX_CONCURRENT_JOBS = settings.WORKER_MAX_CONCURRENT_JOBS        # Maximum simultaneous pipeline runs
 
-# Unique ID for this worker instance (survives restarts via hostname, not random)
-WORKER_ID = f"{platform.node()}:{os.getpid()}"
+# Unique ID for this worker process. Hostname and pid repeat across a container
+# restart (pid 1, same hostname), so a random suffix keeps execution ownership distinct.
+WORKER_ID = f"{platform.node()}:{os.getpid()}:{uuid.uuid4().hex[:12]}"
 
 _started_at: Optional[datetime] = None  # Set on first poll
+# Workers heartbeating when this one started. Their worker_status rows are cleared
+# at startup, so they count as live until they have had time to heartbeat again.
+_startup_live_worker_ids: Set[str] = set()
+
+_scheduler = JobScheduler(
+    max_concurrent_jobs=MAX_CONCURRENT_JOBS,
+    max_jobs_per_tenant=settings.WORKER_MAX_JOBS_PER_ORG,
+    article_budget=settings.WORKER_ARTICLE_BUDGET,
+)
 
 
 # ==================== Scheduler Loop ====================
@@ -40,12 +52,17 @@ async def run():
     On startup: checks for an existing active worker and refuses to start if
     one is found. Cleans up stale rows from previous instances.
 
-    Then polls for ready jobs every POLL_INTERVAL_SECONDS.
+    Then polls for ready jobs every POLL_INTERVAL_SECONDS, and whenever a job
+    finishes so its slot is refilled right away.
     Never crashes - all exceptions are caught and logged.
     """
-    global _started_at
+    global _started_at, _startup_live_worker_ids
     _started_at = datetime.utcnow()
 
+    # Workers still heartbeating own their RUNNING executions; read them before
+    # the cleanup below deletes their rows so their runs are not requeued.
+    _startup_live_worker_ids = await _live_worker_ids() or set()
+
     # Clean up all rows from previous instances/deploys/debug sessions.
     # Must happen before the active check — during immutable deploys the old
     # instance's worker may still be heartbeating when this instance starts.
@@ -57,11 +74,16 @@ async def run():
         worker_state.running = False
         return
 
+    # Runs the previous instance was executing when it stopped are resumed from their checkpoints
+    await _requeue_interrupted_executions()
+
     logger.info("=" * 60)
     logger.info("Scheduler loop starting")
     logger.info(f"  Worker ID: {WORKER_ID}")
     logger.info(f"  Poll interval: {POLL_INTERVAL_SECONDS}s")
     logger.info(f"  Max concurrent jobs: {MAX_CONCURRENT_JOBS}")
+    logger.info(f"  Max jobs per org: {settings.WORKER_MAX_JOBS_PER_ORG or 'unlimited'}")
+    logger.info(f"  Article budget: {settings.WORKER_ARTICLE_BUDGET or 'unlimited'}")
     logger.info("=" * 60)
 
     consecutive_errors = 0
@@ -105,6 +127,9 @@ async def _poll():
     # Read persisted pause flag from DB
     await _sync_paused_flag()
 
+    # Runs of a worker that stopped heartbeating (e.g. the old instance after a deploy) go back to PENDING
+    await _requeue_interrupted_executions()
+
     await _process_email_queue()
 
     poll_summary = {}
@@ -120,6 +145,7 @@ async def _poll():
         completed = [k for k, v in worker_state.active_jobs.items() if v.done()]
         for key in completed:
             task = worker_state.active_jobs.pop(key)
+            worker_state.queued_jobs.pop(key, None)
             try:
                 exc = task.exception()
                 if exc:
@@ -152,44 +178,50 @@ async def _poll():
             await _write_heartbeat(poll_summary)
             return
 
-        # Dispatch pending executions (manual triggers)
-        for execution in ready_jobs['pending_executions']:
-            if active_count >= MAX_CONCURRENT_JOBS:
-                logger.warning(f"Max concurrent jobs ({MAX_CONCURRENT_JOBS}) reached, deferring remaining")
-                break
+        # Order by priority and org fair share, admit within the article budget
+        queue = await discovery.build_queue(ready_jobs)
+        running = {
+            key: job for key, job in worker_state.queued_jobs.items()
+            if key in worker_state.active_jobs
+        }
+        budget_scale = llm_budget_scale()
+        to_start = _scheduler.select(queue, running, budget_scale=budget_scale)
 
-            logger.info(f"Dispatching pending execution: {execution.id} for stream {execution.stream_id}")
-            task = asyncio.create_task(
-                _run_job(_execute_pending, execution, execution.id)
-            )
-            worker_state.active_jobs[execution.id] = task
+        for job in to_start:
+            if job.is_execution:
+                logger.info(
+                    f"Dispatching pending execution: {job.key} for stream {job.stream_id} "
+                    f"(priority={job.priority.name}, {job.tenant}, ~{job.estimated_articles} articles)"
+                )
+                task = asyncio.create_task(_run_job(_execute_pending, job.target, job.key))
+            else:
+                logger.info(
+                    f"Dispatching scheduled run for stream: {job.stream_id} ({job.target.stream_name}) "
+                    f"({job.tenant}, ~{job.estimated_articles} articles)"
+                )
+                task = asyncio.create_task(_run_job(_execute_scheduled, job.target, job.key))
+            # Poll again as soon as a job finishes so the freed slot is refilled
+            task.add_done_callback(lambda _task: worker_state.wake_scheduler())
+            worker_state.active_jobs[job.key] = task
+            worker_state.queued_jobs[job.key] = job
             active_count += 1
             dispatched += 1
 
-        # Dispatch scheduled streams
-        for stream in ready_jobs['scheduled_streams']:
-            if active_count >= MAX_CONCURRENT_JOBS:
-                logger.warning(f"Max concurrent jobs ({MAX_CONCURRENT_JOBS}) reached, deferring remaining")
-                break
-
-            job_key = f"scheduled_{stream.stream_id}"
-            if job_key in worker_state.active_jobs:
-                logger.debug(f"Stream {stream.stream_id} already has a running job, skipping")
-                continue
-
-            logger.info(f"Dispatching scheduled run for stream: {stream.stream_id} ({stream.stream_name})")
-            task = asyncio.create_task(
-                _run_job(_execute_scheduled, stream, job_key)
-            )
-            worker_state.active_jobs[job_key] = task
-            active_count += 1
-            dispatched += 1
+        deferred = len([job for job in queue if job.key not in worker_state.active_jobs])
+        if deferred:
+            logger.info(f"{deferred} ready job(s) deferred ({active_count}/{MAX_CONCURRENT_JOBS} slots in use)")
 
         poll_summary = {
             "pending_found": pending_count,
             "scheduled_found": scheduled_count,
             "active_jobs": active_count,
             "dispatched": dispatched,
+            "deferred": deferred,
+            "articles_in_flight": sum(
+                job.estimated_articles for key, job in worker_state.queued_jobs.items()
+                if key in worker_state.active_jobs
+            ),
+            "article_budget_scale": round(budget_scale, 2),
         }
 
     # Write heartbeat after poll completes (separate session, never fails the poll)
@@ -304,6 +336,42 @@ async def _cleanup_stale_workers():
         logger.warning(f"Failed to clean up worker_status: {e}")
 
 
+async def _live_worker_ids() -> Optional[Set[str]]:
+    """IDs of other workers with a recent heartbeat. None if the check fails."""
+    try:
+        async with AsyncSessionLocal() as db:
+            from services.worker_status_service import WorkerStatusService
+            service = WorkerStatusService(db)
+            return await service.get_live_worker_ids(exclude_worker_id=WORKER_ID)
+    except Exception as e:
+        logger.warning(f"Failed to read live workers: {e}")
+        return None
+
+
+async def _requeue_interrupted_executions():
+    """
+    Requeue RUNNING executions whose worker has no fresh heartbeat.
+
+    Runs at startup and on every poll, so runs of an instance that keeps
+    heartbeating for a while (immutable deploys) are resumed once it stops.
+    """
+    from services.worker_status_service import HEARTBEAT_STALE_SECONDS
+
+    live_worker_ids = await _live_worker_ids()
+    if live_worker_ids is None:
+        return  # Without heartbeats every run would look orphaned
+    if _started_at and datetime.utcnow() - _started_at < timedelta(seconds=HEARTBEAT_STALE_SECONDS):
+        live_worker_ids |= _startup_live_worker_ids
+    try:
+        async with AsyncSessionLocal() as db:
+            dispatcher = JobDispatcher(db, worker_id=WORKER_ID)
+            requeued = await dispatcher.requeue_interrupted(live_worker_ids)
+            if requeued:
+                logger.info(f"Requeued {len(requeued)} interrupted execution(s): {requeued}")
+    except Exception as e:
+        logger.error(f"Failed to requeue interrupted executions: {e}", exc_info=True)
+
+
 async def _sync_paused_flag():
     """Read the persisted paused flag from the DB and sync to in-memory state."""
     try:
@@ -334,14 +402,14 @@ async def _process_email_queue():
 async def _execute_pending(execution, _job_id: str):
     """Execute a pending job with its own DB session."""
     async with AsyncSessionLocal() as db:
-        dispatcher = JobDispatcher(db)
+        dispatcher = JobDispatcher(db, worker_id=WORKER_ID)
         await dispatcher.execute_pending(execution)
 
 
 async def _execute_scheduled(stream, _job_id: str):
     """Execute a scheduled job with its own DB session."""
     async with AsyncSessionLocal() as db:
-        dispatcher = JobDispatcher(db)
+        dispatcher = JobDispatcher(db, worker_id=WORKER_ID)
         await dispatcher.execute_scheduled(stream)
 
 
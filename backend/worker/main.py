@@ -115,6 +115,11 @@ async def lifespan(app: FastAPI):
         except asyncio.TimeoutError:
             logger.warning("Timeout waiting for jobs, forcing shutdown")
 
+    from services.ncbi_http_client import close_ncbi_http_client
+    from utils.prompt_logger import close_prompt_log_writer
+    await close_ncbi_http_client()
+    close_prompt_log_writer()
+
     logger.info("Worker shutdown complete")
 
 
@@ -131,12 +136,27 @@ app.include_router(api_router)
 @app.get("/")
 async def root():
     """Root endpoint with worker info"""
+    from services.pubmed_article_cache import get_pubmed_article_cache
+    from services.pmc_full_text_service import get_pmc_full_text_store
+    from utils.prompt_logger import get_prompt_log_writer
+    from agents.prompts.llm_concurrency import get_llm_concurrency_stats
+    from agents.prompts.llm_cache import get_llm_result_cache
+
+    article_cache = get_pubmed_article_cache()
+    full_text_store = get_pmc_full_text_store()
+    prompt_log = get_prompt_log_writer()
+    llm_cache = get_llm_result_cache()
     return {
         "service": "Report Generation Worker",
         "status": "running" if worker_state.running else "stopped",
         "active_jobs": len([j for j in worker_state.active_jobs.values() if not j.done()]),
         "poll_interval": loop.POLL_INTERVAL_SECONDS,
-        "max_concurrent_jobs": loop.MAX_CONCURRENT_JOBS
+        "max_concurrent_jobs": loop.MAX_CONCURRENT_JOBS,
+        "pubmed_article_cache": article_cache.stats.to_dict() if article_cache else None,
+        "pmc_full_text_store": full_text_store.stats.to_dict() if full_text_store else None,
+        "prompt_log": prompt_log.stats.to_dict() if prompt_log else None,
+        "llm_concurrency": get_llm_concurrency_stats(),
+        "llm_result_cache": llm_cache.stats.to_dict() if llm_cache else None,
     }
 
 
@@ -4,21 +4,154 @@ Job Discovery & Scheduling
 Finds jobs that are ready to run:
 1. Scheduled: Streams with schedule_config.enabled=true and next_scheduled_run <= now
 2. Manual: PipelineExecutions with status='pending'
+
+and decides which of them to start (JobScheduler):
+- Priority: manual runs, then requeued scheduled runs (resumed from a
+  checkpoint), then streams due for their scheduled run
+- Fair share: within a priority, organizations (personal streams: their
+  owner) take turns, the one with the fewest running jobs first
+- Admission control: each job's article volume is estimated from the
+  stream's recent runs; jobs start while the estimated articles in flight
+  stay within WORKER_ARTICLE_BUDGET, scaled down while the adaptive LLM
+  limiters are backing off. A job that does not fit stops admission for
+  this poll (later jobs wait behind it), so large runs are not starved.
 """
 
 import logging
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any
+from enum import IntEnum
+from typing import Any, Dict, Iterable, List, Optional, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import and_, select
 
-from models import ResearchStream, PipelineExecution, ExecutionStatus
+from models import ResearchStream, PipelineExecution, ExecutionStatus, RunType
 from services.execution_service import ExecutionService
+from services.wip_article_service import WipArticleService
 
 logger = logging.getLogger('worker.scheduler')
 
 
+class JobPriority(IntEnum):
+    """Dispatch order of ready jobs (lower runs first)"""
+    MANUAL = 0     # Pending execution triggered by a user
+    RESUMED = 1    # Pending scheduled execution (requeued after an interruption)
+    SCHEDULED = 2  # Stream due for its scheduled run
+
+
+@dataclass
+class QueuedJob:
+    """A ready job with what the scheduler needs to order and admit it"""
+    key: str                 # Key in worker_state.active_jobs
+    target: Union[PipelineExecution, ResearchStream]
+    priority: JobPriority
+    tenant: str              # Fair-share group: "org:<id>", "user:<id>" or "global"
+    stream_id: int
+    estimated_articles: int
+    ready_at: datetime
+
+    @property
+    def is_execution(self) -> bool:
+        return isinstance(self.target, PipelineExecution)
+
+
+def _tenant(stream: Optional[ResearchStream]) -> str:
+    if stream is None:
+        return "global"
+    if stream.org_id is not None:
+        return f"org:{stream.org_id}"
+    if stream.user_id is not None:
+        return f"user:{stream.user_id}"
+    return "global"
+
+
+def llm_budget_scale() -> float:
+    """
+    Fraction of the article budget to use given LLM provider pressure.
+
+    1.0 unless an adaptive LLM limiter has backed off below its initial limit
+    (rate limits or slow responses), in which case the most constrained
+    model's limit / initial limit.
+    """
+    from config.settings import settings
+    from agents.prompts.llm_concurrency import get_llm_concurrency_stats
+
+    limits = [stats["limit"] for stats in get_llm_concurrency_stats().values()]
+    if not limits or settings.LLM_CONCURRENCY_INITIAL <= 0:
+        return 1.0
+    return min(1.0, min(limits) / settings.LLM_CONCURRENCY_INITIAL)
+
+
+class JobScheduler:
+    """Chooses which ready jobs to start (see module docstring)"""
+
+    def __init__(self, max_concurrent_jobs: int, max_jobs_per_tenant: int = 0, article_budget: int = 0):
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_jobs_per_tenant = max_jobs_per_tenant
+        self.article_budget = article_budget
+
+    def select(
+        self,
+        queue: Iterable[QueuedJob],
+        running: Dict[str, QueuedJob],
+        budget_scale: float = 1.0,
+    ) -> List[QueuedJob]:
+        """
+        Jobs to start now, in start order.
+
+        Args:
+            queue: Ready jobs (jobs already running are ignored)
+            running: Running jobs by key
+            budget_scale: Multiplier for the article budget (see llm_budget_scale)
+        """
+        slots = self.max_concurrent_jobs - len(running)
+        if slots <= 0:
+            return []
+
+        budget = self.article_budget * budget_scale
+        in_flight = sum(job.estimated_articles for job in running.values())
+        tenant_jobs = Counter(job.tenant for job in running.values())
+
+        by_priority: Dict[JobPriority, Dict[str, List[QueuedJob]]] = {}
+        for job in queue:
+            if job.key not in running:
+                by_priority.setdefault(job.priority, {}).setdefault(job.tenant, []).append(job)
+
+        selected: List[QueuedJob] = []
+        for priority in sorted(by_priority):
+            tenants = by_priority[priority]
+            for jobs in tenants.values():
+                jobs.sort(key=lambda job: job.ready_at)
+
+            while tenants:
+                # Fewest running jobs first, then whoever has waited longest
+                tenant = min(tenants, key=lambda t: (tenant_jobs[t], tenants[t][0].ready_at))
+                if self.max_jobs_per_tenant and tenant_jobs[tenant] >= self.max_jobs_per_tenant:
+                    del tenants[tenant]
+                    continue
+
+                job = tenants[tenant][0]
+                if self.article_budget and in_flight > 0 and in_flight + job.estimated_articles > budget:
+                    logger.info(
+                        f"Admission deferred at {job.key}: ~{job.estimated_articles} articles, "
+                        f"{int(in_flight)} of {int(budget)} budget in flight"
+                    )
+                    return selected
+
+                selected.append(job)
+                in_flight += job.estimated_articles
+                tenant_jobs[tenant] += 1
+                tenants[tenant].pop(0)
+                if not tenants[tenant]:
+                    del tenants[tenant]
+                if len(selected) >= slots:
+                    return selected
+
+        return selected
+
+
 class JobDiscovery:
     """Discovers jobs ready to be executed"""
 
@@ -112,3 +245,57 @@ class JobDiscovery:
             logger.error(f"Failed to find scheduled streams: {e}")
 
         return result
+
+    async def build_queue(self, ready_jobs: Dict[str, Any]) -> List[QueuedJob]:
+        """
+        Wrap find_all_ready_jobs() results as QueuedJobs for JobScheduler.
+
+        Loads the streams of pending executions (for their organization) and
+        estimates each job's articles from the stream's recent completed runs.
+        """
+        from config.settings import settings
+
+        executions = ready_jobs['pending_executions']
+        streams = {s.stream_id: s for s in ready_jobs['scheduled_streams']}
+        missing = {e.stream_id for e in executions} - set(streams)
+        if missing:
+            result = await self.db.execute(
+                select(ResearchStream).where(ResearchStream.stream_id.in_(missing))
+            )
+            streams.update((s.stream_id, s) for s in result.scalars().all())
+
+        volumes: Dict[int, int] = {}
+        if streams:
+            try:
+                volumes = await WipArticleService(self.db).get_recent_article_volumes(
+                    list(streams), recent_runs=settings.WORKER_ARTICLE_ESTIMATE_RUNS
+                )
+            except SQLAlchemyError as e:
+                logger.warning(f"Could not estimate job sizes, using defaults: {e}")
+
+        def estimate(stream_id: int) -> int:
+            return volumes.get(stream_id, settings.WORKER_DEFAULT_ARTICLE_ESTIMATE)
+
+        queue = []
+        now = datetime.utcnow()
+        for execution in executions:
+            queue.append(QueuedJob(
+                key=execution.id,
+                target=execution,
+                priority=JobPriority.RESUMED if execution.run_type == RunType.SCHEDULED else JobPriority.MANUAL,
+                tenant=_tenant(streams.get(execution.stream_id)),
+                stream_id=execution.stream_id,
+                estimated_articles=estimate(execution.stream_id),
+                ready_at=execution.created_at or now,
+            ))
+        for stream in ready_jobs['scheduled_streams']:
+            queue.append(QueuedJob(
+                key=f"scheduled_{stream.stream_id}",
+                target=stream,
+                priority=JobPriority.SCHEDULED,
+                tenant=_tenant(stream),
+                stream_id=stream.stream_id,
+                estimated_articles=estimate(stream.stream_id),
+                ready_at=stream.next_scheduled_run or now,
+            ))
+        return queue
@@ -15,6 +15,7 @@ class WorkerState:
         self.paused = False  # When True, loop still polls and heartbeats but won't dispatch new jobs
         self.scheduler_task: Optional[asyncio.Task] = None
         self.active_jobs: dict = {}
+        self.queued_jobs: dict = {}  # Job key -> QueuedJob (priority, org, estimated articles) of active jobs
         # Event to wake up scheduler immediately when a job is triggered
         self.wake_event: asyncio.Event = asyncio.Event()
 
@@ -57,7 +57,9 @@ interface AgentTrace {
     initial_messages: Array<Record<string, unknown>>;
     iterations: Array<{
         iteration: number;
-        messages_to_model: Array<Record<string, unknown>>;
+        new_messages?: Array<Record<string, unknown>>;
+        message_count?: number;
+        messages_to_model?: Array<Record<string, unknown>>;
         response_content: Array<Record<string, unknown>>;
         stop_reason: string;
         usage: { input_tokens: number; output_tokens: number };
@@ -1,7 +1,7 @@
 /**
  * Diagnostics panel for viewing agent execution traces in the chat tray
  */
-import { useState } from 'react';
+import { useMemo, useState } from 'react';
 import { BugAntIcon, ChevronDownIcon, ChevronRightIcon, ArrowsPointingOutIcon } from '@heroicons/react/24/solid';
 import { AgentTrace } from '../../types/chat';
 import {
@@ -11,6 +11,7 @@ import {
     IterationCard,
     AgentResponseCard,
     ConfigCard,
+    withMessagesToModel,
 } from './diagnostics';
 
 interface DiagnosticsPanelProps {
@@ -26,6 +27,7 @@ export function DiagnosticsPanel({ diagnostics, onClose }: DiagnosticsPanelProps
     const [expandedToolCalls, setExpandedToolCalls] = useState<Set<string>>(new Set());
     const [expandedSections, setExpandedSections] = useState<Set<string>>(new Set(['messages']));
     const [fullscreenContent, setFullscreenContent] = useState<FullscreenContent | null>(null);
+    const trace = useMemo(() => withMessagesToModel(diagnostics), [diagnostics]);
 
     const toggleIteration = (iter: number) => {
         const next = new Set(expandedIterations);
@@ -104,7 +106,7 @@ export function DiagnosticsPanel({ diagnostics, onClose }: DiagnosticsPanelProps
                 <div className="flex-1 min-h-0 overflow-y-auto p-6 space-y-6">
                     {activeTab === 'messages' && (
                         <MessagesTab
-                            diagnostics={diagnostics}
+                            diagnostics={trace}
                             expandedIterations={expandedIterations}
                             expandedToolCalls={expandedToolCalls}
                             expandedSections={expandedSections}
@@ -369,6 +371,12 @@ function MetricsTab({ diagnostics, onFullscreen }: {
                     <ConfigCard label="Cumulative Output" value={diagnostics.total_output_tokens || 0} />
                     <ConfigCard label="Peak Context" value={diagnostics.peak_input_tokens || diagnostics.total_input_tokens || 0} />
                 </div>
+                {(diagnostics.total_cache_read_input_tokens || diagnostics.total_cache_creation_input_tokens) ? (
+                    <div className="grid grid-cols-3 gap-4 mb-4">
+                        <ConfigCard label="Cache Read" value={diagnostics.total_cache_read_input_tokens || 0} />
+                        <ConfigCard label="Cache Write" value={diagnostics.total_cache_creation_input_tokens || 0} />
+                    </div>
+                ) : null}
 
                 {/* Per-iteration breakdown */}
                 {diagnostics.iterations && diagnostics.iterations.length > 1 && (
@@ -1,6 +1,7 @@
 /**
  * Shared types for diagnostics components
  */
+import { AgentTrace } from '../../../types/chat';
 
 // Content block types for message rendering
 export interface TextBlock {
@@ -76,3 +77,27 @@ export function getContentSummary(blocks: ContentBlock[]): { text: string; badge
         badges
     };
 }
+
+/**
+ * Fill in each iteration's messages_to_model.
+ *
+ * Traces record only the messages added per iteration (new_messages); the full
+ * array sent to the model is initial_messages plus every new_messages so far.
+ * Iterations share the prefix arrays' message objects. Legacy iterations that
+ * already carry messages_to_model are left as they are.
+ */
+export function withMessagesToModel(trace: AgentTrace): AgentTrace {
+    if (!trace.iterations?.some(iteration => !iteration.messages_to_model)) {
+        return trace;
+    }
+    let messages = trace.initial_messages || [];
+    const iterations = trace.iterations.map(iteration => {
+        if (iteration.messages_to_model) {
+            messages = iteration.messages_to_model;
+            return iteration;
+        }
+        messages = messages.concat(iteration.new_messages || []);
+        return { ...iteration, messages_to_model: messages };
+    });
+    return { ...trace, iterations };
+}
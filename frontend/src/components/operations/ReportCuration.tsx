@@ -40,6 +40,7 @@ import {
     resetCuration,
     updateArticleInReport,
     updateWipArticleCurationNotes,
+    getWipArticleAbstract,
     approveReport,
     rejectReport,
     sendApprovalRequest,
@@ -300,6 +301,13 @@ export default function ReportCuration() {
         }
     };
 
+    // Load a filtered/curated article's abstract (not included in the curation view)
+    const handleLoadAbstract = async (wipArticleId: number): Promise<string | null> => {
+        if (!reportId) return null;
+        const response = await getWipArticleAbstract(parseInt(reportId), wipArticleId);
+        return response.abstract;
+    };
+
     // Regenerate executive summary
     const handleRegenerateExecutiveSummary = async () => {
         if (!reportId) return;
@@ -981,6 +989,7 @@ export default function ReportCuration() {
                                 onToggleExpand={() => setExpandedArticle(expandedArticle === article.wip_article_id ? null : article.wip_article_id)}
                                 onInclude={(categoryId) => handleIncludeArticle(article, categoryId)}
                                 onSaveNotes={(notes) => handleSaveCurationNotes(article.wip_article_id, notes)}
+                                onLoadAbstract={() => handleLoadAbstract(article.wip_article_id)}
                             />
                         ))}
 
@@ -1986,6 +1995,7 @@ function FilteredArticleCard({
     onToggleExpand,
     onInclude,
     onSaveNotes,
+    onLoadAbstract,
 }: {
     article: CurationFilteredArticle;
     categories: CurationCategory[];
@@ -1994,10 +2004,30 @@ function FilteredArticleCard({
     onToggleExpand: () => void;
     onInclude: (categoryId?: string) => void;
     onSaveNotes: (notes: string) => void;
+    onLoadAbstract: () => Promise<string | null>;
 }) {
     const [selectedCategory, setSelectedCategory] = useState<string>('');
     const [notes, setNotes] = useState(article.curation_notes || '');
     const [savingNotes, setSavingNotes] = useState(false);
+    // Abstract is fetched on first expand
+    const [abstract, setAbstract] = useState<string | null>(null);
+    const [abstractLoaded, setAbstractLoaded] = useState(false);
+    const [loadingAbstract, setLoadingAbstract] = useState(false);
+
+    useEffect(() => {
+        if (!expanded || abstractLoaded || loadingAbstract) return;
+        setLoadingAbstract(true);
+        onLoadAbstract()
+            .then(setAbstract)
+            .catch((err) => {
+                console.error('Failed to load abstract:', err);
+                setAbstract(null);
+            })
+            .finally(() => {
+                setAbstractLoaded(true);
+                setLoadingAbstract(false);
+            });
+    }, [expanded, abstractLoaded, loadingAbstract, onLoadAbstract]);
     const pubmedUrl = article.pmid ? `https://pubmed.ncbi.nlm.nih.gov/${article.pmid}/` : null;
     const notesModified = notes !== (article.curation_notes || '');
 
@@ -2060,11 +2090,13 @@ function FilteredArticleCard({
                                 )}
 
                                 {/* Abstract */}
-                                {article.abstract && (
+                                {loadingAbstract ? (
+                                    <p className="text-sm text-gray-400 dark:text-gray-500 italic">Loading abstract...</p>
+                                ) : abstract && (
                                     <div>
                                         <span className="text-xs font-medium text-gray-500 dark:text-gray-400">Abstract</span>
                                         <p className="text-sm text-gray-700 dark:text-gray-300 bg-gray-50 dark:bg-gray-900/50 p-3 rounded mt-1">
-                                            {article.abstract}
+                                            {abstract}
                                         </p>
                                     </div>
                                 )}
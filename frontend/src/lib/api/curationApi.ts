@@ -73,6 +73,7 @@ export interface CurationIncludedArticle {
     filter_score_reason: string | null;
 }
 
+// No abstract - getCurationView omits it; load with getWipArticleAbstract
 export interface CurationFilteredArticle {
     wip_article_id: number;
     pmid: string | null;
@@ -84,7 +85,6 @@ export interface CurationFilteredArticle {
     pub_year?: number | null;
     pub_month?: number | null;
     pub_day?: number | null;
-    abstract: string | null;
     url: string | null;
     filter_score: number | null;
     filter_score_reason: string | null;
@@ -191,6 +191,11 @@ export interface UpdateWipArticleNotesResponse {
     curation_notes: string | null;
 }
 
+export interface WipArticleAbstractResponse {
+    wip_article_id: number;
+    abstract: string | null;
+}
+
 export interface ApproveReportResponse {
     report_id: number;
     approval_status: string;
@@ -352,6 +357,20 @@ export async function updateWipArticleCurationNotes(
     return response.data;
 }
 
+/**
+ * Get the abstract of a filtered/curated WipArticle (loaded when the article is expanded).
+ * @param wipArticleId - The WipArticle ID
+ */
+export async function getWipArticleAbstract(
+    reportId: number,
+    wipArticleId: number
+): Promise<WipArticleAbstractResponse> {
+    const response = await api.get<WipArticleAbstractResponse>(
+        `${BASE_PATH}/${reportId}/wip-articles/${wipArticleId}/abstract`
+    );
+    return response.data;
+}
+
 /**
  * Approve a report for distribution.
  */
@@ -71,8 +71,11 @@ export interface ToolDefinition {
 }
 
 export interface TokenUsage {
+    /** Uncached input tokens (excludes prompt cache reads/writes) */
     input_tokens: number;
     output_tokens: number;
+    cache_creation_input_tokens?: number;
+    cache_read_input_tokens?: number;
 }
 
 export interface ToolCall {
@@ -92,8 +95,12 @@ export interface ToolCall {
 
 export interface AgentIteration {
     iteration: number;
-    /** EXACT messages array sent to model */
-    messages_to_model: Record<string, unknown>[];
+    /** Messages appended to the conversation since the previous iteration (replay onto initial_messages) */
+    new_messages?: Record<string, unknown>[];
+    /** Length of the messages array sent to model */
+    message_count?: number;
+    /** EXACT messages array sent to model (legacy traces; rebuilt by withMessagesToModel otherwise) */
+    messages_to_model?: Record<string, unknown>[];
     /** Model response content blocks */
     response_content: Record<string, unknown>[];
     stop_reason: string;
@@ -142,6 +149,9 @@ export interface AgentTrace {
     total_input_tokens: number;
     total_output_tokens: number;
     total_duration_ms: number;
+    // Prompt cache usage (total_input_tokens excludes these)
+    total_cache_creation_input_tokens?: number;
+    total_cache_read_input_tokens?: number;
     // High-water mark: largest single API call's input tokens (context window pressure)
     peak_input_tokens?: number;
 }
@@ -211,12 +221,14 @@ export interface ToolProgressEvent {
     message: string;
     progress: number;  // 0.0 to 1.0
     data?: unknown;
+    tool_use_id?: string;  // Tells concurrent calls of the same tool apart
 }
 
 export interface ToolCompleteEvent {
     type: 'tool_complete';
     tool: string;
     index: number;
+    tool_use_id?: string;
 }
 
 export interface CompleteEvent {